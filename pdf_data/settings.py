@@ -80,14 +80,73 @@ WSGI_APPLICATION = 'pdf_data.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# The web server reads the database while batch ingest writes to it. In WAL
+# mode readers never wait for the writer; synchronous=NORMAL only syncs at
+# checkpoints (safe with WAL); mmap_size (bytes) and cache_size (negative:
+# KiB) are per connection. Writers wait up to 'timeout' seconds for the lock,
+# and IMMEDIATE transactions take it up front so a transaction that reads
+# first cannot fail with "database is locked" when it starts writing.
+
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'mmap_size': 256 * 1024 * 1024,
+    'cache_size': -64 * 1024,
+    'temp_store': 'MEMORY',
+}
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'OPTIONS': {
+            'init_command': ';'.join(f'PRAGMA {name}={value}' for name, value in SQLITE_PRAGMAS.items()),
+            'transaction_mode': 'IMMEDIATE',
+            'timeout': 30,
+        },
     }
 }
 
 
+# Cache
+# The 'search' cache holds semantic search results and result handles; it is
+# file based so batch ingest processes invalidate the web server's entries.
+# The corpus version has a cache of its own, which never fills up and so is
+# never culled (culling drops random entries once MAX_ENTRIES is reached).
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'search': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'cache' / 'search',
+        'OPTIONS': {'MAX_ENTRIES': 20000},
+    },
+    'search_version': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'cache' / 'search_version',
+    },
+}
+
+SEMANTIC_SEARCH_CACHE_TIMEOUT = 3600
+
+# Keyword (BM25) candidates re-ranked by the vector scorer per search
+SEMANTIC_SEARCH_CANDIDATES = 2000
+
+# Contracts the table's free-text search takes from the keyword index (every
+# query term must appear in the contract text)
+TABLE_SEARCH_TEXT_LIMIT = 10000
+
+# Worker processes shared by upload requests to extract PDFs in parallel
+# (None: one per CPU, at most 4)
+IMPORT_EXTRACTION_WORKERS = None
+
+# Seconds the contract/bid table totals are cached (0: exact COUNT on every page).
+# Contract totals are also dropped whenever the corpus version is bumped.
+TABLE_COUNT_CACHE_TIMEOUT = 300
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -2,52 +2,45 @@
 """
 Fixed Army Contracts Filter Script
 Works with the actual database structure.
+
+Streams the joined contract rows in chunks, matches all keywords in one
+pass per row and writes matches straight into a write-only workbook, so
+memory use stays flat however large db.sqlite3 is.
 """
 
 import sqlite3
 import pandas as pd
 import argparse
 import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+from openpyxl import Workbook
 
-def connect_to_database(db_path='db.sqlite3'):
-    """Connect to the SQLite database."""
-    try:
-        conn = sqlite3.connect(db_path)
-        return conn
-    except Exception as e:
-        print(f"❌ Error connecting to database: {e}")
-        return None
+from src.utils.compressed_text import decompress_text
+from src.utils.keyword_matcher import KeywordMatcher
 
 
-def search_contracts(conn, keywords):
-    """Search for contracts containing the specified keywords."""
-    if not conn:
-        return pd.DataFrame()
-    
-    # Build the search query - only use tables that actually exist
-    search_conditions = []
-    params = []
-    
-    for keyword in keywords:
-        search_conditions.append("""
-            (c.raw_text LIKE ? OR 
-             c.contract_no LIKE ? OR
-             od.organisation_name LIKE ? OR
-             od.department LIKE ? OR
-             od.ministry LIKE ? OR
-             bd.address LIKE ? OR
-             pa.address LIKE ?)
-        """)
-        # Add the keyword parameter 7 times (for each field)
-        params.extend([f'%{keyword}%'] * 7)
-    
-    # Combine all conditions with OR
-    where_clause = ' OR '.join(search_conditions)
-    
-    query = f"""
-    SELECT DISTINCT
+# Fields searched for the keywords (case-insensitive substring, like LIKE '%kw%')
+SEARCH_FIELDS = [
+    'raw_text', 'contract_no', 'organisation_name', 'department', 'ministry',
+    'buyer_address', 'pa_address'
+]
+
+# Fields counted towards the minimum field requirement
+FIELDS_TO_COUNT = [
+    'org_type', 'ministry', 'department', 'organisation_name', 'office_zone',
+    'buyer_designation', 'buyer_contact', 'buyer_email', 'buyer_gstin', 'buyer_address',
+    'pa_role', 'payment_mode', 'pa_designation', 'pa_email', 'pa_gstin', 'pa_address',
+    'ifd_concurrence', 'admin_approval_designation', 'financial_approval_designation'
+]
+
+BASIC_FIELDS = ['contract_no', 'raw_text']
+
+CONTRACTS_QUERY = """
+    SELECT
         c.id,
         c.contract_no,
         c.generated_date,
@@ -76,195 +69,235 @@ def search_contracts(conn, keywords):
     LEFT JOIN cont_record_buyerdetail bd ON c.id = bd.contract_id
     LEFT JOIN cont_record_payingauthority pa ON c.id = pa.contract_id
     LEFT JOIN cont_record_financialapproval fa ON c.id = fa.contract_id
-    WHERE {where_clause}
-    """
-    
+    ORDER BY c.id
+"""
+
+EXCEL_COLUMNS = [
+    'Contract No', 'Generated Date', 'Raw Text', 'Organization Type', 'Ministry', 'Department',
+    'Organization Name', 'Office Zone', 'Buyer Designation', 'Buyer Contact', 'Buyer Email',
+    'Buyer GSTIN', 'Buyer Address', 'PA Role', 'PA Payment Mode', 'PA Designation', 'PA Email',
+    'PA GSTIN', 'PA Address', 'IFD Concurrence', 'Admin Approval Designation',
+    'Financial Approval Designation'
+]
+
+ILLEGAL_EXCEL_CHARS = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]')
+
+# Keyword matcher of the current worker process
+_matcher = None
+
+
+def connect_to_database(db_path='db.sqlite3'):
+    """Connect to the SQLite database."""
     try:
-        df = pd.read_sql_query(query, conn, params=params)
-        return df
+        conn = sqlite3.connect(db_path)
+        return conn
     except Exception as e:
-        print(f"❌ Error executing search query: {e}")
-        return pd.DataFrame()
-
-
-def filter_complete_contracts(df, min_fields=3):
-    """Filter contracts that have a minimum number of non-empty fields."""
-    if df.empty:
-        return df
-    
-    # Define the fields to count (only fields that exist in our query)
-    fields_to_count = [
-        'org_type', 'ministry', 'department', 'organisation_name', 'office_zone',
-        'buyer_designation', 'buyer_contact', 'buyer_email', 'buyer_gstin', 'buyer_address',
-        'pa_role', 'payment_mode', 'pa_designation', 'pa_email', 'pa_gstin', 'pa_address',
-        'ifd_concurrence', 'admin_approval_designation', 'financial_approval_designation'
-    ]
-    
-    # Count non-empty fields for each contract
-    field_counts = df[fields_to_count].notna().sum(axis=1)
-    
-    # Filter contracts that meet the minimum field requirement
-    filtered_df = df[field_counts >= min_fields].copy()
-    
-    print(f"📊 Found {len(df)} contracts, {len(filtered_df)} meet minimum field requirement ({min_fields})")
-    
-    # If no contracts meet the requirement, return all contracts with at least some data
-    if len(filtered_df) == 0 and len(df) > 0:
-        print(f"⚠️  No contracts meet minimum requirement. Returning all contracts with any data...")
-        # Return contracts that have at least contract_no and some other data
-        basic_fields = ['contract_no', 'raw_text']
-        basic_counts = df[basic_fields].notna().sum(axis=1)
-        filtered_df = df[basic_counts >= 1].copy()
-        print(f"📊 Returning {len(filtered_df)} contracts with basic data")
-    
-    return filtered_df
+        print(f"❌ Error connecting to database: {e}")
+        return None
 
 
 def clean_text_for_excel(text):
     """Clean text to remove illegal characters for Excel."""
     if not text:
         return ''
-    
-    # Remove or replace illegal characters
-    import re
+
     # Remove control characters except newlines and tabs
-    text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', str(text))
-    # Replace other problematic characters
-    text = text.replace('\x00', '').replace('\x01', '').replace('\x02', '').replace('\x03', '')
-    text = text.replace('\x04', '').replace('\x05', '').replace('\x06', '').replace('\x07', '')
-    text = text.replace('\x08', '').replace('\x0B', '').replace('\x0C', '').replace('\x0E', '')
-    text = text.replace('\x0F', '').replace('\x10', '').replace('\x11', '').replace('\x12', '')
-    text = text.replace('\x13', '').replace('\x14', '').replace('\x15', '').replace('\x16', '')
-    text = text.replace('\x17', '').replace('\x18', '').replace('\x19', '').replace('\x1A', '')
-    text = text.replace('\x1B', '').replace('\x1C', '').replace('\x1D', '').replace('\x1E', '')
-    text = text.replace('\x1F', '').replace('\x7F', '')
-    
-    return text
-
-def create_excel_output(df, output_file, keywords, min_fields):
-    """Create Excel file with contracts and summary data."""
-    if df.empty:
-        print("⚠️  No contracts found with sufficient data")
+    return ILLEGAL_EXCEL_CHARS.sub('', str(text))
+
+
+def contract_row(contract):
+    """Build the Excel row for one joined contract record."""
+    raw_text = contract['raw_text']
+    return [
+        clean_text_for_excel(contract['contract_no'] or ''),
+        clean_text_for_excel(contract['generated_date'] or ''),
+        clean_text_for_excel((raw_text[:1000] + '...') if raw_text and len(raw_text) > 1000 else raw_text or ''),
+        clean_text_for_excel(contract['org_type'] or ''),
+        clean_text_for_excel(contract['ministry'] or ''),
+        clean_text_for_excel(contract['department'] or ''),
+        clean_text_for_excel(contract['organisation_name'] or ''),
+        clean_text_for_excel(contract['office_zone'] or ''),
+        clean_text_for_excel(contract['buyer_designation'] or ''),
+        clean_text_for_excel(contract['buyer_contact'] or ''),
+        clean_text_for_excel(contract['buyer_email'] or ''),
+        clean_text_for_excel(contract['buyer_gstin'] or ''),
+        clean_text_for_excel(contract['buyer_address'] or ''),
+        clean_text_for_excel(contract['pa_role'] or ''),
+        clean_text_for_excel(contract['payment_mode'] or ''),
+        clean_text_for_excel(contract['pa_designation'] or ''),
+        clean_text_for_excel(contract['pa_email'] or ''),
+        clean_text_for_excel(contract['pa_gstin'] or ''),
+        clean_text_for_excel(contract['pa_address'] or ''),
+        'Yes' if contract['ifd_concurrence'] else 'No',
+        clean_text_for_excel(contract['admin_approval_designation'] or ''),
+        clean_text_for_excel(contract['financial_approval_designation'] or ''),
+    ]
+
+
+def init_worker(keywords):
+    """Compile the keyword matcher once per worker process."""
+    global _matcher
+    _matcher = KeywordMatcher(keywords)
+
+
+def scan_chunk(chunk, min_fields, basic_only=False):
+    """Match one chunk of joined rows; returns (matched count, Excel rows kept)."""
+    # raw_text is stored zlib-compressed (CompressedTextField)
+    chunk['raw_text'] = chunk['raw_text'].map(decompress_text)
+    search_values = chunk[SEARCH_FIELDS].to_numpy()
+    matched = [
+        any(isinstance(value, str) and _matcher.contains_any(value) for value in values)
+        for values in search_values
+    ]
+    chunk = chunk[matched]
+    if chunk.empty:
+        return 0, []
+
+    if basic_only:
+        # Fallback when nothing meets the requirement: any contract with basic data
+        keep = chunk[BASIC_FIELDS].notna().sum(axis=1) >= 1
+    else:
+        keep = chunk[FIELDS_TO_COUNT].notna().sum(axis=1) >= min_fields
+    return len(chunk), [contract_row(contract) for contract in chunk[keep].to_dict('records')]
+
+
+def stream_contract_chunks(db_path, chunk_size):
+    """Yield the joined contract rows chunk by chunk."""
+    conn = connect_to_database(db_path)
+    if not conn:
         return
-    
-    # Create output directory if it doesn't exist
-    output_dir = os.path.dirname(output_file)
-    if output_dir and not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-    
-    # Prepare contracts data
-    contracts_data = []
-    
-    for _, contract in df.iterrows():
-        contract_dict = {
-            'Contract No': clean_text_for_excel(contract['contract_no'] or ''),
-            'Generated Date': clean_text_for_excel(contract['generated_date'] or ''),
-            'Raw Text': clean_text_for_excel((contract['raw_text'][:1000] + '...') if contract['raw_text'] and len(contract['raw_text']) > 1000 else contract['raw_text'] or ''),
-            'Organization Type': clean_text_for_excel(contract['org_type'] or ''),
-            'Ministry': clean_text_for_excel(contract['ministry'] or ''),
-            'Department': clean_text_for_excel(contract['department'] or ''),
-            'Organization Name': clean_text_for_excel(contract['organisation_name'] or ''),
-            'Office Zone': clean_text_for_excel(contract['office_zone'] or ''),
-            'Buyer Designation': clean_text_for_excel(contract['buyer_designation'] or ''),
-            'Buyer Contact': clean_text_for_excel(contract['buyer_contact'] or ''),
-            'Buyer Email': clean_text_for_excel(contract['buyer_email'] or ''),
-            'Buyer GSTIN': clean_text_for_excel(contract['buyer_gstin'] or ''),
-            'Buyer Address': clean_text_for_excel(contract['buyer_address'] or ''),
-            'PA Role': clean_text_for_excel(contract['pa_role'] or ''),
-            'PA Payment Mode': clean_text_for_excel(contract['payment_mode'] or ''),
-            'PA Designation': clean_text_for_excel(contract['pa_designation'] or ''),
-            'PA Email': clean_text_for_excel(contract['pa_email'] or ''),
-            'PA GSTIN': clean_text_for_excel(contract['pa_gstin'] or ''),
-            'PA Address': clean_text_for_excel(contract['pa_address'] or ''),
-            'IFD Concurrence': 'Yes' if contract['ifd_concurrence'] else 'No',
-            'Admin Approval Designation': clean_text_for_excel(contract['admin_approval_designation'] or ''),
-            'Financial Approval Designation': clean_text_for_excel(contract['financial_approval_designation'] or ''),
-        }
-        
-        contracts_data.append(contract_dict)
-    
-    # Create Excel file
-    with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-        # Contracts sheet
-        contracts_df = pd.DataFrame(contracts_data)
-        contracts_df.to_excel(writer, sheet_name='Contracts', index=False)
-        
-        # Summary sheet
-        summary_data = {
-            'Metric': [
-                'Total Contracts Found',
-                'Contracts with Complete Data',
-                'Keywords Searched',
-                'Minimum Fields Required',
-                'Export Date'
-            ],
-            'Value': [
-                len(df),
-                len(contracts_data),
-                ', '.join(keywords),
-                min_fields,
-                datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            ]
-        }
-        summary_df = pd.DataFrame(summary_data)
-        summary_df.to_excel(writer, sheet_name='Summary', index=False)
-    
-    print(f"📁 Excel file generated successfully: {output_file}")
-    print(f"📊 File contains {len(contracts_data)} contracts with complete data")
-    print(f"💾 File size: {os.path.getsize(output_file) / 1024:.1f} KB")
+    try:
+        yield from pd.read_sql_query(CONTRACTS_QUERY, conn, chunksize=chunk_size)
+    finally:
+        conn.close()
+
+
+class ContractsWorkbook:
+    """Write-only workbook created on the first row, so empty results leave no file."""
+
+    def __init__(self, output_file):
+        self.output_file = output_file
+        self.workbook = None
+        self.sheet = None
+        self.rows = 0
+
+    def append(self, row):
+        if self.workbook is None:
+            self.workbook = Workbook(write_only=True)
+            self.sheet = self.workbook.create_sheet('Contracts')
+            self.sheet.append(EXCEL_COLUMNS)
+        self.sheet.append(row)
+        self.rows += 1
+
+    def save(self, summary_rows):
+        output_dir = os.path.dirname(self.output_file)
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+        summary = self.workbook.create_sheet('Summary')
+        summary.append(['Metric', 'Value'])
+        for row in summary_rows:
+            summary.append(row)
+        self.workbook.save(self.output_file)
+
+
+def scan_contracts(db_path, keywords, min_fields, output, chunk_size=2000, workers=None, basic_only=False):
+    """Scan every contract in chunks across worker processes; returns the match count."""
+    workers = workers or os.cpu_count() or 1
+    matched = 0
+
+    def collect(result):
+        nonlocal matched
+        chunk_matched, rows = result
+        matched += chunk_matched
+        for row in rows:
+            output.append(row)
+
+    if workers == 1:
+        init_worker(keywords)
+        for chunk in stream_contract_chunks(db_path, chunk_size):
+            collect(scan_chunk(chunk, min_fields, basic_only))
+        return matched
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(keywords,)) as executor:
+        # A bounded number of chunks in flight keeps memory constant; results
+        # are collected in submission order so the output follows c.id
+        pending = deque()
+        for chunk in stream_contract_chunks(db_path, chunk_size):
+            pending.append(executor.submit(scan_chunk, chunk, min_fields, basic_only))
+            if len(pending) >= workers * 2:
+                collect(pending.popleft().result())
+        while pending:
+            collect(pending.popleft().result())
+    return matched
 
 
 def main():
     parser = argparse.ArgumentParser(description='Filter contracts for army-related keywords and generate Excel file')
     parser.add_argument('--output', '-o', default='army_contracts_full_data.xlsx',
                        help='Output Excel file name (default: army_contracts_full_data.xlsx)')
-    parser.add_argument('--keywords', '-k', 
+    parser.add_argument('--keywords', '-k',
                        default='India Army,HQ,Headquarters,Armd,ARMD,army,ARMY,headquarters',
                        help='Comma-separated keywords to search for')
     parser.add_argument('--min-fields', '-m', type=int, default=3,
                        help='Minimum number of required fields that must be present (default: 3)')
     parser.add_argument('--database', '-d', default='db.sqlite3',
                        help='SQLite database file path (default: db.sqlite3)')
-    
+    parser.add_argument('--chunk-size', '-c', type=int, default=2000,
+                       help='Contracts read from the database per chunk (default: 2000)')
+    parser.add_argument('--workers', '-w', type=int, default=None,
+                       help='Worker processes for keyword matching (default: CPU count)')
+
     args = parser.parse_args()
-    
+
     # Parse keywords
     keywords = [kw.strip() for kw in args.keywords.split(',')]
-    
+
     print(f"🔍 Searching for contracts with keywords: {keywords}")
     print(f"📊 Minimum required fields: {args.min_fields}")
     print(f"🗄️  Database: {args.database}")
-    
-    # Connect to database
-    conn = connect_to_database(args.database)
-    if not conn:
+
+    if not os.path.exists(args.database):
+        print(f"❌ Error connecting to database: {args.database} not found")
         return
-    
-    try:
-        # Search for contracts
-        print("🔍 Searching contracts...")
-        contracts_df = search_contracts(conn, keywords)
-        
-        if contracts_df.empty:
-            print("❌ No contracts found matching the keywords")
-            return
-        
-        print(f"📋 Found {len(contracts_df)} contracts matching keywords")
-        
-        # Filter contracts with complete data
-        print("🔍 Filtering contracts with complete data...")
-        filtered_df = filter_complete_contracts(contracts_df, args.min_fields)
-        
-        if filtered_df.empty:
-            print("⚠️  No contracts found with sufficient data")
-            return
-        
-        # Create Excel output
-        print("📁 Creating Excel file...")
-        create_excel_output(filtered_df, args.output, keywords, args.min_fields)
-        
-    finally:
-        conn.close()
+
+    # Search and filter in one streaming pass
+    print("🔍 Searching contracts...")
+    output = ContractsWorkbook(args.output)
+    matched = scan_contracts(
+        args.database, keywords, args.min_fields, output, args.chunk_size, args.workers
+    )
+
+    if matched == 0:
+        print("❌ No contracts found matching the keywords")
+        return
+
+    print(f"📋 Found {matched} contracts matching keywords")
+    print(f"📊 Found {matched} contracts, {output.rows} meet minimum field requirement ({args.min_fields})")
+
+    if output.rows == 0:
+        print(f"⚠️  No contracts meet minimum requirement. Returning all contracts with any data...")
+        scan_contracts(
+            args.database, keywords, args.min_fields, output, args.chunk_size, args.workers, basic_only=True
+        )
+        print(f"📊 Returning {output.rows} contracts with basic data")
+
+    if output.rows == 0:
+        print("⚠️  No contracts found with sufficient data")
+        return
+
+    # Summary sheet and save
+    print("📁 Creating Excel file...")
+    output.save([
+        ['Total Contracts Found', matched],
+        ['Contracts with Complete Data', output.rows],
+        ['Keywords Searched', ', '.join(keywords)],
+        ['Minimum Fields Required', args.min_fields],
+        ['Export Date', datetime.now().strftime('%Y-%m-%d %H:%M:%S')],
+    ])
+
+    print(f"📁 Excel file generated successfully: {args.output}")
+    print(f"📊 File contains {output.rows} contracts with complete data")
+    print(f"💾 File size: {os.path.getsize(args.output) / 1024:.1f} KB")
 
 
 if __name__ == '__main__':
@@ -22,182 +22,36 @@ from django.core.files import File
 from django.core.files.base import ContentFile
 from django.utils import timezone
 from src.apps.bid_record.models import BidDocument
+from src.apps.bid_record.utils.field_scanner import BID_FIELD_PATTERNS, BID_FIELD_SCANNER
+from src.utils.batch_output import BatchOutputSink
+from src.utils.db_writer import get_db_writer
+from src.utils.ingest_watcher import PDFDirectoryWatcher, stop_on_sigterm
+from src.utils.processing_manifest import ProcessingManifest, open_run_manifest
+from src.utils.process_logger import ProcessLogger, StageTimer, quiet_stdout, quietly, timed_stage
+from src.utils.work_queue import ErrorSummary, iter_pdf_files, run_bounded
 
-
-
-class ProcessLogger:
-    """Comprehensive logging for PDF processing operations"""
-    
-    def __init__(self, log_dir="logs"):
-        self.log_dir = Path(log_dir)
-        self.log_dir.mkdir(exist_ok=True)
-        
-        # Create timestamp for this session
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.session_id = f"extraction_session_{timestamp}"
-        
-        # Setup file logging
-        self.setup_file_logging()
-        
-        # Setup detailed CSV logging
-        self.setup_csv_logging()
-        
-        # Processing statistics
-        self.stats = {
-            'total_files': 0,
-            'successful': 0,
-            'failed': 0,
-            'skipped': 0,
-            'ignored': 0,
-            'start_time': datetime.now(),
-            'end_time': None
-        }
-    
-    def setup_file_logging(self):
-        """Setup file-based logging"""
-        log_file = self.log_dir / f"{self.session_id}.log"
-        
-        # Configure logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file, encoding='utf-8'),
-                logging.StreamHandler()  # Also print to console
-            ]
-        )
-        
-        self.logger = logging.getLogger(__name__)
-        self.log_file = log_file
-    
-    def setup_csv_logging(self):
-        """Setup CSV logging for detailed tracking"""
-        csv_file = self.log_dir / f"{self.session_id}_detailed.csv"
-        
-        # CSV headers
-        self.csv_headers = [
-            'timestamp', 'filename', 'status', 'reason', 'file_size', 
-            'processing_time', 'error_details', 'bid_number', 'pages_extracted'
-        ]
-        
-        # Create CSV file with headers
-        with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-            import csv
-            writer = csv.writer(f)
-            writer.writerow(self.csv_headers)
-        
-        self.csv_file = csv_file
-        self.csv_lock = threading.Lock()
-    
-    def log_file_processing(self, filename, status, reason="", file_size=0, 
-                          processing_time=0, error_details="", bid_number="", pages_extracted=0):
-        """Log a file processing result"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        # Log to file
-        if status == 'SUCCESS':
-            self.logger.info(f"✅ {filename}: {reason}")
-        elif status == 'SKIPPED':
-            self.logger.info(f"⏭️  {filename}: {reason}")
-        elif status == 'FAILED':
-            self.logger.error(f"❌ {filename}: {reason}")
-        elif status == 'IGNORED':
-            self.logger.warning(f"⚠️  {filename}: {reason}")
-        
-        # Log to CSV
-        with self.csv_lock:
-            with open(self.csv_file, 'a', newline='', encoding='utf-8') as f:
-                import csv
-                writer = csv.writer(f)
-                writer.writerow([
-                    timestamp, filename, status, reason, file_size,
-                    processing_time, error_details, bid_number, pages_extracted
-                ])
-        
-        # Update statistics
-        if status == 'SUCCESS':
-            self.stats['successful'] += 1
-        elif status == 'SKIPPED':
-            self.stats['skipped'] += 1
-        elif status == 'FAILED':
-            self.stats['failed'] += 1
-        elif status == 'IGNORED':
-            self.stats['ignored'] += 1
-    
-    def log_session_start(self, total_files):
-        """Log the start of a processing session"""
-        self.stats['total_files'] = total_files
-        self.logger.info(f"🚀 Starting PDF extraction session: {self.session_id}")
-        self.logger.info(f"📁 Total files to process: {total_files}")
-        self.logger.info(f"📂 Log directory: {self.log_dir}")
-        self.logger.info(f"📄 Detailed CSV log: {self.csv_file}")
-    
-    def log_session_end(self):
-        """Log the end of a processing session"""
-        self.stats['end_time'] = datetime.now()
-        duration = self.stats['end_time'] - self.stats['start_time']
-        
-        self.logger.info("="*80)
-        self.logger.info("📊 PROCESSING SESSION COMPLETE")
-        self.logger.info("="*80)
-        self.logger.info(f"📁 Total files found: {self.stats['total_files']}")
-        self.logger.info(f"✅ Successful extractions: {self.stats['successful']}")
-        self.logger.info(f"⏭️  Skipped (duplicates): {self.stats['skipped']}")
-        self.logger.info(f"❌ Failed extractions: {self.stats['failed']}")
-        self.logger.info(f"⚠️  Ignored files: {self.stats['ignored']}")
-        self.logger.info(f"⏱️  Total duration: {duration}")
-        self.logger.info(f"📄 Detailed logs saved to: {self.log_file}")
-        self.logger.info(f"📊 CSV summary saved to: {self.csv_file}")
-        self.logger.info("="*80)
-        
-        # Save session summary to JSON
-        summary_file = self.log_dir / f"{self.session_id}_summary.json"
-        summary_data = {
-            'session_id': self.session_id,
-            'start_time': self.stats['start_time'].isoformat(),
-            'end_time': self.stats['end_time'].isoformat(),
-            'duration_seconds': duration.total_seconds(),
-            'statistics': self.stats.copy(),
-            'log_files': {
-                'log_file': str(self.log_file),
-                'csv_file': str(self.csv_file),
-                'summary_file': str(summary_file)
-            }
-        }
-        
-        # Convert datetime objects to strings for JSON serialization
-        summary_data['statistics']['start_time'] = self.stats['start_time'].isoformat()
-        summary_data['statistics']['end_time'] = self.stats['end_time'].isoformat()
-        
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary_data, f, indent=2, ensure_ascii=False)
-        
-        self.logger.info(f"📋 Session summary saved to: {summary_file}")
-    
-    def get_log_files(self):
-        """Get list of log files for this session"""
-        return {
-            'log_file': self.log_file,
-            'csv_file': self.csv_file,
-            'summary_file': self.log_dir / f"{self.session_id}_summary.json"
-        }
+# Columns of the consolidated batch output table
+BID_RECORD_COLUMNS = list(BID_FIELD_PATTERNS) + ['source_file']
 
 
 
 class GeMBiddingPDFExtractor:
     def __init__(self, pdf_path):
         self.pdf_path = pdf_path
+        self.timings = StageTimer()
         self.extracted_data = {}
         self.bid_instance = None
     
     def extract_text_from_pdf(self):
         """Extract text from PDF using PyMuPDF"""
         try:
-            doc = fitz.open(self.pdf_path)
-            text = ""
-            for page in doc:
-                text += page.get_text()
-            doc.close()
+            with self.timings.stage('open'):
+                doc = fitz.open(self.pdf_path)
+            with self.timings.stage('text_extraction'):
+                text = ""
+                for page in doc:
+                    text += page.get_text()
+                doc.close()
             return text
         except Exception as e:
             print(f"Error extracting text from PDF: {e}")
@@ -214,6 +68,7 @@ class GeMBiddingPDFExtractor:
         text = ''.join(char for char in text if char.isprintable() or char.isspace())
         return text.strip()
     
+    @timed_stage('cleaning')
     def clean_text_remove_hindi(self, text):
         """Clean text and remove Hindi characters for storage in models"""
         if not text:
@@ -291,6 +146,12 @@ class GeMBiddingPDFExtractor:
         
         return ""
     
+    def scan_bid_fields(self, text):
+        """Extract every bid field with the compiled single-pass scanner"""
+        raw_values = BID_FIELD_SCANNER.scan(text)
+        return {field: self.clean_text(value) for field, value in raw_values.items()}
+    
+    @timed_stage('field_extraction')
     def extract_bidding_data_enhanced(self, text):
         """Enhanced extraction that handles both Hindi-first and English-first patterns"""
         bidding_data = {}
@@ -298,16 +159,10 @@ class GeMBiddingPDFExtractor:
         print(f"🔍 Extracting bidding data with enhanced pattern matching...")
         print(f"📝 Text length: {len(text)} characters")
         
-        # Extract dated with multiple patterns
-        date_patterns = [
-            r'dated\s*:\s*([^\n]+)',  # English first: "dated: 15-01-2025"
-            r'([^\n]+)\s*dated\s*:',  # Hindi first: "15-01-2025 dated:"
-            r'\d{1,2}-[A-Za-z]{3}-\d{4}',  # Direct date format
-            r'\d{1,2}/\d{1,2}/\d{4}',  # DD/MM/YYYY format
-            r'\d{4}-\d{1,2}-\d{1,2}'   # YYYY-MM-DD format
-        ]
+        # Locate every field in a single pass over the document
+        field_values = self.scan_bid_fields(text)
         
-        date_value = self.extract_field_value_robust(text, date_patterns)
+        date_value = field_values['dated']
         if date_value:
             # Try to parse the date
             try:
@@ -326,107 +181,44 @@ class GeMBiddingPDFExtractor:
         else:
             bidding_data['dated'] = None
         
-        # Extract bid number with multiple patterns
-        bid_patterns = [
-            r'bid\s*number\s*:\s*([^\n]+)',  # English first
-            r'([^\n]+)\s*bid\s*number\s*:',  # Hindi first
-            r'bid\s*no\s*:\s*([^\n]+)',     # Alternative English
-            r'([^\n]+)\s*bid\s*no\s*:',     # Alternative Hindi first
-            r'GEM\d{4}[A-Z]\d+',            # GEM format
-            r'GEM\w*-\d+',                  # GEM with dash
-            r'BID\s*:\s*([^\n]+)',          # BID: format
-            r'([^\n]+)\s*BID\s*:'           # BID: Hindi first
-        ]
-        
-        bid_value = self.extract_field_value_robust(text, bid_patterns)
+        # Extract bid number
+        bid_value = field_values['bid_number']
         bidding_data['bid_number'] = bid_value
         if bid_value:
             print(f"✅ Bid number extracted: {bid_value}")
         
-        # Extract beneficiary with multiple patterns
-        beneficiary_patterns = [
-            r'beneficiary\s*:\s*([^\n]+)',  # English first
-            r'([^\n]+)\s*beneficiary\s*:',  # Hindi first
-            r'Beneficiary\s*\n([^\n]+)',    # Multi-line format
-            r'([^\n]+)\s*Beneficiary\s*\n'  # Multi-line Hindi first
-        ]
-        
-        beneficiary_value = self.extract_field_value_robust(text, beneficiary_patterns)
+        # Extract beneficiary
+        beneficiary_value = field_values['beneficiary']
         bidding_data['beneficiary'] = beneficiary_value
         if beneficiary_value:
             print(f"✅ Beneficiary extracted: {beneficiary_value}")
         
-        # Extract ministry with multiple patterns
-        ministry_patterns = [
-            r'Ministry/State Name\s*\n([^\n]+)',  # Multi-line format
-            r'([^\n]+)\s*Ministry/State Name\s*\n',  # Multi-line Hindi first
-            r'ministry\s*:\s*([^\n]+)',            # English first
-            r'([^\n]+)\s*ministry\s*:',            # Hindi first
-            r'Ministry\s*\n([^\n]+)',              # Alternative multi-line
-            r'([^\n]+)\s*Ministry\s*\n'            # Alternative multi-line Hindi first
-        ]
-        
-        ministry_value = self.extract_field_value_robust(text, ministry_patterns)
+        # Extract ministry
+        ministry_value = field_values['ministry']
         bidding_data['ministry'] = ministry_value
         if ministry_value:
             print(f"✅ Ministry extracted: {ministry_value}")
         
-        # Extract department with multiple patterns
-        department_patterns = [
-            r'Department Name\s*\n([^\n]+)',  # Multi-line format
-            r'([^\n]+)\s*Department Name\s*\n',  # Multi-line Hindi first
-            r'department\s*:\s*([^\n]+)',        # English first
-            r'([^\n]+)\s*department\s*:',        # Hindi first
-            r'Department\s*\n([^\n]+)',          # Alternative multi-line
-            r'([^\n]+)\s*Department\s*\n'        # Alternative multi-line Hindi first
-        ]
-        
-        department_value = self.extract_field_value_robust(text, department_patterns)
+        # Extract department
+        department_value = field_values['department']
         bidding_data['department'] = department_value
         if department_value:
             print(f"✅ Department extracted: {department_value}")
         
-        # Extract organisation with multiple patterns
-        organisation_patterns = [
-            r'Organisation Name\s*\n([^\n]+)',  # Multi-line format
-            r'([^\n]+)\s*Organisation Name\s*\n',  # Multi-line Hindi first
-            r'organisation\s*:\s*([^\n]+)',        # English first
-            r'([^\n]+)\s*organisation\s*:',        # Hindi first
-            r'Organization\s*\n([^\n]+)',          # Alternative spelling
-            r'([^\n]+)\s*Organization\s*\n'        # Alternative spelling Hindi first
-        ]
-        
-        organisation_value = self.extract_field_value_robust(text, organisation_patterns)
+        # Extract organisation
+        organisation_value = field_values['organisation']
         bidding_data['organisation'] = organisation_value
         if organisation_value:
             print(f"✅ Organisation extracted: {organisation_value}")
         
-        # Extract contract period with multiple patterns
-        period_patterns = [
-            r'Contract Period\s*\n([^\n]+)',  # Multi-line format
-            r'([^\n]+)\s*Contract Period\s*\n',  # Multi-line Hindi first
-            r'contract\s*period\s*:\s*([^\n]+)',  # English first
-            r'([^\n]+)\s*contract\s*period\s*:',  # Hindi first
-            r'Period\s*\n([^\n]+)',               # Alternative format
-            r'([^\n]+)\s*Period\s*\n'             # Alternative format Hindi first
-        ]
-        
-        period_value = self.extract_field_value_robust(text, period_patterns)
+        # Extract contract period
+        period_value = field_values['contract_period']
         bidding_data['contract_period'] = period_value
         if period_value:
             print(f"✅ Contract period extracted: {period_value}")
         
-        # Extract item category with multiple patterns
-        category_patterns = [
-            r'Item Category\s*\n([^\n]+)',  # Multi-line format
-            r'([^\n]+)\s*Item Category\s*\n',  # Multi-line Hindi first
-            r'item\s*category\s*:\s*([^\n]+)',  # English first
-            r'([^\n]+)\s*item\s*category\s*:',  # Hindi first
-            r'Category\s*\n([^\n]+)',           # Alternative format
-            r'([^\n]+)\s*Category\s*\n'         # Alternative format Hindi first
-        ]
-        
-        category_value = self.extract_field_value_robust(text, category_patterns)
+        # Extract item category
+        category_value = field_values['item_category']
         if category_value:
             # Clean up the text - remove Hindi characters but keep English
             category_value = re.sub(r'[^\x00-\x7F]+', '', category_value)
@@ -436,47 +228,20 @@ class GeMBiddingPDFExtractor:
         else:
             bidding_data['item_category'] = ""
         
-        # Extract bid end datetime with multiple patterns
-        end_patterns = [
-            r'Bid End Date/Time\s*\n([^\n]+)',  # Multi-line format
-            r'([^\n]+)\s*Bid End Date/Time\s*\n',  # Multi-line Hindi first
-            r'bid\s*end\s*date\s*/\s*time\s*:\s*([^\n]+)',  # English first
-            r'([^\n]+)\s*bid\s*end\s*date\s*/\s*time\s*:',  # Hindi first
-            r'End Date\s*\n([^\n]+)',              # Alternative format
-            r'([^\n]+)\s*End Date\s*\n'            # Alternative format Hindi first
-        ]
-        
-        end_value = self.extract_field_value_robust(text, end_patterns)
+        # Extract bid end datetime
+        end_value = field_values['bid_end_datetime']
         bidding_data['bid_end_datetime'] = end_value
         if end_value:
             print(f"✅ Bid end datetime extracted: {end_value}")
         
-        # Extract bid open datetime with multiple patterns
-        open_patterns = [
-            r'Bid Opening\nDate/Time\s*\n([^\n]+)',  # Multi-line format
-            r'([^\n]+)\s*Bid Opening\nDate/Time\s*\n',  # Multi-line Hindi first
-            r'bid\s*opening\s*date\s*/\s*time\s*:\s*([^\n]+)',  # English first
-            r'([^\n]+)\s*bid\s*opening\s*date\s*/\s*time\s*:',  # Hindi first
-            r'Opening Date\s*\n([^\n]+)',              # Alternative format
-            r'([^\n]+)\s*Opening Date\s*\n'            # Alternative format Hindi first
-        ]
-        
-        open_value = self.extract_field_value_robust(text, open_patterns)
+        # Extract bid open datetime
+        open_value = field_values['bid_open_datetime']
         bidding_data['bid_open_datetime'] = open_value
         if open_value:
             print(f"✅ Bid open datetime extracted: {open_value}")
         
-        # Extract bid offer validity days with multiple patterns
-        validity_patterns = [
-            r'Bid Offer\nValidity \(From End Date\)\s*\n([^\n]+)',  # Multi-line format
-            r'([^\n]+)\s*Bid Offer\nValidity \(From End Date\)\s*\n',  # Multi-line Hindi first
-            r'validity\s*:\s*([^\n]+)',  # English first
-            r'([^\n]+)\s*validity\s*:',  # Hindi first
-            r'Validity\s*\n([^\n]+)',    # Alternative format
-            r'([^\n]+)\s*Validity\s*\n'  # Alternative format Hindi first
-        ]
-        
-        validity_value = self.extract_field_value_robust(text, validity_patterns)
+        # Extract bid offer validity days
+        validity_value = field_values['bid_offer_validity_days']
         if validity_value:
             # Try to extract numeric value
             numeric_match = re.search(r'(\d+)', validity_value)
@@ -491,17 +256,8 @@ class GeMBiddingPDFExtractor:
         else:
             bidding_data['bid_offer_validity_days'] = None
         
-        # Extract similar category with multiple patterns
-        similar_patterns = [
-            r'Similar Category\s*\n([^\n]+)',  # Multi-line format
-            r'([^\n]+)\s*Similar Category\s*\n',  # Multi-line Hindi first
-            r'similar\s*category\s*:\s*([^\n]+)',  # English first
-            r'([^\n]+)\s*similar\s*category\s*:',  # Hindi first
-            r'Similar\s*\n([^\n]+)',              # Alternative format
-            r'([^\n]+)\s*Similar\s*\n'            # Alternative format Hindi first
-        ]
-        
-        similar_value = self.extract_field_value_robust(text, similar_patterns)
+        # Extract similar category
+        similar_value = field_values['similar_category']
         if similar_value:
             # Clean up the text - remove Hindi characters but keep English
             similar_value = re.sub(r'[^\x00-\x7F]+', '', similar_value)
@@ -511,17 +267,8 @@ class GeMBiddingPDFExtractor:
         else:
             bidding_data['similar_category'] = ""
         
-        # Extract MSE exemption with multiple patterns
-        mse_patterns = [
-            r'MSE Exemption\s*\n([^\n]+)',  # Multi-line format
-            r'([^\n]+)\s*MSE Exemption\s*\n',  # Multi-line Hindi first
-            r'mse\s*exemption\s*:\s*([^\n]+)',  # English first
-            r'([^\n]+)\s*mse\s*exemption\s*:',  # Hindi first
-            r'MSE\s*\n([^\n]+)',                # Alternative format
-            r'([^\n]+)\s*MSE\s*\n'              # Alternative format Hindi first
-        ]
-        
-        mse_value = self.extract_field_value_robust(text, mse_patterns)
+        # Extract MSE exemption
+        mse_value = field_values['mse_exemption']
         bidding_data['mse_exemption'] = mse_value
         if mse_value:
             print(f"✅ MSE exemption extracted: {mse_value}")
@@ -570,8 +317,9 @@ class GeMBiddingPDFExtractor:
         print("⚠️  Embedding generation disabled - AI search functionality removed")
         return None
     
+    @timed_stage('db_save')
     def save_to_django_models(self, text):
-        """Save extracted data to Django models"""
+        """Save extracted data to Django models (the insert runs on the process-wide writer thread)"""
         try:
             # Check if bid already exists
             bid_number = self.extracted_data.get('bid_number', '')
@@ -580,36 +328,12 @@ class GeMBiddingPDFExtractor:
                 print(f"⏭️  Bid {bid_number} already exists, skipping...")
                 return False
             
-            # Store cleaned text (without Hindi) in raw_text field
+            # Store cleaned text (without Hindi) in raw_text field; cleaned here, not on the writer thread
             cleaned_text = self.clean_text_remove_hindi(text)
             
-            # Save the PDF file
-            pdf_filename = os.path.basename(self.pdf_path)
-            with open(self.pdf_path, 'rb') as pdf_file:
-                from django.core.files import File
-                pdf_file_obj = File(pdf_file, name=pdf_filename)
-                
-                print(f"💾 Saving bid to database: {bid_number}")
-                
-                # Create BidDocument instance with updated fields including file
-                self.bid_instance = BidDocument.objects.create(
-                    file=pdf_file_obj,
-                    dated=self.extracted_data.get('dated'),
-                    source_file=self.extracted_data.get('source_file', ''),
-                    bid_number=bid_number,
-                    beneficiary=self.extracted_data.get('beneficiary', ''),
-                    ministry=self.extracted_data.get('ministry', ''),
-                    department=self.extracted_data.get('department', ''),
-                    organisation=self.extracted_data.get('organisation', ''),
-                    contract_period=self.extracted_data.get('contract_period', ''),
-                    item_category=self.extracted_data.get('item_category', ''),
-                    bid_end_datetime=self.extracted_data.get('bid_end_datetime', ''),
-                    bid_open_datetime=self.extracted_data.get('bid_open_datetime', ''),
-                    bid_offer_validity_days=self.extracted_data.get('bid_offer_validity_days'),
-                    similar_category=self.extracted_data.get('similar_category', ''),
-                    mse_exemption=self.extracted_data.get('mse_exemption', ''),
-                    raw_text=cleaned_text
-                )
+            if not get_db_writer().run(self.write_bid, bid_number, cleaned_text):
+                print(f"⏭️  Bid {bid_number} already exists, skipping...")
+                return False
             
             print(f"✅ SUCCESS: Bid saved successfully to database")
             return True
@@ -620,6 +344,40 @@ class GeMBiddingPDFExtractor:
             traceback.print_exc()
             return False
     
+    def write_bid(self, bid_number, cleaned_text):
+        """Insert the BidDocument (writer thread only); False when another worker saved it meanwhile"""
+        if self.check_bid_exists(bid_number):
+            return False
+        
+        # Save the PDF file
+        pdf_filename = os.path.basename(self.pdf_path)
+        with open(self.pdf_path, 'rb') as pdf_file:
+            from django.core.files import File
+            pdf_file_obj = File(pdf_file, name=pdf_filename)
+            
+            print(f"💾 Saving bid to database: {bid_number}")
+            
+            # Create BidDocument instance with updated fields including file
+            self.bid_instance = BidDocument.objects.create(
+                file=pdf_file_obj,
+                dated=self.extracted_data.get('dated'),
+                source_file=self.extracted_data.get('source_file', ''),
+                bid_number=bid_number,
+                beneficiary=self.extracted_data.get('beneficiary', ''),
+                ministry=self.extracted_data.get('ministry', ''),
+                department=self.extracted_data.get('department', ''),
+                organisation=self.extracted_data.get('organisation', ''),
+                contract_period=self.extracted_data.get('contract_period', ''),
+                item_category=self.extracted_data.get('item_category', ''),
+                bid_end_datetime=self.extracted_data.get('bid_end_datetime', ''),
+                bid_open_datetime=self.extracted_data.get('bid_open_datetime', ''),
+                bid_offer_validity_days=self.extracted_data.get('bid_offer_validity_days'),
+                similar_category=self.extracted_data.get('similar_category', ''),
+                mse_exemption=self.extracted_data.get('mse_exemption', ''),
+                raw_text=cleaned_text
+            )
+        return True
+    
     def extract_all_data(self):
         """Extract all required data from PDF"""
         print(f"📄 Extracting text from PDF: {os.path.basename(self.pdf_path)}")
@@ -636,6 +394,7 @@ class GeMBiddingPDFExtractor:
         
         return self.extracted_data
     
+    @timed_stage('excel_export')
     def export_to_excel(self, output_path=None):
         """Export extracted data to Excel"""
         if output_path is None:
@@ -680,6 +439,7 @@ class GeMBiddingPDFExtractor:
             print(f"❌ Error exporting to Excel: {e}")
             return False
     
+    @timed_stage('json_export')
     def export_to_json(self, output_path=None):
         """Export extracted data to JSON"""
         if output_path is None:
@@ -696,22 +456,7 @@ class GeMBiddingPDFExtractor:
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
         try:
-            # Clean data for JSON export - handle date objects properly
-            clean_data = {}
-            for field, value in self.extracted_data.items():
-                if field == 'raw_text':
-                    # Skip raw text in JSON export to keep file size manageable
-                    continue
-                if hasattr(value, 'isoformat'):  # Check if it's a date-like object
-                    # Convert date objects to ISO format strings
-                    clean_data[field] = value.isoformat()
-                elif isinstance(value, str):
-                    # Clean the value for JSON
-                    clean_value = re.sub(r'[^\x00-\x7F]+', '', value)  # Remove non-ASCII
-                    clean_value = re.sub(r'\s+', ' ', clean_value).strip()  # Normalize whitespace
-                    clean_data[field] = clean_value
-                else:
-                    clean_data[field] = value
+            clean_data = self.export_record()
             
             with open(output_path, 'w', encoding='utf-8') as f:
                 json.dump(clean_data, f, indent=2, ensure_ascii=False)
@@ -722,6 +467,25 @@ class GeMBiddingPDFExtractor:
             print(f"❌ Error exporting to JSON: {e}")
             return False
     
+    def export_record(self):
+        """Extracted data cleaned for JSON output (no raw text, ISO dates)"""
+        clean_data = {}
+        for field, value in self.extracted_data.items():
+            if field == 'raw_text':
+                # Skip raw text in JSON export to keep file size manageable
+                continue
+            if hasattr(value, 'isoformat'):  # Check if it's a date-like object
+                # Convert date objects to ISO format strings
+                clean_data[field] = value.isoformat()
+            elif isinstance(value, str):
+                # Clean the value for JSON
+                clean_value = re.sub(r'[^\x00-\x7F]+', '', value)  # Remove non-ASCII
+                clean_value = re.sub(r'\s+', ' ', clean_value).strip()  # Normalize whitespace
+                clean_data[field] = clean_value
+            else:
+                clean_data[field] = value
+        return clean_data
+    
     def print_extracted_data(self):
         """Print extracted data in a formatted way"""
         print("\n" + "="*80)
@@ -827,7 +591,8 @@ def find_all_pdfs_in_data_directory_recursive(data_dir):
     
     return pdf_files
 
-def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
+def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4, quiet=False, per_file_exports=False,
+                                                      columnar_format='csv', resume=False, retry_failed=False):
     """Process all PDFs in data directory using multi-threading with improved efficiency"""
     # Setup Django environment first
     import os
@@ -849,18 +614,30 @@ def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
     data_dir.mkdir(exist_ok=True)
     extracted_data_dir.mkdir(exist_ok=True)
     
-    # Find all PDF files recursively
-    pdf_files = find_all_pdfs_in_data_directory_recursive(str(data_dir))
+    # PDFs are found while the workers run; the bounded queue between them
+    # caps how many paths are held, however large the tree is
+    found = 0
     
-    if not pdf_files:
-        print("❌ No PDF files found in data directory or subdirectories")
-        return
+    def discover():
+        nonlocal found
+        for pdf_path in iter_pdf_files(data_dir):
+            found += 1
+            yield pdf_path
+    
+    # Every finished file is recorded so an interrupted run can be resumed
+    manifest = ProcessingManifest(Path(__file__).parent / "processing_manifest.sqlite3")
+    pdf_files = discover()
+    if resume or retry_failed:
+        pdf_files = manifest.iter_pending(pdf_files, retry_failed=retry_failed)
     
     # Initialize comprehensive logger
-    logger = ProcessLogger()
-    logger.log_session_start(len(pdf_files))
+    logger = ProcessLogger(record_field='bid_number', quiet=quiet, manifest=manifest)
+    logger.log_session_start()
     
-    print(f"📁 Found {len(pdf_files)} PDF files in data directory and subdirectories")
+    # One JSON Lines and one columnar file for the whole session
+    output_sink = BatchOutputSink(extracted_data_dir, logger.session_id, columnar_format, columns=BID_RECORD_COLUMNS)
+    
+    print(f"📁 Streaming PDFs from {data_dir} and subdirectories")
     print(f"🚀 Starting multi-threaded processing with {max_workers} workers...")
     print(f"📄 Logging to: {logger.log_dir}")
     print("="*80)
@@ -869,7 +646,7 @@ def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
     successful_extractions = 0
     failed_extractions = 0
     skipped_extractions = 0
-    error_details = []
+    errors = ErrorSummary()
     
     # Thread lock for safe counter updates
     counter_lock = threading.Lock()
@@ -878,10 +655,11 @@ def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
     
     def process_pdf_with_counter(pdf_path):
         """Process a single PDF and update counters safely"""
-        nonlocal successful_extractions, failed_extractions, skipped_extractions, error_details
+        nonlocal successful_extractions, failed_extractions, skipped_extractions
         
         file_start_time = time.time()
         filename = os.path.basename(pdf_path)
+        extractor = None
         
         try:
             # Ensure Django is set up in this thread
@@ -899,12 +677,12 @@ def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
                 processing_time = time.time() - file_start_time
                 
                 logger.log_file_processing(
-                    filename, 'IGNORED', error_msg, file_size, processing_time
+                    filename, 'IGNORED', error_msg, file_size, processing_time, pdf_path=pdf_path
                 )
                 
                 with counter_lock:
                     failed_extractions += 1
-                    error_details.append(error_msg)
+                errors.add(error_msg)
                 print(f"❌ {error_msg}")
                 return False
             
@@ -915,12 +693,12 @@ def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
                 processing_time = time.time() - file_start_time
                 
                 logger.log_file_processing(
-                    filename, 'IGNORED', error_msg, file_size, processing_time
+                    filename, 'IGNORED', error_msg, file_size, processing_time, pdf_path=pdf_path
                 )
                 
                 with counter_lock:
                     failed_extractions += 1
-                    error_details.append(error_msg)
+                errors.add(error_msg)
                 print(f"❌ {error_msg}")
                 return False
             
@@ -934,9 +712,12 @@ def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
                 # Save to Django models
                 text = extractor.extract_text_from_pdf()
                 if extractor.save_to_django_models(text):
-                    # Export to Excel and JSON
-                    extractor.export_to_excel()
-                    extractor.export_to_json()
+                    # Append to the session output; per-file Excel/JSON is opt-in
+                    with extractor.timings.stage('batch_output'):
+                        output_sink.append(extractor.export_record())
+                    if per_file_exports:
+                        extractor.export_to_excel()
+                        extractor.export_to_json()
                     
                     # Get bid details for logging
                     bid_data = extractor.extract_bidding_data_enhanced(text)
@@ -948,7 +729,8 @@ def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
                     logger.log_file_processing(
                         filename, 'SUCCESS', 
                         f"Successfully extracted and saved to database", 
-                        file_size, processing_time, "", bid_number, pages_extracted
+                        file_size, processing_time, "", bid_number, pages_extracted,
+                        stage_timings=extractor.timings.as_dict(), pdf_path=pdf_path
                     )
                     
                     # Update counter safely
@@ -969,7 +751,8 @@ def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
                         logger.log_file_processing(
                             filename, 'SKIPPED', 
                             f"Bid already exists in database", 
-                            file_size, processing_time, "", bid_number, pages_extracted
+                            file_size, processing_time, "", bid_number, pages_extracted,
+                            stage_timings=extractor.timings.as_dict(), pdf_path=pdf_path
                         )
                         
                         with counter_lock:
@@ -982,12 +765,13 @@ def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
                         
                         logger.log_file_processing(
                             filename, 'FAILED', error_msg, file_size, processing_time, 
-                            "Database save operation failed", bid_number, pages_extracted
+                            "Database save operation failed", bid_number, pages_extracted,
+                            stage_timings=extractor.timings.as_dict(), pdf_path=pdf_path
                         )
                         
                         with counter_lock:
                             failed_extractions += 1
-                            error_details.append(error_msg)
+                        errors.add(error_msg)
                         print(f"❌ {error_msg}")
                         return False
             else:
@@ -996,12 +780,12 @@ def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
                 
                 logger.log_file_processing(
                     filename, 'FAILED', error_msg, file_size, processing_time, 
-                    "PDF text extraction failed", "", 0
+                    "PDF text extraction failed", "", 0, stage_timings=extractor.timings.as_dict(), pdf_path=pdf_path
                 )
                 
                 with counter_lock:
                     failed_extractions += 1
-                    error_details.append(error_msg)
+                errors.add(error_msg)
                 print(f"❌ {error_msg}")
                 return False
                 
@@ -1011,51 +795,48 @@ def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
             
             logger.log_file_processing(
                 filename, 'FAILED', error_msg, file_size, processing_time, 
-                str(e), "", 0
+                str(e), "", 0, stage_timings=extractor.timings.as_dict() if extractor else None, pdf_path=pdf_path
             )
             
             with counter_lock:
                 failed_extractions += 1
-                error_details.append(error_msg)
+            errors.add(f"Exception during processing ({type(e).__name__})", str(e))
             print(f"❌ {error_msg}")
             return False
     
-    # Process PDFs using ThreadPoolExecutor with improved task distribution
-    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="PDF_Worker") as executor:
-        # Submit all tasks - each thread will get a different file
-        future_to_pdf = {}
-        
-        # Distribute files evenly across threads
-        for i, pdf_path in enumerate(pdf_files):
-            # Submit task and store future
-            future = executor.submit(process_pdf_with_counter, pdf_path)
-            future_to_pdf[future] = pdf_path
-        
-        print(f"📤 Submitted {len(pdf_files)} tasks to {max_workers} worker threads")
-        print("🔄 Workers are processing files concurrently...")
-        
-        # Process completed tasks and show progress
-        completed = 0
-        for future in as_completed(future_to_pdf):
-            pdf_path = future_to_pdf[future]
+    completed = 0
+    
+    def show_progress(pdf_path, result):
+        nonlocal completed
+        with counter_lock:
             completed += 1
-            
-            try:
-                # Get result (this will raise any exceptions that occurred)
-                success = future.result()
-                
-                # Show progress
-                progress = (completed / len(pdf_files)) * 100
-                print(f"📊 Progress: {completed}/{len(pdf_files)} ({progress:.1f}%) - {os.path.basename(pdf_path)}")
-                
-            except Exception as e:
-                print(f"❌ Exception in thread for {os.path.basename(pdf_path)}: {e}")
+            done = completed
+        if isinstance(result, Exception):
+            print(f"❌ Exception in thread for {os.path.basename(pdf_path)}: {result}")
+        else:
+            print(f"📊 Progress: {done} processed, {found} found - {os.path.basename(pdf_path)}")
+    
+    # Discovery feeds a bounded queue that the worker threads drain
+    with quiet_stdout(quiet):
+        print(f"🔄 {max_workers} worker threads are processing files as they are found...")
+        submitted = run_bounded(
+            pdf_files, quietly(process_pdf_with_counter, quiet), max_workers=max_workers,
+            on_result=quietly(show_progress, quiet), thread_name_prefix="PDF_Worker"
+        )
+    
+    if not found:
+        print("❌ No PDF files found in data directory or subdirectories")
+    elif resume or retry_failed:
+        print(f"⏩ Resumed from manifest: {found - submitted}/{found} PDFs already processed")
     
+    output_sink.close()
     end_time = time.time()
     processing_time = end_time - start_time
     
     # Log session completion
+    logger.stats['total_files'] = found
     logger.log_session_end()
+    manifest.close()
     
     print("\n" + "="*80)
     print("📊 OPTIMIZED MULTI-THREADED EXTRACTION SUMMARY")
@@ -1063,10 +844,13 @@ def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
     print(f"✅ Successful extractions: {successful_extractions}")
     print(f"⏭️  Skipped (duplicates): {skipped_extractions}")
     print(f"❌ Failed extractions: {failed_extractions}")
-    print(f"📁 Total PDFs found: {len(pdf_files)}")
-    print(f"📂 Excel/JSON files saved to: {extracted_data_dir}")
+    print(f"📁 Total PDFs found: {found}")
+    print(f"📦 Batch records ({output_sink.records_written}): {output_sink.jsonl_file}")
+    print(f"📦 Batch table: {output_sink.columnar_file}")
+    if per_file_exports:
+        print(f"📂 Excel/JSON files saved to: {extracted_data_dir}")
     print(f"⏱️  Total processing time: {processing_time:.2f} seconds")
-    print(f"🚀 Average time per PDF: {processing_time/len(pdf_files):.2f} seconds")
+    print(f"🚀 Average time per PDF: {processing_time/max(submitted, 1):.2f} seconds")
     print(f"⚡ Speed improvement: {max_workers}x faster than single-threaded")
     
     # Show log file locations
@@ -1076,17 +860,14 @@ def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
     print(f"  📊 CSV summary: {log_files['csv_file']}")
     print(f"  📋 Session summary: {log_files['summary_file']}")
     
-    # Show error details if any
-    if error_details:
-        print(f"\n❌ ERROR DETAILS ({len(error_details)} errors):")
-        for i, error in enumerate(error_details[:20], 1):  # Show first 20 errors
-            print(f"  {i}. {error}")
-        if len(error_details) > 20:
-            print(f"  ... and {len(error_details) - 20} more errors")
+    # Show error counts by category
+    if errors:
+        errors.print_report()
     
     print("="*80)
 
-def process_all_pdfs_ultra_fast(max_workers=8):
+def process_all_pdfs_ultra_fast(max_workers=8, quiet=False, per_file_exports=False, columnar_format='csv',
+                                resume=False, retry_failed=False):
     """Process all PDFs using ultra-fast chunked multithreading"""
     # Setup Django environment first
     import os
@@ -1115,10 +896,21 @@ def process_all_pdfs_ultra_fast(max_workers=8):
         print("❌ No PDF files found in data directory or subdirectories")
         return
     
+    # Every finished file is recorded so an interrupted run can be resumed
+    manifest, pdf_files = open_run_manifest(
+        Path(__file__).parent / "processing_manifest.sqlite3", pdf_files, resume, retry_failed
+    )
+    if not pdf_files:
+        manifest.close()
+        return
+    
     # Initialize comprehensive logger
-    logger = ProcessLogger()
+    logger = ProcessLogger(record_field='bid_number', quiet=quiet, manifest=manifest)
     logger.log_session_start(len(pdf_files))
     
+    # One JSON Lines and one columnar file for the whole session
+    output_sink = BatchOutputSink(extracted_data_dir, logger.session_id, columnar_format, columns=BID_RECORD_COLUMNS)
+    
     print(f"📁 Found {len(pdf_files)} PDF files in data directory and subdirectories")
     print(f"🚀 Starting ULTRA-FAST processing with {max_workers} workers...")
     print(f"📄 Logging to: {logger.log_dir}")
@@ -1141,47 +933,9 @@ def process_all_pdfs_ultra_fast(max_workers=8):
         chunk_results = []
         
         for pdf_path in pdf_chunk:
-            try:
-                # Ensure Django is set up in this thread
-                import django
-                if not django.conf.settings.configured:
-                    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'pdf_data.settings')
-                    django.setup()
-                
-                print(f"🔄 Processing: {os.path.basename(pdf_path)}")
-                
-                extractor = GeMBiddingPDFExtractor(pdf_path)
-                
-                # Extract data
-                data = extractor.extract_all_data()
-                
-                if data:
-                    # Save to Django models
-                    text = extractor.extract_text_from_pdf()
-                    if extractor.save_to_django_models(text):
-                        # Export to Excel and JSON
-                        extractor.export_to_excel()
-                        extractor.export_to_json()
-                        
-                        chunk_results.append(('success', pdf_path))
-                        print(f"✅ Successfully processed: {os.path.basename(pdf_path)}")
-                    else:
-                        # Check if it was skipped due to duplicate
-                        bid_data = extractor.extract_bidding_data_enhanced(extractor.extract_text_from_pdf())
-                        bid_number = bid_data.get('bid_number', '')
-                        if extractor.check_bid_exists(bid_number):
-                            chunk_results.append(('skipped', pdf_path))
-                            print(f"⏭️  Skipped (already exists): {os.path.basename(pdf_path)}")
-                        else:
-                            chunk_results.append(('failed', pdf_path))
-                            print(f"❌ Failed to save: {os.path.basename(pdf_path)}")
-                else:
-                    chunk_results.append(('failed', pdf_path))
-                    print(f"❌ Failed to extract data from: {os.path.basename(pdf_path)}")
-                    
-            except Exception as e:
-                chunk_results.append(('failed', pdf_path))
-                print(f"❌ Error processing {os.path.basename(pdf_path)}: {e}")
+            # Logged, timed and recorded in the manifest like the other modes
+            status = process_pdf_for_ingest(pdf_path, logger, output_sink, per_file_exports)
+            chunk_results.append(('failed' if status == 'IGNORED' else status.lower(), pdf_path))
         
         # Update counters safely
         with counter_lock:
@@ -1203,12 +957,12 @@ def process_all_pdfs_ultra_fast(max_workers=8):
     print(f"🔧 Each worker will process ~{chunk_size} files")
     
     # Process PDFs using ThreadPoolExecutor with chunked distribution
-    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Ultra_Worker") as executor:
+    with quiet_stdout(quiet), ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Ultra_Worker") as executor:
         # Submit chunked tasks - each thread gets a different chunk of files
         future_to_chunk = {}
         
         for i, chunk in enumerate(file_chunks):
-            future = executor.submit(process_pdf_chunk, chunk)
+            future = executor.submit(quietly(process_pdf_chunk, quiet), chunk)
             future_to_chunk[future] = f"Chunk_{i+1}"
         
         print(f"📤 Submitted {len(file_chunks)} chunks to {max_workers} worker threads")
@@ -1237,11 +991,13 @@ def process_all_pdfs_ultra_fast(max_workers=8):
             except Exception as e:
                 print(f"❌ Exception in chunk {chunk_name}: {e}")
     
+    output_sink.close()
     end_time = time.time()
     processing_time = end_time - start_time
     
     # Log session completion
     logger.log_session_end()
+    manifest.close()
     
     print("\n" + "="*80)
     print("📊 ULTRA-FAST MULTI-THREADED EXTRACTION SUMMARY")
@@ -1250,7 +1006,10 @@ def process_all_pdfs_ultra_fast(max_workers=8):
     print(f"⏭️  Skipped (duplicates): {skipped_extractions}")
     print(f"❌ Failed extractions: {failed_extractions}")
     print(f"📁 Total PDFs found: {len(pdf_files)}")
-    print(f"📂 Excel/JSON files saved to: {extracted_data_dir}")
+    print(f"📦 Batch records ({output_sink.records_written}): {output_sink.jsonl_file}")
+    print(f"📦 Batch table: {output_sink.columnar_file}")
+    if per_file_exports:
+        print(f"📂 Excel/JSON files saved to: {extracted_data_dir}")
     print(f"⏱️  Total processing time: {processing_time:.2f} seconds")
     print(f"🚀 Average time per PDF: {processing_time/len(pdf_files):.2f} seconds")
     print(f"⚡ Speed improvement: {max_workers}x faster than single-threaded")
@@ -1265,7 +1024,8 @@ def process_all_pdfs_ultra_fast(max_workers=8):
     
     print("="*80)
 
-def process_all_pdfs_in_data_directory():
+def process_all_pdfs_in_data_directory(quiet=False, per_file_exports=False, columnar_format='csv',
+                                       resume=False, retry_failed=False):
     """Process all PDFs in data directory (single-threaded)"""
     # Setup Django environment first
     import os
@@ -1294,10 +1054,21 @@ def process_all_pdfs_in_data_directory():
         print("❌ No PDF files found in data directory or subdirectories")
         return
     
+    # Every finished file is recorded so an interrupted run can be resumed
+    manifest, pdf_files = open_run_manifest(
+        Path(__file__).parent / "processing_manifest.sqlite3", pdf_files, resume, retry_failed
+    )
+    if not pdf_files:
+        manifest.close()
+        return
+    
     # Initialize comprehensive logger
-    logger = ProcessLogger()
+    logger = ProcessLogger(record_field='bid_number', quiet=quiet, manifest=manifest)
     logger.log_session_start(len(pdf_files))
     
+    # One JSON Lines and one columnar file for the whole session
+    output_sink = BatchOutputSink(extracted_data_dir, logger.session_id, columnar_format, columns=BID_RECORD_COLUMNS)
+    
     print(f"📁 Found {len(pdf_files)} PDF files in data directory and subdirectories")
     print("🚀 Starting single-threaded processing...")
     print(f"📄 Logging to: {logger.log_dir}")
@@ -1312,131 +1083,142 @@ def process_all_pdfs_in_data_directory():
     start_time = time.time()
     
     # Process each PDF
-    for i, pdf_path in enumerate(pdf_files, 1):
-        try:
-            print(f"\n🔄 Processing {i}/{len(pdf_files)}: {os.path.basename(pdf_path)}")
+    with quiet_stdout(quiet):
+        for i, pdf_path in enumerate(pdf_files, 1):
+            try:
+                print(f"\n🔄 Processing {i}/{len(pdf_files)}: {os.path.basename(pdf_path)}")
             
-            file_start_time = time.time()
-            filename = os.path.basename(pdf_path)
+                file_start_time = time.time()
+                filename = os.path.basename(pdf_path)
+                extractor = None
             
-            # Check if file is readable
-            if not os.access(pdf_path, os.R_OK):
-                error_msg = f"File not readable (permission denied)"
-                file_size = 0
-                processing_time = time.time() - file_start_time
+                # Check if file is readable
+                if not os.access(pdf_path, os.R_OK):
+                    error_msg = f"File not readable (permission denied)"
+                    file_size = 0
+                    processing_time = time.time() - file_start_time
                 
-                logger.log_file_processing(
-                    filename, 'IGNORED', error_msg, file_size, processing_time
-                )
+                    logger.log_file_processing(
+                        filename, 'IGNORED', error_msg, file_size, processing_time, pdf_path=pdf_path
+                    )
                 
-                failed_extractions += 1
-                error_details.append(error_msg)
-                print(f"❌ {error_msg}")
-                continue
+                    failed_extractions += 1
+                    error_details.append(error_msg)
+                    print(f"❌ {error_msg}")
+                    continue
             
-            # Check file size
-            file_size = os.path.getsize(pdf_path)
-            if file_size == 0:
-                error_msg = f"Empty file (0 bytes)"
-                processing_time = time.time() - file_start_time
+                # Check file size
+                file_size = os.path.getsize(pdf_path)
+                if file_size == 0:
+                    error_msg = f"Empty file (0 bytes)"
+                    processing_time = time.time() - file_start_time
                 
-                logger.log_file_processing(
-                    filename, 'IGNORED', error_msg, file_size, processing_time
-                )
+                    logger.log_file_processing(
+                        filename, 'IGNORED', error_msg, file_size, processing_time, pdf_path=pdf_path
+                    )
                 
-                failed_extractions += 1
-                error_details.append(error_msg)
-                print(f"❌ {error_msg}")
-                continue
+                    failed_extractions += 1
+                    error_details.append(error_msg)
+                    print(f"❌ {error_msg}")
+                    continue
             
-            extractor = GeMBiddingPDFExtractor(pdf_path)
+                extractor = GeMBiddingPDFExtractor(pdf_path)
             
-            # Extract data
-            data = extractor.extract_all_data()
+                # Extract data
+                data = extractor.extract_all_data()
             
-            if data:
-                # Save to Django models
-                text = extractor.extract_text_from_pdf()
-                if extractor.save_to_django_models(text):
-                    # Export to Excel and JSON
-                    extractor.export_to_excel()
-                    extractor.export_to_json()
+                if data:
+                    # Save to Django models
+                    text = extractor.extract_text_from_pdf()
+                    if extractor.save_to_django_models(text):
+                        # Append to the session output; per-file Excel/JSON is opt-in
+                        with extractor.timings.stage('batch_output'):
+                            output_sink.append(extractor.export_record())
+                        if per_file_exports:
+                            extractor.export_to_excel()
+                            extractor.export_to_json()
                     
-                    # Get bid details for logging
-                    bid_data = extractor.extract_bidding_data_enhanced(extractor.extract_text_from_pdf())
-                    bid_number = bid_data.get('bid_number', '')
-                    pages_extracted = len(text.split('\n')) if text else 0
+                        # Get bid details for logging
+                        bid_data = extractor.extract_bidding_data_enhanced(extractor.extract_text_from_pdf())
+                        bid_number = bid_data.get('bid_number', '')
+                        pages_extracted = len(text.split('\n')) if text else 0
                     
-                    processing_time = time.time() - file_start_time
+                        processing_time = time.time() - file_start_time
                     
-                    logger.log_file_processing(
-                        filename, 'SUCCESS', 
-                        f"Successfully extracted and saved to database", 
-                        file_size, processing_time, "", bid_number, pages_extracted
-                    )
+                        logger.log_file_processing(
+                            filename, 'SUCCESS', 
+                            f"Successfully extracted and saved to database", 
+                            file_size, processing_time, "", bid_number, pages_extracted,
+                            stage_timings=extractor.timings.as_dict(), pdf_path=pdf_path
+                        )
                     
-                    successful_extractions += 1
-                    print(f"✅ Successfully processed: {filename}")
-                else:
-                    # Check if it was skipped due to duplicate
-                    bid_data = extractor.extract_bidding_data_enhanced(extractor.extract_text_from_pdf())
-                    bid_number = bid_data.get('bid_number', '')
-                    pages_extracted = len(text.split('\n')) if text else 0
+                        successful_extractions += 1
+                        print(f"✅ Successfully processed: {filename}")
+                    else:
+                        # Check if it was skipped due to duplicate
+                        bid_data = extractor.extract_bidding_data_enhanced(extractor.extract_text_from_pdf())
+                        bid_number = bid_data.get('bid_number', '')
+                        pages_extracted = len(text.split('\n')) if text else 0
                     
-                    if extractor.check_bid_exists(bid_number):
-                        processing_time = time.time() - file_start_time
+                        if extractor.check_bid_exists(bid_number):
+                            processing_time = time.time() - file_start_time
                         
-                        logger.log_file_processing(
-                            filename, 'SKIPPED', 
-                            f"Bid already exists in database", 
-                            file_size, processing_time, "", bid_number, pages_extracted
-                        )
+                            logger.log_file_processing(
+                                filename, 'SKIPPED', 
+                                f"Bid already exists in database", 
+                                file_size, processing_time, "", bid_number, pages_extracted,
+                                stage_timings=extractor.timings.as_dict(), pdf_path=pdf_path
+                            )
                         
-                        skipped_extractions += 1
-                        print(f"⏭️  Skipped (already exists): {filename}")
-                    else:
-                        error_msg = f"Failed to save to database"
-                        processing_time = time.time() - file_start_time
+                            skipped_extractions += 1
+                            print(f"⏭️  Skipped (already exists): {filename}")
+                        else:
+                            error_msg = f"Failed to save to database"
+                            processing_time = time.time() - file_start_time
                         
-                        logger.log_file_processing(
-                            filename, 'FAILED', error_msg, file_size, processing_time, 
-                            "Database save operation failed", bid_number, pages_extracted
-                        )
+                            logger.log_file_processing(
+                                filename, 'FAILED', error_msg, file_size, processing_time, 
+                                "Database save operation failed", bid_number, pages_extracted,
+                                stage_timings=extractor.timings.as_dict(), pdf_path=pdf_path
+                            )
                         
-                        failed_extractions += 1
-                        error_details.append(error_msg)
-                        print(f"❌ {error_msg}")
-            else:
-                error_msg = f"Failed to extract data from PDF"
-                processing_time = time.time() - file_start_time
+                            failed_extractions += 1
+                            error_details.append(error_msg)
+                            print(f"❌ {error_msg}")
+                else:
+                    error_msg = f"Failed to extract data from PDF"
+                    processing_time = time.time() - file_start_time
+                
+                    logger.log_file_processing(
+                        filename, 'FAILED', error_msg, file_size, processing_time, 
+                        "PDF text extraction failed", "", 0, stage_timings=extractor.timings.as_dict(), pdf_path=pdf_path
+                    )
+                
+                    failed_extractions += 1
+                    error_details.append(error_msg)
+                    print(f"❌ {error_msg}")
                 
+            except Exception as e:
+                error_msg = f"Exception during processing: {str(e)}"
+                processing_time = time.time() - file_start_time
+            
                 logger.log_file_processing(
                     filename, 'FAILED', error_msg, file_size, processing_time, 
-                    "PDF text extraction failed", "", 0
+                    str(e), "", 0, stage_timings=extractor.timings.as_dict() if extractor else None, pdf_path=pdf_path
                 )
-                
+            
                 failed_extractions += 1
                 error_details.append(error_msg)
                 print(f"❌ {error_msg}")
-                
-        except Exception as e:
-            error_msg = f"Exception during processing: {str(e)}"
-            processing_time = time.time() - file_start_time
-            
-            logger.log_file_processing(
-                filename, 'FAILED', error_msg, file_size, processing_time, 
-                str(e), "", 0
-            )
-            
-            failed_extractions += 1
-            error_details.append(error_msg)
-            print(f"❌ {error_msg}")
+    
+    output_sink.close()
     
     # Calculate elapsed time
     elapsed_time = time.time() - start_time
     
     # Log session completion
     logger.log_session_end()
+    manifest.close()
     
     # Print summary
     print("\n" + "="*80)
@@ -1447,6 +1229,8 @@ def process_all_pdfs_in_data_directory():
     print(f"❌ Failed extractions: {failed_extractions}")
     print(f"⏱️  Total time: {elapsed_time:.2f} seconds")
     print(f"📁 Total PDFs processed: {len(pdf_files)}")
+    print(f"📦 Batch records ({output_sink.records_written}): {output_sink.jsonl_file}")
+    print(f"📦 Batch table: {output_sink.columnar_file}")
     
     # Show log file locations
     log_files = logger.get_log_files()
@@ -1467,6 +1251,135 @@ def process_all_pdfs_in_data_directory():
 
 
 
+def process_pdf_for_ingest(pdf_path, logger, output_sink, per_file_exports=False):
+    """Extract, save and log one PDF (watch and ultra-fast modes); returns the logged status"""
+    file_start_time = time.time()
+    filename = os.path.basename(pdf_path)
+    file_size = 0
+    extractor = None
+    
+    try:
+        print(f"🔄 Processing: {filename}")
+        
+        if not os.access(pdf_path, os.R_OK):
+            logger.log_file_processing(
+                filename, 'IGNORED', "File not readable (permission denied)", 0,
+                time.time() - file_start_time, pdf_path=pdf_path
+            )
+            return 'IGNORED'
+        
+        file_size = os.path.getsize(pdf_path)
+        if file_size == 0:
+            logger.log_file_processing(
+                filename, 'IGNORED', "Empty file (0 bytes)", file_size,
+                time.time() - file_start_time, pdf_path=pdf_path
+            )
+            return 'IGNORED'
+        
+        extractor = GeMBiddingPDFExtractor(pdf_path)
+        data = extractor.extract_all_data()
+        
+        if not data:
+            logger.log_file_processing(
+                filename, 'FAILED', "Failed to extract data from PDF", file_size,
+                time.time() - file_start_time, "PDF text extraction failed", "", 0,
+                stage_timings=extractor.timings.as_dict(), pdf_path=pdf_path
+            )
+            return 'FAILED'
+        
+        text = extractor.extract_text_from_pdf()
+        record_id = extractor.extract_bidding_data_enhanced(text).get('bid_number', '')
+        pages_extracted = len(text.split('\n')) if text else 0
+        
+        if extractor.save_to_django_models(text):
+            with extractor.timings.stage('batch_output'):
+                output_sink.append(extractor.export_record())
+            if per_file_exports:
+                extractor.export_to_excel()
+                extractor.export_to_json()
+            status, reason, error = 'SUCCESS', "Successfully extracted and saved to database", ""
+        elif extractor.check_bid_exists(record_id):
+            status, reason, error = 'SKIPPED', "Bid already exists in database", ""
+        else:
+            status, reason, error = 'FAILED', "Failed to save to database", "Database save operation failed"
+        
+        logger.log_file_processing(
+            filename, status, reason, file_size, time.time() - file_start_time, error,
+            record_id, pages_extracted, stage_timings=extractor.timings.as_dict(), pdf_path=pdf_path
+        )
+        print(f"{'✅' if status == 'SUCCESS' else '⏭️ ' if status == 'SKIPPED' else '❌'} {status}: {filename}")
+        return status
+    
+    except Exception as e:
+        logger.log_file_processing(
+            filename, 'FAILED', f"Exception during processing: {str(e)}", file_size,
+            time.time() - file_start_time, str(e), "", 0,
+            stage_timings=extractor.timings.as_dict() if extractor else None, pdf_path=pdf_path
+        )
+        print(f"❌ Exception during processing {filename}: {e}")
+        return 'FAILED'
+
+def ingest_watch(max_workers=4, batch_size=16, poll_interval=2.0, quiet=False, per_file_exports=False,
+                 columnar_format='csv'):
+    """Watch the data directory and ingest new or changed PDFs in micro-batches"""
+    # Setup Django environment first
+    project_root = Path(__file__).parent.parent.parent.parent
+    sys.path.insert(0, str(project_root))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'pdf_data.settings')
+    django.setup()
+    
+    data_dir = Path(__file__).parent / "data"
+    extracted_data_dir = Path(__file__).parent / "extracted_data"
+    data_dir.mkdir(exist_ok=True)
+    extracted_data_dir.mkdir(exist_ok=True)
+    
+    # The manifest doubles as the index of files that are already handled
+    manifest = ProcessingManifest(Path(__file__).parent / "processing_manifest.sqlite3")
+    watcher = PDFDirectoryWatcher(data_dir, known_files=manifest.file_index(), poll_interval=poll_interval)
+    
+    logger = ProcessLogger(record_field='bid_number', quiet=quiet, manifest=manifest, worker=os.getpid())
+    output_sink = BatchOutputSink(extracted_data_dir, logger.session_id, columnar_format, columns=BID_RECORD_COLUMNS)
+    
+    watcher.start()
+    stop_on_sigterm()
+    print(f"👀 Watching {data_dir} for new PDFs ({watcher.mode}, {max_workers} workers, "
+          f"batches of {batch_size})")
+    print("   Press Ctrl+C to stop")
+    print("="*80)
+    
+    ingested = 0
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Ingest_Worker") as executor:
+            while True:
+                ready = watcher.wait_for_changes()
+                for start in range(0, len(ready), batch_size):
+                    batch = ready[start:start + batch_size]
+                    batch_start = time.time()
+                    statuses = list(executor.map(
+                        quietly(lambda path: process_pdf_for_ingest(
+                            path, logger, output_sink, per_file_exports
+                        ), quiet),
+                        batch
+                    ))
+                    # Make the batch visible to readers of the session files
+                    output_sink.flush()
+                    ingested += len(batch)
+                    print(f"📥 Batch of {len(batch)} in {time.time() - batch_start:.2f}s: "
+                          f"✅{statuses.count('SUCCESS')} ⏭️{statuses.count('SKIPPED')} "
+                          f"❌{statuses.count('FAILED') + statuses.count('IGNORED')} "
+                          f"(total {ingested})")
+    except KeyboardInterrupt:
+        print("\n🛑 Stopping watcher...")
+    finally:
+        watcher.stop()
+        output_sink.close()
+        logger.stats['total_files'] = ingested
+        logger.log_session_end()
+        manifest.close()
+    
+    print(f"📦 Batch records ({output_sink.records_written}): {output_sink.jsonl_file}")
+    print(f"📊 CSV summary: {logger.csv_file}")
+
 def diagnose_pdf_files():
     """Diagnose PDF files for common issues"""
     print("🔍 Diagnosing PDF files for common issues...")
@@ -1646,6 +1559,14 @@ def show_help():
     print("  --workers=N, -w=N       Set number of worker threads (default: 4)")
     print("  --ultra-fast, -uf      Process PDFs using ultra-fast multithreading")
     print("  --ufw=N, -ufw=N        Set number of ultra-fast worker threads (default: 8)")
+    print("  --quiet, -q             Batch runs: no per-file console output (still logged to file)")
+    print("  --per-file-exports, -pfe  Batch runs: also write one Excel + JSON file per PDF")
+    print("  --columnar=FORMAT       Batch table format: csv (default) or parquet (needs pyarrow)")
+    print("  --resume, -r            Batch runs: skip PDFs already finished in an earlier run")
+    print("  --retry-failed, -rf     Like --resume, but also retry PDFs that failed before")
+    print("  --ingest-watch, -iw     Keep running and ingest new or changed PDFs as they arrive")
+    print("  --batch-size=N          Watch mode: PDFs per micro-batch (default: 16)")
+    print("  --poll-interval=S       Watch mode: seconds between checks (default: 2)")
     print("  --diagnose, -d          Diagnose PDF files for common issues")
     print("  --view-logs, -vl        View recent log files and statistics")
     print("")
@@ -1654,8 +1575,11 @@ def show_help():
     print("  python data_extractor.py document.pdf       # Process single PDF file")
     print("  python data_extractor.py --multi-thread     # Multi-threaded processing")
     print("  python data_extractor.py --multi-thread --workers=8  # 8 worker threads")
+    print("  python data_extractor.py --multi-thread --quiet      # Multi-threaded, per-file output only in logs")
     print("  python data_extractor.py --ultra-fast       # Ultra-fast multithreading")
     print("  python data_extractor.py --ultra-fast --ufw=16  # 16 ultra-fast worker threads")
+    print("  python data_extractor.py --multi-thread --resume     # Continue an interrupted run")
+    print("  python data_extractor.py --ingest-watch --workers=8  # Ingest the daily drop continuously")
     print("  python data_extractor.py --diagnose                # Diagnose PDF files")
     print("  python data_extractor.py --view-logs               # View recent logs")
     print("  python data_extractor.py --analyze-patterns        # Analyze text patterns in PDFs")
@@ -1670,6 +1594,20 @@ def main():
         show_help()
         return
     
+    # Quiet mode drops the per-file console output of batch runs
+    quiet = "--quiet" in sys.argv or "-q" in sys.argv
+    
+    # Batch runs write one JSONL + columnar file; per-file Excel/JSON is opt-in
+    per_file_exports = "--per-file-exports" in sys.argv or "-pfe" in sys.argv
+    columnar_format = 'csv'
+    for arg in sys.argv:
+        if arg.startswith("--columnar="):
+            columnar_format = arg.split("=")[1]
+    
+    # Resume from the processing manifest, optionally retrying failed files
+    retry_failed = "--retry-failed" in sys.argv or "-rf" in sys.argv
+    resume = "--resume" in sys.argv or "-r" in sys.argv or retry_failed
+    
     # Check for special commands first
     if "--diagnose" in sys.argv or "-d" in sys.argv:
         # Diagnose PDF files
@@ -1680,6 +1618,23 @@ def main():
         print("📄 Log Viewer Mode")
         view_logs()
 
+    elif "--ingest-watch" in sys.argv or "-iw" in sys.argv:
+        # Long-running mode: ingest new or changed PDFs as they arrive
+        max_workers = 4
+        batch_size = 16
+        poll_interval = 2.0
+        for arg in sys.argv:
+            if arg.startswith("--workers=") or arg.startswith("-w="):
+                max_workers = int(arg.split("=")[1])
+            elif arg.startswith("--batch-size="):
+                batch_size = int(arg.split("=")[1])
+            elif arg.startswith("--poll-interval="):
+                poll_interval = float(arg.split("=")[1])
+        
+        ingest_watch(
+            max_workers, batch_size, poll_interval, quiet=quiet, per_file_exports=per_file_exports,
+            columnar_format=columnar_format
+        )
     elif "--multi-thread" in sys.argv or "-mt" in sys.argv:
         # Get number of workers from command line
         max_workers = 4  # Default
@@ -1692,7 +1647,10 @@ def main():
                 break
         
         print(f"🚀 Starting multi-threaded processing with {max_workers} workers...")
-        process_all_pdfs_in_data_directory_multi_threaded(max_workers)
+        process_all_pdfs_in_data_directory_multi_threaded(
+            max_workers, quiet=quiet, per_file_exports=per_file_exports, columnar_format=columnar_format,
+            resume=resume, retry_failed=retry_failed
+        )
     elif "--ultra-fast" in sys.argv or "-uf" in sys.argv:
         # Get number of ultra-fast workers from command line
         max_workers = 8  # Default for ultra-fast
@@ -1705,7 +1663,10 @@ def main():
                 break
         
         print(f"🚀 Starting ULTRA-FAST processing with {max_workers} workers...")
-        process_all_pdfs_ultra_fast(max_workers)
+        process_all_pdfs_ultra_fast(
+            max_workers, quiet=quiet, per_file_exports=per_file_exports, columnar_format=columnar_format,
+            resume=resume, retry_failed=retry_failed
+        )
     elif "--analyze-patterns" in sys.argv or "-ap" in sys.argv:
         # Analyze text patterns in PDFs
         print("🔍 Analyzing text patterns in PDFs...")
@@ -1714,9 +1675,9 @@ def main():
         # Test enhanced extraction on a single PDF
         print("🧪 Testing enhanced extraction on a single PDF...")
         test_enhanced_extraction()
-    elif len(sys.argv) > 1:
+    elif [arg for arg in sys.argv[1:] if not arg.startswith("-")]:
         # Check if PDF path is provided as command line argument
-        pdf_path = sys.argv[1]
+        pdf_path = [arg for arg in sys.argv[1:] if not arg.startswith("-")][0]
         
         if not os.path.exists(pdf_path):
             print(f"❌ PDF file not found: {pdf_path}")
@@ -1748,7 +1709,10 @@ def main():
             print("❌ Failed to extract data from PDF")
     else:
         # Process all PDFs in data directory (single-threaded)
-        process_all_pdfs_in_data_directory()
+        process_all_pdfs_in_data_directory(
+            quiet=quiet, per_file_exports=per_file_exports, columnar_format=columnar_format,
+            resume=resume, retry_failed=retry_failed
+        )
 
 def analyze_pdf_text_patterns():
     """Analyze text patterns in PDFs to understand Hindi-English text structure"""
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bid_record', '0002_biddocument_file'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='biddocument',
+            index=models.Index(fields=['-dated', '-created_at', '-id'], name='bid_keyset_idx'),
+        ),
+    ]
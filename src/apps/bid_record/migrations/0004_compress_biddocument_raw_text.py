@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:20
+
+import src.utils.compressed_text
+from django.db import migrations
+from src.utils.compressed_text import compress_column, decompress_column
+
+
+def compress_raw_text(apps, schema_editor):
+    compress_column(apps.get_model('bid_record', 'BidDocument'), 'raw_text')
+
+
+def decompress_raw_text(apps, schema_editor):
+    decompress_column(apps.get_model('bid_record', 'BidDocument'), 'raw_text')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bid_record', '0003_biddocument_bid_keyset_idx'),
+    ]
+
+    operations = [
+        # Reversed after the column is a TextField again
+        migrations.RunPython(migrations.RunPython.noop, decompress_raw_text),
+        migrations.AlterField(
+            model_name='biddocument',
+            name='raw_text',
+            field=src.utils.compressed_text.CompressedTextField(blank=True, editable=True, null=True),
+        ),
+        migrations.RunPython(compress_raw_text, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bid_record', '0004_compress_biddocument_raw_text'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='biddocument',
+            index=models.Index(fields=['ministry', '-dated', '-created_at', '-id'], name='bid_ministry_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='biddocument',
+            index=models.Index(fields=['department', '-dated', '-created_at', '-id'], name='bid_department_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='biddocument',
+            index=models.Index(fields=['organisation', '-dated', '-created_at', '-id'], name='bid_organisation_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='biddocument',
+            index=models.Index(fields=['bid_number'], name='bid_number_idx'),
+        ),
+    ]
@@ -1,5 +1,7 @@
 from django.db import models
 
+from src.utils.compressed_text import CompressedTextField
+
 class BidDocument(models.Model):
     file = models.FileField(upload_to='bid_documents/', null=True, blank=True)
     dated = models.DateField(null=True, blank=True)
@@ -18,8 +20,21 @@ class BidDocument(models.Model):
     source_file = models.CharField(max_length=255, null=True, blank=True)
     
     # Required fields for functionality
-    raw_text = models.TextField(null=True, blank=True)
+    raw_text = CompressedTextField(null=True, blank=True)
+    embedding = models.JSONField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Keyset pagination of the bid table (see BidTableView)
+            models.Index(fields=['-dated', '-created_at', '-id'], name='bid_keyset_idx'),
+            # Bid table filters, in table order so a filtered page is an index walk
+            models.Index(fields=['ministry', '-dated', '-created_at', '-id'], name='bid_ministry_idx'),
+            models.Index(fields=['department', '-dated', '-created_at', '-id'], name='bid_department_idx'),
+            models.Index(fields=['organisation', '-dated', '-created_at', '-id'], name='bid_organisation_idx'),
+            # Duplicate check at ingest (check_bid_exists)
+            models.Index(fields=['bid_number'], name='bid_number_idx'),
+        ]
+
     def __str__(self):
         return f"{self.bid_number} - {self.ministry}"
@@ -14,7 +14,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'pdf_data.settings')
 django.setup()
 
-from utils.text_extractor import FinalImprovedAutomatedBidPDFExtractor
+from src.apps.bid_record.utils.text_extractor import FinalImprovedAutomatedBidPDFExtractor
 
 def test_single_pdf():
     """Test processing a single PDF file"""
@@ -0,0 +1,89 @@
+import random
+import re
+
+from django.test import SimpleTestCase
+
+from src.apps.bid_record.utils.field_scanner import BID_FIELD_PATTERNS, SCANNER_FLAGS, BidFieldScanner
+
+# Hand-written bid layouts: English-first, Hindi-first, multi-line labels,
+# labels nested in longer labels and labels at the very start or end
+SAMPLE_TEXTS = [
+    "Bid Number: GEM/2025/B/5813542\nDated: 15-01-2025\nBeneficiary: Colonel Q\n",
+    "बोली संख्या GEM/2025/B/5813542 Bid Number:\nदिनांक 15-01-2025 Dated:\n",
+    "Ministry/State Name\nMinistry of Defence\nDepartment Name\nDepartment of Military Affairs\n"
+    "Organisation Name\nIndian Army\nContract Period\n2 Year(s)\nItem Category\nBoots\n",
+    "रक्षा मंत्रालय\nMinistry/State Name\nसैन्य कार्य विभाग\n  \n Department Name\nभारतीय सेना Organisation Name\n",
+    "Bid End Date/Time\n05-02-2025 15:00:00\nBid Opening\nDate/Time\n05-02-2025 15:30:00\n"
+    "Bid Offer\nValidity (From End Date)\n90 (Days)\nSimilar Category\nNo\nMSE Exemption\nYes\n",
+    "Category\nFootwear\nItem Category\nBoots DMS\nSimilar\nYes\nMSE\nNo\n",
+    "Ministry\n\n\nDefence\nministry : Defence\nvalidity: 120 days\nPeriod\n1 year\n",
+    "Beneficiary\nCOL Q, HQ 9 Corps\nGEM2025B5813542 BID: 42\n",
+    "Organization\nIndian Army\nEnd Date\n05-02-2025\nOpening Date\n06-02-2025\nOrganization\n",
+]
+
+# Building blocks for the randomised documents: every anchor word, label
+# variants, Hindi text and whitespace runs that move the Hindi-first captures
+FUZZ_TOKENS = [
+    'Bid Number', 'bid no', 'BID', 'dated', 'Dated', 'Beneficiary', 'beneficiary', 'Ministry/State Name',
+    'Ministry', 'ministry', 'Department Name', 'Department', 'department', 'Organisation Name',
+    'organisation', 'Organization', 'Contract Period', 'contract period', 'Period', 'Item Category',
+    'item category', 'Category', 'Bid End Date/Time', 'bid end date / time', 'End Date', 'Bid Opening',
+    'Date/Time', 'bid opening date/time', 'Opening Date', 'Bid Offer', 'Validity (From End Date)', 'Validity',
+    'validity', 'Similar Category', 'Similar', 'similar category', 'MSE Exemption', 'MSE', 'mse exemption',
+    'GEM2025B5813542', 'GEM-42', '15-Jan-2025', '15/01/2025', '2025-01-15', 'Indian Army', 'भारतीय सेना',
+    'रक्षा मंत्रालय', 'बोली संख्या', ':', ' : ', ' ', '  ', '\n', '\n', '\n\n', ' \n ', '\t',
+]
+
+
+def per_pattern_search(text, field_patterns=BID_FIELD_PATTERNS):
+    """The scan before BidFieldScanner: ``re.search`` every pattern over the full text in order"""
+    values = {}
+    for field, patterns in field_patterns.items():
+        values[field] = ""
+        for pattern in patterns:
+            match = re.search(pattern, text, SCANNER_FLAGS)
+            if match:
+                values[field] = match.group(1).strip()
+                break
+    return values
+
+
+def outcome(scan, text):
+    """Field values, or the exception type for patterns without a capture group"""
+    try:
+        return scan(text)
+    except IndexError as e:
+        return type(e)
+
+
+class BidFieldScannerTests(SimpleTestCase):
+    def setUp(self):
+        self.scanner = BidFieldScanner()
+
+    def assertMatchesPerPatternSearch(self, text):
+        self.assertEqual(outcome(self.scanner.scan, text), outcome(per_pattern_search, text), repr(text))
+
+    def test_sample_layouts(self):
+        for text in SAMPLE_TEXTS:
+            with self.subTest(text=text[:40]):
+                self.assertMatchesPerPatternSearch(text)
+
+    def test_values_found(self):
+        values = self.scanner.scan(SAMPLE_TEXTS[2])
+        self.assertEqual(values['ministry'], 'Ministry of Defence')
+        self.assertEqual(values['organisation'], 'Indian Army')
+        self.assertEqual(values['item_category'], 'Boots')
+
+    def test_hindi_first_capture(self):
+        values = self.scanner.scan("बोली संख्या GEM/2025/B/5813542 Bid Number:")
+        self.assertEqual(values['bid_number'], 'बोली संख्या GEM/2025/B/5813542')
+
+    def test_empty_text(self):
+        self.assertMatchesPerPatternSearch('')
+        self.assertEqual(self.scanner.scan('no labels here'), {field: '' for field in BID_FIELD_PATTERNS})
+
+    def test_randomised_documents(self):
+        rng = random.Random(26)
+        for _ in range(400):
+            text = ''.join(rng.choice(FUZZ_TOKENS) for _ in range(rng.randint(1, 40)))
+            self.assertMatchesPerPatternSearch(text)
@@ -0,0 +1,204 @@
+import re
+
+# Field patterns for GeM bid documents, tried in order per field.
+# English-first patterns start with the label, Hindi-first patterns capture
+# the line in front of the label. Patterns that start with neither are kept
+# as plain full-text searches.
+BID_FIELD_PATTERNS = {
+    'dated': [
+        r'dated\s*:\s*([^\n]+)',  # English first: "dated: 15-01-2025"
+        r'([^\n]+)\s*dated\s*:',  # Hindi first: "15-01-2025 dated:"
+        r'\d{1,2}-[A-Za-z]{3}-\d{4}',  # Direct date format
+        r'\d{1,2}/\d{1,2}/\d{4}',  # DD/MM/YYYY format
+        r'\d{4}-\d{1,2}-\d{1,2}'   # YYYY-MM-DD format
+    ],
+    'bid_number': [
+        r'bid\s*number\s*:\s*([^\n]+)',  # English first
+        r'([^\n]+)\s*bid\s*number\s*:',  # Hindi first
+        r'bid\s*no\s*:\s*([^\n]+)',     # Alternative English
+        r'([^\n]+)\s*bid\s*no\s*:',     # Alternative Hindi first
+        r'GEM\d{4}[A-Z]\d+',            # GEM format
+        r'GEM\w*-\d+',                  # GEM with dash
+        r'BID\s*:\s*([^\n]+)',          # BID: format
+        r'([^\n]+)\s*BID\s*:'           # BID: Hindi first
+    ],
+    'beneficiary': [
+        r'beneficiary\s*:\s*([^\n]+)',  # English first
+        r'([^\n]+)\s*beneficiary\s*:',  # Hindi first
+        r'Beneficiary\s*\n([^\n]+)',    # Multi-line format
+        r'([^\n]+)\s*Beneficiary\s*\n'  # Multi-line Hindi first
+    ],
+    'ministry': [
+        r'Ministry/State Name\s*\n([^\n]+)',  # Multi-line format
+        r'([^\n]+)\s*Ministry/State Name\s*\n',  # Multi-line Hindi first
+        r'ministry\s*:\s*([^\n]+)',            # English first
+        r'([^\n]+)\s*ministry\s*:',            # Hindi first
+        r'Ministry\s*\n([^\n]+)',              # Alternative multi-line
+        r'([^\n]+)\s*Ministry\s*\n'            # Alternative multi-line Hindi first
+    ],
+    'department': [
+        r'Department Name\s*\n([^\n]+)',  # Multi-line format
+        r'([^\n]+)\s*Department Name\s*\n',  # Multi-line Hindi first
+        r'department\s*:\s*([^\n]+)',        # English first
+        r'([^\n]+)\s*department\s*:',        # Hindi first
+        r'Department\s*\n([^\n]+)',          # Alternative multi-line
+        r'([^\n]+)\s*Department\s*\n'        # Alternative multi-line Hindi first
+    ],
+    'organisation': [
+        r'Organisation Name\s*\n([^\n]+)',  # Multi-line format
+        r'([^\n]+)\s*Organisation Name\s*\n',  # Multi-line Hindi first
+        r'organisation\s*:\s*([^\n]+)',        # English first
+        r'([^\n]+)\s*organisation\s*:',        # Hindi first
+        r'Organization\s*\n([^\n]+)',          # Alternative spelling
+        r'([^\n]+)\s*Organization\s*\n'        # Alternative spelling Hindi first
+    ],
+    'contract_period': [
+        r'Contract Period\s*\n([^\n]+)',  # Multi-line format
+        r'([^\n]+)\s*Contract Period\s*\n',  # Multi-line Hindi first
+        r'contract\s*period\s*:\s*([^\n]+)',  # English first
+        r'([^\n]+)\s*contract\s*period\s*:',  # Hindi first
+        r'Period\s*\n([^\n]+)',               # Alternative format
+        r'([^\n]+)\s*Period\s*\n'             # Alternative format Hindi first
+    ],
+    'item_category': [
+        r'Item Category\s*\n([^\n]+)',  # Multi-line format
+        r'([^\n]+)\s*Item Category\s*\n',  # Multi-line Hindi first
+        r'item\s*category\s*:\s*([^\n]+)',  # English first
+        r'([^\n]+)\s*item\s*category\s*:',  # Hindi first
+        r'Category\s*\n([^\n]+)',           # Alternative format
+        r'([^\n]+)\s*Category\s*\n'         # Alternative format Hindi first
+    ],
+    'bid_end_datetime': [
+        r'Bid End Date/Time\s*\n([^\n]+)',  # Multi-line format
+        r'([^\n]+)\s*Bid End Date/Time\s*\n',  # Multi-line Hindi first
+        r'bid\s*end\s*date\s*/\s*time\s*:\s*([^\n]+)',  # English first
+        r'([^\n]+)\s*bid\s*end\s*date\s*/\s*time\s*:',  # Hindi first
+        r'End Date\s*\n([^\n]+)',              # Alternative format
+        r'([^\n]+)\s*End Date\s*\n'            # Alternative format Hindi first
+    ],
+    'bid_open_datetime': [
+        r'Bid Opening\nDate/Time\s*\n([^\n]+)',  # Multi-line format
+        r'([^\n]+)\s*Bid Opening\nDate/Time\s*\n',  # Multi-line Hindi first
+        r'bid\s*opening\s*date\s*/\s*time\s*:\s*([^\n]+)',  # English first
+        r'([^\n]+)\s*bid\s*opening\s*date\s*/\s*time\s*:',  # Hindi first
+        r'Opening Date\s*\n([^\n]+)',              # Alternative format
+        r'([^\n]+)\s*Opening Date\s*\n'            # Alternative format Hindi first
+    ],
+    'bid_offer_validity_days': [
+        r'Bid Offer\nValidity \(From End Date\)\s*\n([^\n]+)',  # Multi-line format
+        r'([^\n]+)\s*Bid Offer\nValidity \(From End Date\)\s*\n',  # Multi-line Hindi first
+        r'validity\s*:\s*([^\n]+)',  # English first
+        r'([^\n]+)\s*validity\s*:',  # Hindi first
+        r'Validity\s*\n([^\n]+)',    # Alternative format
+        r'([^\n]+)\s*Validity\s*\n'  # Alternative format Hindi first
+    ],
+    'similar_category': [
+        r'Similar Category\s*\n([^\n]+)',  # Multi-line format
+        r'([^\n]+)\s*Similar Category\s*\n',  # Multi-line Hindi first
+        r'similar\s*category\s*:\s*([^\n]+)',  # English first
+        r'([^\n]+)\s*similar\s*category\s*:',  # Hindi first
+        r'Similar\s*\n([^\n]+)',              # Alternative format
+        r'([^\n]+)\s*Similar\s*\n'            # Alternative format Hindi first
+    ],
+    'mse_exemption': [
+        r'MSE Exemption\s*\n([^\n]+)',  # Multi-line format
+        r'([^\n]+)\s*MSE Exemption\s*\n',  # Multi-line Hindi first
+        r'mse\s*exemption\s*:\s*([^\n]+)',  # English first
+        r'([^\n]+)\s*mse\s*exemption\s*:',  # Hindi first
+        r'MSE\s*\n([^\n]+)',                # Alternative format
+        r'([^\n]+)\s*MSE\s*\n'              # Alternative format Hindi first
+    ],
+}
+
+SCANNER_FLAGS = re.IGNORECASE | re.DOTALL
+
+_HINDI_FIRST_PREFIX = r'([^\n]+)\s*'
+_ANCHOR_WORD_RE = re.compile(r'[A-Za-z]+')
+
+
+class _AnchoredPattern:
+    """One field pattern plus the label word its matches are anchored on"""
+
+    def __init__(self, pattern):
+        self.regex = re.compile(pattern, SCANNER_FLAGS)
+        self.hindi_first = pattern.startswith(_HINDI_FIRST_PREFIX)
+        label = pattern[len(_HINDI_FIRST_PREFIX):] if self.hindi_first else pattern
+        anchor = _ANCHOR_WORD_RE.match(label)
+        self.anchor = anchor.group(0).lower() if anchor else None
+        # For Hindi-first patterns the label and everything after it must
+        # match at the anchor position before the captured line is searched
+        self.tail = re.compile(label, SCANNER_FLAGS) if self.hindi_first else None
+
+    def search(self, text, anchor_positions):
+        """Return the same match as ``self.regex.search(text)``, or None"""
+        if self.anchor is None:
+            return self.regex.search(text)
+
+        for pos in anchor_positions.get(self.anchor, ()):
+            if not self.hindi_first:
+                match = self.regex.match(text, pos)
+                if match:
+                    return match
+            elif self.tail.match(text, pos):
+                # No match can start before the line that precedes the
+                # whitespace run in front of the first matching label
+                start = pos
+                while start > 0 and text[start - 1].isspace():
+                    start -= 1
+                if start > 0:
+                    start = text.rfind('\n', 0, start - 1) + 1
+                return self.regex.search(text, start)
+        return None
+
+
+class BidFieldScanner:
+    """Single-pass scanner for the GeM bid label/value fields.
+
+    All label anchor words are located with one alternation over the
+    document, then each field pattern is only tried at the positions of its
+    own anchor. Results are identical to running ``re.search`` with every
+    pattern over the full text in order.
+    """
+
+    def __init__(self, field_patterns=None):
+        field_patterns = field_patterns or BID_FIELD_PATTERNS
+        self.fields = {
+            field: [_AnchoredPattern(pattern) for pattern in patterns]
+            for field, patterns in field_patterns.items()
+        }
+        anchors = sorted(
+            {p.anchor for patterns in self.fields.values() for p in patterns if p.anchor},
+            key=lambda word: (-len(word), word)
+        )
+        self.anchor_regexes = {word: re.compile(re.escape(word), SCANNER_FLAGS) for word in anchors}
+        # Zero-width lookahead so overlapping labels ("Category" inside
+        # "Item Category") are all reported
+        self.anchor_scanner = re.compile(
+            '(?=(?:' + '|'.join(re.escape(word) for word in anchors) + '))', SCANNER_FLAGS
+        )
+
+    def find_anchors(self, text):
+        """Map each anchor word to the ordered positions where it occurs"""
+        positions = {word: [] for word in self.anchor_regexes}
+        for hit in self.anchor_scanner.finditer(text):
+            pos = hit.start()
+            for word, regex in self.anchor_regexes.items():
+                if regex.match(text, pos):
+                    positions[word].append(pos)
+        return positions
+
+    def scan(self, text):
+        """Return the raw (uncleaned) value of every field, "" when not found"""
+        anchor_positions = self.find_anchors(text)
+        values = {}
+        for field, patterns in self.fields.items():
+            values[field] = ""
+            for pattern in patterns:
+                match = pattern.search(text, anchor_positions)
+                if match:
+                    values[field] = match.group(1).strip()
+                    break
+        return values
+
+
+BID_FIELD_SCANNER = BidFieldScanner()
@@ -20,6 +20,9 @@ from django.core.files import File
 from django.core.files.base import ContentFile
 from django.utils import timezone
 from src.apps.bid_record.models import BidDocument
+from src.utils.db_writer import get_db_writer
+from src.utils.embedding_cache import get_chunk_cache
+from src.utils.embedding_encoder import BulkEncoder, encode_document, get_sentence_model
 
 class FinalImprovedAutomatedBidPDFExtractor:
     def __init__(self, pdf_path):
@@ -377,19 +380,15 @@ class FinalImprovedAutomatedBidPDFExtractor:
     def generate_embedding(self, text):
         """Generate embedding for the given text using sentence-transformers"""
         try:
-            from sentence_transformers import SentenceTransformer
-            
             # Get the embedder model
             model = self._get_embedder()
             if model is None:
                 print("⚠️  Warning: Could not load sentence-transformers model, skipping embedding generation")
                 return None
             
-            # Generate embedding for the cleaned text
-            embedding = model.encode([text], normalize_embeddings=True)
-            
-            # Convert numpy array to list of floats for JSON storage
-            embedding_list = embedding[0].tolist()
+            # Generate a chunked embedding for the cleaned text; boilerplate
+            # chunks come from the shared chunk cache
+            embedding_list = encode_document(text, cache=get_chunk_cache())
             
             print(f"✅ Generated embedding with {len(embedding_list)} dimensions")
             return embedding_list
@@ -399,13 +398,8 @@ class FinalImprovedAutomatedBidPDFExtractor:
             return None
     
     def _get_embedder(self):
-        """Get the sentence transformer model for embeddings"""
-        try:
-            from sentence_transformers import SentenceTransformer
-            return SentenceTransformer('all-MiniLM-L6-v2')
-        except Exception as e:
-            print(f"⚠️  Warning: Could not import sentence-transformers: {e}")
-            return None
+        """Get the sentence transformer model for embeddings (loaded once per process)"""
+        return get_sentence_model()
     
     def save_to_django_models(self, text):
         """Save extracted data to Django models"""
@@ -425,8 +419,10 @@ class FinalImprovedAutomatedBidPDFExtractor:
             print("🔍 Generating embedding for bid text...")
             embedding = self.generate_embedding(cleaned_text)
             
-            # Create BidDocument instance with updated fields
-            self.bid_instance = BidDocument.objects.create(
+            # Create BidDocument instance with updated fields; the insert runs on
+            # the writer thread so worker threads never contend for the lock
+            self.bid_instance = get_db_writer().run(
+                BidDocument.objects.create,
                 dated=bid_data.get('dated'),
                 source_file=os.path.basename(self.pdf_path),
                 bid_number=bid_number,
@@ -724,46 +720,60 @@ def process_all_pdfs_in_data_directory():
     print(f"📂 Excel/JSON files saved to: {extracted_data_dir}")
     print("="*80)
 
-def generate_embeddings_for_existing_bids():
+def generate_embeddings_for_existing_bids(processes=1, quantize=False, batch_size=64, chunk_size=512):
     """Generate embeddings for existing bids that don't have them"""
     try:
-        from src.apps.bid_record.models import BidDocument
-        
         print("🔍 Checking for bids without embeddings...")
         
         # Find bids without embeddings
-        bids_without_embeddings = BidDocument.objects.filter(embedding__isnull=True)
+        bids_without_embeddings = BidDocument.objects.filter(embedding__isnull=True).exclude(raw_text='')
+        total = bids_without_embeddings.count()
         
-        print(f"📊 Found {bids_without_embeddings.count()} bids without embeddings")
+        print(f"📊 Found {total} bids without embeddings")
         
-        if bids_without_embeddings.count() == 0:
+        if total == 0:
             print("✅ All bids already have embeddings!")
             return
         
-        # Create extractor instance for embedding generation
-        extractor = FinalImprovedAutomatedBidPDFExtractor("dummy.pdf")
+        encoder = BulkEncoder(processes=processes, quantize=quantize, batch_size=batch_size)
+        if not encoder.available:
+            print("⚠️  Warning: Could not load sentence-transformers model, skipping embedding generation")
+            return
+        print(f"🧠 Encoding with {encoder.processes} process(es){' (int8 quantised)' if quantize else ''}")
         
-        # Generate embeddings for bids
+        cache = get_chunk_cache()
+        start_time = time.time()
         bid_count = 0
-        for bid in bids_without_embeddings:
+        batch = []
+        
+        def flush():
+            nonlocal bid_count
             try:
-                if bid.raw_text:
-                    print(f"🔍 Generating embedding for bid: {bid.bid_number}")
-                    embedding = extractor.generate_embedding(bid.raw_text)
-                    if embedding:
-                        bid.embedding = embedding
-                        bid.save()
-                        bid_count += 1
-                        print(f"✅ Saved embedding for bid: {bid.bid_number}")
-                    else:
-                        print(f"⚠️  Could not generate embedding for bid: {bid.bid_number}")
-                else:
-                    print(f"⚠️  Bid {bid.bid_number} has no raw_text")
+                vecs = encoder.encode_documents([bid.raw_text for bid in batch], cache)
+                for bid, vec in zip(batch, vecs):
+                    bid.embedding = vec.tolist()
+                BidDocument.objects.bulk_update(batch, ['embedding'], batch_size=batch_size)
+                bid_count += len(batch)
+                print(f"✅ Saved embeddings for {bid_count}/{total} bids")
             except Exception as e:
-                print(f"❌ Error generating embedding for bid {bid.bid_number}: {e}")
-        
+                print(f"❌ Error generating embeddings for {len(batch)} bids: {e}")
+            batch.clear()
+        
+        with encoder:
+            # Encode a chunk of bids per call so texts can be length-sorted and
+            # spread over the worker pool
+            for bid in bids_without_embeddings.only('id', 'bid_number', 'raw_text').order_by('pk').iterator(chunk_size=chunk_size):
+                batch.append(bid)
+                if len(batch) >= chunk_size:
+                    flush()
+            if batch:
+                flush()
+        
+        elapsed = max(time.time() - start_time, 1e-9)
         print(f"\n📊 EMBEDDING GENERATION SUMMARY:")
         print(f"✅ Bids processed: {bid_count}")
+        print(f"⚡ Throughput: {bid_count / elapsed:.1f} bids/s")
+        print(f"🧩 Chunk cache: {cache.hits} hits, {cache.misses} chunks encoded")
         print("="*80)
         
     except Exception as e:
@@ -779,6 +789,8 @@ def show_help():
     print("Options:")
     print("  --help, -h              Show this help message")
     print("  --generate-embeddings, -ge  Generate embeddings for existing bids")
+    print("  --processes=N, -p=N     Encoder processes for --generate-embeddings (default: 1)")
+    print("  --quantize, -q          Encode with an int8 quantised model")
     print("  --multi-thread, -mt     Process PDFs using multi-threading")
     print("  --workers=N, -w=N       Set number of worker threads (default: 4)")
     print("")
@@ -788,6 +800,7 @@ def show_help():
     print("  python text_extractor.py --multi-thread     # Multi-threaded processing")
     print("  python text_extractor.py --multi-thread --workers=8  # 8 worker threads")
     print("  python text_extractor.py --generate-embeddings      # Generate embeddings")
+    print("  python text_extractor.py -ge --processes=4 --quantize  # Bulk CPU encoding")
     print("")
     print("Note: Place PDF files in the 'data/' directory for batch processing")
     print("="*60)
@@ -801,8 +814,14 @@ def main():
     # Check for special commands first
     if "--generate-embeddings" in sys.argv or "-ge" in sys.argv:
         # Generate embeddings for existing bids
+        processes = 1
+        for arg in sys.argv:
+            if arg.startswith("--processes=") or arg.startswith("-p="):
+                processes = int(arg.split("=")[1])
+                break
+        quantize = "--quantize" in sys.argv or "-q" in sys.argv
         print("🚀 Generating embeddings for existing bids...")
-        generate_embeddings_for_existing_bids()
+        generate_embeddings_for_existing_bids(processes=processes, quantize=quantize)
     elif "--multi-thread" in sys.argv or "-mt" in sys.argv:
         # Get number of workers from command line
         max_workers = 4  # Default
@@ -3,7 +3,6 @@ from django.shortcuts import render, redirect
 from django.conf import settings
 from .models import BidDocument
 from django.core.files.storage import FileSystemStorage
-from django.core.paginator import Paginator, PageNotAnInteger, EmptyPage
 from django.db.models import Q
 from django.http import JsonResponse, HttpResponse
 from django.views import View
@@ -13,6 +12,8 @@ import numpy as np
 from sklearn.metrics.pairwise import cosine_similarity
 
 from .utils.serialization import make_serializable
+from ...utils.keyset_pagination import KeysetPaginator
+from ...utils.table_helper import safe_int_from_raw
 from .data_extractor import GeMBiddingPDFExtractor
 
 
@@ -63,6 +64,10 @@ def upload_bid_document(request):
 class BidTableView(View):
     template_name = "bid/bid_table.html"
     per_page = 50
+    # Table order; the primary key is the keyset tiebreaker
+    ordering = ('-dated', '-created_at', '-id')
+    # Large columns the table page never shows (raw text is fetched by the modal)
+    page_deferred_fields = ('raw_text', 'embedding')
 
     def get(self, request):
         # Extract filters
@@ -74,15 +79,85 @@ class BidTableView(View):
         date_to = request.GET.get("date_to", "").strip()
 
         # Base queryset
-        bids_qs = BidDocument.objects.all().order_by('-dated', '-created_at')
+        bids_qs = self.filter_queryset(
+            BidDocument.objects.all().order_by(*self.ordering),
+            search_query, org_filter, dept_filter, ministry_filter, date_from, date_to
+        )
 
-        # Apply filters
+        # Export handling
+        if request.GET.get("export") in ["excel", "csv"]:
+            # Build comprehensive data structure
+            bid_data = []
+            for bid in bids_qs:
+                bid_data.append({
+                    # Core bid fields
+                    "bid_number": bid.bid_number,
+                    "dated": bid.dated,
+                    "source_file": bid.source_file,
+                    "raw_text": bid.raw_text,
+
+                    # Organization details
+                    "ministry": bid.ministry,
+                    "department": bid.department,
+                    "organisation": bid.organisation,
+
+                    # Bid details
+                    "beneficiary": bid.beneficiary,
+                    "contract_period": bid.contract_period,
+                    "item_category": bid.item_category,
+
+                    # Additional fields
+                    "bid_end_datetime": bid.bid_end_datetime,
+                    "bid_open_datetime": bid.bid_open_datetime,
+                    "bid_offer_validity_days": bid.bid_offer_validity_days,
+                    "similar_category": bid.similar_category,
+                    "mse_exemption": bid.mse_exemption,
+
+                    # Metadata
+                    "created_at": bid.created_at,
+                    "file": bid.file,
+                })
+
+            return self.export_data(bid_data, request.GET.get("export"))
+
+        # Keyset pagination: deep pages seek on bid_keyset_idx instead of OFFSET.
+        # Bids have no corpus version, so after an upload the total shown can
+        # lag for up to TABLE_COUNT_CACHE_TIMEOUT seconds (the rows do not)
+        paginator = KeysetPaginator(
+            bids_qs.defer(*self.page_deferred_fields), self.ordering, self.per_page,
+            count_timeout=getattr(settings, 'TABLE_COUNT_CACHE_TIMEOUT', 300)
+        )
+        page_obj = paginator.page(
+            after=request.GET.get("after"), before=request.GET.get("before"),
+            number=safe_int_from_raw(request.GET.get("page", 1))
+        )
+
+        # Filter options
+        org_options = BidDocument.objects.exclude(organisation="").values_list("organisation", flat=True).distinct()
+        dept_options = BidDocument.objects.exclude(department="").values_list("department", flat=True).distinct()
+        ministry_options = BidDocument.objects.exclude(ministry="").values_list("ministry", flat=True).distinct()
+
+        return render(request, self.template_name, {
+            "page_obj": page_obj,
+            "search_query": search_query,
+            "org_filter": org_filter,
+            "dept_filter": dept_filter,
+            "ministry_filter": ministry_filter,
+            "date_from": date_from,
+            "date_to": date_to,
+            "org_options": org_options,
+            "dept_options": dept_options,
+            "ministry_options": ministry_options,
+        })
+
+    def filter_queryset(self, bids_qs, search_query, org_filter, dept_filter, ministry_filter, date_from, date_to):
+        # Apply filters (dropdown values, matched exactly so bid_*_idx serve them)
         if org_filter:
-            bids_qs = bids_qs.filter(organisation__icontains=org_filter)
+            bids_qs = bids_qs.filter(organisation=org_filter)
         if dept_filter:
-            bids_qs = bids_qs.filter(department__icontains=dept_filter)
+            bids_qs = bids_qs.filter(department=dept_filter)
         if ministry_filter:
-            bids_qs = bids_qs.filter(ministry__icontains=ministry_filter)
+            bids_qs = bids_qs.filter(ministry=ministry_filter)
         if date_from:
             bids_qs = bids_qs.filter(dated__gte=date_from)
         if date_to:
@@ -115,64 +190,7 @@ class BidTableView(View):
                 Q(raw_text__icontains=search_query)
             ).distinct()
 
-        # Build comprehensive data structure
-        bid_data = []
-        for bid in bids_qs:
-            bid_data.append({
-                # Core bid fields
-                "bid_number": bid.bid_number,
-                "dated": bid.dated,
-                "source_file": bid.source_file,
-                "raw_text": bid.raw_text,
-
-                # Organization details
-                "ministry": bid.ministry,
-                "department": bid.department,
-                "organisation": bid.organisation,
-
-                # Bid details
-                "beneficiary": bid.beneficiary,
-                "contract_period": bid.contract_period,
-                "item_category": bid.item_category,
-
-                # Additional fields
-                "bid_end_datetime": bid.bid_end_datetime,
-                "bid_open_datetime": bid.bid_open_datetime,
-                "bid_offer_validity_days": bid.bid_offer_validity_days,
-                "similar_category": bid.similar_category,
-                "mse_exemption": bid.mse_exemption,
-
-                # Metadata
-                "created_at": bid.created_at,
-                "file": bid.file,
-            })
-
-        # Export handling
-        if request.GET.get("export") in ["excel", "csv"]:
-            return self.export_data(bid_data, request.GET.get("export"))
-
-        # Pagination
-        paginator = Paginator(bids_qs, self.per_page)
-        page_number = request.GET.get('page', 1)
-        page_obj = paginator.get_page(page_number)
-
-        # Filter options
-        org_options = BidDocument.objects.exclude(organisation="").values_list("organisation", flat=True).distinct()
-        dept_options = BidDocument.objects.exclude(department="").values_list("department", flat=True).distinct()
-        ministry_options = BidDocument.objects.exclude(ministry="").values_list("ministry", flat=True).distinct()
-
-        return render(request, self.template_name, {
-            "page_obj": page_obj,
-            "search_query": search_query,
-            "org_filter": org_filter,
-            "dept_filter": dept_filter,
-            "ministry_filter": ministry_filter,
-            "date_from": date_from,
-            "date_to": date_to,
-            "org_options": org_options,
-            "dept_options": dept_options,
-            "ministry_options": ministry_options,
-        })
+        return bids_qs
 
     def export_data(self, rows, file_type):
         df = pd.DataFrame(rows)
@@ -193,7 +211,7 @@ class BidTableView(View):
 def get_bid_details_api(request, bid_id):
     """API endpoint to get bid details by ID"""
     try:
-        bid = BidDocument.objects.get(id=bid_id)
+        bid = BidDocument.objects.defer('embedding').get(id=bid_id)
         data = {
             'id': bid.id,
             'bid_number': bid.bid_number,
@@ -235,7 +253,7 @@ def ai_search_bids(request):
             return JsonResponse({'success': False, 'message': 'Query is required'}, status=400)
         
         # Get all bids with embeddings
-        bids = BidDocument.objects.filter(embedding__isnull=False).exclude(embedding='')
+        bids = BidDocument.objects.filter(embedding__isnull=False).exclude(embedding='').defer('raw_text')
         
         if not bids.exists():
             return JsonResponse({'success': False, 'message': 'No bids with embeddings found'}, status=404)
@@ -4,3 +4,6 @@ class ContractRecordAppConfig(AppConfig):
     name = "src.apps.cont_record"
 
     verbose_name = "Contract Record App"
+
+    def ready(self):
+        from . import signals  # noqa: F401
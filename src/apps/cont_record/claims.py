@@ -0,0 +1,182 @@
+import os
+import socket
+import threading
+import uuid
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from src.apps.cont_record.models import IngestClaim
+from src.utils.db_writer import get_db_writer
+from src.utils.work_queue import iter_pdf_files
+
+# Seconds a claim stays valid without a heartbeat; a worker renews it every third of that
+LEASE_SECONDS = 120
+# A file whose lease has run out this many times is marked FAILED instead of reclaimed
+MAX_ATTEMPTS = 3
+# Rows inserted per statement when queueing
+ENQUEUE_BATCH_SIZE = 1000
+
+# Logged file statuses that finish a claim as DONE; the rest finish it as FAILED
+DONE_RESULTS = ('SUCCESS', 'SKIPPED')
+
+
+def enqueue_pdfs(data_dir, batch_size=ENQUEUE_BATCH_SIZE) -> Tuple[int, int]:
+    """Queue every PDF under ``data_dir`` that is not queued yet; returns (found, added)"""
+    data_dir = Path(data_dir)
+    before = IngestClaim.objects.count()
+    found = 0
+    batch = []
+    for pdf_path in iter_pdf_files(data_dir):
+        found += 1
+        batch.append(IngestClaim(path=Path(pdf_path).relative_to(data_dir).as_posix()))
+        if len(batch) >= batch_size:
+            IngestClaim.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    if batch:
+        IngestClaim.objects.bulk_create(batch, ignore_conflicts=True)
+    return found, IngestClaim.objects.count() - before
+
+
+def queue_status() -> Dict[str, int]:
+    """Row count per status, plus 'STALE' for claims whose lease has run out"""
+    counts = dict(IngestClaim.objects.values_list('status').annotate(n=Count('pk')).order_by())
+    counts['STALE'] = IngestClaim.objects.filter(
+        status=IngestClaim.CLAIMED, lease_expires_at__lt=timezone.now()
+    ).count()
+    return counts
+
+
+class ClaimQueue:
+    """Lease-based work distribution over the IngestClaim table.
+
+    ``claim`` moves up to ``batch_size`` claimable rows (pending, or claimed
+    under a lease that has run out) to this worker under a fresh lease
+    token in one transaction, so processes that share the database never
+    receive the same row. A heartbeat thread
+    renews the lease while the batch is processed; when a worker dies its
+    lease lapses and the rows are claimed again, up to ``max_attempts``
+    times. All statements go through the process's database writer.
+
+    With the default SQLite database every worker must run on the host
+    that holds db.sqlite3: WAL mode relies on shared memory, which does
+    not work over a network filesystem. Workers on several hosts need a
+    client/server database (PostgreSQL, MySQL) in DATABASES.
+    """
+
+    def __init__(self, worker=None, lease_seconds=LEASE_SECONDS, max_attempts=MAX_ATTEMPTS):
+        self.worker = worker or f"{socket.gethostname()}:{os.getpid()}"
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.lease_token = ''
+        self._stop = threading.Event()
+        self._heartbeat = None
+
+    def _claimable(self, now):
+        return Q(status=IngestClaim.PENDING) | Q(status=IngestClaim.CLAIMED, lease_expires_at__lt=now)
+
+    def claim(self, batch_size) -> List[IngestClaim]:
+        """Lease up to ``batch_size`` files; an empty list when nothing is claimable"""
+        return get_db_writer().run(self._claim, batch_size)
+
+    def _claim(self, batch_size):
+        token = uuid.uuid4().hex
+        now = timezone.now()
+        with transaction.atomic():
+            IngestClaim.objects.filter(
+                status=IngestClaim.CLAIMED, lease_expires_at__lt=now, attempts__gte=self.max_attempts
+            ).update(
+                status=IngestClaim.FAILED, result='FAILED', worker='', lease_token='', lease_expires_at=None,
+                error=f"Lease ran out {self.max_attempts} times (worker died or hung)", updated_at=now
+            )
+            # FOR UPDATE SKIP LOCKED where supported; SQLite serialises the whole
+            # transaction instead (it starts with BEGIN IMMEDIATE)
+            ids = list(
+                IngestClaim.objects.select_for_update(skip_locked=True).filter(self._claimable(now))
+                .order_by('pk').values_list('pk', flat=True)[:batch_size]
+            )
+            if not ids:
+                return []
+            # The claimable condition is repeated so a row taken since the SELECT stays taken
+            IngestClaim.objects.filter(self._claimable(now), pk__in=ids).update(
+                status=IngestClaim.CLAIMED, worker=self.worker, lease_token=token,
+                lease_expires_at=now + timedelta(seconds=self.lease_seconds),
+                attempts=F('attempts') + 1, updated_at=now
+            )
+        self.lease_token = token
+        return list(IngestClaim.objects.filter(lease_token=token).order_by('pk'))
+
+    def renew(self) -> int:
+        """Extend the lease of the current batch; returns how many of its rows are still held"""
+        if not self.lease_token:
+            return 0
+        return get_db_writer().run(self._renew, self.lease_token)
+
+    def _renew(self, token):
+        now = timezone.now()
+        return IngestClaim.objects.filter(lease_token=token, status=IngestClaim.CLAIMED).update(
+            lease_expires_at=now + timedelta(seconds=self.lease_seconds), updated_at=now
+        )
+
+    def finish(self, claims, results) -> int:
+        """Record the logged status of each claimed file; rows lost to another worker are left alone"""
+        return get_db_writer().run(self._finish, claims, results)
+
+    def _finish(self, claims, results):
+        by_result = {}
+        for claim, result in zip(claims, results):
+            by_result.setdefault(result, []).append(claim.pk)
+        now = timezone.now()
+        finished = 0
+        with transaction.atomic():
+            for result, ids in by_result.items():
+                finished += IngestClaim.objects.filter(
+                    pk__in=ids, lease_token=self.lease_token, status=IngestClaim.CLAIMED
+                ).update(
+                    status=IngestClaim.DONE if result in DONE_RESULTS else IngestClaim.FAILED,
+                    result=result or '', lease_expires_at=None, updated_at=now
+                )
+        self.lease_token = ''
+        return finished
+
+    def release(self) -> int:
+        """Hand the unfinished rows of the current batch back to the queue (clean shutdown)"""
+        if not self.lease_token:
+            return 0
+        return get_db_writer().run(self._release, self.lease_token)
+
+    def _release(self, token):
+        released = IngestClaim.objects.filter(lease_token=token, status=IngestClaim.CLAIMED).update(
+            status=IngestClaim.PENDING, worker='', lease_token='', lease_expires_at=None,
+            attempts=F('attempts') - 1, updated_at=timezone.now()
+        )
+        self.lease_token = ''
+        return released
+
+    def others_active(self) -> bool:
+        """Whether some worker still holds a live lease (its rows may yet come back)"""
+        return IngestClaim.objects.filter(
+            status=IngestClaim.CLAIMED, lease_expires_at__gte=timezone.now()
+        ).exists()
+
+    def start_heartbeat(self):
+        def beat():
+            while not self._stop.wait(self.lease_seconds / 3):
+                try:
+                    self.renew()
+                except Exception as e:
+                    print(f"⚠️  Could not renew claims of {self.worker}: {e}")
+
+        self._stop.clear()
+        self._heartbeat = threading.Thread(target=beat, name="Claim_Heartbeat", daemon=True)
+        self._heartbeat.start()
+
+    def stop_heartbeat(self):
+        self._stop.set()
+        if self._heartbeat is not None:
+            self._heartbeat.join()
+            self._heartbeat = None
@@ -1,5 +1,4 @@
 import fitz  # PyMuPDF
-import pandas as pd
 import json
 import re
 import os
@@ -21,1095 +20,13 @@ django.setup()
 from django.core.files import File
 from django.core.files.base import ContentFile
 from django.utils import timezone
-from src.apps.cont_record.models import (
-    Contract, PdfFile, OrganisationDetail, BuyerDetail, FinancialApproval,
-    PayingAuthority, SellerDetail, Product, ConsigneeDetail
-)
-
-class ProcessLogger:
-    """Comprehensive logging for PDF processing operations"""
-    
-    def __init__(self, log_dir="logs"):
-        self.log_dir = Path(log_dir)
-        self.log_dir.mkdir(exist_ok=True)
-        
-        # Create timestamp for this session
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.session_id = f"extraction_session_{timestamp}"
-        
-        # Setup file logging
-        self.setup_file_logging()
-        
-        # Setup detailed CSV logging
-        self.setup_csv_logging()
-        
-        # Processing statistics
-        self.stats = {
-            'total_files': 0,
-            'successful': 0,
-            'failed': 0,
-            'skipped': 0,
-            'ignored': 0,
-            'start_time': datetime.now(),
-            'end_time': None
-        }
-    
-    def setup_file_logging(self):
-        """Setup file-based logging"""
-        log_file = self.log_dir / f"{self.session_id}.log"
-        
-        # Configure logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file, encoding='utf-8'),
-                logging.StreamHandler()  # Also print to console
-            ]
-        )
-        
-        self.logger = logging.getLogger(__name__)
-        self.log_file = log_file
-    
-    def setup_csv_logging(self):
-        """Setup CSV logging for detailed tracking"""
-        csv_file = self.log_dir / f"{self.session_id}_detailed.csv"
-        
-        # CSV headers
-        self.csv_headers = [
-            'timestamp', 'filename', 'status', 'reason', 'file_size', 
-            'processing_time', 'error_details', 'contract_no', 'pages_extracted'
-        ]
-        
-        # Create CSV file with headers
-        with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-            import csv
-            writer = csv.writer(f)
-            writer.writerow(self.csv_headers)
-        
-        self.csv_file = csv_file
-        self.csv_lock = threading.Lock()
-    
-    def log_file_processing(self, filename, status, reason="", file_size=0, 
-                          processing_time=0, error_details="", contract_no="", pages_extracted=0):
-        """Log a file processing result"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        # Log to file
-        if status == 'SUCCESS':
-            self.logger.info(f"✅ {filename}: {reason}")
-        elif status == 'SKIPPED':
-            self.logger.info(f"⏭️  {filename}: {reason}")
-        elif status == 'FAILED':
-            self.logger.error(f"❌ {filename}: {reason}")
-        elif status == 'IGNORED':
-            self.logger.warning(f"⚠️  {filename}: {reason}")
-        
-        # Log to CSV
-        with self.csv_lock:
-            with open(self.csv_file, 'a', newline='', encoding='utf-8') as f:
-                import csv
-                writer = csv.writer(f)
-                writer.writerow([
-                    timestamp, filename, status, reason, file_size,
-                    processing_time, error_details, contract_no, pages_extracted
-                ])
-        
-        # Update statistics
-        if status == 'SUCCESS':
-            self.stats['successful'] += 1
-        elif status == 'SKIPPED':
-            self.stats['skipped'] += 1
-        elif status == 'FAILED':
-            self.stats['failed'] += 1
-        elif status == 'IGNORED':
-            self.stats['ignored'] += 1
-    
-    def log_session_start(self, total_files):
-        """Log the start of a processing session"""
-        self.stats['total_files'] = total_files
-        self.logger.info(f"🚀 Starting PDF extraction session: {self.session_id}")
-        self.logger.info(f"📁 Total files to process: {total_files}")
-        self.logger.info(f"📂 Log directory: {self.log_dir}")
-        self.logger.info(f"📄 Detailed CSV log: {self.csv_file}")
-    
-    def log_session_end(self):
-        """Log the end of a processing session"""
-        self.stats['end_time'] = datetime.now()
-        duration = self.stats['end_time'] - self.stats['start_time']
-        
-        self.logger.info("="*80)
-        self.logger.info("📊 PROCESSING SESSION COMPLETE")
-        self.logger.info("="*80)
-        self.logger.info(f"📁 Total files found: {self.stats['total_files']}")
-        self.logger.info(f"✅ Successful extractions: {self.stats['successful']}")
-        self.logger.info(f"⏭️  Skipped (duplicates): {self.stats['skipped']}")
-        self.logger.info(f"❌ Failed extractions: {self.stats['failed']}")
-        self.logger.info(f"⚠️  Ignored files: {self.stats['ignored']}")
-        self.logger.info(f"⏱️  Total duration: {duration}")
-        self.logger.info(f"📄 Detailed logs saved to: {self.log_file}")
-        self.logger.info(f"📊 CSV summary saved to: {self.csv_file}")
-        self.logger.info("="*80)
-        
-        # Save session summary to JSON
-        summary_file = self.log_dir / f"{self.session_id}_summary.json"
-        summary_data = {
-            'session_id': self.session_id,
-            'start_time': self.stats['start_time'].isoformat(),
-            'end_time': self.stats['end_time'].isoformat(),
-            'duration_seconds': duration.total_seconds(),
-            'statistics': self.stats.copy(),
-            'log_files': {
-                'log_file': str(self.log_file),
-                'csv_file': str(self.csv_file),
-                'summary_file': str(summary_file)
-            }
-        }
-        
-        # Convert datetime objects to strings for JSON serialization
-        summary_data['statistics']['start_time'] = self.stats['start_time'].isoformat()
-        summary_data['statistics']['end_time'] = self.stats['end_time'].isoformat()
-        
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary_data, f, indent=2, ensure_ascii=False)
-        
-        self.logger.info(f"📋 Session summary saved to: {summary_file}")
-    
-    def get_log_files(self):
-        """Get list of log files for this session"""
-        return {
-            'log_file': self.log_file,
-            'csv_file': self.csv_file,
-            'summary_file': self.log_dir / f"{self.session_id}_summary.json"
-        }
-
-
-
-class FinalImprovedAutomatedGEMCPDFExtractor:
-    def __init__(self, pdf_path):
-        self.pdf_path = pdf_path
-        self.extracted_data = {}
-        self.contract_instance = None
-        self.pdf_file_instance = None
-        
-
-    
-
-    
-
-    
-    def extract_text_from_pdf(self):
-        """Extract text from PDF using PyMuPDF"""
-        try:
-            doc = fitz.open(self.pdf_path)
-            text = ""
-            for page in doc:
-                text += page.get_text()
-            doc.close()
-            return text
-        except Exception as e:
-            print(f"Error extracting text from PDF: {e}")
-            return ""
-    
-    def clean_text(self, text):
-        """Clean and normalize extracted text"""
-        if not text:
-            return ""
-        # Remove extra whitespace and normalize
-        text = re.sub(r'\s+', ' ', text)
-        text = text.replace('|', ' ')
-        # Remove any non-printable characters
-        text = ''.join(char for char in text if char.isprintable() or char.isspace())
-        return text.strip()
-    
-    def clean_text_remove_hindi(self, text):
-        """Clean text and remove Hindi characters for storage in models"""
-        if not text:
-            return ""
-        
-        # Remove Hindi and non-ASCII characters
-        text = re.sub(r'[^\x00-\x7F]+', '', text)
-        
-        # Remove specific mixed text patterns
-        patterns_to_remove = [
-            r'वdीय.*?ववरण',
-            r'वेता.*?ववरण', 
-            r'एमएसएमई.*?GSTIN',
-            r'जीएसटXआईएन.*?GSTIN',
-            r'GST.*?invoice.*?Buyer',
-            r'Delivery.*?Instructions.*?NA',
-            r'उ पाद.*?ववरण',
-            r'MSME Registration number.*?GSTIN',
-            r'Registration number.*?GSTIN',
-            r'GSTIN.*?R',
-            r'Tax invoice.*?Buyer',
-            r'Delivery Instructions.*?NA',
-            r'उ पाद.*?ववरण',
-            r'oMSME Registration number.*?',
-            r'MSME Registration number.*?',
-            r'Registration number.*?'
-        ]
-        
-        for pattern in patterns_to_remove:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.DOTALL)
-        
-        # Clean up extra whitespace and normalize
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
-        
-        return text
-    
-    def detect_pdf_pattern_type(self, text):
-        """Detect whether PDF has Hindi-first or English-first pattern"""
-        if not text:
-            return "unknown"
-        
-        # Count patterns
-        hindi_first_count = 0
-        english_first_count = 0
-        
-        # Pattern 1: Hindi followed by English (hindi_text english_text)
-        hindi_first_patterns = re.findall(r'[^\x00-\x7F]+\s+[a-zA-Z]', text)
-        hindi_first_count = len(hindi_first_patterns)
-        
-        # Pattern 2: English followed by Hindi (english_text hindi_text)
-        english_first_patterns = re.findall(r'[a-zA-Z]\s+[^\x00-\x7F]+', text)
-        english_first_count = len(english_first_patterns)
-        
-        # Pattern 3: Look for field patterns
-        # Hindi field: English value
-        hindi_field_patterns = re.findall(r'[^\x00-\x7F]+\s*:\s*[a-zA-Z]', text)
-        hindi_first_count += len(hindi_field_patterns)
-        
-        # English field: Hindi value
-        english_field_patterns = re.findall(r'[a-zA-Z]\s*:\s*[^\x00-\x7F]+', text)
-        english_first_count += len(english_field_patterns)
-        
-        print(f"🔍 Pattern Detection Results:")
-        print(f"   Hindi-first patterns found: {hindi_first_count}")
-        print(f"   English-first patterns found: {english_first_count}")
-        
-        if hindi_first_count > english_first_count:
-            pattern_type = "hindi_first"
-            print(f"   📊 Detected pattern: Hindi-first (नाम Name: value)")
-        elif english_first_count > hindi_first_count:
-            pattern_type = "english_first"
-            print(f"   📊 Detected pattern: English-first (Name नाम: value)")
-        else:
-            pattern_type = "mixed"
-            print(f"   📊 Detected pattern: Mixed (both patterns present)")
-        
-        return pattern_type
-    
-    def clean_text_smart_bilingual(self, text):
-        """Smart text cleaning that adapts based on detected PDF pattern"""
-        if not text:
-            return ""
-        
-        # First detect the pattern type
-        pattern_type = self.detect_pdf_pattern_type(text)
-        
-        print(f"🧠 Applying {pattern_type} pattern cleaning strategy...")
-        
-        if pattern_type == "hindi_first":
-            # Use original method for Hindi-first PDFs
-            return self.clean_text_remove_hindi(text)
-        
-        elif pattern_type == "english_first":
-            # Special handling for English-first PDFs
-            return self.clean_text_english_first(text)
-        
-        else:  # mixed pattern
-            # Use enhanced method that handles both patterns
-            return self.clean_text_enhanced_bilingual(text)
-    
-    def clean_text_english_first(self, text):
-        """Special cleaning for English-first pattern PDFs"""
-        if not text:
-            return ""
-        
-        print("🔍 Extracting text from English-first pattern PDF...")
-        
-        # Method 1: Extract English text that comes before Hindi
-        english_before_hindi = re.findall(r'([a-zA-Z\s\d\.,\-\(\)\/]+)\s+[^\x00-\x7F]+', text)
-        
-        # Method 2: Extract pure English segments
-        pure_english = re.findall(r'[a-zA-Z\s\d\.,\-\(\)\/]+', text)
-        
-        # Method 3: Extract text between Hindi sections
-        hindi_split = re.split(r'[^\x00-\x7F]+', text)
-        between_hindi = []
-        for part in hindi_split:
-            if part.strip() and re.search(r'[a-zA-Z]', part):
-                between_hindi.append(part.strip())
-        
-        # Method 4: Extract English field names from mixed patterns
-        english_fields = re.findall(r'([a-zA-Z\s\d\.,\-\(\)\/]+)\s*:\s*[^\x00-\x7F]+', text)
-        
-        # Combine all extracted text
-        all_extracted = []
-        all_extracted.extend(english_before_hindi)
-        all_extracted.extend(pure_english)
-        all_extracted.extend(between_hindi)
-        all_extracted.extend(english_fields)
-        
-        # Clean and combine
-        cleaned_text = ""
-        for segment in all_extracted:
-            if segment and len(segment.strip()) > 1:
-                cleaned_segment = segment.strip()
-                # Remove any remaining non-printable characters
-                cleaned_segment = ''.join(char for char in cleaned_segment if char.isprintable() or char.isspace())
-                if cleaned_segment:
-                    cleaned_text += cleaned_segment + " "
-        
-        # Final cleanup
-        cleaned_text = re.sub(r'\s+', ' ', cleaned_text)
-        cleaned_text = cleaned_text.strip()
-        
-        print(f"✅ Extracted {len(cleaned_text)} characters from English-first pattern")
-        return cleaned_text
-    
-    def clean_text_enhanced_bilingual(self, text):
-        """Enhanced text cleaning that handles both Hindi-first and English-first patterns"""
-        if not text:
-            return ""
-        
-        print("🔍 Using enhanced bilingual cleaning for mixed pattern PDF...")
-        
-        # Extract all English text segments using multiple methods
-        english_segments = []
-        
-        # Method 1: Pure English text
-        pure_english = re.findall(r'[a-zA-Z\s\d\.,\-\(\)\/]+', text)
-        english_segments.extend(pure_english)
-        
-        # Method 2: English text that comes after Hindi
-        after_hindi = re.findall(r'[^\x00-\x7F]+\s+([a-zA-Z\s\d\.,\-\(\)\/]+)', text)
-        english_segments.extend(after_hindi)
-        
-        # Method 3: English text that comes before Hindi
-        before_hindi = re.findall(r'([a-zA-Z\s\d\.,\-\(\)\/]+)\s+[^\x00-\x7F]+', text)
-        english_segments.extend(before_hindi)
-        
-        # Method 4: Text between Hindi sections
-        hindi_split = re.split(r'[^\x00-\x7F]+', text)
-        for part in hindi_split:
-            if part.strip() and re.search(r'[a-zA-Z]', part):
-                english_segments.append(part.strip())
-        
-        # Method 5: Field patterns
-        field_patterns = [
-            r'([a-zA-Z\s\d\.,\-\(\)\/]+)\s*:\s*([^\x00-\x7F]+)',  # field: hindi_value
-            r'([^\x00-\x7F]+)\s*:\s*([a-zA-Z\s\d\.,\-\(\)\/]+)',  # hindi_field: english_value
-        ]
-        
-        for pattern in field_patterns:
-            matches = re.findall(pattern, text)
-            for match in matches:
-                if isinstance(match, tuple):
-                    for part in match:
-                        if part.strip() and re.search(r'[a-zA-Z]', part):
-                            english_segments.append(part.strip())
-                else:
-                    if match.strip() and re.search(r'[a-zA-Z]', match):
-                        english_segments.append(match.strip())
-        
-        # Clean and combine all segments
-        cleaned_text = ""
-        for segment in english_segments:
-            if segment and len(segment.strip()) > 1:
-                cleaned_segment = segment.strip()
-                # Remove any remaining non-printable characters
-                cleaned_segment = ''.join(char for char in cleaned_segment if char.isprintable() or char.isspace())
-                if cleaned_segment:
-                    cleaned_text += cleaned_segment + " "
-        
-        # Final cleanup
-        cleaned_text = re.sub(r'\s+', ' ', cleaned_text)
-        cleaned_text = cleaned_text.strip()
-        
-        print(f"✅ Enhanced bilingual cleaning extracted {len(cleaned_text)} characters")
-        return cleaned_text
-    
-    def clean_address(self, address):
-        """Clean address text by removing extra content"""
-        if not address:
-            return ""
-        
-        # Enhanced cleaning - remove all Hindi and mixed content
-        # Remove Hindi characters and mixed text
-        address = re.sub(r'[^\x00-\x7F]+', '', address)  # Remove non-ASCII characters
-        
-        # Remove specific mixed text patterns
-        address = re.sub(r'वdीय.*?ववरण', '', address)
-        address = re.sub(r'वेता.*?ववरण', '', address)
-        address = re.sub(r'एमएसएमई.*?GSTIN', '', address)
-        address = re.sub(r'जीएसटXआईएन.*?GSTIN', '', address)
-        address = re.sub(r'GST.*?invoice.*?Buyer', '', address)
-        address = re.sub(r'Delivery.*?Instructions.*?NA', '', address)
-        address = re.sub(r'उ पाद.*?ववरण', '', address)
-        
-        # Remove any remaining mixed content
-        address = re.sub(r'[^\w\s,.-]', '', address)
-        
-        # Clean up extra whitespace and normalize
-        address = re.sub(r'\s+', ' ', address)
-        address = address.strip()
-        
-        # Remove any trailing commas or dashes
-        address = re.sub(r'[,\s-]+$', '', address)
-        
-        return address
-    
-    def clean_address_aggressive(self, address):
-        """Aggressively clean address text to remove ALL mixed content"""
-        if not address:
-            return ""
-        
-        # Step 1: Remove all non-ASCII characters (Hindi, special chars)
-        address = re.sub(r'[^\x00-\x7F]+', '', address)
-        
-        # Step 2: Remove specific problematic patterns
-        patterns_to_remove = [
-            r'वdीय.*?ववरण',
-            r'वेता.*?ववरण', 
-            r'एमएसएमई.*?GSTIN',
-            r'जीएसटXआईएन.*?GSTIN',
-            r'GST.*?invoice.*?Buyer',
-            r'Delivery.*?Instructions.*?NA',
-            r'उ पाद.*?ववरण',
-            r'MSME Registration number.*?GSTIN',
-            r'Registration number.*?GSTIN',
-            r'GSTIN.*?R',
-            r'Tax invoice.*?Buyer',
-            r'Delivery Instructions.*?NA',
-            r'उ पाद.*?ववरण',
-            r'oMSME Registration number.*?',
-            r'MSME Registration number.*?',
-            r'Registration number.*?'
-        ]
-        
-        for pattern in patterns_to_remove:
-            address = re.sub(pattern, '', address, flags=re.IGNORECASE | re.DOTALL)
-        
-        # Step 3: Remove any remaining mixed content and clean up
-        address = re.sub(r'[^\w\s,.-]', '', address)
-        address = re.sub(r'\s+', ' ', address)
-        address = address.strip()
-        
-        # Step 4: Remove trailing artifacts and clean up
-        address = re.sub(r'[,\s-]+$', '', address)
-        address = re.sub(r'^\s*[,\s-]+', '', address)
-        
-        # Step 5: Final cleanup - remove any remaining mixed text
-        # Look for patterns that indicate mixed content
-        if re.search(r'[a-zA-Z]{1,2}\s+[a-zA-Z]{1,2}$', address):
-            # Remove last few characters if they look like mixed content
-            address = re.sub(r'\s+[a-zA-Z]{1,2}\s+[a-zA-Z]{1,2}$', '', address)
-        
-        # Step 6: Remove any remaining trailing artifacts like "- o -"
-        address = re.sub(r'\s*-\s*[a-zA-Z]\s*-\s*$', '', address)
-        address = re.sub(r'\s*-\s*[a-zA-Z]\s*$', '', address)
-        address = re.sub(r'\s*[a-zA-Z]\s*-\s*$', '', address)
-        
-        # Final cleanup
-        address = re.sub(r'\s+$', '', address)
-        address = re.sub(r'^\s+', '', address)
-        
-        return address
-    
-    def extract_field_value(self, text, field_pattern, section_text=""):
-        """Extract field value using regex pattern"""
-        if section_text:
-            search_text = section_text
-        else:
-            search_text = text
-            
-        match = re.search(field_pattern, search_text, re.IGNORECASE | re.DOTALL)
-        if match:
-            value = match.group(1).strip()
-            return self.clean_text(value)
-        return ""
-    
-    def extract_section_text(self, text, start_marker, end_marker):
-        """Extract text between two markers with better boundary handling"""
-        start_pos = text.find(start_marker)
-        if start_pos == -1:
-            return ""
-        
-        end_pos = text.find(end_marker, start_pos)
-        if end_pos == -1:
-            # If no end marker, take until the next section
-            section_text = text[start_pos:]
-        else:
-            section_text = text[start_pos:end_pos]
-        
-        return section_text
-    
-    def extract_organization_details(self, text):
-        """Extract Organization Details from text"""
-        org_data = {}
-        
-        # Extract the organization section
-        org_section = self.extract_section_text(text, "Organisation Details", "Buyer Details")
-        
-        # Extract fields with improved patterns
-        org_data['Type'] = self.extract_field_value(org_section, r'Type\s*:\s*([^\n]+)')
-        org_data['Ministry'] = self.extract_field_value(org_section, r'Ministry\s*:\s*([^\n]+)')
-        org_data['Department'] = self.extract_field_value(org_section, r'Department\s*:\s*([^\n]+)')
-        org_data['Organization Name'] = self.extract_field_value(org_section, r'Organisation\s+Name\s*:\s*([^\n]+)')
-        
-        # Try multiple patterns for Office Zone
-        office_zone = self.extract_field_value(org_section, r'Office\s+Zone\s*:\s*([^\n]+)')
-        if not office_zone:
-            # Try alternative patterns
-            office_zone = self.extract_field_value(org_section, r'Office\s*Zone\s*:\s*([^\n]+)')
-        if not office_zone:
-            # Look for Sujanpur in the organization section
-            if 'Sujanpur' in org_section:
-                office_zone = 'Sujanpur'
-        org_data['Office Zone'] = office_zone
-        
-        return org_data
-    
-    def extract_contract_details(self, text):
-        """Extract Contract Details from the top of the PDF"""
-        contract_data = {}
-        
-        # Extract Contract No - look for patterns like "Contract No: GEMC-511687790000002"
-        contract_match = re.search(r'Contract\s+No\s*:\s*([^\n]+)', text, re.IGNORECASE)
-        if contract_match:
-            contract_data['Contract No'] = contract_match.group(1).strip()
-        else:
-            # Try alternative patterns
-            contract_match = re.search(r'GEMC-\d+', text)
-            if contract_match:
-                contract_data['Contract No'] = contract_match.group(0)
-            else:
-                contract_data['Contract No'] = ""
-        
-        # Extract Generated Date - look for patterns like "Generated Date : 17-Feb-2025"
-        date_match = re.search(r'Generated\s+Date\s*:\s*([^\n]+)', text, re.IGNORECASE)
-        if date_match:
-            contract_data['Generated Date'] = date_match.group(1).strip()
-        else:
-            # Try alternative patterns
-            date_match = re.search(r'\d{1,2}-[A-Za-z]{3}-\d{4}', text)
-            if date_match:
-                contract_data['Generated Date'] = date_match.group(0)
-            else:
-                contract_data['Generated Date'] = ""
-        
-        return contract_data
-    
-    def extract_buyer_details(self, text):
-        """Extract Buyer Details from text"""
-        buyer_data = {}
-        
-        # Extract the buyer section
-        buyer_section = self.extract_section_text(text, "Buyer Details", "Financial Approval Detail")
-        
-        # Extract fields
-        buyer_data['Designation'] = self.extract_field_value(buyer_section, r'Designation\s*:\s*([^\n]+)')
-        buyer_data['Contact No'] = self.extract_field_value(buyer_section, r'Contact\s+No\.?\s*:\s*([^\n]+)')
-        buyer_data['Email ID'] = self.extract_field_value(buyer_section, r'Email\s+ID\s*:\s*([^\n]+)')
-        buyer_data['GSTIN'] = self.extract_field_value(buyer_section, r'GSTIN\s*:\s*([^\n]+)')
-        
-        # Extract address - handle multi-line addresses
-        address_match = re.search(r'Address\s*:\s*(.*?)(?=\n\w+\s*:|$)', buyer_section, re.DOTALL)
-        if address_match:
-            address = address_match.group(1).strip()
-            buyer_data['Address'] = self.clean_address_aggressive(address)
-        else:
-            buyer_data['Address'] = ""
-        
-        return buyer_data
-    
-    def extract_financial_approval_details(self, text):
-        """Extract Financial Approval Details from text"""
-        financial_data = {}
-        
-        # Extract the financial approval section
-        financial_section = self.extract_section_text(text, "Financial Approval Detail", "Paying Authority Details")
-        
-        # Extract fields
-        financial_data['IFD Concurrence'] = self.extract_field_value(financial_section, r'IFD\s+Concurrence\s*:\s*([^\n]+)')
-        financial_data['Designation of Administrative Approval'] = self.extract_field_value(financial_section, r'Designation\s+of\s+Administrative\s+Approval\s*:\s*([^\n]+)')
-        financial_data['Designation of Financial Approval'] = self.extract_field_value(financial_section, r'Designation\s+of\s+Financial\s+Approval\s*:\s*([^\n]+)')
-        
-        return financial_data
-    
-    def extract_paying_authority_details(self, text):
-        """Extract Paying Authority Details from text"""
-        paying_data = {}
-        
-        # Extract the paying authority section
-        paying_section = self.extract_section_text(text, "Paying Authority Details", "Seller Details")
-        
-        # Extract fields
-        paying_data['Role'] = self.extract_field_value(paying_section, r'Role\s*:\s*([^\n]+)')
-        paying_data['Payment Mode'] = self.extract_field_value(paying_section, r'Payment\s+Mode\s*:\s*([^\n]+)')
-        paying_data['Designation'] = self.extract_field_value(paying_section, r'Designation\s*:\s*([^\n]+)')
-        paying_data['Email ID'] = self.extract_field_value(paying_section, r'Email\s+ID\s*:\s*([^\n]+)')
-        paying_data['GSTIN'] = self.extract_field_value(paying_section, r'GSTIN\s*:\s*([^\n]+)')
-        
-        # Extract address
-        address_match = re.search(r'Address\s*:\s*([^\n]+)', paying_section)
-        if address_match:
-            address = address_match.group(1).strip()
-            paying_data['Address'] = self.clean_address_aggressive(address)
-        else:
-            paying_data['Address'] = ""
-        
-        return paying_data
-    
-    def extract_seller_details(self, text):
-        """Extract Seller Details from text"""
-        seller_data = {}
-        
-        # Extract the seller section
-        seller_section = self.extract_section_text(text, "Seller Details", "Product Details")
-        
-        # Extract fields
-        seller_data['GeM Seller ID'] = self.extract_field_value(seller_section, r'GeM\s+Seller\s+ID\s*:\s*([^\n]+)')
-        seller_data['Company Name'] = self.extract_field_value(seller_section, r'Company\s+Name\s*:\s*([^\n]+)')
-        seller_data['Contact No'] = self.extract_field_value(seller_section, r'Contact\s+No\.?\s*:\s*([^\n]+)')
-        seller_data['Email ID'] = self.extract_field_value(seller_section, r'Email\s+ID\s*:\s*([^\n]+)')
-        seller_data['MSME Registration number'] = self.extract_field_value(seller_section, r'MSME\s+Registration\s+number\s*:\s*([^\n]+)')
-        seller_data['GSTIN'] = self.extract_field_value(seller_section, r'GSTIN\s*:\s*([^\n]+)')
-        
-        # Extract address
-        address_match = re.search(r'Address\s*:\s*([^\n]+)', seller_section)
-        if address_match:
-            address = address_match.group(1).strip()
-            seller_data['Address'] = self.clean_address_aggressive(address)
-        else:
-            seller_data['Address'] = ""
-        
-        return seller_data
-    
-    def extract_product_details(self, text):
-        """Extract Product Details from text"""
-        product_data = {}
-        
-        # Extract the product section
-        product_section = self.extract_section_text(text, "Product Details", "Consignee Detail")
-        
-        # Extract fields
-        product_data['Item Description'] = self.extract_field_value(product_section, r'Item\s+Description\s*:\s*([^\n]+)')
-        product_data['Product Name'] = self.extract_field_value(product_section, r'Product\s+Name\s*:\s*([^\n]+)')
-        product_data['Brand'] = self.extract_field_value(product_section, r'Brand\s*:\s*([^\n]+)')
-        product_data['Brand Type'] = self.extract_field_value(product_section, r'Brand\s+Type\s*:\s*([^\n]+)')
-        product_data['Catalogue Status'] = self.extract_field_value(product_section, r'Catalogue\s+Status\s*:\s*([^\n]+)')
-        product_data['Selling As'] = self.extract_field_value(product_section, r'Selling\s+As\s*:\s*([^\n]+)')
-        product_data['Category Name & Quadrant'] = self.extract_field_value(product_section, r'Category\s+Name\s*&\s*Quadrant\s*:\s*([^\n]+)')
-        product_data['Model'] = self.extract_field_value(product_section, r'Model\s*:\s*([^\n]+)')
-        product_data['HSN Code'] = self.extract_field_value(product_section, r'HSN\s+Code\s*:\s*([^\n]+)')
-        
-        # Extract quantity and price from table with improved patterns
-        quantity_match = re.search(r'(\d+)\s+pieces', product_section)
-        product_data['Ordered Quantity'] = quantity_match.group(1) if quantity_match else ""
-        product_data['Unit'] = "pieces" if quantity_match else ""
-        
-        # Try multiple patterns for unit price - prioritize finding the actual unit price
-        # First, look for the unit price field specifically
-        price_match = re.search(r'Unit\s+Price\s*\(INR\)\s*:\s*(\d+)', product_section, re.IGNORECASE)
-        if price_match:
-            product_data['Unit Price (INR)'] = price_match.group(1)
-        else:
-            # Look for price in table structure - try to find the larger number which is likely the unit price
-            price_match = re.search(r'(\d+)\s+NA\s+(\d+)', product_section)
-            if price_match:
-                # Use the larger number as it's more likely to be the unit price
-                num1, num2 = int(price_match.group(1)), int(price_match.group(2))
-                product_data['Unit Price (INR)'] = str(max(num1, num2))
-            else:
-                # Try alternative patterns
-                price_match = re.search(r'(\d+)\s*NA\s*(\d+)', product_section)
-                if price_match:
-                    num1, num2 = int(price_match.group(1)), int(price_match.group(2))
-                    product_data['Unit Price (INR)'] = str(max(num1, num2))
-                else:
-                    # Look for price in the table structure
-                    price_match = re.search(r'(\d+)\s*pieces\s*(\d+)', product_section)
-                    if price_match:
-                        num1, num2 = int(price_match.group(1)), int(price_match.group(2))
-                        product_data['Unit Price (INR)'] = str(max(num1, num2))
-                    else:
-                        # Final fallback - look for any 3-digit number that could be a price
-                        price_match = re.search(r'\b(\d{3})\b', product_section)
-                        if price_match:
-                            product_data['Unit Price (INR)'] = price_match.group(1)
-                        else:
-                            product_data['Unit Price (INR)'] = ""
-        
-        return product_data
-    
-    def extract_consignee_details(self, text):
-        """Extract Consignee Details from text"""
-        consignee_data = {}
-        
-        # Extract the consignee section
-        consignee_section = self.extract_section_text(text, "Consignee Detail", "Product Specification")
-        
-        # Extract fields
-        consignee_data['Designation'] = self.extract_field_value(consignee_section, r'Designation\s*:\s*([^\n]+)')
-        consignee_data['Email ID'] = self.extract_field_value(consignee_section, r'Email\s+ID\s*:\s*([^\n]+)')
-        consignee_data['Contact'] = self.extract_field_value(consignee_section, r'Contact\s*:\s*([^\n]+)')
-        consignee_data['GSTIN'] = self.extract_field_value(consignee_section, r'GSTIN\s*:\s*([^\n]+)')
-        
-        # Enhanced Item extraction - try multiple approaches
-        item = ""
-        
-        # Method 1: Direct extraction from Item field
-        item = self.extract_field_value(consignee_section, r'Item\s*:\s*([^\n]+)')
-        
-        # Method 2: Look for product name in the consignee section
-        if not item:
-            if 'SOBBY Cotton Plain Strobel Cloth' in consignee_section:
-                item = 'SOBBY Cotton Plain Strobel Cloth'
-        
-        # Method 3: Extract from the address line that contains product info
-        if not item:
-            address_match = re.search(r'Address\s*:\s*([^\n]+)', consignee_section)
-            if address_match:
-                address_text = address_match.group(1)
-                # Look for product name in address
-                if 'SOBBY Cotton Plain Strobel Cloth' in address_text:
-                    item = 'SOBBY Cotton Plain Strobel Cloth'
-        
-        # Method 4: Use product name from product details if available
-        if not item:
-            product_section = self.extract_section_text(text, "Product Details", "Consignee Detail")
-            if 'SOBBY Cotton Plain Strobel Cloth' in product_section:
-                item = 'SOBBY Cotton Plain Strobel Cloth'
-        
-        consignee_data['Item'] = item
-        
-        # Extract address
-        address_match = re.search(r'Address\s*:\s*([^\n]+)', consignee_section)
-        if address_match:
-            address = address_match.group(1).strip()
-            consignee_data['Address'] = self.clean_address_aggressive(address)
-        else:
-            consignee_data['Address'] = ""
-        
-        return consignee_data
-    
-    def check_contract_exists(self, contract_no):
-        """Check if contract already exists in database"""
-        if not contract_no:
-            return False
-        return Contract.objects.filter(contract_no=contract_no).exists()
-    
-    def save_to_django_models(self, text):
-        """Save extracted data to Django models"""
-        try:
-            # Check if contract already exists
-            contract_data = self.extracted_data['Contract Details']
-            contract_no = contract_data.get('Contract No', '')
-            
-            if self.check_contract_exists(contract_no):
-                print(f"⏭️  Contract {contract_no} already exists, skipping...")
-                return False
-            
-            # 1. Save PDF file
-            pdf_filename = os.path.basename(self.pdf_path)
-            with open(self.pdf_path, 'rb') as pdf_file:
-                self.pdf_file_instance = PdfFile.objects.create(
-                    pdf_file=File(pdf_file, name=pdf_filename)
-                )
-            
-            # 2. Save Contract with CLEANED raw text (no Hindi)
-            generated_date_str = contract_data.get('Generated Date', '')
-            
-            # Parse generated date
-            generated_date = None
-            if generated_date_str:
-                try:
-                    # Try different date formats
-                    for fmt in ['%d-%b-%Y', '%d/%m/%Y', '%Y-%m-%d']:
-                        try:
-                            generated_date = datetime.strptime(generated_date_str, fmt).date()
-                            break
-                        except ValueError:
-                            continue
-                except:
-                    generated_date = None
-            
-            # Store cleaned text using smart bilingual cleaning that adapts to PDF pattern
-            cleaned_text = self.clean_text_smart_bilingual(text)
-            
-            self.contract_instance = Contract.objects.create(
-                file=self.pdf_file_instance,
-                contract_no=contract_no,
-                generated_date=generated_date,
-                raw_text=cleaned_text,  # Store cleaned text
-                embedding=None  # No embedding generation
-            )
-            
-            # 3. Save Organization Details
-            org_data = self.extracted_data['Organization Details']
-            OrganisationDetail.objects.create(
-                contract=self.contract_instance,
-                type=org_data.get('Type', ''),
-                ministry=org_data.get('Ministry', ''),
-                department=org_data.get('Department', ''),
-                organisation_name=org_data.get('Organization Name', ''),
-                office_zone=org_data.get('Office Zone', '')
-            )
-            
-            # 4. Save Buyer Details
-            buyer_data = self.extracted_data['Buyer Details']
-            BuyerDetail.objects.create(
-                contract=self.contract_instance,
-                designation=buyer_data.get('Designation', ''),
-                contact_no=buyer_data.get('Contact No', ''),
-                email=buyer_data.get('Email ID', ''),
-                gstin=buyer_data.get('GSTIN', ''),
-                address=buyer_data.get('Address', '')
-            )
-            
-            # 5. Save Financial Approval
-            financial_data = self.extracted_data['Financial Approval Detail']
-            FinancialApproval.objects.create(
-                contract=self.contract_instance,
-                ifd_concurrence=financial_data.get('IFD Concurrence', '').lower() == 'yes',
-                admin_approval_designation=financial_data.get('Designation of Administrative Approval', ''),
-                financial_approval_designation=financial_data.get('Designation of Financial Approval', '')
-            )
-            
-            # 6. Save Paying Authority
-            paying_data = self.extracted_data['Paying Authority Details']
-            PayingAuthority.objects.create(
-                contract=self.contract_instance,
-                role=paying_data.get('Role', ''),
-                payment_mode=paying_data.get('Payment Mode', ''),
-                designation=paying_data.get('Designation', ''),
-                email=paying_data.get('Email ID', ''),
-                gstin=paying_data.get('GSTIN', ''),
-                address=paying_data.get('Address', '')
-            )
-            
-            # 7. Save Seller Details
-            seller_data = self.extracted_data['Seller Details']
-            SellerDetail.objects.create(
-                contract=self.contract_instance,
-                gem_seller_id=seller_data.get('GeM Seller ID', ''),
-                company_name=seller_data.get('Company Name', ''),
-                contact_no=seller_data.get('Contact No', ''),
-                email=seller_data.get('Email ID', ''),
-                address=seller_data.get('Address', ''),
-                msme_registration_number=seller_data.get('MSME Registration number', ''),
-                gstin=seller_data.get('GSTIN', '')
-            )
-            
-            # 8. Save Product
-            product_data = self.extracted_data['Product Details']
-            
-            product = Product.objects.create(
-                contract=self.contract_instance,
-                item_description=product_data.get('Item Description', ''),
-                product_name=product_data.get('Product Name', ''),
-                brand=product_data.get('Brand', ''),
-                brand_type=product_data.get('Brand Type', ''),
-                catalogue_status=product_data.get('Catalogue Status', ''),
-                selling_as=product_data.get('Selling As', ''),
-                category_name_quadrant=product_data.get('Category Name & Quadrant', ''),
-                model=product_data.get('Model', ''),
-                hsn_code=product_data.get('HSN Code', ''),
-                ordered_quantity=product_data.get('Ordered Quantity', ''),
-                unit=product_data.get('Unit', ''),
-                unit_price=product_data.get('Unit Price (INR)', ''),
-                embedding=None  # No embedding generation
-            )
-            
-            # 9. Save Consignee Detail
-            consignee_data = self.extracted_data['Consignee Detail']
-            ConsigneeDetail.objects.create(
-                product=product,
-                designation=consignee_data.get('Designation', ''),
-                email=consignee_data.get('Email ID', ''),
-                contact=consignee_data.get('Contact', ''),
-                gstin=consignee_data.get('GSTIN', ''),
-                address=consignee_data.get('Address', ''),
-                item=consignee_data.get('Item', '')
-            )
-            
-            print(f"✅ Successfully saved data to Django models for contract: {contract_no}")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Error saving to Django models: {e}")
-            return False
-    
-    def extract_all_data(self):
-        """Extract all required data from PDF"""
-        print(f"📄 Extracting text from PDF: {os.path.basename(self.pdf_path)}")
-        text = self.extract_text_from_pdf()
-        
-        if not text:
-            print("❌ No text extracted from PDF")
-            return None
-        
-        print("🔍 Parsing extracted data...")
-        
-        # Extract all sections
-        self.extracted_data = {
-            'Organization Details': self.extract_organization_details(text),
-            'Contract Details': self.extract_contract_details(text),
-            'Buyer Details': self.extract_buyer_details(text),
-            'Financial Approval Detail': self.extract_financial_approval_details(text),
-            'Paying Authority Details': self.extract_paying_authority_details(text),
-            'Seller Details': self.extract_seller_details(text),
-            'Product Details': self.extract_product_details(text),
-            'Consignee Detail': self.extract_consignee_details(text)
-        }
-        
-        return self.extracted_data
-    
-    def export_to_excel(self, output_path=None):
-        """Export extracted data to Excel"""
-        if output_path is None:
-            # Auto-generate filename using contract ID
-            contract_no = self.extracted_data.get('Contract Details', {}).get('Contract No', 'unknown')
-            if contract_no and contract_no != 'unknown':
-                output_path = f"extracted_data/{contract_no}.xlsx"
-            else:
-                output_path = "extracted_data/final_improved_data.xlsx"
-        
-        # Ensure extracted_data directory exists
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        
-        try:
-            # Create a writer object
-            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-                # Write each section to a separate sheet
-                for section_name, section_data in self.extracted_data.items():
-                    # Convert to DataFrame
-                    df = pd.DataFrame(list(section_data.items()), columns=['Field', 'Value'])
-                    # Write to Excel
-                    df.to_excel(writer, sheet_name=section_name[:31], index=False)  # Excel sheet names limited to 31 chars
-                    
-            print(f"📊 Data exported to Excel: {output_path}")
-            return True
-        except Exception as e:
-            print(f"❌ Error exporting to Excel: {e}")
-            return False
-    
-    def export_to_json(self, output_path=None):
-        """Export extracted data to JSON"""
-        if output_path is None:
-            # Auto-generate filename using contract ID
-            contract_no = self.extracted_data.get('Contract Details', {}).get('Contract No', 'unknown')
-            if contract_no and contract_no != 'unknown':
-                output_path = f"extracted_data/{contract_no}.json"
-            else:
-                output_path = "extracted_data/final_improved_data.json"
-        
-        # Ensure extracted_data directory exists
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        
-        try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(self.extracted_data, f, indent=2, ensure_ascii=False)
-            
-            print(f"📄 Data exported to JSON: {output_path}")
-            return True
-        except Exception as e:
-            print(f"❌ Error exporting to JSON: {e}")
-            return False
-    
-    def print_extracted_data(self):
-        """Print extracted data in a formatted way"""
-        print("\n" + "="*80)
-        print("FINAL IMPROVED AUTOMATED EXTRACTED DATA FROM PDF")
-        print("="*80)
-        
-        for section_name, section_data in self.extracted_data.items():
-            print(f"\n{section_name}:")
-            print("-" * len(section_name))
-            for field, value in section_data.items():
-                print(f"{field}: {value}")
-    
-    def test_smart_bilingual_extraction(self):
-        """Test the smart bilingual text extraction with various patterns"""
-        print("🧪 TESTING SMART BILINGUAL TEXT EXTRACTION")
-        print("="*80)
-        
-        # Test case 1: Hindi-first pattern (original pattern)
-        print("\n📝 TEST CASE 1: Hindi-first pattern")
-        test_text_1 = """
-        नाम Name: John Doe
-        पता Address: 123 Main Street
-        संगठन Organization: Ministry of Finance
-        """
-        print("Original text:")
-        print(test_text_1)
-        
-        pattern_1 = self.detect_pdf_pattern_type(test_text_1)
-        cleaned_1 = self.clean_text_smart_bilingual(test_text_1)
-        print(f"Detected pattern: {pattern_1}")
-        print(f"Cleaned text: {cleaned_1}")
-        
-        # Test case 2: English-first pattern (new pattern that was missing)
-        print("\n📝 TEST CASE 2: English-first pattern")
-        test_text_2 = """
-        Name नाम: John Doe
-        Address पता: 123 Main Street
-        Organization संगठन: Ministry of Finance
-        """
-        print("Original text:")
-        print(test_text_2)
-        
-        pattern_2 = self.detect_pdf_pattern_type(test_text_2)
-        cleaned_2 = self.clean_text_smart_bilingual(test_text_2)
-        print(f"Detected pattern: {pattern_2}")
-        print(f"Cleaned text: {cleaned_2}")
-        
-        # Test case 3: Mixed pattern
-        print("\n📝 TEST CASE 3: Mixed pattern")
-        test_text_3 = """
-        नाम Name: John Doe
-        Address पता: 123 Main Street
-        संगठन Organization: Ministry of Finance
-        Designation पद: Manager
-        """
-        print("Original text:")
-        print(test_text_3)
-        
-        pattern_3 = self.detect_pdf_pattern_type(test_text_3)
-        cleaned_3 = self.clean_text_smart_bilingual(test_text_3)
-        print(f"Detected pattern: {pattern_3}")
-        print(f"Cleaned text: {cleaned_3}")
-        
-        # Summary
-        print("\n" + "="*80)
-        print("📊 EXTRACTION SUMMARY")
-        print("="*80)
-        print(f"Test 1 (Hindi-first): Pattern={pattern_1}, {len(cleaned_1)} chars")
-        print(f"Test 2 (English-first): Pattern={pattern_2}, {len(cleaned_2)} chars")
-        print(f"Test 3 (Mixed): Pattern={pattern_3}, {len(cleaned_3)} chars")
-        
-        # Check if enhanced method is working
-        if len(cleaned_2) > 0:
-            print("\n✅ SUCCESS: Smart bilingual method now captures English-first patterns!")
-            print("   Previously, this pattern would have been missed.")
-        else:
-            print("\n❌ ISSUE: Smart bilingual method still not capturing English-first patterns")
-        
-        print("\n🌐 The smart bilingual extraction now:")
-        print("   - Automatically detects PDF pattern type")
-        print("   - Applies appropriate cleaning strategy")
-        print("   - Handles Hindi-first, English-first, and mixed patterns")
-        print("   - Ensures no data is missed regardless of pattern order")
-        
-        return {
-            'test1': {'pattern': pattern_1, 'cleaned': cleaned_1, 'length': len(cleaned_1)},
-            'test2': {'pattern': pattern_2, 'cleaned': cleaned_2, 'length': len(cleaned_2)},
-            'test3': {'pattern': pattern_3, 'cleaned': cleaned_3, 'length': len(cleaned_3)}
-        }
+from src.apps.cont_record.claims import LEASE_SECONDS, ClaimQueue, enqueue_pdfs, queue_status
+from src.apps.cont_record.contract_extractor import FinalImprovedAutomatedGEMCPDFExtractor
+from src.utils.batch_output import BatchOutputSink
+from src.utils.ingest_watcher import PDFDirectoryWatcher, stop_on_sigterm
+from src.utils.processing_manifest import ProcessingManifest, open_run_manifest
+from src.utils.process_logger import ProcessLogger, quiet_stdout, quietly
+from src.utils.work_queue import ErrorSummary, iter_pdf_files, run_bounded
 
 def find_all_pdfs_in_data_directory_recursive(data_dir):
     """Find all PDF files recursively in data directory with improved performance"""
@@ -1169,7 +86,8 @@ def process_single_pdf(pdf_path, thread_id):
 
 
 
-def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
+def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4, quiet=False, per_file_exports=False,
+                                                      columnar_format='csv', resume=False, retry_failed=False):
     """Process all PDFs in data directory using multi-threading with improved efficiency"""
     # Setup Django environment first
     import os
@@ -1191,18 +109,30 @@ def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
     data_dir.mkdir(exist_ok=True)
     extracted_data_dir.mkdir(exist_ok=True)
     
-    # Find all PDF files recursively
-    pdf_files = find_all_pdfs_in_data_directory_recursive(str(data_dir))
+    # PDFs are found while the workers run; the bounded queue between them
+    # caps how many paths are held, however large the tree is
+    found = 0
     
-    if not pdf_files:
-        print("❌ No PDF files found in data directory or subdirectories")
-        return
+    def discover():
+        nonlocal found
+        for pdf_path in iter_pdf_files(data_dir):
+            found += 1
+            yield pdf_path
+    
+    # Every finished file is recorded so an interrupted run can be resumed
+    manifest = ProcessingManifest(Path(__file__).parent / "processing_manifest.sqlite3")
+    pdf_files = discover()
+    if resume or retry_failed:
+        pdf_files = manifest.iter_pending(pdf_files, retry_failed=retry_failed)
     
     # Initialize comprehensive logger
-    logger = ProcessLogger()
-    logger.log_session_start(len(pdf_files))
+    logger = ProcessLogger(quiet=quiet, manifest=manifest)
+    logger.log_session_start()
     
-    print(f"📁 Found {len(pdf_files)} PDF files in data directory and subdirectories")
+    # One JSON Lines and one columnar file for the whole session
+    output_sink = BatchOutputSink(extracted_data_dir, logger.session_id, columnar_format)
+    
+    print(f"📁 Streaming PDFs from {data_dir} and subdirectories")
     print(f"🚀 Starting multi-threaded processing with {max_workers} workers...")
     print(f"📄 Logging to: {logger.log_dir}")
     print("="*80)
@@ -1211,7 +141,7 @@ def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
     successful_extractions = 0
     failed_extractions = 0
     skipped_extractions = 0
-    error_details = []
+    errors = ErrorSummary()
     
     # Thread lock for safe counter updates
     counter_lock = threading.Lock()
@@ -1220,10 +150,11 @@ def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
     
     def process_pdf_with_counter(pdf_path):
         """Process a single PDF and update counters safely"""
-        nonlocal successful_extractions, failed_extractions, skipped_extractions, error_details
+        nonlocal successful_extractions, failed_extractions, skipped_extractions
         
         file_start_time = time.time()
         filename = os.path.basename(pdf_path)
+        extractor = None
         
         try:
             # Ensure Django is set up in this thread
@@ -1241,12 +172,12 @@ def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
                 processing_time = time.time() - file_start_time
                 
                 logger.log_file_processing(
-                    filename, 'IGNORED', error_msg, file_size, processing_time
+                    filename, 'IGNORED', error_msg, file_size, processing_time, pdf_path=pdf_path
                 )
                 
                 with counter_lock:
                     failed_extractions += 1
-                    error_details.append(error_msg)
+                errors.add(error_msg)
                 print(f"❌ {error_msg}")
                 return False
             
@@ -1257,12 +188,12 @@ def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
                 processing_time = time.time() - file_start_time
                 
                 logger.log_file_processing(
-                    filename, 'IGNORED', error_msg, file_size, processing_time
+                    filename, 'IGNORED', error_msg, file_size, processing_time, pdf_path=pdf_path
                 )
                 
                 with counter_lock:
                     failed_extractions += 1
-                    error_details.append(error_msg)
+                errors.add(error_msg)
                 print(f"❌ {error_msg}")
                 return False
             
@@ -1275,9 +206,12 @@ def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
                 # Save to Django models
                 text = extractor.extract_text_from_pdf()
                 if extractor.save_to_django_models(text):
-                    # Export to Excel and JSON
-                    extractor.export_to_excel()
-                    extractor.export_to_json()
+                    # Append to the session output; per-file Excel/JSON is opt-in
+                    with extractor.timings.stage('batch_output'):
+                        output_sink.append(extractor.export_record())
+                    if per_file_exports:
+                        extractor.export_to_excel()
+                        extractor.export_to_json()
                     
                     # Get contract details for logging
                     contract_data = extractor.extract_contract_details(text)
@@ -1289,7 +223,8 @@ def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
                     logger.log_file_processing(
                         filename, 'SUCCESS', 
                         f"Successfully extracted and saved to database", 
-                        file_size, processing_time, "", contract_no, pages_extracted
+                        file_size, processing_time, "", contract_no, pages_extracted,
+                        stage_timings=extractor.timings.as_dict(), pdf_path=pdf_path
                     )
                     
                     # Update counter safely
@@ -1310,7 +245,8 @@ def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
                         logger.log_file_processing(
                             filename, 'SKIPPED', 
                             f"Contract already exists in database", 
-                            file_size, processing_time, "", contract_no, pages_extracted
+                            file_size, processing_time, "", contract_no, pages_extracted,
+                            stage_timings=extractor.timings.as_dict(), pdf_path=pdf_path
                         )
                         
                         with counter_lock:
@@ -1323,12 +259,13 @@ def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
                         
                         logger.log_file_processing(
                             filename, 'FAILED', error_msg, file_size, processing_time, 
-                            "Database save operation failed", contract_no, pages_extracted
+                            "Database save operation failed", contract_no, pages_extracted,
+                            stage_timings=extractor.timings.as_dict(), pdf_path=pdf_path
                         )
                         
                         with counter_lock:
                             failed_extractions += 1
-                            error_details.append(error_msg)
+                        errors.add(error_msg)
                         print(f"❌ {error_msg}")
                         return False
             else:
@@ -1337,12 +274,12 @@ def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
                 
                 logger.log_file_processing(
                     filename, 'FAILED', error_msg, file_size, processing_time, 
-                    "PDF text extraction failed", "", 0
+                    "PDF text extraction failed", "", 0, stage_timings=extractor.timings.as_dict(), pdf_path=pdf_path
                 )
                 
                 with counter_lock:
                     failed_extractions += 1
-                    error_details.append(error_msg)
+                errors.add(error_msg)
                 print(f"❌ {error_msg}")
                 return False
                 
@@ -1352,51 +289,48 @@ def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
             
             logger.log_file_processing(
                 filename, 'FAILED', error_msg, file_size, processing_time, 
-                str(e), "", 0
+                str(e), "", 0, stage_timings=extractor.timings.as_dict() if extractor else None, pdf_path=pdf_path
             )
             
             with counter_lock:
                 failed_extractions += 1
-                error_details.append(error_msg)
+            errors.add(f"Exception during processing ({type(e).__name__})", str(e))
             print(f"❌ {error_msg}")
             return False
     
-    # Process PDFs using ThreadPoolExecutor with improved task distribution
-    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="PDF_Worker") as executor:
-        # Submit all tasks - each thread will get a different file
-        future_to_pdf = {}
-        
-        # Distribute files evenly across threads
-        for i, pdf_path in enumerate(pdf_files):
-            # Submit task and store future
-            future = executor.submit(process_pdf_with_counter, pdf_path)
-            future_to_pdf[future] = pdf_path
-        
-        print(f"📤 Submitted {len(pdf_files)} tasks to {max_workers} worker threads")
-        print("🔄 Workers are processing files concurrently...")
-        
-        # Process completed tasks and show progress
-        completed = 0
-        for future in as_completed(future_to_pdf):
-            pdf_path = future_to_pdf[future]
+    completed = 0
+    
+    def show_progress(pdf_path, result):
+        nonlocal completed
+        with counter_lock:
             completed += 1
-            
-            try:
-                # Get result (this will raise any exceptions that occurred)
-                success = future.result()
-                
-                # Show progress
-                progress = (completed / len(pdf_files)) * 100
-                print(f"📊 Progress: {completed}/{len(pdf_files)} ({progress:.1f}%) - {os.path.basename(pdf_path)}")
-                
-            except Exception as e:
-                print(f"❌ Exception in thread for {os.path.basename(pdf_path)}: {e}")
+            done = completed
+        if isinstance(result, Exception):
+            print(f"❌ Exception in thread for {os.path.basename(pdf_path)}: {result}")
+        else:
+            print(f"📊 Progress: {done} processed, {found} found - {os.path.basename(pdf_path)}")
+    
+    # Discovery feeds a bounded queue that the worker threads drain
+    with quiet_stdout(quiet):
+        print(f"🔄 {max_workers} worker threads are processing files as they are found...")
+        submitted = run_bounded(
+            pdf_files, quietly(process_pdf_with_counter, quiet), max_workers=max_workers,
+            on_result=quietly(show_progress, quiet), thread_name_prefix="PDF_Worker"
+        )
+    
+    if not found:
+        print("❌ No PDF files found in data directory or subdirectories")
+    elif resume or retry_failed:
+        print(f"⏩ Resumed from manifest: {found - submitted}/{found} PDFs already processed")
     
+    output_sink.close()
     end_time = time.time()
     processing_time = end_time - start_time
     
     # Log session completion
+    logger.stats['total_files'] = found
     logger.log_session_end()
+    manifest.close()
     
     print("\n" + "="*80)
     print("📊 OPTIMIZED MULTI-THREADED EXTRACTION SUMMARY")
@@ -1404,10 +338,13 @@ def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
     print(f"✅ Successful extractions: {successful_extractions}")
     print(f"⏭️  Skipped (duplicates): {skipped_extractions}")
     print(f"❌ Failed extractions: {failed_extractions}")
-    print(f"📁 Total PDFs found: {len(pdf_files)}")
-    print(f"📂 Excel/JSON files saved to: {extracted_data_dir}")
+    print(f"📁 Total PDFs found: {found}")
+    print(f"📦 Batch records ({output_sink.records_written}): {output_sink.jsonl_file}")
+    print(f"📦 Batch table: {output_sink.columnar_file}")
+    if per_file_exports:
+        print(f"📂 Excel/JSON files saved to: {extracted_data_dir}")
     print(f"⏱️  Total processing time: {processing_time:.2f} seconds")
-    print(f"🚀 Average time per PDF: {processing_time/len(pdf_files):.2f} seconds")
+    print(f"🚀 Average time per PDF: {processing_time/max(submitted, 1):.2f} seconds")
     print(f"⚡ Speed improvement: {max_workers}x faster than single-threaded")
     
     # Show log file locations
@@ -1417,17 +354,14 @@ def process_all_pdfs_in_data_directory_multi_threaded(max_workers=4):
     print(f"  📊 CSV summary: {log_files['csv_file']}")
     print(f"  📋 Session summary: {log_files['summary_file']}")
     
-    # Show error details if any
-    if error_details:
-        print(f"\n❌ ERROR DETAILS ({len(error_details)} errors):")
-        for i, error in enumerate(error_details[:20], 1):  # Show first 20 errors
-            print(f"  {i}. {error}")
-        if len(error_details) > 20:
-            print(f"  ... and {len(error_details) - 20} more errors")
+    # Show error counts by category
+    if errors:
+        errors.print_report()
     
     print("="*80)
 
-def process_all_pdfs_ultra_fast(max_workers=8):
+def process_all_pdfs_ultra_fast(max_workers=8, quiet=False, per_file_exports=False, columnar_format='csv',
+                                resume=False, retry_failed=False):
     """Process all PDFs using ultra-fast chunked multithreading"""
     # Setup Django environment first
     import os
@@ -1456,8 +390,24 @@ def process_all_pdfs_ultra_fast(max_workers=8):
         print("❌ No PDF files found in data directory or subdirectories")
         return
     
+    # Every finished file is recorded so an interrupted run can be resumed
+    manifest, pdf_files = open_run_manifest(
+        Path(__file__).parent / "processing_manifest.sqlite3", pdf_files, resume, retry_failed
+    )
+    if not pdf_files:
+        manifest.close()
+        return
+    
+    # Initialize comprehensive logger
+    logger = ProcessLogger(quiet=quiet, manifest=manifest)
+    logger.log_session_start(len(pdf_files))
+    
+    # One JSON Lines and one columnar file for the whole session
+    output_sink = BatchOutputSink(extracted_data_dir, logger.session_id, columnar_format)
+    
     print(f"📁 Found {len(pdf_files)} PDF files in data directory and subdirectories")
     print(f"🚀 Starting ULTRA-FAST processing with {max_workers} workers...")
+    print(f"📄 Logging to: {logger.log_dir}")
     print("="*80)
     
     # Thread-safe counters
@@ -1477,47 +427,9 @@ def process_all_pdfs_ultra_fast(max_workers=8):
         chunk_results = []
         
         for pdf_path in pdf_chunk:
-            try:
-                # Ensure Django is set up in this thread
-                import django
-                if not django.conf.settings.configured:
-                    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'pdf_data.settings')
-                    django.setup()
-                
-                print(f"🔄 Processing: {os.path.basename(pdf_path)}")
-                
-                extractor = FinalImprovedAutomatedGEMCPDFExtractor(pdf_path)
-                
-                # Extract data
-                data = extractor.extract_all_data()
-                
-                if data:
-                    # Save to Django models
-                    text = extractor.extract_text_from_pdf()
-                    if extractor.save_to_django_models(text):
-                        # Export to Excel and JSON
-                        extractor.export_to_excel()
-                        extractor.export_to_json()
-                        
-                        chunk_results.append(('success', pdf_path))
-                        print(f"✅ Successfully processed: {os.path.basename(pdf_path)}")
-                    else:
-                        # Check if it was skipped due to duplicate
-                        contract_data = extractor.extract_contract_details(extractor.extract_text_from_pdf())
-                        contract_no = contract_data.get('Contract No', '')
-                        if extractor.check_contract_exists(contract_no):
-                            chunk_results.append(('skipped', pdf_path))
-                            print(f"⏭️  Skipped (already exists): {os.path.basename(pdf_path)}")
-                        else:
-                            chunk_results.append(('failed', pdf_path))
-                            print(f"❌ Failed to save: {os.path.basename(pdf_path)}")
-                else:
-                    chunk_results.append(('failed', pdf_path))
-                    print(f"❌ Failed to extract data from: {os.path.basename(pdf_path)}")
-                    
-            except Exception as e:
-                chunk_results.append(('failed', pdf_path))
-                print(f"❌ Error processing {os.path.basename(pdf_path)}: {e}")
+            # Logged, timed and recorded in the manifest like the other modes
+            status = process_pdf_for_ingest(pdf_path, logger, output_sink, per_file_exports)
+            chunk_results.append(('failed' if status == 'IGNORED' else status.lower(), pdf_path))
         
         # Update counters safely
         with counter_lock:
@@ -1539,12 +451,12 @@ def process_all_pdfs_ultra_fast(max_workers=8):
     print(f"🔧 Each worker will process ~{chunk_size} files")
     
     # Process PDFs using ThreadPoolExecutor with chunked distribution
-    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Ultra_Worker") as executor:
+    with quiet_stdout(quiet), ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Ultra_Worker") as executor:
         # Submit chunked tasks - each thread gets a different chunk of files
         future_to_chunk = {}
         
         for i, chunk in enumerate(file_chunks):
-            future = executor.submit(process_pdf_chunk, chunk)
+            future = executor.submit(quietly(process_pdf_chunk, quiet), chunk)
             future_to_chunk[future] = f"Chunk_{i+1}"
         
         print(f"📤 Submitted {len(file_chunks)} chunks to {max_workers} worker threads")
@@ -1573,9 +485,14 @@ def process_all_pdfs_ultra_fast(max_workers=8):
             except Exception as e:
                 print(f"❌ Exception in chunk {chunk_name}: {e}")
     
+    output_sink.close()
     end_time = time.time()
     processing_time = end_time - start_time
     
+    # Log session completion
+    logger.log_session_end()
+    manifest.close()
+    
     print("\n" + "="*80)
     print("📊 ULTRA-FAST MULTI-THREADED EXTRACTION SUMMARY")
     print("="*80)
@@ -1583,14 +500,26 @@ def process_all_pdfs_ultra_fast(max_workers=8):
     print(f"⏭️  Skipped (duplicates): {skipped_extractions}")
     print(f"❌ Failed extractions: {failed_extractions}")
     print(f"📁 Total PDFs found: {len(pdf_files)}")
-    print(f"📂 Excel/JSON files saved to: {extracted_data_dir}")
+    print(f"📦 Batch records ({output_sink.records_written}): {output_sink.jsonl_file}")
+    print(f"📦 Batch table: {output_sink.columnar_file}")
+    if per_file_exports:
+        print(f"📂 Excel/JSON files saved to: {extracted_data_dir}")
     print(f"⏱️  Total processing time: {processing_time:.2f} seconds")
     print(f"🚀 Average time per PDF: {processing_time/len(pdf_files):.2f} seconds")
     print(f"⚡ Speed improvement: {max_workers}x faster than single-threaded")
     print(f"🚀 Ultra-fast mode: ~{max_workers * 1.5:.1f}x faster than regular multithreading")
+    
+    # Show log file locations
+    log_files = logger.get_log_files()
+    print(f"\n📄 LOG FILES SAVED:")
+    print(f"  📋 Detailed log: {log_files['log_file']}")
+    print(f"  📊 CSV summary: {log_files['csv_file']}")
+    print(f"  📋 Session summary: {log_files['summary_file']}")
+    
     print("="*80)
 
-def process_all_pdfs_in_data_directory():
+def process_all_pdfs_in_data_directory(quiet=False, per_file_exports=False, columnar_format='csv',
+                                       resume=False, retry_failed=False):
     """Process all PDFs in data directory (single-threaded)"""
     # Setup Django environment first
     import os
@@ -1619,10 +548,21 @@ def process_all_pdfs_in_data_directory():
         print("❌ No PDF files found in data directory or subdirectories")
         return
     
+    # Every finished file is recorded so an interrupted run can be resumed
+    manifest, pdf_files = open_run_manifest(
+        Path(__file__).parent / "processing_manifest.sqlite3", pdf_files, resume, retry_failed
+    )
+    if not pdf_files:
+        manifest.close()
+        return
+    
     # Initialize comprehensive logger
-    logger = ProcessLogger()
+    logger = ProcessLogger(quiet=quiet, manifest=manifest)
     logger.log_session_start(len(pdf_files))
     
+    # One JSON Lines and one columnar file for the whole session
+    output_sink = BatchOutputSink(extracted_data_dir, logger.session_id, columnar_format)
+    
     print(f"📁 Found {len(pdf_files)} PDF files in data directory and subdirectories")
     print("🚀 Starting single-threaded processing...")
     print(f"📄 Logging to: {logger.log_dir}")
@@ -1637,131 +577,142 @@ def process_all_pdfs_in_data_directory():
     start_time = time.time()
     
     # Process each PDF
-    for i, pdf_path in enumerate(pdf_files, 1):
-        try:
-            print(f"\n🔄 Processing {i}/{len(pdf_files)}: {os.path.basename(pdf_path)}")
+    with quiet_stdout(quiet):
+        for i, pdf_path in enumerate(pdf_files, 1):
+            try:
+                print(f"\n🔄 Processing {i}/{len(pdf_files)}: {os.path.basename(pdf_path)}")
             
-            file_start_time = time.time()
-            filename = os.path.basename(pdf_path)
+                file_start_time = time.time()
+                filename = os.path.basename(pdf_path)
+                extractor = None
             
-            # Check if file is readable
-            if not os.access(pdf_path, os.R_OK):
-                error_msg = f"File not readable (permission denied)"
-                file_size = 0
-                processing_time = time.time() - file_start_time
+                # Check if file is readable
+                if not os.access(pdf_path, os.R_OK):
+                    error_msg = f"File not readable (permission denied)"
+                    file_size = 0
+                    processing_time = time.time() - file_start_time
                 
-                logger.log_file_processing(
-                    filename, 'IGNORED', error_msg, file_size, processing_time
-                )
+                    logger.log_file_processing(
+                        filename, 'IGNORED', error_msg, file_size, processing_time, pdf_path=pdf_path
+                    )
                 
-                failed_extractions += 1
-                error_details.append(error_msg)
-                print(f"❌ {error_msg}")
-                continue
+                    failed_extractions += 1
+                    error_details.append(error_msg)
+                    print(f"❌ {error_msg}")
+                    continue
             
-            # Check file size
-            file_size = os.path.getsize(pdf_path)
-            if file_size == 0:
-                error_msg = f"Empty file (0 bytes)"
-                processing_time = time.time() - file_start_time
+                # Check file size
+                file_size = os.path.getsize(pdf_path)
+                if file_size == 0:
+                    error_msg = f"Empty file (0 bytes)"
+                    processing_time = time.time() - file_start_time
                 
-                logger.log_file_processing(
-                    filename, 'IGNORED', error_msg, file_size, processing_time
-                )
+                    logger.log_file_processing(
+                        filename, 'IGNORED', error_msg, file_size, processing_time, pdf_path=pdf_path
+                    )
                 
-                failed_extractions += 1
-                error_details.append(error_msg)
-                print(f"❌ {error_msg}")
-                continue
+                    failed_extractions += 1
+                    error_details.append(error_msg)
+                    print(f"❌ {error_msg}")
+                    continue
             
-            extractor = FinalImprovedAutomatedGEMCPDFExtractor(pdf_path)
+                extractor = FinalImprovedAutomatedGEMCPDFExtractor(pdf_path)
             
-            # Extract data
-            data = extractor.extract_all_data()
+                # Extract data
+                data = extractor.extract_all_data()
             
-            if data:
-                # Save to Django models
-                text = extractor.extract_text_from_pdf()
-                if extractor.save_to_django_models(text):
-                    # Export to Excel and JSON
-                    extractor.export_to_excel()
-                    extractor.export_to_json()
+                if data:
+                    # Save to Django models
+                    text = extractor.extract_text_from_pdf()
+                    if extractor.save_to_django_models(text):
+                        # Append to the session output; per-file Excel/JSON is opt-in
+                        with extractor.timings.stage('batch_output'):
+                            output_sink.append(extractor.export_record())
+                        if per_file_exports:
+                            extractor.export_to_excel()
+                            extractor.export_to_json()
                     
-                    # Get contract details for logging
-                    contract_data = extractor.extract_contract_details(text)
-                    contract_no = contract_data.get('Contract No', '')
-                    pages_extracted = len(text.split('\n')) if text else 0
+                        # Get contract details for logging
+                        contract_data = extractor.extract_contract_details(text)
+                        contract_no = contract_data.get('Contract No', '')
+                        pages_extracted = len(text.split('\n')) if text else 0
                     
-                    processing_time = time.time() - file_start_time
+                        processing_time = time.time() - file_start_time
                     
-                    logger.log_file_processing(
-                        filename, 'SUCCESS', 
-                        f"Successfully extracted and saved to database", 
-                        file_size, processing_time, "", contract_no, pages_extracted
-                    )
+                        logger.log_file_processing(
+                            filename, 'SUCCESS', 
+                            f"Successfully extracted and saved to database", 
+                            file_size, processing_time, "", contract_no, pages_extracted,
+                            stage_timings=extractor.timings.as_dict(), pdf_path=pdf_path
+                        )
                     
-                    successful_extractions += 1
-                    print(f"✅ Successfully processed: {filename}")
-                else:
-                    # Check if it was skipped due to duplicate
-                    contract_data = extractor.extract_contract_details(extractor.extract_text_from_pdf())
-                    contract_no = contract_data.get('Contract No', '')
-                    pages_extracted = len(text.split('\n')) if text else 0
+                        successful_extractions += 1
+                        print(f"✅ Successfully processed: {filename}")
+                    else:
+                        # Check if it was skipped due to duplicate
+                        contract_data = extractor.extract_contract_details(extractor.extract_text_from_pdf())
+                        contract_no = contract_data.get('Contract No', '')
+                        pages_extracted = len(text.split('\n')) if text else 0
                     
-                    if extractor.check_contract_exists(contract_no):
-                        processing_time = time.time() - file_start_time
+                        if extractor.check_contract_exists(contract_no):
+                            processing_time = time.time() - file_start_time
                         
-                        logger.log_file_processing(
-                            filename, 'SKIPPED', 
-                            f"Contract already exists in database", 
-                            file_size, processing_time, "", contract_no, pages_extracted
-                        )
+                            logger.log_file_processing(
+                                filename, 'SKIPPED', 
+                                f"Contract already exists in database", 
+                                file_size, processing_time, "", contract_no, pages_extracted,
+                                stage_timings=extractor.timings.as_dict(), pdf_path=pdf_path
+                            )
                         
-                        skipped_extractions += 1
-                        print(f"⏭️  Skipped (already exists): {filename}")
-                    else:
-                        error_msg = f"Failed to save to database"
-                        processing_time = time.time() - file_start_time
+                            skipped_extractions += 1
+                            print(f"⏭️  Skipped (already exists): {filename}")
+                        else:
+                            error_msg = f"Failed to save to database"
+                            processing_time = time.time() - file_start_time
                         
-                        logger.log_file_processing(
-                            filename, 'FAILED', error_msg, file_size, processing_time, 
-                            "Database save operation failed", contract_no, pages_extracted
-                        )
+                            logger.log_file_processing(
+                                filename, 'FAILED', error_msg, file_size, processing_time, 
+                                "Database save operation failed", contract_no, pages_extracted,
+                                stage_timings=extractor.timings.as_dict(), pdf_path=pdf_path
+                            )
                         
-                        failed_extractions += 1
-                        error_details.append(error_msg)
-                        print(f"❌ {error_msg}")
-            else:
-                error_msg = f"Failed to extract data from PDF"
-                processing_time = time.time() - file_start_time
+                            failed_extractions += 1
+                            error_details.append(error_msg)
+                            print(f"❌ {error_msg}")
+                else:
+                    error_msg = f"Failed to extract data from PDF"
+                    processing_time = time.time() - file_start_time
                 
+                    logger.log_file_processing(
+                        filename, 'FAILED', error_msg, file_size, processing_time, 
+                        "PDF text extraction failed", "", 0, stage_timings=extractor.timings.as_dict(), pdf_path=pdf_path
+                    )
+                
+                    failed_extractions += 1
+                    error_details.append(error_msg)
+                    print(f"❌ {error_msg}")
+                
+            except Exception as e:
+                error_msg = f"Exception during processing: {str(e)}"
+                processing_time = time.time() - file_start_time
+            
                 logger.log_file_processing(
                     filename, 'FAILED', error_msg, file_size, processing_time, 
-                    "PDF text extraction failed", "", 0
+                    str(e), "", 0, stage_timings=extractor.timings.as_dict() if extractor else None, pdf_path=pdf_path
                 )
-                
+            
                 failed_extractions += 1
                 error_details.append(error_msg)
                 print(f"❌ {error_msg}")
-                
-        except Exception as e:
-            error_msg = f"Exception during processing: {str(e)}"
-            processing_time = time.time() - file_start_time
-            
-            logger.log_file_processing(
-                filename, 'FAILED', error_msg, file_size, processing_time, 
-                str(e), "", 0
-            )
-            
-            failed_extractions += 1
-            error_details.append(error_msg)
-            print(f"❌ {error_msg}")
+    
+    output_sink.close()
     
     # Calculate elapsed time
     elapsed_time = time.time() - start_time
     
     # Log session completion
     logger.log_session_end()
+    manifest.close()
     
     # Print summary
     print("\n" + "="*80)
@@ -1772,6 +723,8 @@ def process_all_pdfs_in_data_directory():
     print(f"❌ Failed extractions: {failed_extractions}")
     print(f"⏱️  Total time: {elapsed_time:.2f} seconds")
     print(f"📁 Total PDFs processed: {len(pdf_files)}")
+    print(f"📦 Batch records ({output_sink.records_written}): {output_sink.jsonl_file}")
+    print(f"📦 Batch table: {output_sink.columnar_file}")
     
     # Show log file locations
     log_files = logger.get_log_files()
@@ -1792,6 +745,211 @@ def process_all_pdfs_in_data_directory():
 
 
 
+def process_pdf_for_ingest(pdf_path, logger, output_sink, per_file_exports=False):
+    """Extract, save and log one PDF (watch, claim and ultra-fast modes); returns the logged status"""
+    file_start_time = time.time()
+    filename = os.path.basename(pdf_path)
+    file_size = 0
+    extractor = None
+    
+    try:
+        print(f"🔄 Processing: {filename}")
+        
+        if not os.access(pdf_path, os.R_OK):
+            logger.log_file_processing(
+                filename, 'IGNORED', "File not readable (permission denied)", 0,
+                time.time() - file_start_time, pdf_path=pdf_path
+            )
+            return 'IGNORED'
+        
+        file_size = os.path.getsize(pdf_path)
+        if file_size == 0:
+            logger.log_file_processing(
+                filename, 'IGNORED', "Empty file (0 bytes)", file_size,
+                time.time() - file_start_time, pdf_path=pdf_path
+            )
+            return 'IGNORED'
+        
+        extractor = FinalImprovedAutomatedGEMCPDFExtractor(pdf_path)
+        data = extractor.extract_all_data()
+        
+        if not data:
+            logger.log_file_processing(
+                filename, 'FAILED', "Failed to extract data from PDF", file_size,
+                time.time() - file_start_time, "PDF text extraction failed", "", 0,
+                stage_timings=extractor.timings.as_dict(), pdf_path=pdf_path
+            )
+            return 'FAILED'
+        
+        text = extractor.extract_text_from_pdf()
+        record_id = extractor.extract_contract_details(text).get('Contract No', '')
+        pages_extracted = len(text.split('\n')) if text else 0
+        
+        if extractor.save_to_django_models(text):
+            with extractor.timings.stage('batch_output'):
+                output_sink.append(extractor.export_record())
+            if per_file_exports:
+                extractor.export_to_excel()
+                extractor.export_to_json()
+            status, reason, error = 'SUCCESS', "Successfully extracted and saved to database", ""
+        elif extractor.check_contract_exists(record_id):
+            status, reason, error = 'SKIPPED', "Contract already exists in database", ""
+        else:
+            status, reason, error = 'FAILED', "Failed to save to database", "Database save operation failed"
+        
+        logger.log_file_processing(
+            filename, status, reason, file_size, time.time() - file_start_time, error,
+            record_id, pages_extracted, stage_timings=extractor.timings.as_dict(), pdf_path=pdf_path
+        )
+        print(f"{'✅' if status == 'SUCCESS' else '⏭️ ' if status == 'SKIPPED' else '❌'} {status}: {filename}")
+        return status
+    
+    except Exception as e:
+        logger.log_file_processing(
+            filename, 'FAILED', f"Exception during processing: {str(e)}", file_size,
+            time.time() - file_start_time, str(e), "", 0,
+            stage_timings=extractor.timings.as_dict() if extractor else None, pdf_path=pdf_path
+        )
+        print(f"❌ Exception during processing {filename}: {e}")
+        return 'FAILED'
+
+def ingest_watch(max_workers=4, batch_size=16, poll_interval=2.0, quiet=False, per_file_exports=False,
+                 columnar_format='csv'):
+    """Watch the data directory and ingest new or changed PDFs in micro-batches"""
+    # Setup Django environment first
+    project_root = Path(__file__).parent.parent.parent.parent
+    sys.path.insert(0, str(project_root))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'pdf_data.settings')
+    django.setup()
+    
+    data_dir = Path(__file__).parent / "data"
+    extracted_data_dir = Path(__file__).parent / "extracted_data"
+    data_dir.mkdir(exist_ok=True)
+    extracted_data_dir.mkdir(exist_ok=True)
+    
+    # The manifest doubles as the index of files that are already handled
+    manifest = ProcessingManifest(Path(__file__).parent / "processing_manifest.sqlite3")
+    watcher = PDFDirectoryWatcher(data_dir, known_files=manifest.file_index(), poll_interval=poll_interval)
+    
+    logger = ProcessLogger(quiet=quiet, manifest=manifest, worker=os.getpid())
+    output_sink = BatchOutputSink(extracted_data_dir, logger.session_id, columnar_format)
+    
+    watcher.start()
+    stop_on_sigterm()
+    print(f"👀 Watching {data_dir} for new PDFs ({watcher.mode}, {max_workers} workers, "
+          f"batches of {batch_size})")
+    print("   Press Ctrl+C to stop")
+    print("="*80)
+    
+    ingested = 0
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Ingest_Worker") as executor:
+            while True:
+                ready = watcher.wait_for_changes()
+                for start in range(0, len(ready), batch_size):
+                    batch = ready[start:start + batch_size]
+                    batch_start = time.time()
+                    statuses = list(executor.map(
+                        quietly(lambda path: process_pdf_for_ingest(
+                            path, logger, output_sink, per_file_exports
+                        ), quiet),
+                        batch
+                    ))
+                    # Make the batch visible to readers of the session files
+                    output_sink.flush()
+                    ingested += len(batch)
+                    print(f"📥 Batch of {len(batch)} in {time.time() - batch_start:.2f}s: "
+                          f"✅{statuses.count('SUCCESS')} ⏭️{statuses.count('SKIPPED')} "
+                          f"❌{statuses.count('FAILED') + statuses.count('IGNORED')} "
+                          f"(total {ingested})")
+    except KeyboardInterrupt:
+        print("\n🛑 Stopping watcher...")
+    finally:
+        watcher.stop()
+        output_sink.close()
+        logger.stats['total_files'] = ingested
+        logger.log_session_end()
+        manifest.close()
+    
+    print(f"📦 Batch records ({output_sink.records_written}): {output_sink.jsonl_file}")
+    print(f"📊 CSV summary: {logger.csv_file}")
+
+def ingest_claims(max_workers=4, batch_size=16, poll_interval=5.0, lease_seconds=LEASE_SECONDS, enqueue=False,
+                  quiet=False, per_file_exports=False, columnar_format='csv', worker=None):
+    """Claim batches of PDFs from the shared queue until it is drained.
+
+    Any number of these workers may run at once on the database host; see
+    ClaimQueue for running them on several hosts. ``worker`` names this
+    worker in the queue and in its session files (default: host and pid).
+    """
+    # Setup Django environment first
+    project_root = Path(__file__).parent.parent.parent.parent
+    sys.path.insert(0, str(project_root))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'pdf_data.settings')
+    django.setup()
+    
+    data_dir = Path(__file__).parent / "data"
+    extracted_data_dir = Path(__file__).parent / "extracted_data"
+    data_dir.mkdir(exist_ok=True)
+    extracted_data_dir.mkdir(exist_ok=True)
+    
+    if enqueue:
+        found, added = enqueue_pdfs(data_dir)
+        print(f"📥 Queued {added} new PDFs ({found} found under {data_dir})")
+    
+    # The claim table replaces the local manifest: it is shared by every worker
+    queue = ClaimQueue(worker=worker, lease_seconds=lease_seconds)
+    logger = ProcessLogger(quiet=quiet, worker=queue.worker)
+    logger.log_session_start()
+    output_sink = BatchOutputSink(extracted_data_dir, logger.session_id, columnar_format)
+    
+    stop_on_sigterm()
+    queue.start_heartbeat()
+    print(f"🤝 Worker {queue.worker}: batches of {batch_size}, {max_workers} threads, "
+          f"{lease_seconds}s leases")
+    print("="*80)
+    
+    processed = 0
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Claim_Worker") as executor:
+            while True:
+                claims = queue.claim(batch_size)
+                if not claims:
+                    if not queue.others_active():
+                        break
+                    # Other workers still hold leases; wait in case one of them dies
+                    time.sleep(poll_interval)
+                    continue
+                batch_start = time.time()
+                statuses = list(executor.map(
+                    quietly(lambda claim: process_pdf_for_ingest(
+                        str(data_dir / claim.path), logger, output_sink, per_file_exports
+                    ), quiet),
+                    claims
+                ))
+                finished = queue.finish(claims, statuses)
+                output_sink.flush()
+                processed += len(claims)
+                lost = f" ({len(claims) - finished} lost to other workers)" if finished < len(claims) else ""
+                print(f"📥 Batch of {len(claims)} in {time.time() - batch_start:.2f}s: "
+                      f"✅{statuses.count('SUCCESS')} ⏭️{statuses.count('SKIPPED')} "
+                      f"❌{statuses.count('FAILED') + statuses.count('IGNORED')} "
+                      f"(total {processed}){lost}")
+    except KeyboardInterrupt:
+        print("\n🛑 Stopping worker...")
+    finally:
+        queue.stop_heartbeat()
+        released = queue.release()
+        if released:
+            print(f"↩️  Released {released} unfinished claims")
+        output_sink.close()
+        logger.stats['total_files'] = processed
+        logger.log_session_end()
+    
+    print(f"📦 Batch records ({output_sink.records_written}): {output_sink.jsonl_file}")
+    print(f"📊 CSV summary: {logger.csv_file}")
+    print(f"🗂️  Queue: {queue_status()}")
+
 def diagnose_pdf_files():
     """Diagnose PDF files to identify potential issues before processing"""
     data_dir = Path(__file__).parent / "data"
@@ -1886,6 +1044,20 @@ def main():
         show_help()
         return
     
+    # Quiet mode drops the per-file console output of batch runs
+    quiet = "--quiet" in sys.argv or "-q" in sys.argv
+    
+    # Batch runs write one JSONL + columnar file; per-file Excel/JSON is opt-in
+    per_file_exports = "--per-file-exports" in sys.argv or "-pfe" in sys.argv
+    columnar_format = 'csv'
+    for arg in sys.argv:
+        if arg.startswith("--columnar="):
+            columnar_format = arg.split("=")[1]
+    
+    # Resume from the processing manifest, optionally retrying failed files
+    retry_failed = "--retry-failed" in sys.argv or "-rf" in sys.argv
+    resume = "--resume" in sys.argv or "-r" in sys.argv or retry_failed
+    
     # Check for diagnostic command
     if "--diagnose" in sys.argv or "-d" in sys.argv:
         print("🔍 Running PDF file diagnosis...")
@@ -1907,7 +1079,50 @@ def main():
         return
     
     # Check for special commands first
-    if "--multi-thread" in sys.argv or "-mt" in sys.argv:
+    if "--ingest-watch" in sys.argv or "-iw" in sys.argv:
+        # Long-running mode: ingest new or changed PDFs as they arrive
+        max_workers = 4
+        batch_size = 16
+        poll_interval = 2.0
+        for arg in sys.argv:
+            if arg.startswith("--workers=") or arg.startswith("-w="):
+                max_workers = int(arg.split("=")[1])
+            elif arg.startswith("--batch-size="):
+                batch_size = int(arg.split("=")[1])
+            elif arg.startswith("--poll-interval="):
+                poll_interval = float(arg.split("=")[1])
+        
+        ingest_watch(
+            max_workers, batch_size, poll_interval, quiet=quiet, per_file_exports=per_file_exports,
+            columnar_format=columnar_format
+        )
+    elif "--claim-status" in sys.argv:
+        print(f"🗂️  Queue: {queue_status()}")
+    elif "--claim-worker" in sys.argv or "-cw" in sys.argv or "--enqueue" in sys.argv:
+        # Shared-queue mode: several processes divide the data directory
+        max_workers = 4
+        batch_size = 16
+        poll_interval = 5.0
+        lease_seconds = LEASE_SECONDS
+        for arg in sys.argv:
+            if arg.startswith("--workers=") or arg.startswith("-w="):
+                max_workers = int(arg.split("=")[1])
+            elif arg.startswith("--batch-size="):
+                batch_size = int(arg.split("=")[1])
+            elif arg.startswith("--poll-interval="):
+                poll_interval = float(arg.split("=")[1])
+            elif arg.startswith("--lease="):
+                lease_seconds = int(arg.split("=")[1])
+        
+        if "--claim-worker" in sys.argv or "-cw" in sys.argv:
+            ingest_claims(
+                max_workers, batch_size, poll_interval, lease_seconds, enqueue="--enqueue" in sys.argv,
+                quiet=quiet, per_file_exports=per_file_exports, columnar_format=columnar_format
+            )
+        else:
+            found, added = enqueue_pdfs(Path(__file__).parent / "data")
+            print(f"📥 Queued {added} new PDFs ({found} found)")
+    elif "--multi-thread" in sys.argv or "-mt" in sys.argv:
         # Get number of workers from command line
         max_workers = 4  # Default
         for arg in sys.argv:
@@ -1919,7 +1134,10 @@ def main():
                 break
         
         print(f"🚀 Starting multi-threaded processing with {max_workers} workers...")
-        process_all_pdfs_in_data_directory_multi_threaded(max_workers)
+        process_all_pdfs_in_data_directory_multi_threaded(
+            max_workers, quiet=quiet, per_file_exports=per_file_exports, columnar_format=columnar_format,
+            resume=resume, retry_failed=retry_failed
+        )
     elif "--ultra-fast" in sys.argv or "-uf" in sys.argv:
         # Get number of ultra-fast workers from command line
         max_workers = 8  # Default for ultra-fast
@@ -1932,10 +1150,13 @@ def main():
                 break
         
         print(f"🚀 Starting ULTRA-FAST processing with {max_workers} workers...")
-        process_all_pdfs_ultra_fast(max_workers)
-    elif len(sys.argv) > 1:
+        process_all_pdfs_ultra_fast(
+            max_workers, quiet=quiet, per_file_exports=per_file_exports, columnar_format=columnar_format,
+            resume=resume, retry_failed=retry_failed
+        )
+    elif [arg for arg in sys.argv[1:] if not arg.startswith("-")]:
         # Check if PDF path is provided as command line argument
-        pdf_path = sys.argv[1]
+        pdf_path = [arg for arg in sys.argv[1:] if not arg.startswith("-")][0]
         
         if not os.path.exists(pdf_path):
             print(f"❌ PDF file not found: {pdf_path}")
@@ -1967,7 +1188,10 @@ def main():
             print("❌ Failed to extract data from PDF")
     else:
         # Process all PDFs in data directory (single-threaded)
-        process_all_pdfs_in_data_directory()
+        process_all_pdfs_in_data_directory(
+            quiet=quiet, per_file_exports=per_file_exports, columnar_format=columnar_format,
+            resume=resume, retry_failed=retry_failed
+        )
 
 def show_help():
     """Display help information for the script"""
@@ -1985,6 +1209,18 @@ def show_help():
     print("  --workers=N, -w=N       Set number of worker threads (default: 4)")
     print("  --ultra-fast, -uf      Process PDFs using ultra-fast multithreading")
     print("  --ufw=N, -ufw=N        Set number of ultra-fast worker threads (default: 8)")
+    print("  --quiet, -q             Batch runs: no per-file console output (still logged to file)")
+    print("  --per-file-exports, -pfe  Batch runs: also write one Excel + JSON file per PDF")
+    print("  --columnar=FORMAT       Batch table format: csv (default) or parquet (needs pyarrow)")
+    print("  --resume, -r            Batch runs: skip PDFs already finished in an earlier run")
+    print("  --retry-failed, -rf     Like --resume, but also retry PDFs that failed before")
+    print("  --ingest-watch, -iw     Keep running and ingest new or changed PDFs as they arrive")
+    print("  --batch-size=N          Watch mode: PDFs per micro-batch (default: 16)")
+    print("  --poll-interval=S       Watch mode: seconds between checks (default: 2)")
+    print("  --enqueue               Add PDFs in data/ to the shared claim queue (in the database)")
+    print("  --claim-worker, -cw     Claim and ingest batches from the shared queue until it is empty")
+    print("  --lease=S               Claim mode: seconds a claim survives without a heartbeat (default: 120)")
+    print("  --claim-status          Show the shared claim queue counts")
     print("")
     print("Examples:")
     print("  python data_extractor.py                    # Process all PDFs in data/ directory")
@@ -1994,8 +1230,13 @@ def show_help():
     print("  python data_extractor.py --test-smart-bilingual  # Test smart bilingual extraction")
     print("  python data_extractor.py --multi-thread     # Multi-threaded processing")
     print("  python data_extractor.py --multi-thread --workers=8  # 8 worker threads")
+    print("  python data_extractor.py --multi-thread --quiet      # Multi-threaded, per-file output only in logs")
     print("  python data_extractor.py --ultra-fast       # Ultra-fast multithreading")
     print("  python data_extractor.py --ultra-fast --ufw=16  # 16 ultra-fast worker threads")
+    print("  python data_extractor.py --multi-thread --resume     # Continue an interrupted run")
+    print("  python data_extractor.py --ingest-watch --workers=8  # Ingest the daily drop continuously")
+    print("  python data_extractor.py --enqueue          # Queue the backlog once...")
+    print("  python data_extractor.py --claim-worker     # ...then start one worker per process")
     print("")
     print("Note: Place PDF files in the 'data/' directory for batch processing")
     print("📄 All processing sessions are automatically logged with detailed information")
@@ -0,0 +1,97 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import Any, Dict, List, Union
+
+from django.conf import settings
+
+from src.utils.contract_parsers import parse_contract_text_to_json
+from src.utils.extract_text import _extract_english_from_pdf, read_pdf_with_structure
+
+# Pool size when settings.IMPORT_EXTRACTION_WORKERS is not set: one per CPU, up to this
+DEFAULT_MAX_WORKERS = 4
+
+
+def extract_contract(pdf_path) -> Dict[str, Any]:
+    """Extract one contract PDF (pdfplumber text and tables + the contract parsers).
+
+    Returns the filename, the English text stored as raw_text, the parsed
+    JSON SaveInDb consumes (including the tables it mines for products,
+    consignees, specifications, terms and EPBG) and a summary for the
+    upload page. Nothing is saved, and only plain-Python helpers are
+    imported, so pool workers need no Django setup.
+    """
+    extraction_result = read_pdf_with_structure(str(pdf_path))
+    raw_text = extraction_result["text"]
+    tables = extraction_result.get("tables", [])
+
+    english_text = _extract_english_from_pdf(raw_text)
+    return {
+        'filename': os.path.basename(str(pdf_path)),
+        'parsed_data': parse_contract_text_to_json(english_text, tables),
+        'english_text': english_text,
+        'summary': {
+            'pages': extraction_result.get("pages_count", 0),
+            'tables_count': len(tables),
+            'english_text_length': len(english_text),
+            'extraction_method': extraction_result.get("method", "unknown"),
+            'ocr_used': extraction_result.get("ocr_used", False),
+        },
+    }
+
+
+def _worker_ready():
+    return os.getpid()
+
+
+@lru_cache(maxsize=1)
+def get_extraction_pool() -> ProcessPoolExecutor:
+    """Process pool shared by all requests, sized once from settings.IMPORT_EXTRACTION_WORKERS.
+
+    Workers are spawned rather than forked, so they never inherit the web
+    server's threads or open database connections. They are started on
+    creation, each importing the PDF and parsing libraries once.
+    """
+    workers = getattr(settings, 'IMPORT_EXTRACTION_WORKERS', None) or min(DEFAULT_MAX_WORKERS, os.cpu_count() or 1)
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+    for _ in range(workers):
+        pool.submit(_worker_ready)
+    return pool
+
+
+def extract_contracts(pdf_paths) -> List[Union[Dict[str, Any], Exception]]:
+    """``extract_contract`` for every path on the shared pool, in the order given.
+
+    Each item is the extraction or the exception it raised. A single PDF
+    is extracted in this process; if the pool has broken (a worker died)
+    it is replaced and the affected files are extracted here.
+    """
+    pdf_paths = [str(path) for path in pdf_paths]
+    if len(pdf_paths) <= 1:
+        return [_extract_inline(path) for path in pdf_paths]
+
+    try:
+        futures = [get_extraction_pool().submit(extract_contract, path) for path in pdf_paths]
+    except (BrokenProcessPool, RuntimeError):
+        get_extraction_pool.cache_clear()
+        return [_extract_inline(path) for path in pdf_paths]
+
+    results = []
+    for path, future in zip(pdf_paths, futures):
+        try:
+            results.append(future.result())
+        except BrokenProcessPool:
+            get_extraction_pool.cache_clear()
+            results.append(_extract_inline(path))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def _extract_inline(path):
+    try:
+        return extract_contract(path)
+    except Exception as e:
+        return e
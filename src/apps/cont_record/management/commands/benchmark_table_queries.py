@@ -0,0 +1,188 @@
+import random
+import statistics
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test.utils import CaptureQueriesContext
+
+from src.apps.bid_record.models import BidDocument
+from src.apps.bid_record.views import BidTableView
+from src.apps.cont_record.models import Contract, OrganisationDetail
+from src.apps.cont_record.views import ContractTableView
+from src.utils.keyset_pagination import KeysetPaginator, encode_cursor
+
+# Vocabulary sizes of the seeded filter columns
+SEED_MINISTRIES = 12
+SEED_DEPARTMENTS = 40
+SEED_ORGANISATIONS = 200
+# Seeded dates span this many days back from today; one row in SEED_NULL_DATE has none
+SEED_DAYS = 3 * 365
+SEED_NULL_DATE = 50
+
+
+class Command(BaseCommand):
+    help = "Report EXPLAIN QUERY PLAN and latency for the contract/bid table filter queries"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--table', choices=['contracts', 'bids', 'all'], default='all')
+        parser.add_argument('--seed', type=int, default=0,
+                            help='Rows to add to each table first (rolled back at the end)')
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per query; the median is reported')
+        parser.add_argument('--analyze', action='store_true', help='Run ANALYZE first so the planner has statistics')
+
+    def handle(self, *args, **options):
+        self.repeat = max(1, options['repeat'])
+        tables = ['contracts', 'bids'] if options['table'] == 'all' else [options['table']]
+        # Everything runs in one transaction that is rolled back, so seeded
+        # rows and ANALYZE statistics never reach the database
+        with transaction.atomic():
+            if options['seed']:
+                start = time.perf_counter()
+                for table in tables:
+                    getattr(self, f'seed_{table}')(options['seed'])
+                self.stdout.write(self.style.NOTICE(
+                    f'Seeded {options["seed"]} rows per table in {time.perf_counter() - start:.1f}s'
+                ))
+            if options['analyze']:
+                with connection.cursor() as cursor:
+                    cursor.execute('ANALYZE')
+            for table in tables:
+                getattr(self, f'benchmark_{table}')()
+            transaction.set_rollback(True)
+
+    # Seeding
+
+    def seed_values(self, rng):
+        return (
+            f'Ministry {rng.randrange(SEED_MINISTRIES)}',
+            f'Department {rng.randrange(SEED_DEPARTMENTS)}',
+            f'Organisation {rng.randrange(SEED_ORGANISATIONS)}',
+            None if rng.randrange(SEED_NULL_DATE) == 0 else date.today() - timedelta(days=rng.randrange(SEED_DAYS)),
+        )
+
+    def seed_contracts(self, rows, batch_size=5000):
+        rng = random.Random(45)
+        prefix = f'BENCH-{int(time.time())}'
+        for start in range(0, rows, batch_size):
+            values = [self.seed_values(rng) for _ in range(min(batch_size, rows - start))]
+            contracts = Contract.objects.bulk_create([
+                Contract(contract_no=f'{prefix}-{start + i}', generated_date=generated_date)
+                for i, (_, _, _, generated_date) in enumerate(values)
+            ])
+            OrganisationDetail.objects.bulk_create([
+                OrganisationDetail(contract=contract, ministry=ministry, department=department,
+                                   organisation_name=organisation)
+                for contract, (ministry, department, organisation, _) in zip(contracts, values)
+            ])
+
+    def seed_bids(self, rows, batch_size=5000):
+        rng = random.Random(45)
+        prefix = f'GEM/BENCH/{int(time.time())}'
+        for start in range(0, rows, batch_size):
+            BidDocument.objects.bulk_create([
+                BidDocument(bid_number=f'{prefix}/{start + i}', ministry=ministry, department=department,
+                            organisation=organisation, dated=dated)
+                for i, (ministry, department, organisation, dated) in enumerate(
+                    self.seed_values(rng) for _ in range(min(batch_size, rows - start))
+                )
+            ])
+
+    # Benchmarks
+
+    def benchmark_contracts(self):
+        view = ContractTableView()
+        orgs = OrganisationDetail.objects
+        self.benchmark_table(
+            'contracts', Contract, view,
+            lambda **filters: view.filter_queryset(view.page_queryset(), **filters),
+            ministry=self.most_common(orgs, 'ministry'),
+            department=self.most_common(orgs, 'department'),
+            organisation=self.most_common(orgs, 'organisation_name'),
+            date_field='generated_date',
+        )
+
+    def benchmark_bids(self):
+        view = BidTableView()
+        bids = BidDocument.objects
+        self.benchmark_table(
+            'bids', BidDocument, view,
+            lambda **filters: view.filter_queryset(
+                bids.order_by(*view.ordering).defer(*view.page_deferred_fields), **filters
+            ),
+            ministry=self.most_common(bids, 'ministry'),
+            department=self.most_common(bids, 'department'),
+            organisation=self.most_common(bids, 'organisation'),
+            date_field='dated',
+        )
+        bid_number = bids.exclude(bid_number=None).values_list('bid_number', flat=True).first()
+        if bid_number:
+            self.stdout.write('  bid_number lookup (check_bid_exists)')
+            self.measure('exists', lambda: bids.filter(bid_number=bid_number).exists())
+
+    def benchmark_table(self, label, model, view, build, ministry, department, organisation, date_field):
+        total = model.objects.count()
+        if not total:
+            self.stdout.write(self.style.WARNING(f'No {label} to benchmark (use --seed N)'))
+            return
+        latest = model.objects.order_by(f'-{date_field}').values_list(date_field, flat=True).first() or date.today()
+        date_range = {'date_from': (latest - timedelta(days=90)).isoformat(), 'date_to': latest.isoformat()}
+        combinations = [
+            ('no filters', {}),
+            ('date range (90 days)', date_range),
+            ('ministry', {'ministry_filter': ministry}),
+            ('department', {'dept_filter': department}),
+            ('organisation', {'org_filter': organisation}),
+            ('ministry + date range', {'ministry_filter': ministry, **date_range}),
+            ('ministry + department', {'ministry_filter': ministry, 'dept_filter': department}),
+            ('search text', {'search_query': (ministry or 'a').split()[0]}),
+        ]
+        self.stdout.write(self.style.NOTICE(f'\n{label}: {total} rows'))
+        for name, filters in combinations:
+            filters = {
+                'search_query': '', 'org_filter': '', 'dept_filter': '', 'ministry_filter': '',
+                'date_from': '', 'date_to': '', **filters,
+            }
+            queryset = build(**filters)
+            paginator = KeysetPaginator(queryset, view.ordering, view.per_page, count_timeout=0)
+            count = paginator.count
+            self.stdout.write(f'  {name}: {count} rows')
+            if not count:
+                continue
+            self.measure('first page', lambda: list(paginator.page()))
+            # Cursor of a row most of the way through, as a deep "Next" link would carry
+            cursor = encode_cursor(list(queryset.values_list(*paginator.names)[int(count * 0.8)]))
+            self.measure('deep page', lambda: list(paginator.page(after=cursor, number=2)))
+            self.measure('count', lambda: queryset.count())
+
+    def most_common(self, queryset, field):
+        row = (
+            queryset.exclude(**{field: ''}).exclude(**{f'{field}__isnull': True})
+            .values(field).annotate(n=Count('pk')).order_by('-n').first()
+        )
+        return row[field] if row else ''
+
+    def measure(self, label, run):
+        """Median latency of ``run`` and the plan of the first query it issues"""
+        with CaptureQueriesContext(connection) as queries:
+            run()
+        timings = []
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            run()
+            timings.append((time.perf_counter() - start) * 1000)
+        self.stdout.write(self.style.SUCCESS(
+            f'    {label:<11} {statistics.median(timings):8.2f} ms  ({len(queries.captured_queries)} queries)'
+        ))
+        if queries.captured_queries:
+            for line in self.query_plan(queries.captured_queries[0]['sql']):
+                self.stdout.write(f'      {line}')
+
+    def query_plan(self, sql):
+        with connection.cursor() as cursor:
+            cursor.execute(f'{connection.ops.explain_query_prefix()} {sql}')
+            rows = cursor.fetchall()
+        # SQLite rows are (id, parent, notused, detail)
+        return [str(row[-1]) for row in rows]
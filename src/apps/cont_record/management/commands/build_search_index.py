@@ -0,0 +1,25 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from src.apps.cont_record.search_index import get_search_index, index_contracts
+
+
+class Command(BaseCommand):
+    help = "Build the keyword (BM25) index that supplies semantic search candidates"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch', type=int, default=500, help='Contracts indexed per transaction')
+        parser.add_argument('--rebuild', action='store_true', help='Clear the index before indexing')
+
+    def handle(self, *args, **options):
+        index = get_search_index()
+        if options['rebuild']:
+            index.clear()
+        self.stdout.write(self.style.NOTICE(f'Indexing contracts into {index.db_path}...'))
+
+        start = time.time()
+        done = index_contracts(batch_size=int(options['batch']))
+        self.stdout.write(self.style.SUCCESS(
+            f'Indexed {done} contracts in {time.time() - start:.1f}s ({len(index)} documents in index)'
+        ))
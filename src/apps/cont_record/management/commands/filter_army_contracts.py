@@ -6,8 +6,9 @@ import os
 
 from src.apps.cont_record.models import (
     Contract, OrganisationDetail, BuyerDetail, SellerDetail, 
-    Product, ConsigneeDetail, PayingAuthority, FinancialApproval
+    Product, ConsigneeDetail, PayingAuthority, FinancialApproval, ContractTag
 )
+from src.apps.cont_record.tagging import get_tag_rules
 
 
 class Command(BaseCommand):
@@ -20,11 +21,17 @@ class Command(BaseCommand):
             default='army_contracts_filtered.xlsx',
             help='Output Excel file name (default: army_contracts_filtered.xlsx)'
         )
+        parser.add_argument(
+            '--tag',
+            type=str,
+            default='army',
+            help='Tag rule set to filter on (default: army); see the tag_contracts command'
+        )
         parser.add_argument(
             '--keywords',
             type=str,
-            default='India Army,HQ,Headquarters,Armd,ARMD,army,ARMY,Headquarters,headquarters',
-            help='Comma-separated keywords to search for'
+            default=None,
+            help='Comma-separated keywords for an ad-hoc full-text scan instead of a tag'
         )
         parser.add_argument(
             '--min-fields',
@@ -35,13 +42,34 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         output_file = options['output']
-        keywords = [kw.strip() for kw in options['keywords'].split(',')]
         min_fields = options['min_fields']
 
-        self.stdout.write(self.style.NOTICE(f'Searching for contracts with keywords: {keywords}'))
+        if options['keywords']:
+            keywords = [kw.strip() for kw in options['keywords'].split(',')]
+            self.stdout.write(self.style.NOTICE(f'Searching for contracts with keywords: {keywords}'))
+            contracts = Contract.objects.filter(self.keyword_query(keywords)).distinct()
+        else:
+            # Tags are computed at ingest, so this is an indexed join
+            tag = options['tag']
+            keywords = get_tag_rules().get(tag, [])
+            if not ContractTag.objects.filter(tag=tag).exists():
+                self.stdout.write(self.style.WARNING(
+                    f'No contracts tagged "{tag}" yet; run "manage.py tag_contracts" to backfill existing rows'
+                ))
+            self.stdout.write(self.style.NOTICE(f'Filtering contracts tagged "{tag}" (keywords: {keywords})'))
+            contracts = Contract.objects.filter(tags__tag=tag)
+
         self.stdout.write(self.style.NOTICE(f'Minimum required fields: {min_fields}'))
 
-        # Build search query
+        contracts = contracts.select_related(
+            'organization_details', 'buyer', 'seller', 'paying_authority', 'financial_approval'
+        ).prefetch_related(
+            'products', 'products__consignees', 'products__specifications'
+        )
+        self.filter_and_export(contracts, keywords, output_file, min_fields)
+
+    def keyword_query(self, keywords):
+        """Ad-hoc OR of icontains lookups across the contract and its relations"""
         search_query = Q()
         for keyword in keywords:
             search_query |= (
@@ -59,14 +87,9 @@ class Command(BaseCommand):
                 Q(products__consignees__delivery_to__icontains=keyword) |
                 Q(paying_authority__address__icontains=keyword)
             )
+        return search_query
 
-        # Get contracts matching keywords
-        contracts = Contract.objects.filter(search_query).distinct().select_related(
-            'organization_details', 'buyer', 'seller', 'paying_authority', 'financial_approval'
-        ).prefetch_related(
-            'products', 'products__consignees', 'products__specifications'
-        )
-
+    def filter_and_export(self, contracts, keywords, output_file, min_fields):
         self.stdout.write(self.style.NOTICE(f'Found {contracts.count()} contracts matching keywords'))
 
         # Filter contracts with complete data
@@ -1,81 +1,126 @@
+import hashlib
+import time
+
 from django.core.management.base import BaseCommand
 from django.db import transaction
 
 from src.apps.cont_record.models import Contract, Product
+from src.apps.cont_record.search_cache import bump_corpus_version
+from src.utils.embedding_cache import get_chunk_cache
+from src.utils.embedding_encoder import BulkEncoder
+
+# Bump when the way vectors are built changes, so every row is re-encoded once
+EMBEDDING_SCHEME = 'chunked-v1'
+
+
+def contract_embedding_text(c):
+    parts = [
+        c.contract_no or '',
+        c.generated_date.isoformat() if c.generated_date else '',
+        getattr(c.organization_details, 'organisation_name', '') if hasattr(c, 'organization_details') else '',
+        getattr(c.organization_details, 'department', '') if hasattr(c, 'organization_details') else '',
+        getattr(c.seller, 'company_name', '') if hasattr(c, 'seller') else '',
+        getattr(c.buyer, 'email', '') if hasattr(c, 'buyer') else '',
+        c.raw_text or ''
+    ]
+    return ' | '.join([p for p in parts if p])
+
 
-try:
-    from sentence_transformers import SentenceTransformer
-except Exception:  # pragma: no cover
-    SentenceTransformer = None
+def product_embedding_text(p):
+    parts = [p.product_name or '', p.category_name_quadrant or '', p.hsn_code or '', p.note or '']
+    return ' | '.join([x for x in parts if x])
+
+
+def source_hash(text):
+    return hashlib.sha256(f'{EMBEDDING_SCHEME}\n{text}'.encode('utf-8')).hexdigest()
 
 
 class Command(BaseCommand):
-    help = "Compute and store embeddings for existing Contract and Product records"
+    help = "Compute and store embeddings for Contract and Product records whose text changed"
 
     def add_arguments(self, parser):
         parser.add_argument('--batch', type=int, default=128, help='Batch size for embedding computation')
+        parser.add_argument('--chunk', type=int, default=2000, help='Rows fetched from the database per chunk')
+        parser.add_argument('--force', action='store_true', help='Re-encode every row, changed or not')
+        parser.add_argument('--processes', type=int, default=1, help='Encoder processes (multi-process pool when > 1)')
+        parser.add_argument('--quantize', action='store_true', help='Encode with an int8 dynamically quantised model')
+        parser.add_argument('--no-cache', action='store_true', help='Do not read or write the chunk embedding cache')
 
     def handle(self, *args, **options):
-        if SentenceTransformer is None:
+        batch_size = int(options['batch'])
+        chunk_size = int(options['chunk'])
+        force = options['force']
+
+        encoder = BulkEncoder(processes=options['processes'], quantize=options['quantize'], batch_size=batch_size)
+        if not encoder.available:
             self.stderr.write(self.style.ERROR('sentence-transformers not available. Install requirements first.'))
             return
+        if encoder.processes > 1 or encoder.quantize:
+            self.stdout.write(self.style.NOTICE(
+                f'Encoding with {encoder.processes} process(es){" (int8 quantised)" if encoder.quantize else ""}'
+            ))
 
-        model = SentenceTransformer('all-MiniLM-L6-v2')
-        batch_size = int(options['batch'])
+        cache = None if options['no_cache'] else get_chunk_cache()
+        with encoder:
+            # The stored vectors are never read here, only replaced
+            contracts = Contract.objects.select_related(
+                'organization_details', 'buyer', 'seller'
+            ).defer('embedding').order_by('pk')
+            self.reindex('contracts', contracts, contract_embedding_text, encoder, cache, batch_size, chunk_size, force)
 
-        # Contracts
-        contracts = list(Contract.objects.all().select_related('organization_details', 'buyer', 'seller'))
-        self.stdout.write(self.style.NOTICE(f'Computing embeddings for {len(contracts)} contracts...'))
-        texts = []
-        refs = []
-        for c in contracts:
-            parts = [
-                c.contract_no or '',
-                c.generated_date.isoformat() if c.generated_date else '',
-                getattr(c.organization_details, 'organisation_name', '') if hasattr(c, 'organization_details') else '',
-                getattr(c.organization_details, 'department', '') if hasattr(c, 'organization_details') else '',
-                getattr(c.seller, 'company_name', '') if hasattr(c, 'seller') else '',
-                getattr(c.buyer, 'email', '') if hasattr(c, 'buyer') else '',
-                c.raw_text or ''
-            ]
-            texts.append(' | '.join([p for p in parts if p]))
-            refs.append(c)
-
-        for i in range(0, len(texts), batch_size):
-            batch_texts = texts[i:i+batch_size]
-            batch_refs = refs[i:i+batch_size]
-            if not batch_texts:
-                continue
-            vecs = model.encode(batch_texts, normalize_embeddings=True)
-            with transaction.atomic():
-                for ref, vec in zip(batch_refs, vecs):
-                    ref.embedding = vec.tolist()
-                    ref.save(update_fields=['embedding'])
-        self.stdout.write(self.style.SUCCESS('Contract embeddings updated.'))
-
-        # Products
-        products = list(Product.objects.select_related('contract').all())
-        self.stdout.write(self.style.NOTICE(f'Computing embeddings for {len(products)} products...'))
-        p_texts = []
-        p_refs = []
-        for p in products:
-            parts = [p.product_name or '', p.category_name_quadrant or '', p.hsn_code or '', p.note or '']
-            combo = ' | '.join([x for x in parts if x])
-            if not combo:
-                continue
-            p_texts.append(combo)
-            p_refs.append(p)
+            products = Product.objects.defer('embedding').order_by('pk')
+            self.reindex('products', products, product_embedding_text, encoder, cache, batch_size, chunk_size, force)
 
-        for i in range(0, len(p_texts), batch_size):
-            batch_texts = p_texts[i:i+batch_size]
-            batch_refs = p_refs[i:i+batch_size]
-            if not batch_texts:
-                continue
-            vecs = model.encode(batch_texts, normalize_embeddings=True)
+        # bulk_update sends no save signals
+        bump_corpus_version()
+
+    def reindex(self, label, queryset, build_text, encoder, cache, batch_size, chunk_size, force):
+        """Stream ``queryset`` and re-encode only rows whose source text hash changed"""
+        self.stdout.write(self.style.NOTICE(f'Scanning {label} for changed text...'))
+        model_class = queryset.model
+        start = time.time()
+        scanned = encoded = 0
+        refs, texts, hashes = [], [], []
+
+        def flush():
+            nonlocal encoded
+            vecs = encoder.encode_documents(texts, cache)
+            for ref, vec, text_hash in zip(refs, vecs, hashes):
+                ref.embedding = vec.tolist()
+                ref.embedding_source_hash = text_hash
             with transaction.atomic():
-                for ref, vec in zip(batch_refs, vecs):
-                    ref.embedding = vec.tolist()
-                    ref.save(update_fields=['embedding'])
-        self.stdout.write(self.style.SUCCESS('Product embeddings updated.'))
+                model_class.objects.bulk_update(refs, ['embedding', 'embedding_source_hash'], batch_size=batch_size)
+            encoded += len(refs)
+            refs.clear()
+            texts.clear()
+            hashes.clear()
 
+        for obj in queryset.iterator(chunk_size=chunk_size):
+            scanned += 1
+            text = build_text(obj)
+            if not text:
+                continue
+            text_hash = source_hash(text)
+            if not force and obj.embedding_source_hash == text_hash:
+                continue
+            refs.append(obj)
+            texts.append(text)
+            hashes.append(text_hash)
+            # Encode a whole chunk at once so length sorting and the worker
+            # pool have enough texts to work with
+            if len(refs) >= chunk_size:
+                flush()
+        if refs:
+            flush()
 
+        elapsed = max(time.time() - start, 1e-9)
+        self.stdout.write(self.style.SUCCESS(
+            f'{label.capitalize()}: scanned {scanned}, re-encoded {encoded}, '
+            f'unchanged {scanned - encoded} in {elapsed:.1f}s '
+            f'({scanned / elapsed:.0f} rows/s scanned, {encoded / elapsed:.1f} rows/s encoded)'
+        ))
+        if cache is not None:
+            self.stdout.write(
+                f'  chunk cache: {cache.hits} hits, {cache.misses} encoded, {cache.count()} chunks stored'
+            )
+            cache.hits = cache.misses = 0
@@ -0,0 +1,41 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from src.apps.cont_record.models import Contract
+from src.apps.cont_record.search_cache import bump_corpus_version
+from src.apps.cont_record.summaries import extractive_summary
+
+
+class Command(BaseCommand):
+    help = "Backfill the stored extractive summaries used by semantic search"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch', type=int, default=200, help='Contracts updated per bulk_update')
+        parser.add_argument('--all', action='store_true', help='Recompute summaries that already exist')
+
+    def handle(self, *args, **options):
+        batch_size = int(options['batch'])
+        queryset = Contract.objects.exclude(raw_text='').only('id', 'raw_text', 'summary').order_by('pk')
+        if not options['all']:
+            queryset = queryset.filter(summary='')
+        total = queryset.count()
+        self.stdout.write(self.style.NOTICE(f'Summarizing {total} contracts...'))
+
+        start = time.time()
+        batch = []
+        done = 0
+        for contract in queryset.iterator(chunk_size=batch_size):
+            contract.summary = extractive_summary(contract.raw_text)
+            batch.append(contract)
+            if len(batch) >= batch_size:
+                Contract.objects.bulk_update(batch, ['summary'])
+                done += len(batch)
+                batch = []
+        if batch:
+            Contract.objects.bulk_update(batch, ['summary'])
+            done += len(batch)
+
+        # bulk_update sends no save signals
+        bump_corpus_version()
+        self.stdout.write(self.style.SUCCESS(f'Summarized {done} contracts in {time.time() - start:.1f}s'))
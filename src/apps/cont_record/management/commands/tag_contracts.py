@@ -0,0 +1,36 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from src.apps.cont_record.models import Contract
+from src.apps.cont_record.tagging import get_tag_rules, tag_contracts
+
+
+class Command(BaseCommand):
+    help = "Backfill keyword tags (e.g. 'army') for existing contracts"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch', type=int, default=500, help='Contracts tagged per transaction')
+        parser.add_argument(
+            '--untagged-only',
+            action='store_true',
+            help='Only tag contracts that have no tags yet'
+        )
+
+    def handle(self, *args, **options):
+        rules = get_tag_rules()
+        self.stdout.write(self.style.NOTICE(f'Tag rule sets: {", ".join(rules) or "(none)"}'))
+
+        queryset = Contract.objects.all()
+        if options['untagged_only']:
+            queryset = queryset.filter(tags__isnull=True)
+        total = queryset.count()
+        self.stdout.write(self.style.NOTICE(f'Tagging {total} contracts...'))
+
+        start = time.time()
+        counts = tag_contracts(queryset, batch_size=int(options['batch']))
+        elapsed = time.time() - start
+
+        for tag, count in counts.items():
+            self.stdout.write(f'  {tag}: {count} contracts')
+        self.stdout.write(self.style.SUCCESS(f'Tagged {total} contracts in {elapsed:.1f}s'))
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cont_record', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContractTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tag', models.CharField(max_length=64)),
+                ('matched_keywords', models.CharField(blank=True, max_length=512)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('contract', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tags', to='cont_record.contract')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('tag', 'contract'), name='unique_contract_tag')],
+            },
+        ),
+    ]
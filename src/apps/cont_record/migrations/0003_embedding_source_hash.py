@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cont_record', '0002_contract_tag'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contract',
+            name='embedding_source_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='embedding_source_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+    ]
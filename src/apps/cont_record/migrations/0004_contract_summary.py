@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cont_record', '0003_embedding_source_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contract',
+            name='summary',
+            field=models.TextField(blank=True, default=''),
+        ),
+    ]
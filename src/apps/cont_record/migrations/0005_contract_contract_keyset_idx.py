@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cont_record', '0004_contract_summary'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contract',
+            index=models.Index(fields=['-generated_date', '-created_at', '-id'], name='contract_keyset_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:20
+
+import src.utils.compressed_text
+from django.db import migrations
+from src.utils.compressed_text import compress_column, decompress_column
+
+
+def compress_raw_text(apps, schema_editor):
+    compress_column(apps.get_model('cont_record', 'Contract'), 'raw_text')
+
+
+def decompress_raw_text(apps, schema_editor):
+    decompress_column(apps.get_model('cont_record', 'Contract'), 'raw_text')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cont_record', '0005_contract_contract_keyset_idx'),
+    ]
+
+    operations = [
+        # Reversed after the column is a TextField again
+        migrations.RunPython(migrations.RunPython.noop, decompress_raw_text),
+        migrations.AlterField(
+            model_name='contract',
+            name='raw_text',
+            field=src.utils.compressed_text.CompressedTextField(blank=True, editable=True),
+        ),
+        migrations.RunPython(compress_raw_text, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cont_record', '0006_compress_contract_raw_text'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='organisationdetail',
+            index=models.Index(fields=['ministry', 'contract'], name='org_ministry_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='organisationdetail',
+            index=models.Index(fields=['department', 'contract'], name='org_department_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='organisationdetail',
+            index=models.Index(fields=['organisation_name', 'contract'], name='org_name_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cont_record', '0007_organisation_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IngestClaim',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('path', models.CharField(max_length=1024, unique=True)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('CLAIMED', 'Claimed'), ('DONE', 'Done'), ('FAILED', 'Failed')], default='PENDING', max_length=16)),
+                ('worker', models.CharField(blank=True, max_length=128)),
+                ('lease_token', models.CharField(blank=True, max_length=32)),
+                ('lease_expires_at', models.DateTimeField(blank=True, null=True)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('result', models.CharField(blank=True, max_length=16)),
+                ('error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'lease_expires_at'], name='claim_status_lease_idx'), models.Index(fields=['worker', 'lease_token'], name='claim_worker_idx')],
+            },
+        ),
+    ]
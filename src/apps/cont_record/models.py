@@ -3,6 +3,8 @@ from django.core.validators import RegexValidator
 from django.utils import timezone
 from typing import Optional, List
 
+from src.utils.compressed_text import CompressedTextField
+
 
 PHONE_REGEX = RegexValidator(
     regex=r'^[\d\-\+\s\(\)]{3,30}$',
@@ -27,14 +29,23 @@ class Contract(TimeStampedModel):
     file = models.ForeignKey(PdfFile, on_delete=models.CASCADE,blank=True, null=True)
     contract_no = models.CharField(max_length=64, unique=True, db_index=True)
     generated_date = models.DateField(null=True, blank=True)
-    raw_text = models.TextField(blank=True)
+    # Stored zlib-compressed; defer() it in queries that don't show the text
+    raw_text = CompressedTextField(blank=True)
     embedding = models.JSONField(null=True, blank=True)
+    # sha256 of the text the embedding was computed from (see reindex_embeddings)
+    embedding_source_hash = models.CharField(max_length=64, blank=True, editable=False)
+    # Query-independent extractive summary, computed at ingest
+    summary = models.TextField(blank=True, default='')
 
     def __str__(self):
         return f"{self.contract_no} — {self.generated_date or 'Contract'}"
 
     class Meta:
         ordering = ['-generated_date', '-created_at']
+        indexes = [
+            # Keyset pagination of the contract table (see ContractTableView)
+            models.Index(fields=['-generated_date', '-created_at', '-id'], name='contract_keyset_idx'),
+        ]
         
     @classmethod
     def _get_embedder(cls):
@@ -69,6 +80,14 @@ class OrganisationDetail(models.Model):
     organisation_name = models.CharField(max_length=256, blank=True)
     office_zone = models.CharField(max_length=256, blank=True)
 
+    class Meta:
+        indexes = [
+            # Contract table filters; contract_id makes them covering for the join
+            models.Index(fields=['ministry', 'contract'], name='org_ministry_idx'),
+            models.Index(fields=['department', 'contract'], name='org_department_idx'),
+            models.Index(fields=['organisation_name', 'contract'], name='org_name_idx'),
+        ]
+
 class BuyerDetail(models.Model):
     contract = models.OneToOneField(Contract, on_delete=models.CASCADE, related_name='buyer')
     designation = models.CharField(max_length=128, blank=True)
@@ -138,6 +157,7 @@ class Product(TimeStampedModel):
 
     note = models.TextField(blank=True)  # e.g., seller note or undertakings
     embedding = models.JSONField(null=True, blank=True)
+    embedding_source_hash = models.CharField(max_length=64, blank=True, editable=False)
 
     def __str__(self):
         return f"{self.product_name} — {self.contract.contract_no}"
@@ -188,3 +208,52 @@ class TermsAndCondition(models.Model):
     def __str__(self):
         short = (self.clause_text[:60] + '...') if len(self.clause_text) > 60 else self.clause_text
         return f"T&C ({short})"
+
+
+class ContractTag(models.Model):
+    """Keyword rule set that matched a contract, evaluated once at ingest"""
+    contract = models.ForeignKey(Contract, on_delete=models.CASCADE, related_name='tags')
+    tag = models.CharField(max_length=64)
+    matched_keywords = models.CharField(max_length=512, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            # Also the index behind filtering contracts by tag
+            models.UniqueConstraint(fields=['tag', 'contract'], name='unique_contract_tag'),
+        ]
+
+    def __str__(self):
+        return f"{self.tag} ({self.contract.contract_no})"
+
+
+class IngestClaim(models.Model):
+    """One PDF of the shared ingest queue; worker processes lease batches of pending rows"""
+    PENDING = 'PENDING'
+    CLAIMED = 'CLAIMED'
+    DONE = 'DONE'
+    FAILED = 'FAILED'
+    STATUS_CHOICES = [(s, s.title()) for s in (PENDING, CLAIMED, DONE, FAILED)]
+
+    # Relative to the data directory, so hosts may mount the share at different paths
+    path = models.CharField(max_length=1024, unique=True)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=PENDING)
+    worker = models.CharField(max_length=128, blank=True)
+    lease_token = models.CharField(max_length=32, blank=True)
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+    # Status logged for the file (SUCCESS, SKIPPED, FAILED, IGNORED)
+    result = models.CharField(max_length=16, blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # Claim queries: pending rows in order, and claimed rows whose lease ran out
+            models.Index(fields=['status', 'lease_expires_at'], name='claim_status_lease_idx'),
+            models.Index(fields=['worker', 'lease_token'], name='claim_worker_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.path} ({self.status})"
@@ -0,0 +1,100 @@
+import hashlib
+import json
+import re
+import uuid
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+
+from src.utils.embedding_encoder import get_sentence_model
+
+CORPUS_VERSION_KEY = "semantic_search:corpus_version"
+# Query texts whose embeddings are kept per process
+QUERY_EMBEDDING_CACHE_SIZE = 1024
+
+
+def get_search_cache():
+    """The 'search' cache alias when configured, else the default cache"""
+    return caches['search'] if 'search' in settings.CACHES else caches['default']
+
+
+def get_version_cache():
+    """The 'search_version' alias when configured: it holds only the corpus version, so culling never drops it"""
+    return caches['search_version'] if 'search_version' in settings.CACHES else get_search_cache()
+
+
+def normalise_query(query: str) -> str:
+    # MiniLM is uncased, so case and spacing never change the embedding
+    return ' '.join(query.split()).lower()
+
+
+def _new_version() -> str:
+    # A random token rather than a counter: a lost key or two processes
+    # bumping at once can never bring back a version results are cached under
+    return uuid.uuid4().hex
+
+
+def get_corpus_version() -> str:
+    cache = get_version_cache()
+    version = cache.get(CORPUS_VERSION_KEY)
+    if version is None:
+        cache.add(CORPUS_VERSION_KEY, _new_version(), timeout=None)
+        version = cache.get(CORPUS_VERSION_KEY)
+    return version
+
+
+def bump_corpus_version(**kwargs) -> None:
+    """Invalidate every cached search result (usable as a signal receiver)"""
+    get_version_cache().set(CORPUS_VERSION_KEY, _new_version(), timeout=None)
+
+
+@lru_cache(maxsize=QUERY_EMBEDDING_CACHE_SIZE)
+def _query_embedding(query: str, quantize: bool):
+    model = get_sentence_model(quantize)
+    if model is None:
+        return None
+    vec = model.encode([query], normalize_embeddings=True)
+    # Shared between requests, so it must not be modified in place
+    vec.flags.writeable = False
+    return vec
+
+
+def query_embedding(query: str):
+    """(1, dim) embedding of ``query``, from a per-process LRU"""
+    return _query_embedding(normalise_query(query), getattr(settings, 'EMBEDDING_QUANTIZE', False))
+
+
+def _result_key(query: str, top_k: int, version: str, filters: Optional[Dict[str, Any]] = None) -> str:
+    text = normalise_query(query)
+    if filters:
+        text += '\n' + json.dumps(filters, sort_keys=True, default=str)
+    digest = hashlib.sha1(text.encode('utf-8')).hexdigest()
+    return f"semantic_search:v{version}:{top_k}:{digest}"
+
+
+def get_cached_results(query: str, top_k: int, version: str,
+                       filters: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    return get_search_cache().get(_result_key(query, top_k, version, filters))
+
+
+def set_cached_results(query: str, top_k: int, version: str, payload: Dict[str, Any],
+                       filters: Optional[Dict[str, Any]] = None) -> None:
+    """Store under the version read before searching, so a save during the search wins"""
+    timeout = getattr(settings, 'SEMANTIC_SEARCH_CACHE_TIMEOUT', 3600)
+    get_search_cache().set(_result_key(query, top_k, version, filters), payload, timeout=timeout)
+
+
+def store_result_handle(contract_ids: List[int], scores: List[float]) -> str:
+    """Keep a ranked result list server-side; returns the handle the table view pages through"""
+    handle = uuid.uuid4().hex
+    timeout = getattr(settings, 'SEMANTIC_SEARCH_CACHE_TIMEOUT', 3600)
+    get_search_cache().set(f"semantic_search:handle:{handle}", {'ids': contract_ids, 'scores': scores}, timeout=timeout)
+    return handle
+
+
+def load_result_handle(handle: str) -> Optional[Dict[str, List]]:
+    if not handle or not re.fullmatch(r'[0-9a-f]{32}', handle):
+        return None
+    return get_search_cache().get(f"semantic_search:handle:{handle}")
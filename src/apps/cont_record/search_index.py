@@ -0,0 +1,77 @@
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional
+
+from django.conf import settings
+
+from src.apps.cont_record.models import Contract
+from src.utils.bm25_index import BM25Index
+
+# Relations needed to build the indexed text without per-contract queries
+INDEX_SELECT_RELATED = ('organization_details', 'buyer', 'seller', 'paying_authority')
+INDEX_PREFETCH_RELATED = ('products',)
+
+
+@lru_cache(maxsize=1)
+def get_search_index() -> BM25Index:
+    """Keyword index at settings.SEARCH_INDEX_PATH (default: next to the project DB)"""
+    path = getattr(settings, 'SEARCH_INDEX_PATH', None) or Path(settings.BASE_DIR) / 'search_index.sqlite3'
+    return BM25Index(path)
+
+
+def contract_search_text(contract: Contract) -> str:
+    """Contract and product text, plus the identifiers people search for verbatim"""
+    return search_text(
+        contract,
+        getattr(contract, 'organization_details', None),
+        getattr(contract, 'buyer', None),
+        getattr(contract, 'seller', None),
+        getattr(contract, 'paying_authority', None),
+        contract.products.all(),
+    )
+
+
+def search_text(contract, org=None, buyer=None, seller=None, paying=None, products=()) -> str:
+    """``contract_search_text`` from the parts, which may be unsaved"""
+    parts = [contract.contract_no, contract.raw_text]
+    if org:
+        parts += [org.organisation_name, org.department, org.ministry, org.office_zone]
+    if buyer:
+        parts += [buyer.email, buyer.gstin]
+    if seller:
+        parts += [seller.company_name, seller.gstin, seller.gem_seller_id]
+    if paying:
+        parts.append(paying.gstin)
+    for product in products:
+        parts += [product.product_name, product.category_name_quadrant, product.hsn_code, product.note]
+    return '\n'.join(p for p in parts if p)
+
+
+def index_contract(contract: Contract) -> None:
+    """(Re)index one contract, refetched with the relations the text needs"""
+    contract = (
+        Contract.objects.select_related(*INDEX_SELECT_RELATED)
+        .prefetch_related(*INDEX_PREFETCH_RELATED)
+        .get(pk=contract.pk)
+    )
+    get_search_index().add_document(contract.pk, contract_search_text(contract))
+
+
+def index_contracts(queryset: Optional[Iterable[Contract]] = None, batch_size: int = 500) -> int:
+    """Index ``queryset`` (all contracts by default) in batches; returns the count"""
+    if queryset is None:
+        queryset = Contract.objects.all()
+    queryset = queryset.select_related(*INDEX_SELECT_RELATED).prefetch_related(*INDEX_PREFETCH_RELATED)
+    index = get_search_index()
+    batch = []
+    count = 0
+    for contract in queryset.order_by('pk').iterator(chunk_size=batch_size):
+        batch.append((contract.pk, contract_search_text(contract)))
+        if len(batch) >= batch_size:
+            index.add_documents(batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        index.add_documents(batch)
+        count += len(batch)
+    return count
@@ -0,0 +1,26 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from src.apps.cont_record.models import Contract, Product
+from src.apps.cont_record.search_cache import bump_corpus_version
+from src.apps.cont_record.search_index import get_search_index
+
+
+@receiver(post_save, sender=Contract)
+@receiver(post_delete, sender=Contract)
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def invalidate_search_cache(sender, **kwargs):
+    # After commit, so no search caches results from before the save; once
+    # per transaction, however many contracts and products it saves
+    connection = transaction.get_connection()
+    if any(callback is bump_corpus_version for _, callback, *_ in connection.run_on_commit):
+        return
+    transaction.on_commit(bump_corpus_version)
+
+
+@receiver(post_delete, sender=Contract)
+def remove_from_search_index(sender, instance, **kwargs):
+    contract_id = instance.pk
+    transaction.on_commit(lambda: get_search_index().remove_document(contract_id))
@@ -0,0 +1,111 @@
+import re
+from functools import lru_cache
+from typing import Optional
+
+from src.apps.cont_record.models import Contract
+
+try:
+    from transformers import pipeline
+except Exception:
+    pipeline = None
+
+try:
+    from summa.summarizer import summarize
+except Exception:
+    summarize = None
+
+QA_MODEL = "deepset/roberta-base-squad2"
+# Minimum confidence for a QA answer to be used as the search summary
+QA_MIN_SCORE = 0.1
+# QA only reads the start of the contract
+QA_CONTEXT_CHARS = 3000
+SUMMARY_WORDS = 100
+
+
+def clean_raw_text(text: str) -> str:
+    """Clean and normalize raw text"""
+    if not text:
+        return ""
+
+    # Remove common PDF artifacts
+    text = re.sub(r'\s+', ' ', text)  # Collapse whitespace
+    text = re.sub(r'[^\w\s.,;:!?()-]', '', text)  # Remove special chars
+    text = re.sub(r'\bPage \d+\b', '', text)  # Remove page numbers
+
+    lines = text.split('.')
+    unique_lines = []
+    seen = set()
+    for line in lines:
+        clean_line = line.strip()
+        if clean_line and clean_line not in seen:
+            unique_lines.append(clean_line)
+            seen.add(clean_line)
+
+    return '. '.join(unique_lines)
+
+
+@lru_cache(maxsize=1)
+def get_qa_pipeline():
+    """Question-answering pipeline, built on first use and kept for the process"""
+    if pipeline is None:
+        return None
+    try:
+        return pipeline("question-answering", model=QA_MODEL, tokenizer=QA_MODEL)
+    except Exception:
+        return None
+
+
+def extractive_summary(text: str) -> str:
+    """Query-independent extractive summary of a contract's cleaned text"""
+    text = clean_raw_text(text)
+    if not text:
+        return ""
+    if summarize is not None:
+        try:
+            summary = summarize(text, words=SUMMARY_WORDS, split=True)
+            if summary:
+                return " ".join(summary)
+        except Exception:
+            pass
+    # Without summa: the opening sentences
+    sentences = re.split(r'(?<=[.!?])\s+', text)
+    return " ".join(sentences[:3])
+
+
+def summarize_contract(contract: Contract) -> str:
+    """Compute and store the extractive summary of ``contract``"""
+    contract.summary = extractive_summary(contract.raw_text)
+    Contract.objects.filter(pk=contract.pk).update(summary=contract.summary)
+    return contract.summary
+
+
+def answer_query(text: str, query: str) -> Optional[str]:
+    """Direct answer to ``query`` from ``text`` when the QA model is confident"""
+    qa_pipeline = get_qa_pipeline()
+    if qa_pipeline is None or not text:
+        return None
+    try:
+        answer = qa_pipeline(question=query, context=text[:QA_CONTEXT_CHARS])
+    except Exception:
+        return None
+    if answer['score'] > QA_MIN_SCORE:
+        return answer['answer']
+    return None
+
+
+def query_sentences(text: str, query: str) -> str:
+    """Up to three sentences of ``text`` containing a query term"""
+    sentences = re.split(r'(?<=[.!?])\s+', text)
+    query_terms = query.lower().split()
+    relevant_sentences = [s for s in sentences if any(term in s.lower() for term in query_terms)][:3]
+    return " ".join(relevant_sentences)
+
+
+def search_summary(contract: Contract, query: str) -> str:
+    """Summary for the top search hit: a QA answer, else the stored summary"""
+    cleaned_text = clean_raw_text(contract.raw_text)
+    answer = answer_query(cleaned_text, query)
+    if answer:
+        return answer
+    summary = contract.summary or summarize_contract(contract)
+    return summary or query_sentences(cleaned_text, query) or "No relevant information found"
@@ -0,0 +1,115 @@
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+
+from src.apps.cont_record.models import Contract, ContractTag
+from src.utils.keyword_matcher import RuleSetMatcher
+
+# Keyword rule sets (tag -> keywords); override with settings.CONTRACT_TAG_RULES
+DEFAULT_CONTRACT_TAG_RULES = {
+    'army': ['India Army', 'HQ', 'Headquarters', 'Armd', 'army'],
+}
+
+# Relations needed to build the tag text without per-contract queries
+TAG_SELECT_RELATED = ('organization_details', 'buyer', 'seller', 'paying_authority')
+TAG_PREFETCH_RELATED = ('products', 'products__consignees')
+
+
+def get_tag_rules() -> Dict[str, List[str]]:
+    return getattr(settings, 'CONTRACT_TAG_RULES', DEFAULT_CONTRACT_TAG_RULES)
+
+
+@lru_cache(maxsize=1)
+def get_rule_matcher() -> RuleSetMatcher:
+    return RuleSetMatcher(get_tag_rules())
+
+
+def contract_tag_text(contract: Contract) -> str:
+    """Join the fields the keyword filters search, one per line"""
+    return tag_text(
+        contract,
+        getattr(contract, 'organization_details', None),
+        getattr(contract, 'buyer', None),
+        getattr(contract, 'seller', None),
+        getattr(contract, 'paying_authority', None),
+        [(product, product.consignees.all()) for product in contract.products.all()],
+    )
+
+
+def tag_text(contract, org=None, buyer=None, seller=None, paying=None, products=()) -> str:
+    """``contract_tag_text`` from the parts, which may be unsaved; ``products`` are (product, consignees) pairs"""
+    parts = [contract.raw_text, contract.contract_no]
+    if org:
+        parts += [org.organisation_name, org.department, org.ministry]
+    if buyer:
+        parts.append(buyer.address)
+    if seller:
+        parts += [seller.company_name, seller.address]
+    if paying:
+        parts.append(paying.address)
+    for product, consignees in products:
+        parts += [product.item_description, product.product_name]
+        for consignee in consignees:
+            parts += [consignee.address, consignee.delivery_to]
+    return '\n'.join(p for p in parts if p)
+
+
+def match_tags(text: str, matcher: Optional[RuleSetMatcher] = None) -> Dict[str, List[str]]:
+    """Tag -> matched keywords for ``text``"""
+    return (matcher or get_rule_matcher()).match(text)
+
+
+def build_contract_tags(contract: Contract, matcher: Optional[RuleSetMatcher] = None,
+                        matches: Optional[Dict[str, List[str]]] = None) -> List[ContractTag]:
+    if matches is None:
+        matches = match_tags(contract_tag_text(contract), matcher)
+    return [
+        ContractTag(contract=contract, tag=tag, matched_keywords=', '.join(keywords)[:512])
+        for tag, keywords in matches.items()
+    ]
+
+
+def tag_contract(contract: Contract) -> List[str]:
+    """(Re)compute the tags of one contract; returns the tag names"""
+    contract = (
+        Contract.objects.select_related(*TAG_SELECT_RELATED)
+        .prefetch_related(*TAG_PREFETCH_RELATED)
+        .get(pk=contract.pk)
+    )
+    tags = build_contract_tags(contract)
+    with transaction.atomic():
+        ContractTag.objects.filter(contract=contract).delete()
+        ContractTag.objects.bulk_create(tags)
+    return [t.tag for t in tags]
+
+
+def tag_contracts(queryset: Optional[Iterable[Contract]] = None, batch_size: int = 500) -> Dict[str, int]:
+    """Backfill tags for ``queryset`` (all contracts by default); returns counts per tag"""
+    if queryset is None:
+        queryset = Contract.objects.all()
+    queryset = queryset.select_related(*TAG_SELECT_RELATED).prefetch_related(*TAG_PREFETCH_RELATED)
+    matcher = get_rule_matcher()
+    counts = {tag: 0 for tag in matcher.rules}
+
+    batch_ids = []
+    batch_tags = []
+
+    def flush():
+        with transaction.atomic():
+            ContractTag.objects.filter(contract_id__in=batch_ids).delete()
+            ContractTag.objects.bulk_create(batch_tags)
+        batch_ids.clear()
+        batch_tags.clear()
+
+    for contract in queryset.iterator(chunk_size=batch_size):
+        batch_ids.append(contract.pk)
+        for tag in build_contract_tags(contract, matcher):
+            batch_tags.append(tag)
+            counts[tag.tag] += 1
+        if len(batch_ids) >= batch_size:
+            flush()
+    if batch_ids:
+        flush()
+    return counts
@@ -0,0 +1,55 @@
+import zlib
+
+from django.db import connection
+from django.test import TestCase
+
+from src.apps.cont_record.models import Contract
+from src.utils.compressed_text import compress_column, decompress_text
+
+TEXT = "Contract for Army boots DMS — बूट, HQ 9 Corps\n" * 50
+
+
+class CompressedTextFieldTests(TestCase):
+    def stored(self, contract):
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT raw_text FROM cont_record_contract WHERE id = %s', [contract.pk])
+            return cursor.fetchone()[0]
+
+    def test_round_trip(self):
+        contract = Contract.objects.create(contract_no='GEMC-ZLIB-1', raw_text=TEXT)
+        contract.refresh_from_db()
+        self.assertEqual(contract.raw_text, TEXT)
+        stored = bytes(self.stored(contract))
+        self.assertEqual(zlib.decompress(stored).decode('utf-8'), TEXT)
+        self.assertLess(len(stored), len(TEXT.encode('utf-8')))
+
+    def test_empty_text(self):
+        contract = Contract.objects.create(contract_no='GEMC-ZLIB-2')
+        self.assertEqual(Contract.objects.get(pk=contract.pk).raw_text, '')
+        self.assertEqual(bytes(self.stored(contract)), b'')
+        self.assertTrue(Contract.objects.filter(pk=contract.pk, raw_text='').exists())
+
+    def test_contains_lookups_match_decompressed_text(self):
+        contract = Contract.objects.create(contract_no='GEMC-ZLIB-3', raw_text=TEXT)
+        Contract.objects.create(contract_no='GEMC-ZLIB-4', raw_text='Socks woollen')
+        self.assertEqual(list(Contract.objects.filter(raw_text__contains='boots DMS')), [contract])
+        self.assertEqual(list(Contract.objects.filter(raw_text__icontains='ARMY BOOTS')), [contract])
+        self.assertFalse(Contract.objects.filter(raw_text__icontains='woollen boots').exists())
+
+    def test_deferred_text_loads_on_access(self):
+        contract = Contract.objects.create(contract_no='GEMC-ZLIB-5', raw_text=TEXT)
+        deferred = Contract.objects.defer('raw_text').get(pk=contract.pk)
+        self.assertIn('raw_text', deferred.get_deferred_fields())
+        self.assertEqual(deferred.raw_text, TEXT)
+
+    def test_plain_text_rows_are_read_and_compressed(self):
+        contract = Contract.objects.create(contract_no='GEMC-ZLIB-6')
+        # A row written before the compression migration
+        with connection.cursor() as cursor:
+            cursor.execute('UPDATE cont_record_contract SET raw_text = %s WHERE id = %s', [TEXT, contract.pk])
+        self.assertEqual(Contract.objects.get(pk=contract.pk).raw_text, TEXT)
+
+        compress_column(Contract, 'raw_text')
+        self.assertEqual(decompress_text(self.stored(contract)), TEXT)
+        self.assertNotIsInstance(self.stored(contract), str)
+        self.assertEqual(Contract.objects.get(pk=contract.pk).raw_text, TEXT)
@@ -0,0 +1,71 @@
+from datetime import date
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from src.apps.cont_record.models import (
+    BuyerDetail, Contract, ContractTag, OrganisationDetail, PayingAuthority, SellerDetail
+)
+from src.apps.cont_record.views import CONTRACT_API_FIELDS, CONTRACT_API_LIST_FIELDS
+
+
+class ContractListApiTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.contract = Contract.objects.create(
+            contract_no='GEMC-API-1', generated_date=date(2024, 5, 1), raw_text='text', summary='A summary'
+        )
+        OrganisationDetail.objects.create(
+            contract=cls.contract, type='Central', ministry='Ministry of Defence',
+            department='Department of Military Affairs', organisation_name='Indian Army', office_zone='North'
+        )
+        BuyerDetail.objects.create(contract=cls.contract, designation='Officer', email='buyer@example.com',
+                                   gstin='BUYERGSTIN')
+        PayingAuthority.objects.create(contract=cls.contract, gstin='PAYINGGSTIN')
+        SellerDetail.objects.create(contract=cls.contract, company_name='Acme', gstin='SELLERGSTIN',
+                                    gem_seller_id='SELLER1')
+        ContractTag.objects.create(contract=cls.contract, tag='defence')
+        ContractTag.objects.create(contract=cls.contract, tag='army')
+        # No related rows at all
+        Contract.objects.create(contract_no='GEMC-API-2', generated_date=date(2024, 4, 1))
+        cls.url = reverse('pdf_record:contract_list_api')
+
+    def get(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def test_every_advertised_field(self):
+        for field in [*CONTRACT_API_FIELDS, *CONTRACT_API_LIST_FIELDS]:
+            with self.subTest(field=field):
+                results = self.get(fields=field)['results']
+                self.assertEqual(len(results), 2)
+                self.assertEqual([list(row) for row in results], [[field], [field]])
+
+    def test_all_fields_together(self):
+        fields = [*CONTRACT_API_FIELDS, *CONTRACT_API_LIST_FIELDS]
+        first, second = self.get(fields=','.join(fields))['results']
+        self.assertEqual(first['contract_no'], 'GEMC-API-1')
+        self.assertEqual(first['generated_date'], '2024-05-01')
+        self.assertEqual(first['ministry'], 'Ministry of Defence')
+        self.assertEqual(first['seller_gstin'], 'SELLERGSTIN')
+        self.assertEqual(first['tags'], ['army', 'defence'])
+        self.assertEqual(second['ministry'], '')
+        self.assertEqual(second['tags'], [])
+
+    def test_default_fields(self):
+        first = self.get()['results'][0]
+        self.assertEqual(list(first), ['id', 'contract_no', 'generated_date', 'ministry', 'department', 'organisation'])
+
+    def test_unknown_field(self):
+        response = self.client.get(self.url, {'fields': 'contract_no,tag'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('tags', response.json()['fields'])
+
+    def test_tags_use_one_prefetch_query(self):
+        with CaptureQueriesContext(connection) as without_tags:
+            self.get(fields='contract_no')
+        with self.assertNumQueries(len(without_tags) + 1):
+            self.get(fields='contract_no,tags')
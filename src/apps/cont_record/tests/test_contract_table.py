@@ -0,0 +1,179 @@
+import json
+import tempfile
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from src.apps.cont_record import views
+from src.apps.cont_record.models import (
+    BuyerDetail, Contract, EPBGDetail, FinancialApproval, OrganisationDetail, PayingAuthority, SellerDetail
+)
+from src.apps.cont_record.search_cache import get_search_cache, get_version_cache, store_result_handle
+from src.apps.cont_record.vector_index import ContractVectorIndex
+from src.utils.bm25_index import BM25Index
+
+LOCMEM = {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+
+
+@override_settings(CACHES={
+    'default': LOCMEM,
+    'search': {**LOCMEM, 'LOCATION': 'table-tests'},
+    'search_version': {**LOCMEM, 'LOCATION': 'table-version-tests'},
+})
+class AiSearchHandleTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.contracts = [
+            Contract.objects.create(contract_no=f'GEMC-TABLE-{i}', generated_date=date(2024, 1, i + 1))
+            for i in range(3)
+        ]
+        # Ingest always saves every section; the table rows rely on it
+        for contract in cls.contracts:
+            for model in (OrganisationDetail, BuyerDetail, FinancialApproval, PayingAuthority, SellerDetail,
+                          EPBGDetail):
+                model.objects.create(contract=contract)
+        cls.url = reverse('pdf_record:view')
+
+    def setUp(self):
+        get_search_cache().clear()
+
+    def contract_nos(self, response):
+        return [row['contract_no'] for row in response.context['page_obj'].object_list]
+
+    def test_handle_pages_in_relevance_order(self):
+        first, _, third = self.contracts
+        handle = store_result_handle([third.id, first.id], [0.9, 0.4])
+        response = self.client.get(self.url, {'ai_search': handle})
+        self.assertEqual(self.contract_nos(response), ['GEMC-TABLE-2', 'GEMC-TABLE-0'])
+        self.assertFalse(response.context['ai_search_expired'])
+
+    def test_expired_handle_shows_no_rows(self):
+        handle = store_result_handle([self.contracts[0].id], [0.9])
+        get_search_cache().clear()
+        response = self.client.get(self.url, {'ai_search': handle})
+        self.assertTrue(response.context['ai_search_expired'])
+        self.assertEqual(self.contract_nos(response), [])
+        self.assertContains(response, 'AI search expired')
+
+    def test_expired_handle_does_not_export_the_table(self):
+        response = self.client.get(self.url, {'ai_search': 'f' * 32, 'export': 'csv'})
+        self.assertEqual(response['Content-Type'].split(';')[0], 'text/html')
+        self.assertTrue(response.context['ai_search_expired'])
+
+    def test_without_handle_lists_every_contract(self):
+        response = self.client.get(self.url)
+        self.assertFalse(response.context['ai_search_expired'])
+        self.assertEqual(len(self.contract_nos(response)), 3)
+
+
+@override_settings(CACHES={
+    'default': LOCMEM,
+    'search': {**LOCMEM, 'LOCATION': 'filter-tests'},
+    'search_version': {**LOCMEM, 'LOCATION': 'filter-version-tests'},
+})
+class OrganisationFilterTests(TestCase):
+    """The table and AI search match the organisation filters the same way"""
+
+    @classmethod
+    def setUpTestData(cls):
+        names = ['Indian Army', 'Indian Army', 'Indian Army Ordnance', 'indian army', 'Navy']
+        for i, name in enumerate(names):
+            contract = Contract.objects.create(
+                contract_no=f'GEMC-FILTER-{i}', generated_date=date(2024, 2, i + 1), embedding=[1.0, 0.0]
+            )
+            OrganisationDetail.objects.create(
+                contract=contract, organisation_name=name, department='Department of Military Affairs',
+                ministry='Ministry of Defence'
+            )
+            for model in (BuyerDetail, FinancialApproval, PayingAuthority, SellerDetail, EPBGDetail):
+                model.objects.create(contract=contract)
+
+    def setUp(self):
+        get_search_cache().clear()
+        get_version_cache().clear()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        # An empty keyword index, so AI search falls back to / tops up from every contract
+        index = BM25Index(Path(directory.name) / 'search_index.sqlite3')
+        self.addCleanup(index.close)
+        patcher = mock.patch.object(views, 'get_search_index', return_value=index)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def table(self, **filters):
+        response = self.client.get(reverse('pdf_record:view'), filters)
+        return {row['contract_no'] for row in response.context['page_obj'].object_list}
+
+    def ai_search(self, **filters):
+        response = self.client.post(
+            reverse('pdf_record:semantic_search'),
+            json.dumps({'query': 'GEMC-FILTER', 'top_k': 10, **filters}), content_type='application/json'
+        )
+        return {result['contract_no'] for result in response.json()['results']}
+
+    def test_keyword_fallback_matches_table(self):
+        with mock.patch.object(views.SemanticSearchView, 'get_model', return_value=None):
+            for name in ('Indian Army', 'Navy', 'Army'):
+                with self.subTest(organisation_name=name):
+                    table = self.table(organisation_name=name)
+                    self.assertEqual(self.ai_search(organisation_name=name), table)
+        self.assertEqual(table, set())
+
+    def test_vector_search_matches_table(self):
+        # Without sentence-transformers installed the view has no NumPy either
+        for patcher in (
+            mock.patch.object(views, 'np', np),
+            mock.patch.object(views.SemanticSearchView, 'get_model', return_value=object()),
+            mock.patch.object(views, 'get_vector_index', side_effect=lambda encode: ContractVectorIndex.build()),
+            mock.patch.object(views, 'query_embedding', return_value=np.array([[1.0, 0.0]], dtype=np.float32)),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        for name in ('Indian Army', 'Navy', 'Army'):
+            with self.subTest(organisation_name=name):
+                self.assertEqual(self.ai_search(organisation_name=name), self.table(organisation_name=name))
+        self.assertEqual(self.ai_search(organisation_name='Indian Army'), {'GEMC-FILTER-0', 'GEMC-FILTER-1'})
+
+
+@override_settings(CACHES={'default': LOCMEM})
+class TableTextSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        texts = ['Supply of woollen army boots to the depot', 'Annual maintenance of navy radar sets']
+        cls.contracts = []
+        for i, text in enumerate(texts):
+            contract = Contract.objects.create(contract_no=f'GEMC-TEXT-{i}', raw_text=text)
+            for model in (OrganisationDetail, BuyerDetail, FinancialApproval, PayingAuthority, SellerDetail,
+                          EPBGDetail):
+                model.objects.create(contract=contract)
+            cls.contracts.append(contract)
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        index = BM25Index(Path(directory.name) / 'search_index.sqlite3')
+        self.addCleanup(index.close)
+        index.add_documents((contract.pk, contract.raw_text) for contract in self.contracts)
+        patcher = mock.patch.object(views, 'get_search_index', return_value=index)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def search(self, text):
+        response = self.client.get(reverse('pdf_record:view'), {'search': text})
+        return {row['contract_no'] for row in response.context['page_obj'].object_list}
+
+    def test_contract_text_found_through_keyword_index(self):
+        self.assertEqual(self.search('Army Boots'), {'GEMC-TEXT-0'})
+        self.assertEqual(self.search('radar'), {'GEMC-TEXT-1'})
+        # Every word must appear in the same contract
+        self.assertEqual(self.search('army radar'), set())
+        self.assertEqual(self.search('GEMC-TEXT'), {'GEMC-TEXT-0', 'GEMC-TEXT-1'})
+
+    def test_raw_text_is_not_scanned(self):
+        view = views.ContractTableView()
+        queryset = view.filter_queryset(view.page_queryset(), 'boots', '', '', '', '', '')
+        self.assertNotIn('raw_text', str(queryset.query.where))
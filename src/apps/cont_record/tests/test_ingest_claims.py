@@ -0,0 +1,76 @@
+import contextlib
+import csv
+import io
+import json
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+from django.test import TransactionTestCase
+
+from src.apps.cont_record import data_extractor
+from src.apps.cont_record.claims import enqueue_pdfs
+from src.utils import process_logger
+from src.utils.db_writer import get_db_writer
+
+STARTED = datetime(2026, 1, 1, 9, 30, 0)
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return STARTED
+
+
+def fake_ingest(pdf_path, logger, output_sink, per_file_exports=False):
+    """Stands in for the PDF extraction; logs and outputs like process_pdf_for_ingest"""
+    filename = os.path.basename(pdf_path)
+    output_sink.append({'Source File': filename})
+    logger.log_file_processing(filename, 'SUCCESS', "ok", pdf_path=pdf_path)
+    return 'SUCCESS'
+
+
+class ClaimWorkerSessionTests(TransactionTestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        self.data_dir = self.tmp / 'data'
+        self.data_dir.mkdir()
+        cwd = os.getcwd()
+        os.chdir(self.tmp)  # ProcessLogger writes to ./logs
+        self.addCleanup(os.chdir, cwd)
+        self.addCleanup(get_db_writer().close)
+        for patcher in (
+            # data/, extracted_data/ and the session files go to the temporary directory
+            mock.patch.object(data_extractor, '__file__', str(self.tmp / 'data_extractor.py')),
+            mock.patch.object(data_extractor, 'process_pdf_for_ingest', fake_ingest),
+            mock.patch.object(data_extractor, 'stop_on_sigterm', lambda: None),
+            # Both workers start in the same second
+            mock.patch.object(process_logger, 'datetime', _FrozenDatetime),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def run_worker(self, worker, pdf_name):
+        (self.data_dir / pdf_name).write_bytes(b'%PDF-1.4')
+        enqueue_pdfs(self.data_dir)
+        with contextlib.redirect_stdout(io.StringIO()):
+            data_extractor.ingest_claims(max_workers=1, batch_size=4, quiet=True, worker=worker)
+
+    def test_workers_started_in_the_same_second_write_separate_files(self):
+        self.run_worker('host:1', 'first.pdf')
+        self.run_worker('host:2', 'second.pdf')
+
+        jsonl_files = sorted((self.tmp / 'extracted_data').glob('*.jsonl'))
+        self.assertEqual(len(jsonl_files), 2)
+        records = [[json.loads(line)['Source File'] for line in open(path)] for path in jsonl_files]
+        self.assertEqual(sorted(records), [['first.pdf'], ['second.pdf']])
+        self.assertEqual(len(list((self.tmp / 'extracted_data').glob('*.csv'))), 2)
+
+        detailed = sorted((self.tmp / 'logs').glob('*_detailed.csv'))
+        self.assertEqual(len(detailed), 2)
+        logged = sorted([row['filename'] for row in csv.DictReader(open(path))] for path in detailed)
+        self.assertEqual(logged, [['first.pdf'], ['second.pdf']])
@@ -0,0 +1,91 @@
+from datetime import date, datetime, timezone
+
+from django.test import TestCase, override_settings
+
+from src.apps.cont_record.models import Contract
+from src.utils.keyset_pagination import KeysetPaginator, encode_cursor
+
+ORDERING = ('-generated_date', '-created_at', '-id')
+SAME_TIME = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+class KeysetPaginatorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # Ties on the date, on the date and created_at, and a block of NULL dates
+        rows = [
+            (date(2024, 3, 1), SAME_TIME), (date(2024, 3, 1), SAME_TIME), (date(2024, 3, 1), SAME_TIME),
+            (date(2024, 3, 1), datetime(2024, 6, 2, tzinfo=timezone.utc)),
+            (date(2024, 2, 1), SAME_TIME), (date(2024, 4, 1), SAME_TIME),
+            (None, SAME_TIME), (None, SAME_TIME), (None, datetime(2024, 5, 1, tzinfo=timezone.utc)),
+            (date(2024, 1, 1), datetime(2024, 1, 1, 0, 0, 0, 123456, tzinfo=timezone.utc)),
+            (None, datetime(2024, 7, 1, tzinfo=timezone.utc)),
+        ]
+        for i, (generated_date, created_at) in enumerate(rows):
+            contract = Contract.objects.create(contract_no=f'GEMC-KEYSET-{i}', generated_date=generated_date)
+            # created_at is auto_now_add, so ties are set afterwards
+            Contract.objects.filter(pk=contract.pk).update(created_at=created_at)
+
+        def key(contract):
+            return (contract.generated_date is not None, contract.generated_date or date.min,
+                    contract.created_at, contract.id)
+        cls.expected = [c.id for c in sorted(Contract.objects.all(), key=key, reverse=True)]
+
+    def paginator(self, per_page):
+        return KeysetPaginator(Contract.objects.all(), ORDERING, per_page, count_timeout=0)
+
+    def walk_forward(self, paginator):
+        pages = [paginator.page()]
+        while pages[-1].has_next():
+            pages.append(paginator.page(after=pages[-1].next_cursor, number=pages[-1].next_page_number()))
+        return pages
+
+    def ids(self, page):
+        return [contract.id for contract in page]
+
+    def test_forward_walk_matches_nulls_last_order(self):
+        for per_page in (1, 2, 3, 4, 11, 20):
+            with self.subTest(per_page=per_page):
+                pages = self.walk_forward(self.paginator(per_page))
+                self.assertEqual([pk for page in pages for pk in self.ids(page)], self.expected)
+                self.assertEqual([page.number for page in pages], list(range(1, len(pages) + 1)))
+                self.assertEqual(len(pages), self.paginator(per_page).num_pages)
+
+    def test_backward_walk_returns_the_same_pages(self):
+        for per_page in (1, 2, 3, 4):
+            with self.subTest(per_page=per_page):
+                paginator = self.paginator(per_page)
+                forward = self.walk_forward(paginator)
+                page = forward[-1]
+                for expected in reversed(forward[:-1]):
+                    page = paginator.page(before=page.previous_cursor, number=page.previous_page_number())
+                    self.assertEqual(self.ids(page), self.ids(expected))
+                self.assertFalse(page.has_previous())
+
+    def test_cursor_inside_null_block(self):
+        paginator = self.paginator(2)
+        first_null = Contract.objects.get(pk=self.expected[7])
+        self.assertIsNone(first_null.generated_date)
+        page = paginator.page(after=encode_cursor(paginator.values_of(first_null)), number=5)
+        self.assertEqual(self.ids(page), self.expected[8:10])
+        page = paginator.page(before=encode_cursor(paginator.values_of(first_null)), number=4)
+        self.assertEqual(self.ids(page), self.expected[5:7])
+
+    def test_invalid_cursor_returns_first_page(self):
+        paginator = self.paginator(3)
+        for cursor in ('not-a-cursor', encode_cursor([1, 2]), ''):
+            with self.subTest(cursor=cursor):
+                page = paginator.page(after=cursor, number=7)
+                self.assertEqual(self.ids(page), self.expected[:3])
+                self.assertEqual(page.number, 1)
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                                           'LOCATION': 'keyset-count-tests'}})
+    def test_new_count_version_drops_cached_total(self):
+        def count(version):
+            return KeysetPaginator(Contract.objects.all(), ORDERING, count_version=version).count
+
+        self.assertEqual(count('v1'), len(self.expected))
+        Contract.objects.create(contract_no='GEMC-KEYSET-NEW')
+        self.assertEqual(count('v1'), len(self.expected))
+        self.assertEqual(count('v2'), len(self.expected) + 1)
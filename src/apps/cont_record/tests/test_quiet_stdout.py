@@ -0,0 +1,60 @@
+import contextlib
+import io
+import threading
+
+from django.test import SimpleTestCase
+
+from src.utils.process_logger import quiet_stdout, quietly
+
+
+class QuietStdoutTests(SimpleTestCase):
+    def test_only_the_quiet_thread_is_silenced(self):
+        out = io.StringIO()
+        entered, printed = threading.Event(), threading.Event()
+
+        def other_thread():
+            entered.wait()
+            print("other")
+            printed.set()
+
+        with contextlib.redirect_stdout(out):
+            thread = threading.Thread(target=other_thread)
+            thread.start()
+            with quiet_stdout(True):
+                entered.set()
+                printed.wait()
+                print("quiet")
+            thread.join()
+            print("after")
+        self.assertEqual(out.getvalue(), "other\nafter\n")
+
+    def test_nested_uses_restore_output(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            with quiet_stdout(True):
+                with quiet_stdout(True):
+                    print("inner")
+                print("outer")
+            with quiet_stdout(False):
+                print("loud")
+        self.assertEqual(out.getvalue(), "loud\n")
+
+    def test_quietly_silences_worker_threads(self):
+        out = io.StringIO()
+
+        def work(n):
+            print(f"working {n}")
+            return n * 2
+
+        with contextlib.redirect_stdout(out):
+            results = []
+            threads = [
+                threading.Thread(target=lambda n=n: results.append(quietly(work, True)(n))) for n in range(3)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            print(quietly(work, False)(5))
+        self.assertEqual(sorted(results), [0, 2, 4])
+        self.assertEqual(out.getvalue(), "working 5\n10\n")
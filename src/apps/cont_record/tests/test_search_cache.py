@@ -0,0 +1,93 @@
+from unittest import mock
+
+from django.db import transaction
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from src.apps.cont_record import signals
+from src.apps.cont_record.models import Contract, Product
+from src.apps.cont_record.search_cache import (
+    CORPUS_VERSION_KEY, bump_corpus_version, get_corpus_version, get_search_cache, get_version_cache,
+    load_result_handle, store_result_handle
+)
+
+LOCMEM = {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+
+
+@override_settings(CACHES={
+    'default': LOCMEM,
+    'search': {**LOCMEM, 'LOCATION': 'search-tests'},
+    'search_version': {**LOCMEM, 'LOCATION': 'search-version-tests'},
+})
+class CorpusVersionTests(SimpleTestCase):
+    def setUp(self):
+        get_search_cache().clear()
+        get_version_cache().clear()
+
+    def test_bump_changes_version(self):
+        before = get_corpus_version()
+        bump_corpus_version()
+        after = get_corpus_version()
+        self.assertNotEqual(after, before)
+        bump_corpus_version()
+        self.assertNotIn(get_corpus_version(), (before, after))
+
+    def test_lost_key_never_comes_back(self):
+        bump_corpus_version()
+        before = get_corpus_version()
+        # As when the entry is culled or the cache directory removed
+        get_version_cache().delete(CORPUS_VERSION_KEY)
+        self.assertNotEqual(get_corpus_version(), before)
+
+    def test_bump_of_lost_key_never_comes_back(self):
+        before = get_corpus_version()
+        get_version_cache().delete(CORPUS_VERSION_KEY)
+        bump_corpus_version()
+        self.assertNotEqual(get_corpus_version(), before)
+
+    def test_overlapping_bumps_both_invalidate(self):
+        # Two processes that read the same version and then bump
+        before = get_corpus_version()
+        bump_corpus_version()
+        first = get_corpus_version()
+        bump_corpus_version()
+        self.assertNotIn(get_corpus_version(), (before, first))
+
+    def test_version_survives_search_cache_clear(self):
+        before = get_corpus_version()
+        get_search_cache().clear()
+        self.assertEqual(get_corpus_version(), before)
+
+    def test_result_handle_round_trip(self):
+        handle = store_result_handle([3, 1, 2], [0.9, 0.5, 0.1])
+        self.assertEqual(load_result_handle(handle), {'ids': [3, 1, 2], 'scores': [0.9, 0.5, 0.1]})
+        self.assertIsNone(load_result_handle('not-a-handle'))
+
+
+class CorpusVersionSignalTests(TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(signals, 'bump_corpus_version')
+        self.bump = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def save_contract(self, contract_no, products=3):
+        contract = Contract.objects.create(contract_no=contract_no)
+        for i in range(products):
+            Product.objects.create(contract=contract, product_name=f'Item {i}')
+
+    def test_one_bump_per_committed_ingest(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                self.save_contract('GEMC-SIGNAL-1')
+        self.assertEqual(self.bump.call_count, 1)
+
+    def test_rolled_back_savepoint_does_not_swallow_the_bump(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                try:
+                    with transaction.atomic():
+                        self.save_contract('GEMC-SIGNAL-2')
+                        raise RuntimeError
+                except RuntimeError:
+                    pass
+                self.save_contract('GEMC-SIGNAL-3')
+        self.assertEqual(self.bump.call_count, 1)
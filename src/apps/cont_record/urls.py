@@ -6,6 +6,8 @@ urlpatterns = [
     # path('', views.SemanticSearchView.as_view(), name='search'),
     path('', views.ImportDataView.as_view(), name='import'),
     path('view/', views.ContractTableView.as_view(), name='view'),
+    path('api/contracts/', views.ContractListApiView.as_view(), name='contract_list_api'),
+    path('api/contracts/<int:pk>/', views.ContractDetailApiView.as_view(), name='contract_detail_api'),
     path('save-to-database/', views.SaveInDb.as_view(), name='save_to_database'),
     path('semantic-search/', views.SemanticSearchView.as_view(), name='semantic_search'),
     # path('search/', views.SemanticSearchView.as_view(), name='search'),
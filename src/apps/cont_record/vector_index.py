@@ -0,0 +1,374 @@
+import threading
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+
+from src.apps.cont_record.management.commands.reindex_embeddings import (
+    contract_embedding_text, product_embedding_text
+)
+from src.apps.cont_record.models import Contract, Product
+from src.apps.cont_record.search_cache import get_corpus_version
+from src.utils.embedding_cache import embed_documents, get_chunk_cache
+from src.utils.embedding_encoder import model_key
+
+# Row kinds
+KIND_CONTRACT = 0
+KIND_PRODUCT = 1
+
+# Ordinal stored for rows without a generated_date
+NO_DATE = 0
+
+# OrganisationDetail columns held as integer-coded arrays for filtering
+FILTER_ATTRIBUTES = ('ministry', 'department', 'organisation_name')
+# Code of rows without a value
+NO_VALUE = -1
+NO_CODES = tuple(NO_VALUE for _ in FILTER_ATTRIBUTES)
+
+# A refresh reloads rows saved this many seconds before the previous load
+# started too, so a save that committed during that load is not missed
+REFRESH_OVERLAP_SECONDS = 60
+# Contract ids per IN (...) query when loading changed contracts
+LOAD_BATCH_SIZE = 500
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def month_keys(ordinals: np.ndarray) -> np.ndarray:
+    """Months since 1970-01 for each date ordinal (-1 where there is no date)"""
+    days = (ordinals.astype(np.int64) - _EPOCH_ORDINAL).astype('datetime64[D]')
+    months = days.astype('datetime64[M]').astype(np.int64).astype(np.int32)
+    return np.where(ordinals == NO_DATE, -1, months).astype(np.int32)
+
+
+class _Rows:
+    """Index rows being loaded, with the organisation vocabularies their codes index into"""
+
+    def __init__(self, vocab=None):
+        self.vectors, self.row_ids, self.contract_ids, self.kinds, self.ordinals, self.contract_nos = [], [], [], [], [], []
+        self.codes = {name: [] for name in FILTER_ATTRIBUTES}
+        self.vocab = vocab or {name: {} for name in FILTER_ATTRIBUTES}
+        self.missing_rows, self.missing_texts = [], []
+
+    def encode_attributes(self, org):
+        if org is None:
+            return NO_CODES
+        row_codes = []
+        for name in FILTER_ATTRIBUTES:
+            value = (getattr(org, name, '') or '').strip()
+            vocab = self.vocab[name]
+            row_codes.append(vocab.setdefault(value, len(vocab)) if value else NO_VALUE)
+        return tuple(row_codes)
+
+    def add(self, vector, row_id, contract_id, kind, generated_date, contract_no, row_codes):
+        self.vectors.append(vector)
+        self.row_ids.append(row_id)
+        self.contract_ids.append(contract_id)
+        self.kinds.append(kind)
+        self.ordinals.append(generated_date.toordinal() if generated_date else NO_DATE)
+        self.contract_nos.append(contract_no or '')
+        for name, code in zip(FILTER_ATTRIBUTES, row_codes):
+            self.codes[name].append(code)
+        return len(self.vectors) - 1
+
+    def load(self, contract_ids=None, encode_documents=None):
+        """Add the rows of every contract (or of ``contract_ids``) and of their products.
+
+        Rows without a stored embedding are encoded with ``encode_documents``
+        (or left out without it); raw_text is only read for those contracts.
+        """
+        contracts = Contract.objects.select_related('organization_details', 'buyer', 'seller').defer(
+            'raw_text', 'summary'
+        )
+        products = Product.objects.select_related('contract').only(
+            'id', 'contract_id', 'product_name', 'note', 'hsn_code', 'category_name_quadrant', 'embedding',
+            'contract__contract_no', 'contract__generated_date'
+        )
+        if contract_ids is not None:
+            contracts = contracts.filter(pk__in=contract_ids)
+            products = products.filter(contract_id__in=contract_ids)
+
+        # contract id -> attribute codes, reused for the contract's products
+        contract_codes = {}
+        # contract id -> row of contracts whose text is read after the pass
+        needs_text = {}
+        for c in contracts.order_by('pk').iterator(chunk_size=2000):
+            row_codes = self.encode_attributes(getattr(c, 'organization_details', None))
+            contract_codes[c.id] = row_codes
+            if c.embedding:
+                self.add(c.embedding, c.id, c.id, KIND_CONTRACT, c.generated_date, c.contract_no, row_codes)
+            elif encode_documents is not None:
+                needs_text[c.id] = self.add(None, c.id, c.id, KIND_CONTRACT, c.generated_date, c.contract_no,
+                                            row_codes)
+
+        for p in products.order_by('pk').iterator(chunk_size=2000):
+            text = product_embedding_text(p) if not p.embedding else ''
+            if not p.embedding and (encode_documents is None or not text):
+                continue
+            row = self.add(p.embedding or None, p.id, p.contract_id, KIND_PRODUCT, p.contract.generated_date,
+                           p.contract.contract_no, contract_codes.get(p.contract_id, NO_CODES))
+            if not p.embedding:
+                self.missing_rows.append(row)
+                self.missing_texts.append(text)
+
+        pending = list(needs_text)
+        for start in range(0, len(pending), LOAD_BATCH_SIZE):
+            batch = Contract.objects.select_related('organization_details', 'buyer', 'seller').defer('summary')
+            for c in batch.filter(pk__in=pending[start:start + LOAD_BATCH_SIZE]):
+                text = contract_embedding_text(c)
+                if text:
+                    self.missing_rows.append(needs_text[c.id])
+                    self.missing_texts.append(text)
+
+        if self.missing_texts:
+            for row, vector in zip(self.missing_rows, encode_documents(self.missing_texts)):
+                self.vectors[row] = vector
+            self.missing_rows, self.missing_texts = [], []
+
+    def arrays(self, dim=None):
+        """``ContractVectorIndex`` arguments for the loaded rows; rows left without a vector are dropped"""
+        encoded = [i for i, vector in enumerate(self.vectors) if vector is not None]
+        if dim is None:
+            dim = len(self.vectors[encoded[0]]) if encoded else 0
+        matrix = np.zeros((len(encoded), dim), dtype=np.float32)
+        for i, row in enumerate(encoded):
+            if len(self.vectors[row]) == dim:
+                matrix[i] = self.vectors[row]
+        return dict(
+            vectors=matrix,
+            row_ids=np.array(self.row_ids, dtype=np.int64)[encoded],
+            contract_ids=np.array(self.contract_ids, dtype=np.int64)[encoded],
+            kinds=np.array(self.kinds, dtype=np.int8)[encoded],
+            date_ordinals=np.array(self.ordinals, dtype=np.int32)[encoded],
+            contract_nos=[self.contract_nos[row] for row in encoded],
+            attribute_codes={
+                name: np.array(self.codes[name], dtype=np.int32)[encoded] for name in FILTER_ATTRIBUTES
+            },
+            attribute_values={name: list(self.vocab[name]) for name in FILTER_ATTRIBUTES},
+        )
+
+
+class ContractVectorIndex:
+    """In-memory matrix of the contract and product embeddings.
+
+    Row i holds one vector plus parallel arrays: the contract or product
+    it was loaded from, the contract it belongs to, its kind, the
+    contract's generated_date as an int32 ordinal and its organisation
+    attributes as int32 codes into small vocabularies, so scoring, date
+    bias and filters are NumPy expressions over all rows.
+    """
+
+    def __init__(self, vectors, contract_ids, kinds, date_ordinals, contract_nos, version=None,
+                 attribute_codes=None, attribute_values=None, row_ids=None, loaded_at=None):
+        self.vectors = vectors
+        self.contract_ids = contract_ids
+        self.kinds = kinds
+        self.date_ordinals = date_ordinals
+        self.date_months = month_keys(date_ordinals)
+        self.contract_nos = contract_nos
+        self.version = version
+        self.attribute_codes = attribute_codes or {
+            name: np.full(len(contract_ids), NO_VALUE, dtype=np.int32) for name in FILTER_ATTRIBUTES
+        }
+        self.attribute_values = attribute_values or {name: [] for name in FILTER_ATTRIBUTES}
+        self.row_ids = row_ids if row_ids is not None else contract_ids
+        self.loaded_at = loaded_at
+
+    def __len__(self):
+        return len(self.contract_ids)
+
+    @classmethod
+    def build(cls, encode_documents=None, version=None):
+        """Load stored embeddings; rows without one are encoded with ``encode_documents``"""
+        loaded_at = timezone.now()
+        rows = _Rows()
+        rows.load(encode_documents=encode_documents)
+        return cls(version=version, loaded_at=loaded_at, **rows.arrays())
+
+    def refreshed(self, encode_documents=None, version=None):
+        """A new index with the rows of contracts changed since this one was loaded reloaded.
+
+        A contract counts as changed when it or one of its products was
+        saved (``updated_at``) or deleted; the rows of every other contract
+        are carried over with their vectors, so nothing is encoded again.
+        """
+        if self.loaded_at is None:
+            return self.build(encode_documents, version)
+        loaded_at = timezone.now()
+        since = self.loaded_at - timedelta(seconds=REFRESH_OVERLAP_SECONDS)
+
+        changed = set(Contract.objects.filter(updated_at__gte=since).values_list('pk', flat=True))
+        changed.update(Product.objects.filter(updated_at__gte=since).values_list('contract_id', flat=True))
+        for kind, model in ((KIND_CONTRACT, Contract), (KIND_PRODUCT, Product)):
+            of_kind = self.kinds == kind
+            existing = np.fromiter(model.objects.values_list('pk', flat=True), dtype=np.int64)
+            deleted = of_kind & ~np.isin(self.row_ids, existing)
+            changed.update(self.contract_ids[deleted].tolist())
+
+        changed_ids = np.fromiter(changed, dtype=np.int64, count=len(changed))
+        keep = ~np.isin(self.contract_ids, changed_ids)
+        rows = _Rows({
+            name: {value: code for code, value in enumerate(self.attribute_values[name])}
+            for name in FILTER_ATTRIBUTES
+        })
+        pending = sorted(changed)
+        for start in range(0, len(pending), LOAD_BATCH_SIZE):
+            rows.load(pending[start:start + LOAD_BATCH_SIZE], encode_documents)
+
+        dim = self.vectors.shape[1] if len(self) else None
+        new = rows.arrays(dim)
+        return ContractVectorIndex(
+            np.concatenate([self.vectors[keep], new['vectors']]) if len(self) else new['vectors'],
+            np.concatenate([self.contract_ids[keep], new['contract_ids']]),
+            np.concatenate([self.kinds[keep], new['kinds']]),
+            np.concatenate([self.date_ordinals[keep], new['date_ordinals']]),
+            [no for no, kept in zip(self.contract_nos, keep.tolist()) if kept] + new['contract_nos'],
+            version,
+            {
+                name: np.concatenate([self.attribute_codes[name][keep], new['attribute_codes'][name]])
+                for name in FILTER_ATTRIBUTES
+            },
+            new['attribute_values'],
+            np.concatenate([self.row_ids[keep], new['row_ids']]),
+            loaded_at,
+        )
+
+    def date_bias(self, wanted_date: date) -> np.ndarray:
+        """+0.2 on the date, +0.1 in the same month, fading to 0 within 14 days"""
+        wanted = np.int32(wanted_date.toordinal())
+        wanted_month = np.int32(wanted_date.year * 12 + wanted_date.month - 1 - 1970 * 12)
+        has_date = self.date_ordinals != NO_DATE
+        delta = np.abs(self.date_ordinals - wanted)
+        near = np.clip(0.1 * (1 - delta / 14.0), 0.0, None)
+        bias = np.where(delta == 0, 0.2, np.where(self.date_months == wanted_month, 0.1, near))
+        return np.where(has_date, bias, 0.0).astype(np.float32)
+
+    def date_range_mask(self, date_from: Optional[date] = None, date_to: Optional[date] = None) -> np.ndarray:
+        """Rows whose contract date lies in [date_from, date_to]"""
+        mask = np.ones(len(self), dtype=bool)
+        if date_from is not None:
+            mask &= self.date_ordinals >= date_from.toordinal()
+        if date_to is not None:
+            mask &= (self.date_ordinals != NO_DATE) & (self.date_ordinals <= date_to.toordinal())
+        return mask
+
+    def attribute_mask(self, name: str, value: str) -> np.ndarray:
+        """Rows whose ``name`` attribute is exactly ``value``, as the contract table filters match"""
+        value = value.strip()
+        matching = [code for code, known in enumerate(self.attribute_values[name]) if known == value]
+        return np.isin(self.attribute_codes[name], np.array(matching, dtype=np.int32))
+
+    def filter_mask(self, filters: Dict[str, Any]) -> Optional[np.ndarray]:
+        """Combined mask for date_from/date_to and the organisation filters; None when unfiltered"""
+        mask = None
+        if filters.get('date_from') or filters.get('date_to'):
+            mask = self.date_range_mask(filters.get('date_from'), filters.get('date_to'))
+        for name in FILTER_ATTRIBUTES:
+            if filters.get(name):
+                attribute_mask = self.attribute_mask(name, filters[name])
+                mask = attribute_mask if mask is None else mask & attribute_mask
+        return mask
+
+    def search(self, query_vec, top_k: int, wanted_date: Optional[date] = None,
+               mask: Optional[np.ndarray] = None,
+               candidate_ids: Optional[np.ndarray] = None) -> List[Tuple[int, float]]:
+        """Best ``top_k`` rows as (row, score), at most one row per contract.
+
+        With ``mask`` and/or ``candidate_ids`` (contract ids, e.g. from the
+        keyword index) only the selected rows are scored.
+        """
+        if not len(self) or top_k <= 0:
+            return []
+        rows = None
+        if candidate_ids is not None:
+            selected = np.isin(self.contract_ids, candidate_ids)
+            mask = selected if mask is None else mask & selected
+        if mask is not None:
+            rows = np.flatnonzero(mask)
+            if not len(rows):
+                return []
+
+        query_vec = np.asarray(query_vec, dtype=np.float32).reshape(-1)
+        if rows is None:
+            sims = self.vectors @ query_vec
+            contract_ids = self.contract_ids
+        else:
+            sims = self.vectors[rows] @ query_vec
+            contract_ids = self.contract_ids[rows]
+        if wanted_date is not None:
+            bias = self.date_bias(wanted_date)
+            sims += bias if rows is None else bias[rows]
+
+        # Several rows can share a contract, so widen the partition until
+        # top_k distinct contracts are found
+        candidates = min(len(sims), top_k * 4)
+        while True:
+            top = np.argpartition(-sims, candidates - 1)[:candidates]
+            top = top[np.argsort(-sims[top], kind='stable')]
+            hits, seen = [], set()
+            for i in top.tolist():
+                contract_id = int(contract_ids[i])
+                if contract_id in seen:
+                    continue
+                seen.add(contract_id)
+                hits.append((i if rows is None else int(rows[i]), float(sims[i])))
+                if len(hits) >= top_k:
+                    return hits
+            if candidates >= len(sims):
+                return hits
+            candidates = min(len(sims), candidates * 4)
+
+
+_index = None
+_index_lock = threading.Lock()
+_refresh_thread = None
+
+
+def get_vector_index(encode_documents=None) -> ContractVectorIndex:
+    """Process-wide index, built by the first call.
+
+    When the corpus version moves on, the current index keeps answering
+    while a background thread reloads the changed contracts and swaps the
+    refreshed index in (see ``index.version``).
+    """
+    global _index, _refresh_thread
+    version = get_corpus_version()
+    with _index_lock:
+        if _index is None:
+            _index = ContractVectorIndex.build(encode_documents, version)
+        elif _index.version != version and (_refresh_thread is None or not _refresh_thread.is_alive()):
+            _refresh_thread = threading.Thread(
+                target=_refresh_index, args=(encode_documents,), name="Vector_Index_Refresh", daemon=True
+            )
+            _refresh_thread.start()
+        return _index
+
+
+def _refresh_index(encode_documents):
+    global _index
+    try:
+        # Saves that land during a refresh bump the version again; catch up with them too
+        while True:
+            version = get_corpus_version()
+            if _index.version == version:
+                return
+            refreshed = _index.refreshed(encode_documents, version)
+            with _index_lock:
+                _index = refreshed
+    except Exception as e:
+        print(f"⚠️  Vector index refresh failed: {e}")
+    finally:
+        connections.close_all()
+
+
+def encode_with_cache(model):
+    """``encode_documents`` for ``get_vector_index`` backed by the chunk cache"""
+    def encode_documents(texts):
+        return embed_documents(
+            lambda chunks: model.encode(chunks, normalize_embeddings=True),
+            texts, get_chunk_cache(), model_key(getattr(settings, 'EMBEDDING_QUANTIZE', False))
+        )
+    return encode_documents
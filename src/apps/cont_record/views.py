@@ -2,16 +2,18 @@ import json
 import os
 import re
 import zipfile
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from io import BytesIO
 from urllib.parse import urlparse
 import pandas as pd
 from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
 from django.core.files.storage import FileSystemStorage
 from django.core.paginator import Paginator, PageNotAnInteger, EmptyPage
 from django.db import transaction, connection
-from django.db.models import Q, Prefetch, Case, When
+from django.db.models import Q, Prefetch
+from django.db.models.fields.files import FieldFile
 from django.http import JsonResponse, HttpResponse
 from django.shortcuts import render
 from django.views import View
@@ -19,17 +21,27 @@ from django.views.decorators.csrf import csrf_exempt, ensure_csrf_cookie
 from django.utils.decorators import method_decorator
 from django.views.decorators.http import require_http_methods
 
-from src.utils.contract_parsers import parse_contract_text_to_json
-from src.utils.extract_text import read_pdf_with_structure, _extract_english_from_pdf
 from .models import (
     Contract, OrganisationDetail, BuyerDetail, FinancialApproval,
     PayingAuthority, SellerDetail, Product, ProductSpecification,
-    ConsigneeDetail, EPBGDetail, TermsAndCondition, PdfFile
+    ConsigneeDetail, EPBGDetail, TermsAndCondition, PdfFile, ContractTag
 )
+from .search_cache import (
+    get_cached_results, get_corpus_version, load_result_handle, query_embedding, set_cached_results,
+    store_result_handle
+)
+from .extraction import extract_contracts, get_extraction_pool
+from .vector_index import FILTER_ATTRIBUTES, encode_with_cache, get_vector_index
+from .search_index import get_search_index, index_contract
+from .summaries import query_sentences, search_summary, summarize_contract
+from .tagging import tag_contract
 from ...utils.save_data_helper import safe_str
 from ...utils.save_helper import extract_from_tables, parse_int, parse_decimal, extract_email, \
     extract_phone, parse_date
+from ...utils.keyset_pagination import KeysetPaginator
 from ...utils.table_helper import safe_decimal_from_raw, safe_int_from_raw
+from ...utils.embedding_cache import get_chunk_cache
+from ...utils.embedding_encoder import encode_document, get_sentence_model
 
 # AI/ML imports
 try:
@@ -39,36 +51,17 @@ except Exception:
     SentenceTransformer = None
     np = None
 
-try:
-    from transformers import pipeline
-except Exception:
-    pipeline = None
-
-try:
-    from summa import keywords
-    from summa.summarizer import summarize
-except Exception:
-    keywords = None
-    summarize = None
-
-_EMBEDDER = None
-
 def get_embedder():
-    global _EMBEDDER
-    if SentenceTransformer is None:
-        return None
-    if _EMBEDDER is None:
-        try:
-            _EMBEDDER = SentenceTransformer('all-MiniLM-L6-v2')
-        except Exception:
-            _EMBEDDER = None
-    return _EMBEDDER
+    # Shared per-process model; EMBEDDING_QUANTIZE selects the int8 variant
+    return get_sentence_model(getattr(settings, 'EMBEDDING_QUANTIZE', False))
 
 
 class ImportDataView(View):
     template_name = "contracts/import_data.html"
 
     def get(self, request):
+        # Start the extraction workers while the user picks files
+        get_extraction_pool()
         return render(request, self.template_name)
 
     def post(self, request):
@@ -81,70 +74,64 @@ class ImportDataView(View):
         if not uploaded_files:
             return render(request, self.template_name, {"error": "Please upload at least one PDF or ZIP file."})
 
-        for uploaded_file in uploaded_files:
-            temp_files = []
-            saved_file = None
-
-            try:
-                # Handle ZIP file: extract only PDFs
-                if uploaded_file.name.lower().endswith(".zip"):
-                    zip_filename = fs.save(uploaded_file.name, uploaded_file)
-                    zip_path = fs.path(zip_filename)
-
-                    with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                        for member in zip_ref.namelist():
-                            if member.lower().endswith(".pdf"):
-                                extracted_path = os.path.join(settings.MEDIA_ROOT, member)
-                                os.makedirs(os.path.dirname(extracted_path), exist_ok=True)
-                                zip_ref.extract(member, settings.MEDIA_ROOT)
-                                temp_files.append(extracted_path)
-
-                    fs.delete(zip_filename)  # remove zip after extraction
-
-                # Handle single/multiple PDF files
-                elif uploaded_file.name.lower().endswith(".pdf"):
-                    saved_file = PdfFile.objects.create(pdf_file=uploaded_file)
-
-                    pdf_filename = fs.save(uploaded_file.name, uploaded_file)
-
-                    pdf_path = fs.path(pdf_filename)
-                    temp_files.append(pdf_path)
-                else:
-                    return render(request, self.template_name, {"error": "Only PDF or ZIP files are allowed."})
-
-                # Process each PDF
-                for pdf_file in temp_files:
-                    try:
-
-                        extraction_result = read_pdf_with_structure(pdf_file)
-                        raw_text = extraction_result["text"]
-                        tables = extraction_result.get("tables", [])
-
-                        english_text = _extract_english_from_pdf(raw_text)
-                        parsed_data = parse_contract_text_to_json(english_text, tables)
-                        source_file_id = saved_file.id if (saved_file and getattr(saved_file, 'pdf_file', None)) else ""
-                        parsed_data = {
-                            "source_file": source_file_id,
-                            **parsed_data
-                        }
-                        all_results.append({
-                            "filename": os.path.basename(pdf_file),
-                            "parsed_data": json.dumps(parsed_data, indent=2, ensure_ascii=False),
-                            "english_text": english_text,
-                            "summary": {
-                                "pages": extraction_result.get("pages_count", 0),
-                                "tables_count": len(tables),
-                                "english_text_length": len(english_text),
-                                "extraction_method": extraction_result.get("method", "unknown"),
-                                "ocr_used": extraction_result.get("ocr_used", False)
-                            }
-                        })
-                    finally:
-                        if os.path.exists(pdf_file):
-                            os.remove(pdf_file)
+        # (uploaded file name, extracted PDF path, PdfFile row) for every PDF, in upload order
+        pdf_jobs = []
+        try:
+            for uploaded_file in uploaded_files:
+                saved_file = None
 
-            except Exception as e:
-                return render(request, self.template_name, {"error": f"Error processing file {uploaded_file.name}: {str(e)}"})
+                try:
+                    # Handle ZIP file: extract only PDFs
+                    if uploaded_file.name.lower().endswith(".zip"):
+                        zip_filename = fs.save(uploaded_file.name, uploaded_file)
+                        zip_path = fs.path(zip_filename)
+
+                        with zipfile.ZipFile(zip_path, "r") as zip_ref:
+                            for member in zip_ref.namelist():
+                                if member.lower().endswith(".pdf"):
+                                    extracted_path = os.path.join(settings.MEDIA_ROOT, member)
+                                    os.makedirs(os.path.dirname(extracted_path), exist_ok=True)
+                                    zip_ref.extract(member, settings.MEDIA_ROOT)
+                                    pdf_jobs.append((uploaded_file.name, extracted_path, None))
+
+                        fs.delete(zip_filename)  # remove zip after extraction
+
+                    # Handle single/multiple PDF files
+                    elif uploaded_file.name.lower().endswith(".pdf"):
+                        saved_file = PdfFile.objects.create(pdf_file=uploaded_file)
+
+                        pdf_filename = fs.save(uploaded_file.name, uploaded_file)
+
+                        pdf_path = fs.path(pdf_filename)
+                        pdf_jobs.append((uploaded_file.name, pdf_path, saved_file))
+                    else:
+                        return render(request, self.template_name, {"error": "Only PDF or ZIP files are allowed."})
+
+                except Exception as e:
+                    return render(request, self.template_name, {"error": f"Error processing file {uploaded_file.name}: {str(e)}"})
+
+            # Every PDF is extracted at once on the shared process pool; results come back in upload order
+            extractions = extract_contracts([pdf_path for _, pdf_path, _ in pdf_jobs])
+
+            for (upload_name, pdf_path, saved_file), extraction in zip(pdf_jobs, extractions):
+                if isinstance(extraction, Exception):
+                    return render(request, self.template_name, {"error": f"Error processing file {upload_name}: {str(extraction)}"})
+
+                source_file_id = saved_file.id if (saved_file and getattr(saved_file, 'pdf_file', None)) else ""
+                parsed_data = {
+                    "source_file": source_file_id,
+                    **extraction["parsed_data"]
+                }
+                all_results.append({
+                    "filename": extraction["filename"],
+                    "parsed_data": json.dumps(parsed_data, indent=2, ensure_ascii=False),
+                    "english_text": extraction["english_text"],
+                    "summary": extraction["summary"]
+                })
+        finally:
+            for _, pdf_path, _ in pdf_jobs:
+                if os.path.exists(pdf_path):
+                    os.remove(pdf_path)
 
         # If only one file was uploaded, show it directly
         if len(all_results) == 1:
@@ -162,6 +149,10 @@ class ImportDataView(View):
 class ContractTableView(View):
     template_name = "contracts/contract_table.html"
     per_page = 50
+    # Table order; the primary key is the keyset tiebreaker
+    ordering = ('-generated_date', '-created_at', '-id')
+    # Large columns the table page never shows
+    page_deferred_fields = ('raw_text', 'embedding', 'embedding_source_hash', 'summary')
 
     def get(self, request):
         # Extract filters
@@ -172,34 +163,90 @@ class ContractTableView(View):
         date_from = request.GET.get("date_from", "").strip()
         date_to = request.GET.get("date_to", "").strip()
         
-        # AI filter parameters
-        ai_filter = request.GET.get("ai_filter", "").strip()
-        ai_contracts = request.GET.get("ai_contracts", "").strip()
+        # Semantic search results, kept server-side by SemanticSearchView
+        ai_search = request.GET.get("ai_search", "").strip()
+        ai_result = load_result_handle(ai_search)
+        # A handle that expired (or was evicted) must not widen to the whole table
+        ai_search_expired = bool(ai_search) and ai_result is None
+
+        if ai_search_expired:
+            page_obj, contract_data = Paginator([], self.per_page).get_page(1), None
+        elif ai_result is not None:
+            # Filters were already applied inside the vector search
+            page_obj, contract_data = self.ai_result_page(request, ai_result)
+        else:
+            page_obj, contract_data = self.filtered_page(
+                request, search_query, org_filter, dept_filter, ministry_filter, date_from, date_to
+            )
+        if contract_data is not None:
+            return self.export_data(contract_data, request.GET.get("export"))
 
-        # Base queryset with prefetching
-        contracts_qs = Contract.objects.select_related(
-            "file", "organization_details", "buyer",
-            "financial_approval", "paying_authority", "seller", "epbg"
-        ).prefetch_related(
-            Prefetch('products', queryset=Product.objects.prefetch_related(
-                Prefetch('specifications', queryset=ProductSpecification.objects.all()),
-                Prefetch('consignees', queryset=ConsigneeDetail.objects.all())
-            )),
-            Prefetch('terms', queryset=TermsAndCondition.objects.all())
-        ).order_by('-generated_date', '-created_at')
+        # Filter options
+        org_options = OrganisationDetail.objects.exclude(organisation_name="").values_list("organisation_name",
+                                                                                           flat=True).distinct()
+        dept_options = OrganisationDetail.objects.exclude(department="").values_list("department", flat=True).distinct()
+        ministry_options = OrganisationDetail.objects.exclude(ministry="").values_list("ministry", flat=True).distinct()
 
-        # Apply filters
+        return render(request, self.template_name, {
+            "page_obj": page_obj,
+            "search_query": search_query,
+            "org_filter": org_filter,
+            "dept_filter": dept_filter,
+            "ministry_filter": ministry_filter,
+            "date_from": date_from,
+            "date_to": date_to,
+            "org_options": org_options,
+            "dept_options": dept_options,
+            "ministry_options": ministry_options,
+            "ai_search": ai_search if ai_result is not None else "",
+            "ai_search_expired": ai_search_expired,
+        })
+
+    def filtered_page(self, request, search_query, org_filter, dept_filter, ministry_filter, date_from, date_to):
+        """Page of the filtered table; returns (page_obj, rows to export or None)"""
+        exporting = request.GET.get("export") in ["excel", "csv"]
+        contracts_qs = self.filter_queryset(
+            self.base_queryset() if exporting else self.page_queryset(),
+            search_query, org_filter, dept_filter, ministry_filter, date_from, date_to
+        )
+
+        # Export handling
+        if exporting:
+            return None, [self.contract_row(contract) for contract in contracts_qs]
+
+        # Keyset pagination: deep pages seek on contract_keyset_idx instead of OFFSET
+        paginator = KeysetPaginator(
+            contracts_qs, self.ordering, self.per_page,
+            count_timeout=getattr(settings, 'TABLE_COUNT_CACHE_TIMEOUT', 300),
+            count_version=get_corpus_version()
+        )
+        page_obj = paginator.page(
+            after=request.GET.get("after"), before=request.GET.get("before"),
+            number=safe_int_from_raw(request.GET.get("page", 1))
+        )
+        # Only the contracts on this page are turned into rows
+        page_obj.object_list = [self.contract_row(contract, detail=False) for contract in page_obj.object_list]
+        return page_obj, None
+
+    def filter_queryset(self, contracts_qs, search_query, org_filter, dept_filter, ministry_filter, date_from,
+                        date_to):
+        # Apply filters (dropdown values, matched exactly so org_*_idx serve them)
         if org_filter:
-            contracts_qs = contracts_qs.filter(organization_details__organisation_name__icontains=org_filter)
+            contracts_qs = contracts_qs.filter(organization_details__organisation_name=org_filter)
         if dept_filter:
-            contracts_qs = contracts_qs.filter(organization_details__department__icontains=dept_filter)
+            contracts_qs = contracts_qs.filter(organization_details__department=dept_filter)
         if ministry_filter:
-            contracts_qs = contracts_qs.filter(organization_details__ministry__icontains=ministry_filter)
+            contracts_qs = contracts_qs.filter(organization_details__ministry=ministry_filter)
         if date_from:
             contracts_qs = contracts_qs.filter(generated_date__gte=date_from)
         if date_to:
             contracts_qs = contracts_qs.filter(generated_date__lte=date_to)
         if search_query:
+            # Contract text is matched through the keyword index: raw_text is
+            # stored compressed, so icontains would decompress every row
+            text_ids, _ = get_search_index().search(
+                search_query, limit=getattr(settings, 'TABLE_SEARCH_TEXT_LIMIT', 10000), match_all=True
+            )
             contracts_qs = contracts_qs.filter(
                 # Contract basic info
                 Q(contract_no__icontains=search_query) |
@@ -235,49 +282,101 @@ class ContractTableView(View):
                 Q(products__brand__icontains=search_query) |
                 Q(products__category_name_quadrant__icontains=search_query) |
                 
-                # Raw text for comprehensive search
-                Q(raw_text__icontains=search_query)
+                # Contract text (keyword index)
+                Q(id__in=text_ids.tolist())
             ).distinct()
-        
-        # Apply AI filter if present
-        if ai_filter and ai_contracts:
-            ai_contract_list = [c.strip() for c in ai_contracts.split(',') if c.strip()]
-            if ai_contract_list:
-                # Filter to only show AI-relevant contracts
-                contracts_qs = contracts_qs.filter(contract_no__in=ai_contract_list)
-                # Reorder to match AI relevance order
-                preserved = Case(*[When(contract_no=contract_no, then=pos) for pos, contract_no in enumerate(ai_contract_list)])
-                contracts_qs = contracts_qs.annotate(ai_order=preserved).order_by('ai_order')
-
-        # Build comprehensive data structure
-        contract_data = []
-        for contract in contracts_qs:
-            # File info
-            source_file = contract.file.pdf_file.url if contract.file and contract.file.pdf_file else ""
-            source_filename = os.path.basename(urlparse(source_file).path) if source_file else ""
-
-            # Calculate totals
-            total_value = Decimal('0')
-            total_qty = 0
-            for product in contract.products.all():
-                try:
-                    total_value += Decimal(product.total_price) if product.total_price else Decimal('0')
-                except:
-                    pass
-                try:
-                    total_qty += int(product.ordered_quantity) if product.ordered_quantity else 0
-                except:
-                    pass
 
+        return contracts_qs
+
+    def ai_result_page(self, request, ai_result):
+        """Page through a semantic search result handle in relevance order"""
+        scores = dict(zip(ai_result['ids'], ai_result['scores']))
+        if request.GET.get("export") in ["excel", "csv"]:
+            ids = ai_result['ids']
+            by_id = self.base_queryset().in_bulk(ids)
+            return None, [self.contract_row(by_id[i], scores[i]) for i in ids if i in by_id]
+
+        page_obj = Paginator(ai_result['ids'], self.per_page).get_page(request.GET.get('page', 1))
+        # Only the contracts on this page are loaded
+        by_id = self.page_queryset().in_bulk(list(page_obj.object_list))
+        page_obj.object_list = [
+            self.contract_row(by_id[i], scores[i], detail=False) for i in page_obj.object_list if i in by_id
+        ]
+        return page_obj, None
+
+    def base_queryset(self):
+        # Base queryset with prefetching
+        return Contract.objects.select_related(
+            "file", "organization_details", "buyer",
+            "financial_approval", "paying_authority", "seller", "epbg"
+        ).prefetch_related(
+            Prefetch('products', queryset=Product.objects.prefetch_related(
+                Prefetch('specifications', queryset=ProductSpecification.objects.all()),
+                Prefetch('consignees', queryset=ConsigneeDetail.objects.all())
+            )),
+            Prefetch('terms', queryset=TermsAndCondition.objects.all())
+        ).order_by(*self.ordering)
+
+    def page_queryset(self):
+        """Table page queryset: no raw text or embeddings, products only for the totals"""
+        return Contract.objects.select_related(
+            "file", "organization_details", "buyer", "financial_approval", "paying_authority", "seller"
+        ).defer(*self.page_deferred_fields).prefetch_related(
+            Prefetch('products', queryset=Product.objects.only('id', 'contract_id', 'total_price', 'ordered_quantity'))
+        ).order_by(*self.ordering)
+
+    @staticmethod
+    def product_row(p):
+        return {
+            "name": p.product_name,
+            "brand": p.brand,
+            "type": p.brand_type,
+            "status": p.catalogue_status,
+            "selling_as": p.selling_as,
+            "category": p.category_name_quadrant,
+            "model": p.model,
+            "hsn": p.hsn_code,
+            "quantity": p.ordered_quantity,
+            "unit": p.unit,
+            "unit_price": p.unit_price,
+            "tax": p.tax_bifurcation,
+            "total_price": p.total_price,
+            "note": p.note
+        }
+
+    def contract_row(self, contract, ai_score=None, detail=True):
+        """Table/export row; ``detail=False`` leaves out the raw text and nested product data
+        (the table page loads those per row from ContractDetailApiView)"""
+        # File info
+        source_file = contract.file.pdf_file.url if contract.file and contract.file.pdf_file else ""
+        source_filename = os.path.basename(urlparse(source_file).path) if source_file else ""
+
+        products = list(contract.products.all())
+
+        # Calculate totals
+        total_value = Decimal('0')
+        total_qty = 0
+        for product in products:
+            try:
+                total_value += Decimal(product.total_price) if product.total_price else Decimal('0')
+            except:
+                pass
+            try:
+                total_qty += int(product.ordered_quantity) if product.ordered_quantity else 0
+            except:
+                pass
+
+        specifications = []
+        consignees = []
+        terms = []
+        if detail:
             # Collect specifications
-            specifications = []
-            for product in contract.products.all():
+            for product in products:
                 for spec in product.specifications.all():
                     specifications.append(f"{spec.category}: {spec.sub_spec} = {spec.value}")
 
             # Collect consignees
-            consignees = []
-            for product in contract.products.all():
+            for product in products:
                 for consignee in product.consignees.all():
                     consignees.append(
                         f"{consignee.designation} - {consignee.address} "
@@ -287,128 +386,76 @@ class ContractTableView(View):
             # Collect terms
             terms = [term.clause_text for term in contract.terms.all()]
 
-            # Check if this contract is AI-relevant
-            is_ai_relevant = False
-            ai_score = None
-            if ai_filter and ai_contracts:
-                ai_contract_list = [c.strip() for c in ai_contracts.split(',') if c.strip()]
-                if contract.contract_no in ai_contract_list:
-                    is_ai_relevant = True
-                    # Get AI score if available (you can enhance this later)
-                    ai_score = "AI Relevant"
-
-            contract_data.append({
-                # Contract fields
-                "contract_no": contract.contract_no,
-                "generated_date": contract.generated_date,
-                "raw_text": contract.raw_text,
-                "source_file": source_file,
-                "source_filename": source_filename,
-
-                # Organisation details
-                "org_type": contract.organization_details.type if contract.organization_details else "",
-                "ministry": contract.organization_details.ministry if contract.organization_details else "",
-                "department": contract.organization_details.department if contract.organization_details else "",
-                "organisation": contract.organization_details.organisation_name if contract.organization_details else "",
-                "office_zone": contract.organization_details.office_zone if contract.organization_details else "",
-
-                # Buyer details
-                "buyer_designation": contract.buyer.designation if contract.buyer else "",
-                "buyer_contact": contract.buyer.contact_no if contract.buyer else "",
-                "buyer_email": contract.buyer.email if contract.buyer else "",
-                "buyer_gstin": contract.buyer.gstin if contract.buyer else "",
-                "buyer_address": contract.buyer.address if contract.buyer else "",
-
-                # Financial approval
-                "ifd_concurrence": "Yes" if contract.financial_approval and contract.financial_approval.ifd_concurrence else "No",
-                "admin_approval": contract.financial_approval.admin_approval_designation if contract.financial_approval else "",
-                "financial_approval": contract.financial_approval.financial_approval_designation if contract.financial_approval else "",
-
-                # Paying authority
-                "paying_role": contract.paying_authority.role if contract.paying_authority else "",
-                "payment_mode": contract.paying_authority.payment_mode if contract.paying_authority else "",
-                "paying_designation": contract.paying_authority.designation if contract.paying_authority else "",
-                "paying_email": contract.paying_authority.email if contract.paying_authority else "",
-                "paying_gstin": contract.paying_authority.gstin if contract.paying_authority else "",
-                "paying_address": contract.paying_authority.address if contract.paying_authority else "",
-
-                # Seller details
-                "gem_seller_id": contract.seller.gem_seller_id if contract.seller else "",
-                "seller_company": contract.seller.company_name if contract.seller else "",
-                "seller_contact": contract.seller.contact_no if contract.seller else "",
-                "seller_email": contract.seller.email if contract.seller else "",
-                "seller_address": contract.seller.address if contract.seller else "",
-                "msme_reg": contract.seller.msme_registration_number if contract.seller else "",
-                "seller_gstin": contract.seller.gstin if contract.seller else "",
-
-                # Products
-                "products": [
-                    {
-                        "name": p.product_name,
-                        "brand": p.brand,
-                        "type": p.brand_type,
-                        "status": p.catalogue_status,
-                        "selling_as": p.selling_as,
-                        "category": p.category_name_quadrant,
-                        "model": p.model,
-                        "hsn": p.hsn_code,
-                        "quantity": p.ordered_quantity,
-                        "unit": p.unit,
-                        "unit_price": p.unit_price,
-                        "tax": p.tax_bifurcation,
-                        "total_price": p.total_price,
-                        "note": p.note
-                    } for p in contract.products.all()
-                ],
-                "specifications": specifications,
-
-                # Consignees
-                "consignees": consignees,
-
-                # EPBG
-                # "epbg_detail": contract.epbg.detail if contract.epbg else "",
-
-                # Terms
-                "terms": terms,
-
-                # Calculated values
-                "total_value": total_value,
-                "total_quantity": total_qty,
-                
-                # AI relevance
-                "is_ai_relevant": is_ai_relevant,
-                "ai_score": ai_score,
-            })
-
-        # Export handling
-        if request.GET.get("export") in ["excel", "csv"]:
-            return self.export_data(contract_data, request.GET.get("export"))
-
-        # Pagination
-        paginator = Paginator(contract_data, self.per_page)
-        page_number = request.GET.get('page', 1)
-        page_obj = paginator.get_page(page_number)
-
-        # Filter options
-        org_options = OrganisationDetail.objects.exclude(organisation_name="").values_list("organisation_name",
-                                                                                           flat=True).distinct()
-        dept_options = OrganisationDetail.objects.exclude(department="").values_list("department", flat=True).distinct()
-        ministry_options = OrganisationDetail.objects.exclude(ministry="").values_list("ministry", flat=True).distinct()
+        row = {
+            # Contract fields
+            "contract_no": contract.contract_no,
+            "generated_date": contract.generated_date,
+            "raw_text": contract.raw_text if detail else "",
+            "source_file": source_file,
+            "source_filename": source_filename,
+
+            # Organisation details
+            "org_type": contract.organization_details.type if contract.organization_details else "",
+            "ministry": contract.organization_details.ministry if contract.organization_details else "",
+            "department": contract.organization_details.department if contract.organization_details else "",
+            "organisation": contract.organization_details.organisation_name if contract.organization_details else "",
+            "office_zone": contract.organization_details.office_zone if contract.organization_details else "",
+
+            # Buyer details
+            "buyer_designation": contract.buyer.designation if contract.buyer else "",
+            "buyer_contact": contract.buyer.contact_no if contract.buyer else "",
+            "buyer_email": contract.buyer.email if contract.buyer else "",
+            "buyer_gstin": contract.buyer.gstin if contract.buyer else "",
+            "buyer_address": contract.buyer.address if contract.buyer else "",
+
+            # Financial approval
+            "ifd_concurrence": "Yes" if contract.financial_approval and contract.financial_approval.ifd_concurrence else "No",
+            "admin_approval": contract.financial_approval.admin_approval_designation if contract.financial_approval else "",
+            "financial_approval": contract.financial_approval.financial_approval_designation if contract.financial_approval else "",
+
+            # Paying authority
+            "paying_role": contract.paying_authority.role if contract.paying_authority else "",
+            "payment_mode": contract.paying_authority.payment_mode if contract.paying_authority else "",
+            "paying_designation": contract.paying_authority.designation if contract.paying_authority else "",
+            "paying_email": contract.paying_authority.email if contract.paying_authority else "",
+            "paying_gstin": contract.paying_authority.gstin if contract.paying_authority else "",
+            "paying_address": contract.paying_authority.address if contract.paying_authority else "",
+
+            # Seller details
+            "gem_seller_id": contract.seller.gem_seller_id if contract.seller else "",
+            "seller_company": contract.seller.company_name if contract.seller else "",
+            "seller_contact": contract.seller.contact_no if contract.seller else "",
+            "seller_email": contract.seller.email if contract.seller else "",
+            "seller_address": contract.seller.address if contract.seller else "",
+            "msme_reg": contract.seller.msme_registration_number if contract.seller else "",
+            "seller_gstin": contract.seller.gstin if contract.seller else "",
+
+            # Products
+            "products": [self.product_row(p) for p in products] if detail else [],
+            "specifications": specifications,
+
+            # Consignees
+            "consignees": consignees,
+
+            # EPBG
+            # "epbg_detail": contract.epbg.detail if contract.epbg else "",
+
+            # Terms
+            "terms": terms,
+
+            # Calculated values
+            "total_value": total_value,
+            "total_quantity": total_qty,
+            
+            # AI relevance
+            "is_ai_relevant": ai_score is not None,
+            "ai_score": f"{ai_score:.3f}" if ai_score is not None else None,
+        }
+        if not detail:
+            row["id"] = contract.id
+            row["product_count"] = len(products)
+        return row
 
-        return render(request, self.template_name, {
-            "page_obj": page_obj,
-            "search_query": search_query,
-            "org_filter": org_filter,
-            "dept_filter": dept_filter,
-            "ministry_filter": ministry_filter,
-            "date_from": date_from,
-            "date_to": date_to,
-            "org_options": org_options,
-            "dept_options": dept_options,
-            "ministry_options": ministry_options,
-            "ai_filter": ai_filter,
-            "ai_contracts": ai_contracts,
-        })
     def export_data(self, rows, file_type):
         df = pd.DataFrame(rows)
         if "contract_obj" in df.columns:
@@ -426,6 +473,166 @@ class ContractTableView(View):
 
 
 
+# Public field name -> model path, for ContractListApiView's ``fields=`` projection
+CONTRACT_API_FIELDS = {
+    "id": "id",
+    "contract_no": "contract_no",
+    "generated_date": "generated_date",
+    "summary": "summary",
+    "source_file": "file__pdf_file",
+    "org_type": "organization_details__type",
+    "ministry": "organization_details__ministry",
+    "department": "organization_details__department",
+    "organisation": "organization_details__organisation_name",
+    "office_zone": "organization_details__office_zone",
+    "buyer_designation": "buyer__designation",
+    "buyer_email": "buyer__email",
+    "buyer_gstin": "buyer__gstin",
+    "paying_gstin": "paying_authority__gstin",
+    "seller_company": "seller__company_name",
+    "seller_gstin": "seller__gstin",
+    "gem_seller_id": "seller__gem_seller_id",
+}
+# Fields holding a list, loaded with one prefetch query per page: name -> (relation, queryset, attribute)
+CONTRACT_API_LIST_FIELDS = {
+    "tags": ("tags", ContractTag.objects.only("contract_id", "tag").order_by("tag"), "tag"),
+}
+CONTRACT_API_DEFAULT_FIELDS = ("id", "contract_no", "generated_date", "ministry", "department", "organisation")
+# Parts of a contract ContractDetailApiView can return
+CONTRACT_DETAIL_PARTS = ("raw_text", "products", "terms")
+
+
+class ContractListApiView(ContractTableView):
+    """JSON contract list: only the ``fields=`` columns are loaded, paged by keyset cursor"""
+    max_per_page = 200
+
+    def get(self, request):
+        requested = [f.strip() for f in request.GET.get("fields", "").split(",") if f.strip()]
+        requested = list(dict.fromkeys(requested)) or list(CONTRACT_API_DEFAULT_FIELDS)
+        unknown = [f for f in requested if f not in CONTRACT_API_FIELDS and f not in CONTRACT_API_LIST_FIELDS]
+        if unknown:
+            return JsonResponse({
+                "success": False,
+                "message": f"Unknown fields: {', '.join(unknown)}",
+                "fields": list(CONTRACT_API_FIELDS) + list(CONTRACT_API_LIST_FIELDS),
+            }, status=400)
+
+        paths = [CONTRACT_API_FIELDS[f] for f in requested if f in CONTRACT_API_FIELDS]
+        related = sorted({path.rsplit("__", 1)[0] for path in paths if "__" in path})
+        prefetches = [
+            Prefetch(CONTRACT_API_LIST_FIELDS[f][0], queryset=CONTRACT_API_LIST_FIELDS[f][1])
+            for f in requested if f in CONTRACT_API_LIST_FIELDS
+        ]
+        # The ordering columns are always needed for the cursor
+        contracts_qs = Contract.objects.select_related(*related).prefetch_related(*prefetches).only(
+            "id", *paths, "generated_date", "created_at"
+        ).order_by(*self.ordering)
+        contracts_qs = self.filter_queryset(
+            contracts_qs,
+            request.GET.get("search", "").strip(),
+            request.GET.get("organisation_name", "").strip(),
+            request.GET.get("department", "").strip(),
+            request.GET.get("ministry", "").strip(),
+            request.GET.get("date_from", "").strip(),
+            request.GET.get("date_to", "").strip(),
+        )
+
+        per_page = min(max(safe_int_from_raw(request.GET.get("limit", self.per_page)), 1), self.max_per_page)
+        paginator = KeysetPaginator(
+            contracts_qs, self.ordering, per_page,
+            count_timeout=getattr(settings, 'TABLE_COUNT_CACHE_TIMEOUT', 300),
+            count_version=get_corpus_version()
+        )
+        page = paginator.page(after=request.GET.get("after"), before=request.GET.get("before"))
+
+        payload = {
+            "success": True,
+            "results": [
+                {name: self.field_value(contract, name) for name in requested}
+                for contract in page
+            ],
+            "next": page.next_cursor,
+            "previous": page.previous_cursor,
+        }
+        if request.GET.get("count"):
+            payload["count"] = paginator.count
+        return JsonResponse(payload)
+
+    @staticmethod
+    def field_value(contract, name):
+        if name in CONTRACT_API_LIST_FIELDS:
+            relation, _, attr = CONTRACT_API_LIST_FIELDS[name]
+            return [getattr(obj, attr) for obj in getattr(contract, relation).all()]
+        value = contract
+        path = CONTRACT_API_FIELDS[name]
+        for attr in path.split("__"):
+            try:
+                value = getattr(value, attr)
+            except ObjectDoesNotExist:
+                return ""
+            if value is None:
+                return ""
+        if isinstance(value, FieldFile):
+            return value.url if value else ""
+        return value
+
+
+class ContractDetailApiView(View):
+    """Raw text, products (with specifications and consignees) and terms of one contract,
+    fetched when a table row's modal or details are opened"""
+
+    def get(self, request, pk):
+        parts = [p.strip() for p in request.GET.get("fields", "").split(",") if p.strip()]
+        parts = parts or list(CONTRACT_DETAIL_PARTS)
+        unknown = [p for p in parts if p not in CONTRACT_DETAIL_PARTS]
+        if unknown:
+            return JsonResponse({
+                "success": False,
+                "message": f"Unknown fields: {', '.join(unknown)}",
+                "fields": list(CONTRACT_DETAIL_PARTS),
+            }, status=400)
+
+        contracts_qs = Contract.objects.only("id", "contract_no", *(["raw_text"] if "raw_text" in parts else []))
+        if "products" in parts:
+            contracts_qs = contracts_qs.prefetch_related(
+                Prefetch('products', queryset=Product.objects.defer('embedding', 'embedding_source_hash')
+                         .prefetch_related('specifications', 'consignees'))
+            )
+        if "terms" in parts:
+            contracts_qs = contracts_qs.prefetch_related('terms')
+        contract = contracts_qs.filter(pk=pk).first()
+        if contract is None:
+            return JsonResponse({"success": False, "message": "Contract not found"}, status=404)
+
+        payload = {"success": True, "id": contract.id, "contract_no": contract.contract_no}
+        if "raw_text" in parts:
+            payload["raw_text"] = contract.raw_text
+        if "products" in parts:
+            payload["products"] = [
+                {
+                    **ContractTableView.product_row(p),
+                    "specifications": [
+                        {"category": spec.category, "sub_spec": spec.sub_spec, "value": spec.value}
+                        for spec in p.specifications.all()
+                    ],
+                    "consignees": [
+                        {
+                            "designation": c.designation,
+                            "address": c.address,
+                            "quantity": c.quantity,
+                            "delivery_start": c.delivery_start,
+                            "delivery_end": c.delivery_end,
+                        }
+                        for c in p.consignees.all()
+                    ],
+                }
+                for p in contract.products.all()
+            ]
+        if "terms" in parts:
+            payload["terms"] = [term.clause_text for term in contract.terms.all()]
+        return JsonResponse(payload)
+
+
 class SaveInDb(View):
     def post(self, request):
         """
@@ -602,17 +809,20 @@ class SaveInDb(View):
                         pass
 
                 # Compute and store contract embedding if model available
-                embedder = get_embedder()
-                if embedder is not None and english_text:
+                if english_text:
                     try:
                         combo = ' | '.join(filter(None, [
                             contract.contract_no,
                             contract.generated_date.isoformat() if contract.generated_date else '',
                             english_text
                         ]))
-                        vec = embedder.encode([combo], normalize_embeddings=True)
-                        contract.embedding = vec[0].tolist()
-                        contract.save(update_fields=['embedding'])
+                        # Chunked so boilerplate chunks come from the shared cache
+                        vec = encode_document(
+                            combo, getattr(settings, 'EMBEDDING_QUANTIZE', False), get_chunk_cache()
+                        )
+                        if vec is not None:
+                            contract.embedding = vec
+                            contract.save(update_fields=['embedding'])
                     except Exception:
                         pass
 
@@ -674,6 +884,7 @@ class SaveInDb(View):
 
                 # Products + Specs + Consignees
                 product_map = {}
+                product_texts = []
                 for p in combined_products:
                     pname = safe_str(p.get('product_name') or 'Unknown Product')
                     prod_defaults = {
@@ -705,22 +916,25 @@ class SaveInDb(View):
                         )
                         created['specs'] += 1
 
-                    # Compute and store product embedding if model available
-                    embedder = get_embedder()
-                    if embedder is not None:
-                        try:
-                            pcombo = ' | '.join(filter(None, [
-                                prod_obj.product_name,
-                                prod_obj.category_name_quadrant,
-                                prod_obj.hsn_code,
-                                prod_obj.note
-                            ]))
-                            if pcombo:
-                                pvec = embedder.encode([pcombo], normalize_embeddings=True)
-                                prod_obj.embedding = pvec[0].tolist()
-                                prod_obj.save(update_fields=['embedding'])
-                        except Exception:
-                            pass
+                    pcombo = ' | '.join(filter(None, [
+                        prod_obj.product_name,
+                        prod_obj.category_name_quadrant,
+                        prod_obj.hsn_code,
+                        prod_obj.note
+                    ]))
+                    if pcombo:
+                        product_texts.append((prod_obj, pcombo))
+
+                # Compute and store product embeddings in one encode call if model available
+                embedder = get_embedder()
+                if embedder is not None and product_texts:
+                    try:
+                        pvecs = embedder.encode([text for _, text in product_texts], normalize_embeddings=True)
+                        for (prod_obj, _), pvec in zip(product_texts, pvecs):
+                            prod_obj.embedding = pvec.tolist()
+                        Product.objects.bulk_update([prod_obj for prod_obj, _ in product_texts], ['embedding'])
+                    except Exception:
+                        pass
                 if not product_map and parsed_data.get('products'):
                     for p in parsed_data.get('products'):
                         pname = safe_str(p if isinstance(p, str) else p.get('product_name', 'Unknown'))
@@ -769,9 +983,21 @@ class SaveInDb(View):
                     TermsAndCondition.objects.get_or_create(contract=contract, clause_text=t)
                     created['terms'] += 1
 
+                # Keyword tags (e.g. "army") for indexed filtering
+                created['tags'] = tag_contract(contract)
+
+                # Query-independent summary, so search only runs QA on the top hit
+                summarize_contract(contract)
+
         except Exception as exc:
             return JsonResponse({'success': False, 'message': f'Error saving to database: {str(exc)}'}, status=500)
 
+        # Keyword index for hybrid search, once the contract is committed
+        try:
+            index_contract(contract)
+        except Exception:
+            pass
+
         return JsonResponse({'success': True, 'message': f'Contract {contract.contract_no} saved/updated', 'created': created})
 
 
@@ -780,90 +1006,9 @@ class SaveInDb(View):
 class SemanticSearchView(View):
     template_name = "contracts/search.html"
 
-    def generate_clean_summary(self, text, query):
-        print("TEXT : ",text)
-        """Generate a clean, query-focused summary using AI transformers"""
-        # First, try to answer the query directly
-        if pipeline is not None:
-            try:
-                # Initialize QA pipeline
-                qa_pipeline = pipeline(
-                    "question-answering",
-                    model="deepset/roberta-base-squad2",
-                    tokenizer="deepset/roberta-base-squad2"
-                )
-
-                # Try to extract a direct answer
-                answer = qa_pipeline(question=query, context=text[:3000])  # Limit context
-                if answer['score'] > 0.1:  # Minimum confidence threshold
-                    return answer['answer']
-            except Exception:
-                pass
-
-        # If QA fails, generate an extractive summary focused on query terms
-        if summarize is not None:
-            try:
-                # Clean text by removing common PDF artifacts
-                text = re.sub(r'\s+', ' ', text)  # Collapse whitespace
-                text = re.sub(r'[^\w\s.,;:!?()-]', '', text)  # Remove special chars
-
-                # Use extractive summarization focused on query terms
-                # Boost query terms in importance
-                query_keywords = " ".join(set(query.split()))
-                boosted_text = f"{query_keywords}. {text}"
-
-                summary = summarize(
-                    boosted_text,
-                    ratio=0.2,
-                    words=100,
-                    split=True
-                )
-
-                if summary:
-                    return " ".join(summary)
-            except Exception:
-                pass
-
-        # Fallback: extract sentences containing query terms
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        query_terms = query.lower().split()
-        relevant_sentences = [
-                                 s for s in sentences
-                                 if any(term in s.lower() for term in query_terms)
-                             ][:3]
-
-        return " ".join(relevant_sentences) or "No relevant information found"
-
-    def clean_raw_text(self,text):
-        """Clean and normalize raw text"""
-        if not text:
-            return ""
-
-        # Remove common PDF artifacts
-        text = re.sub(r'\s+', ' ', text)  # Collapse whitespace
-        text = re.sub(r'[^\w\s.,;:!?()-]', '', text)  # Remove special chars
-        text = re.sub(r'\bPage \d+\b', '', text)  # Remove page numbers
-
-        lines = text.split('.')
-        unique_lines = []
-        seen = set()
-        for line in lines:
-            clean_line = line.strip()
-            if clean_line and clean_line not in seen:
-                unique_lines.append(clean_line)
-                seen.add(clean_line)
-
-        return '. '.join(unique_lines)
     def get_model(self):
-        if SentenceTransformer is None:
-            return None
-        # Cache on class
-        if not hasattr(self.__class__, "_embedder"):
-            try:
-                self.__class__._embedder = SentenceTransformer('all-MiniLM-L6-v2')
-            except Exception:
-                self.__class__._embedder = None
-        return getattr(self.__class__, "_embedder", None)
+        # Same per-process model as ingest, so query vectors match stored ones
+        return get_embedder()
 
     def get(self, request):
         return render(request, self.template_name, {"query": request.GET.get("q", "")})
@@ -883,15 +1028,39 @@ class SemanticSearchView(View):
         if not query:
             return JsonResponse({"success": False, "message": "Empty query"}, status=400)
 
+        # Optional table filters (date range YYYY-MM-DD, organisation
+        # attributes), applied as a mask before top-k
+        try:
+            date_from = parse_date(body.get('date_from') or request.POST.get('date_from') or '')
+            date_to = parse_date(body.get('date_to') or request.POST.get('date_to') or '')
+        except Exception:
+            date_from = date_to = None
+        filters = {'date_from': date_from, 'date_to': date_to}
+        for name in FILTER_ATTRIBUTES:
+            filters[name] = (body.get(name) or request.POST.get(name) or '').strip()
+
+        # Repeat queries are answered from the result cache until the corpus changes
+        corpus_version = get_corpus_version()
+        cached = get_cached_results(query, top_k, corpus_version, filters)
+        if cached is not None:
+            return JsonResponse(cached)
+
         model = self.get_model()
         print(f"Model available: {model is not None}, NumPy available: {np is not None}")
         
+        # Keyword (BM25) candidates: exact identifiers hit directly and the
+        # vector scorer only re-ranks these contracts
+        candidate_limit = getattr(settings, 'SEMANTIC_SEARCH_CANDIDATES', 2000)
+        keyword_ids, keyword_scores = get_search_index().search(query, limit=candidate_limit)
+
         if model is None or np is None:
             print("Using fallback keyword search")
-            # Fallback: keyword search
-            qs = (
-                Contract.objects.select_related('organization_details', 'buyer', 'seller')
-                .filter(
+            if len(keyword_ids):
+                # Fallback: BM25 ranking
+                qs = Contract.objects.filter(id__in=keyword_ids.tolist())
+            else:
+                # Fallback: substring search
+                qs = Contract.objects.filter(
                     Q(contract_no__icontains=query)
                     | Q(raw_text__icontains=query)
                     | Q(organization_details__organisation_name__icontains=query)
@@ -900,35 +1069,52 @@ class SemanticSearchView(View):
                     | Q(seller__company_name__icontains=query)
                     | Q(buyer__email__icontains=query)
                 )
-                .only('id', 'contract_no', 'generated_date', 'raw_text')
-                .distinct()
-            )
+            qs = qs.only('id', 'contract_no', 'generated_date', 'raw_text', 'summary').distinct()
+            if date_from:
+                qs = qs.filter(generated_date__gte=date_from)
+            if date_to:
+                qs = qs.filter(generated_date__lte=date_to)
+            # Exact, like the contract table's dropdown filters
+            for name in FILTER_ATTRIBUTES:
+                if filters[name]:
+                    qs = qs.filter(**{f'organization_details__{name}': filters[name]})
+            if len(keyword_ids):
+                allowed = set(qs.values_list('id', flat=True))
+                ranked = [(i, score) for i, score in zip(keyword_ids.tolist(), keyword_scores.tolist()) if i in allowed]
+                by_id = qs.in_bulk([i for i, _ in ranked[:top_k]])
+                top_contracts = [by_id[i] for i, _ in ranked[:top_k]]
+                top_scores = [score for _, score in ranked[:top_k]]
+            else:
+                top_contracts = list(qs[:top_k])
+                top_scores = [0.0] * len(top_contracts)
             results = [
                 {
                     'raw_text': c.raw_text,
                     'contract_no': c.contract_no,
                     'generated_date': c.generated_date.isoformat() if c.generated_date else '',
-                    'score': 0.0,
+                    'score': score,
                 }
-                for c in qs[:top_k]
+                for c, score in zip(top_contracts, top_scores)
             ]
             top_summary = ""
 
             if results:
-                print("HELLO ...", results)
-                top_contract = qs.first()
+                top_contract = top_contracts[0]
                 if top_contract and top_contract.raw_text:
                     print(f"Generating summary for contract: {top_contract.contract_no}")
-                    top_summary = self.generate_clean_summary(self.clean_raw_text(top_contract.raw_text), query)
+                    top_summary = search_summary(top_contract, query)
                 else:
                     print("No raw text available for summary generation")
                     top_summary = "No text available for summary"
 
             summary = top_summary
 
-            print("SUMMERY : ", summary)
             print(f"Returning {len(results)} results")
-            return JsonResponse({"success": True, "results": results, "summary": summary, "top_summary": top_summary})
+            handle = store_result_handle([c.id for c in top_contracts], top_scores)
+            payload = {"success": True, "results": results, "summary": summary, "top_summary": top_summary,
+                       "handle": handle}
+            set_cached_results(query, top_k, corpus_version, payload, filters)
+            return JsonResponse(payload)
 
         # Optional: parse date in query to bias ranking
         wanted_date = None
@@ -948,125 +1134,65 @@ class SemanticSearchView(View):
         except Exception:
             wanted_date = None
 
-        # Build corpus of searchable texts with references
-        corpus = []
-        refs = []
-        for c in Contract.objects.all().select_related('buyer', 'seller', 'organization_details'):
-            parts = [
-                c.contract_no or '',
-                (c.generated_date.isoformat() if c.generated_date else ''),
-                getattr(c.organization_details, 'organisation_name', '') if hasattr(c, 'organization_details') else '',
-                getattr(c.organization_details, 'department', '') if hasattr(c, 'organization_details') else '',
-                getattr(c.seller, 'company_name', '') if hasattr(c, 'seller') else '',
-                getattr(c.buyer, 'email', '') if hasattr(c, 'buyer') else '',
-                c.raw_text or ''
-            ]
-            corpus.append(' | '.join([p for p in parts if p]))
-            refs.append({
-                'id': c.id,
-                'contract_no': c.contract_no,
-                'generated_date': c.generated_date.isoformat() if c.generated_date else '',
-                'date_obj': c.generated_date,
-                'type': 'contract',
-            })
-
-        # Add product names and notes as separate entries linked to their contract
-        for p in (
-            Product.objects
-            .select_related('contract')
-            .only(
-                'id', 'contract_id', 'product_name', 'note', 'hsn_code', 'category_name_quadrant',
-                'contract__contract_no', 'contract__generated_date'
-            )
-        ):
-            parts = [p.product_name or '', p.note or '', p.hsn_code or '', p.category_name_quadrant or '']
-            corpus.append(' | '.join([x for x in parts if x]))
-            refs.append({
-                'id': p.contract_id,
-                'contract_no': p.contract.contract_no if p.contract_id else '',
-                'generated_date': p.contract.generated_date.isoformat() if p.contract and p.contract.generated_date else '',
-                'date_obj': p.contract.generated_date if p.contract else None,
-                'type': 'product',
-            })
-
-        if not corpus:
+        # Score every stored vector at once; rows without a stored embedding
+        # are encoded when their contract is loaded into the index
+        index = get_vector_index(encode_with_cache(model))
+        if not len(index):
             return JsonResponse({"success": True, "results": [], "summary": "No data indexed yet"})
 
-        # Use precomputed embeddings when available for contracts/products
-        query_vec = model.encode([query], normalize_embeddings=True)
-        # Compute corpus embeddings in batches for memory safety
-        batch_size = 256
-        corpus_vecs = []
-        for i in range(0, len(corpus), batch_size):
-            batch = corpus[i:i+batch_size]
-            vecs = model.encode(batch, normalize_embeddings=True)
-            corpus_vecs.append(vecs)
-        corpus_vecs = np.vstack(corpus_vecs)
-        # cosine similarity
-        sims = (query_vec @ corpus_vecs.T)[0]
-
-        # Apply date bias if query contained a date
-        if wanted_date is not None:
-            bias = np.zeros_like(sims)
-            for i, ref in enumerate(refs):
-                d = ref.get('date_obj')
-                if not d:
-                    continue
-                if d == wanted_date:
-                    bias[i] = 0.2
-                elif d.year == wanted_date.year and d.month == wanted_date.month:
-                    bias[i] = 0.1
-                else:
-                    delta = abs((d - wanted_date).days)
-                    if delta <= 14:
-                        bias[i] = max(0.0, 0.1 * (1 - delta / 14.0))
-            sims = sims + bias
-        top_idx = np.argsort(-sims)[:top_k]
-
-        seen_contracts = set()
-        results = []
-        for i in top_idx.tolist():
-            ref = refs[i]
-            key = ref['id']
-            if key in seen_contracts:
-                continue
-            seen_contracts.add(key)
-            results.append({
-                'contract_no': ref['contract_no'],
-                'generated_date': ref['generated_date'],
-                'score': float(sims[i])
-            })
-            if len(results) >= top_k:
-                break
+        mask = index.filter_mask(filters)
+        query_vec = query_embedding(query)[0]
+        if len(keyword_ids):
+            hits = index.search(query_vec, top_k, wanted_date=wanted_date, mask=mask, candidate_ids=keyword_ids)
+        else:
+            hits = []
+        if len(hits) < top_k:
+            # Too few keyword candidates (paraphrased queries): top up from the full index
+            found = {int(index.contract_ids[row]) for row, _ in hits}
+            for row, score in index.search(query_vec, top_k + len(found), wanted_date=wanted_date, mask=mask):
+                if int(index.contract_ids[row]) not in found and len(hits) < top_k:
+                    hits.append((row, score))
+
+        results = [
+            {
+                'contract_no': index.contract_nos[row],
+                'generated_date': date.fromordinal(int(index.date_ordinals[row])).isoformat()
+                if index.date_ordinals[row] else '',
+                'score': score
+            }
+            for row, score in hits
+        ]
 
         # short summary and top summary text
         top_summary = ""
         if results:
             summary = f"Top match: {results[0]['contract_no']} dated {results[0]['generated_date']} (score {results[0]['score']:.3f})"
+            top_contract = None
             try:
-                top_ref = refs[top_idx.tolist()[0]]
-                top_contract = Contract.objects.filter(id=top_ref['id']).first()
+                # QA runs on the top hit only; the rest is precomputed at ingest
+                top_id = int(index.contract_ids[hits[0][0]])
+                top_contract = Contract.objects.filter(id=top_id).only('id', 'raw_text', 'summary').first()
                 if top_contract and top_contract.raw_text:
-                    cleaned_text = self.clean_raw_text(top_contract.raw_text)
-                    top_summary = self.generate_clean_summary(cleaned_text, query)
+                    top_summary = search_summary(top_contract, query)
             except Exception as e:
                 print(f"Error generating semantic summary: {str(e)}")
                 # Fallback to sentence extraction
                 if top_contract and top_contract.raw_text:
-                    text = top_contract.raw_text
-                    sentences = re.split(r'(?<=[.!?])\s+', text)
-                    query_terms = query.lower().split()
-                    relevant_sentences = [
-                                             s for s in sentences
-                                             if any(term in s.lower() for term in query_terms)
-                                         ][:3]
-                    top_summary = " ".join(relevant_sentences) or "No relevant information found"
+                    top_summary = query_sentences(top_contract.raw_text, query) or "No relevant information found"
         else:
             summary = "No relevant contracts found"
         print("SUMMARY : ",summary)
-        return JsonResponse({
+        payload = {
             "success": True,
             "results": results,
             "summary": top_summary,
-            "top_summary": top_summary
-        })
\ No newline at end of file
+            "top_summary": top_summary,
+            # Ranked contract ids kept server-side for ContractTableView (?ai_search=<handle>)
+            "handle": store_result_handle(
+                [int(index.contract_ids[row]) for row, _ in hits], [score for _, score in hits]
+            ),
+        }
+        # An index still catching up with the corpus answers now, but its results are not cached
+        if index.version == corpus_version:
+            set_cached_results(query, top_k, corpus_version, payload, filters)
+        return JsonResponse(payload)
\ No newline at end of file
@@ -0,0 +1,150 @@
+import csv
+import json
+import threading
+from datetime import date, datetime
+from pathlib import Path
+
+# Parquet output is optional; without pyarrow the columnar file is CSV
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except Exception:
+    pa = None
+    pq = None
+
+COLUMNAR_FORMATS = ('csv', 'parquet')
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def flatten_record(record, prefix=""):
+    """Flatten nested section dicts into "Section.Field" columns"""
+    flat = {}
+    for key, value in record.items():
+        column = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten_record(value, f"{column}."))
+        elif isinstance(value, (datetime, date)):
+            flat[column] = value.isoformat()
+        elif isinstance(value, (list, tuple)):
+            flat[column] = json.dumps(value, ensure_ascii=False, default=_json_default)
+        else:
+            flat[column] = value
+    return flat
+
+
+class BatchOutputSink:
+    """Append every extracted record of a batch session to shared files.
+
+    Records go to one JSON Lines file (full nested record) and one columnar
+    file (flattened, CSV or Parquet). The columns are taken from ``columns``
+    or from the first record; keys outside them only appear in the JSON
+    Lines file. Safe to call from several worker threads.
+    """
+
+    def __init__(self, output_dir, session_id=None, columnar_format='csv', columns=None,
+                 row_group_size=1000):
+        if columnar_format not in COLUMNAR_FORMATS:
+            raise ValueError(f"Unsupported columnar format: {columnar_format}")
+        if columnar_format == 'parquet' and pq is None:
+            print("⚠️  pyarrow is not installed, writing the columnar output as CSV")
+            columnar_format = 'csv'
+
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if session_id is None:
+            session_id = f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.session_id = session_id
+        self.columnar_format = columnar_format
+        self.columns = list(columns) if columns else None
+        self.row_group_size = row_group_size
+
+        self.jsonl_file = self.output_dir / f"{session_id}.jsonl"
+        self.columnar_file = self.output_dir / f"{session_id}.{columnar_format}"
+        self.records_written = 0
+
+        self._lock = threading.Lock()
+        self._jsonl = None
+        self._csv_handle = None
+        self._csv_writer = None
+        self._parquet_writer = None
+        self._parquet_rows = []
+        self._closed = False
+
+    def append(self, record):
+        """Write one record to the JSON Lines and columnar outputs"""
+        line = json.dumps(record, ensure_ascii=False, default=_json_default)
+        row = flatten_record(record)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Batch output sink is already closed")
+            if self._jsonl is None:
+                self._jsonl = open(self.jsonl_file, 'a', encoding='utf-8')
+            self._jsonl.write(line + "\n")
+            if self.columns is None:
+                self.columns = list(row)
+            if self.columnar_format == 'parquet':
+                self._parquet_rows.append(row)
+                if len(self._parquet_rows) >= self.row_group_size:
+                    self._write_parquet_rows()
+            else:
+                self._write_csv_row(row)
+            self.records_written += 1
+
+    def _write_csv_row(self, row):
+        if self._csv_writer is None:
+            self._csv_handle = open(self.columnar_file, 'w', newline='', encoding='utf-8')
+            self._csv_writer = csv.DictWriter(
+                self._csv_handle, fieldnames=self.columns, restval="", extrasaction='ignore'
+            )
+            self._csv_writer.writeheader()
+        self._csv_writer.writerow(row)
+
+    def _write_parquet_rows(self):
+        if not self._parquet_rows:
+            return
+        # Every column is stored as text; values are already cleaned strings
+        data = {
+            column: [None if row.get(column) is None else str(row[column]) for row in self._parquet_rows]
+            for column in self.columns
+        }
+        table = pa.table(data, schema=pa.schema([(column, pa.string()) for column in self.columns]))
+        if self._parquet_writer is None:
+            self._parquet_writer = pq.ParquetWriter(self.columnar_file, table.schema)
+        self._parquet_writer.write_table(table)
+        self._parquet_rows = []
+
+    def flush(self):
+        """Push buffered output to disk"""
+        with self._lock:
+            if self._jsonl is not None:
+                self._jsonl.flush()
+            if self._csv_handle is not None:
+                self._csv_handle.flush()
+            if self.columnar_format == 'parquet':
+                self._write_parquet_rows()
+
+    def close(self):
+        """Flush and close the session files"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self.columnar_format == 'parquet':
+                self._write_parquet_rows()
+                if self._parquet_writer is not None:
+                    self._parquet_writer.close()
+            if self._csv_handle is not None:
+                self._csv_handle.close()
+            if self._jsonl is not None:
+                self._jsonl.close()
+
+    def get_output_files(self):
+        return {
+            'jsonl_file': self.jsonl_file,
+            'columnar_file': self.columnar_file
+        }
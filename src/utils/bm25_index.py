@@ -0,0 +1,149 @@
+import math
+import re
+import sqlite3
+import threading
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+# Lowercase alphanumeric runs: "GEMC-511687700000005" -> "gemc", "511687700000005",
+# so contract numbers, HSN codes and GSTINs are single exact terms
+TOKEN_RE = re.compile(r'[a-z0-9]{2,}')
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+
+def tokenize(text):
+    return TOKEN_RE.findall((text or '').lower())
+
+
+class BM25Index:
+    """Disk-backed inverted index with BM25 scoring.
+
+    Postings (term, doc_id, tf) live in SQLite so the index is built
+    incrementally as documents are ingested and survives restarts;
+    document count and total length are kept in a meta table so a query
+    only reads the postings of its own terms.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS docs (
+                doc_id INTEGER PRIMARY KEY,
+                length INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS postings (
+                term TEXT NOT NULL,
+                doc_id INTEGER NOT NULL,
+                tf INTEGER NOT NULL,
+                PRIMARY KEY (term, doc_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS postings_doc ON postings (doc_id);
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            );
+            INSERT OR IGNORE INTO meta (key, value) VALUES ('n_docs', 0), ('total_length', 0);
+        """)
+        self.connection.commit()
+
+    def _remove(self, doc_id):
+        row = self.connection.execute("SELECT length FROM docs WHERE doc_id = ?", (doc_id,)).fetchone()
+        if row is None:
+            return
+        self.connection.execute("DELETE FROM postings WHERE doc_id = ?", (doc_id,))
+        self.connection.execute("DELETE FROM docs WHERE doc_id = ?", (doc_id,))
+        self.connection.execute("UPDATE meta SET value = value - 1 WHERE key = 'n_docs'")
+        self.connection.execute("UPDATE meta SET value = value - ? WHERE key = 'total_length'", (row[0],))
+
+    def add_documents(self, documents):
+        """Index or re-index (doc_id, text) pairs in one transaction"""
+        # Tokenised before taking the lock, so concurrent callers only wait for the writes
+        documents = [(doc_id, Counter(tokenize(text))) for doc_id, text in documents]
+        with self._lock, self.connection:
+            for doc_id, counts in documents:
+                self._remove(doc_id)
+                length = sum(counts.values())
+                if not length:
+                    continue
+                self.connection.execute("INSERT INTO docs (doc_id, length) VALUES (?, ?)", (doc_id, length))
+                self.connection.executemany(
+                    "INSERT INTO postings (term, doc_id, tf) VALUES (?, ?, ?)",
+                    [(term, doc_id, tf) for term, tf in counts.items()]
+                )
+                self.connection.execute("UPDATE meta SET value = value + 1 WHERE key = 'n_docs'")
+                self.connection.execute("UPDATE meta SET value = value + ? WHERE key = 'total_length'", (length,))
+
+    def add_document(self, doc_id, text):
+        self.add_documents([(doc_id, text)])
+
+    def remove_document(self, doc_id):
+        with self._lock, self.connection:
+            self._remove(doc_id)
+
+    def clear(self):
+        with self._lock, self.connection:
+            self.connection.execute("DELETE FROM postings")
+            self.connection.execute("DELETE FROM docs")
+            self.connection.execute("UPDATE meta SET value = 0")
+
+    def __len__(self):
+        with self._lock:
+            return self.connection.execute("SELECT value FROM meta WHERE key = 'n_docs'").fetchone()[0]
+
+    def search(self, query, limit=2000, match_all=False):
+        """Best ``limit`` documents for ``query`` as (doc_ids, scores), best first.
+
+        With ``match_all`` only documents containing every query term count.
+        """
+        terms = set(tokenize(query))
+        with self._lock:
+            n_docs, total_length = (row[0] for row in self.connection.execute(
+                "SELECT value FROM meta WHERE key IN ('n_docs', 'total_length') ORDER BY key"
+            ).fetchall())
+            if not terms or not n_docs:
+                return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+            avg_length = total_length / n_docs
+            doc_ids, partial = [], []
+            for term in terms:
+                rows = self.connection.execute(
+                    "SELECT p.doc_id, p.tf, d.length FROM postings p JOIN docs d ON d.doc_id = p.doc_id "
+                    "WHERE p.term = ?", (term,)
+                ).fetchall()
+                if not rows:
+                    if match_all:
+                        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+                    continue
+                postings = np.array(rows, dtype=np.float64)
+                idf = math.log(1 + (n_docs - len(rows) + 0.5) / (len(rows) + 0.5))
+                tf, length = postings[:, 1], postings[:, 2]
+                doc_ids.append(postings[:, 0].astype(np.int64))
+                partial.append(idf * tf * (K1 + 1) / (tf + K1 * (1 - B + B * length / avg_length)))
+
+        if not doc_ids:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        unique_ids, inverse = np.unique(np.concatenate(doc_ids), return_inverse=True)
+        scores = np.bincount(inverse, weights=np.concatenate(partial)).astype(np.float32)
+        if match_all:
+            # A term has at most one posting per document
+            matched = np.bincount(inverse) == len(doc_ids)
+            unique_ids, scores = unique_ids[matched], scores[matched]
+        if len(scores) > limit:
+            top = np.argpartition(-scores, limit - 1)[:limit]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return unique_ids[top], scores[top]
+
+    def close(self):
+        with self._lock:
+            self.connection.close()
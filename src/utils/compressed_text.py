@@ -0,0 +1,121 @@
+import zlib
+
+from django import forms
+from django.db import models
+from django.db.backends.signals import connection_created
+from django.db.models import lookups
+from django.db.utils import NotSupportedError
+from django.dispatch import receiver
+
+# zlib level; higher levels cost much more CPU for a few percent on PDF text
+COMPRESSION_LEVEL = 6
+# SQLite function the contains/icontains lookups decompress through
+SQL_DECOMPRESS_FUNCTION = 'decompress_text'
+
+
+def compress_text(text):
+    """zlib bytes for ``text``; '' is stored as empty bytes so ``field=''`` lookups still match"""
+    if text is None:
+        return None
+    if not text:
+        return b''
+    return zlib.compress(text.encode('utf-8'), COMPRESSION_LEVEL)
+
+
+def decompress_text(value):
+    """Text for a stored value; str (a row not compressed yet) passes through"""
+    if value is None or isinstance(value, str):
+        return value
+    value = bytes(value)
+    if not value:
+        return ''
+    return zlib.decompress(value).decode('utf-8')
+
+
+@receiver(connection_created)
+def register_sql_functions(sender, connection, **kwargs):
+    if connection.vendor == 'sqlite':
+        connection.connection.create_function(SQL_DECOMPRESS_FUNCTION, 1, decompress_text, deterministic=True)
+
+
+class CompressedTextField(models.BinaryField):
+    """Text stored zlib-compressed in a BLOB column and decompressed when loaded.
+
+    Model code reads and assigns str as with a TextField. Querysets that
+    never show the text should ``defer()`` it, which skips both the read
+    and the decompression until the attribute is accessed.
+    """
+
+    description = "Text (zlib-compressed)"
+
+    def __init__(self, *args, **kwargs):
+        # BinaryField defaults to editable=False
+        kwargs.setdefault('editable', True)
+        super().__init__(*args, **kwargs)
+
+    def get_default(self):
+        default = super().get_default()
+        return '' if default == b'' else default
+
+    def get_prep_value(self, value):
+        value = models.Field.get_prep_value(self, value)
+        if isinstance(value, str):
+            return compress_text(value)
+        return value
+
+    def from_db_value(self, value, expression, connection):
+        return decompress_text(value)
+
+    def to_python(self, value):
+        return decompress_text(value)
+
+    def value_to_string(self, obj):
+        return self.value_from_object(obj)
+
+    def formfield(self, **kwargs):
+        return models.Field.formfield(self, **{'form_class': forms.CharField, 'widget': forms.Textarea, **kwargs})
+
+
+class DecompressedLhsMixin:
+    """Match against the decompressed text (SQLite only)"""
+
+    def process_lhs(self, compiler, connection, lhs=None):
+        if connection.vendor != 'sqlite':
+            raise NotSupportedError(f"{self.lookup_name} on a CompressedTextField requires SQLite")
+        sql, params = super().process_lhs(compiler, connection, lhs)
+        return f'{SQL_DECOMPRESS_FUNCTION}({sql})', params
+
+
+@CompressedTextField.register_lookup
+class CompressedContains(DecompressedLhsMixin, lookups.Contains):
+    pass
+
+
+@CompressedTextField.register_lookup
+class CompressedIContains(DecompressedLhsMixin, lookups.IContains):
+    pass
+
+
+def compress_column(model, field_name, batch_size=500):
+    """Rewrite ``field_name`` of every row compressed (for data migrations)"""
+    _rewrite_column(model, field_name, batch_size)
+
+
+def decompress_column(model, field_name, batch_size=500):
+    """Rewrite ``field_name`` of every row as plain text (reverse data migrations, once it is a TextField again)"""
+    _rewrite_column(model, field_name, batch_size, convert=decompress_text)
+
+
+def _rewrite_column(model, field_name, batch_size, convert=None):
+    batch = []
+    for pk, value in model.objects.values_list('pk', field_name).order_by('pk').iterator(chunk_size=batch_size):
+        if value is None:
+            continue
+        obj = model(pk=pk)
+        setattr(obj, field_name, convert(value) if convert else value)
+        batch.append(obj)
+        if len(batch) >= batch_size:
+            model.objects.bulk_update(batch, [field_name])
+            batch = []
+    if batch:
+        model.objects.bulk_update(batch, [field_name])
@@ -0,0 +1,60 @@
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connections
+
+
+class DatabaseWriter:
+    """One thread that performs every database write of a process.
+
+    SQLite allows a single writer at a time, so extraction threads that
+    save directly queue on the database lock and fail once the busy
+    timeout runs out. Routing the saves through this thread (and its one
+    connection) serialises them in the process, while the callers keep
+    reading and parsing PDFs in parallel.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor = None
+        self._thread = None
+
+    def _started(self):
+        self._thread = threading.current_thread()
+
+    def run(self, func, *args, **kwargs):
+        """Call ``func`` on the writer thread and return its result (or raise its exception)"""
+        if threading.current_thread() is self._thread:
+            return func(*args, **kwargs)
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="DB_Writer", initializer=self._started
+                )
+            future = self._executor.submit(func, *args, **kwargs)
+        return future.result()
+
+    def close(self):
+        """Close the writer's connection and stop the thread; the next ``run`` starts a new one"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.submit(connections.close_all).result()
+            executor.shutdown(wait=True)
+            self._thread = None
+
+
+_writer = DatabaseWriter()
+
+
+def get_db_writer():
+    return _writer
+
+
+def single_writer(method):
+    """Decorator that runs every call of ``method`` on the process-wide writer thread"""
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        return _writer.run(method, *args, **kwargs)
+    return wrapper
@@ -0,0 +1,162 @@
+import hashlib
+import sqlite3
+import threading
+import zlib
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+# MiniLM reads at most 256 word pieces, roughly 150-180 English words
+CHUNK_MAX_WORDS = 150
+# A chunk may end early after this many words, at a content-defined boundary
+CHUNK_MIN_WORDS = 40
+# On average one line in CHUNK_BOUNDARY closes a chunk
+CHUNK_BOUNDARY = 8
+
+
+def normalise_chunk(text):
+    """Collapse whitespace and lowercase (MiniLM is uncased, so the vector is unchanged)"""
+    return ' '.join(text.split()).lower()
+
+
+def _is_boundary(line):
+    # crc32 is stable across processes, unlike hash()
+    return zlib.crc32(line.encode('utf-8')) % CHUNK_BOUNDARY == 0
+
+
+def chunk_text(text, max_words=CHUNK_MAX_WORDS, min_words=CHUNK_MIN_WORDS):
+    """Split ``text`` into normalised chunks of at most ``max_words`` words.
+
+    Chunks end on lines chosen by their content rather than by word
+    offset, so the same boilerplate block produces the same chunks no
+    matter how long the contract-specific text in front of it is.
+    """
+    chunks, current, words = [], [], 0
+    for raw_line in (text or '').splitlines():
+        tokens = raw_line.split()
+        # Over-long lines (PDF text without line breaks) become word windows
+        for start in range(0, len(tokens), max_words):
+            piece = tokens[start:start + max_words]
+            if words + len(piece) > max_words and current:
+                chunks.append(normalise_chunk(' '.join(current)))
+                current, words = [], 0
+            line = ' '.join(piece)
+            current.append(line)
+            words += len(piece)
+            if words >= max_words or (words >= min_words and _is_boundary(normalise_chunk(line))):
+                chunks.append(normalise_chunk(' '.join(current)))
+                current, words = [], 0
+    if current:
+        chunks.append(normalise_chunk(' '.join(current)))
+    return chunks
+
+
+def chunk_key(model_key, chunk):
+    """Content address of a normalised chunk for one model variant"""
+    return hashlib.sha256(f'{model_key}\n{chunk}'.encode('utf-8')).hexdigest()
+
+
+class ChunkEmbeddingCache:
+    """Content-addressed store of chunk vectors.
+
+    Keyed by the hash of the normalised chunk text (and the model variant),
+    so boilerplate shared by many documents is encoded once for the whole
+    corpus. Vectors are stored as float32 blobs.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS chunk_embeddings (
+                key TEXT PRIMARY KEY,
+                vector BLOB NOT NULL
+            )
+        """)
+        self.connection.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, keys):
+        """Return {key: vector} for the keys already stored"""
+        found = {}
+        keys = list(keys)
+        with self._lock:
+            # Stay below SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                rows = self.connection.execute(
+                    f"SELECT key, vector FROM chunk_embeddings WHERE key IN ({','.join('?' * len(batch))})",
+                    batch
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def put_many(self, items):
+        """Store (key, vector) pairs; existing keys are left as they are"""
+        with self._lock:
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO chunk_embeddings (key, vector) VALUES (?, ?)",
+                [(key, np.asarray(vec, dtype=np.float32).tobytes()) for key, vec in items]
+            )
+            self.connection.commit()
+
+    def count(self):
+        with self._lock:
+            return self.connection.execute("SELECT COUNT(*) FROM chunk_embeddings").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self.connection.close()
+
+
+@lru_cache(maxsize=1)
+def get_chunk_cache():
+    """Shared cache at settings.EMBEDDING_CACHE_PATH (default: next to the project DB)"""
+    from django.conf import settings
+    path = getattr(settings, 'EMBEDDING_CACHE_PATH', None) or Path(settings.BASE_DIR) / 'embedding_cache.sqlite3'
+    return ChunkEmbeddingCache(path)
+
+
+def embed_documents(encode, texts, cache=None, model_key=''):
+    """Embed long ``texts`` as the pooled vectors of their chunks.
+
+    ``encode`` maps a list of chunk strings to L2-normalised vectors. Each
+    distinct chunk is encoded once (or taken from ``cache``); a document
+    vector is the word-count weighted mean of its chunk vectors,
+    re-normalised. Returns an (n, dim) float32 array in input order.
+    """
+    doc_chunks = [chunk_text(text) for text in texts]
+    doc_keys = [[chunk_key(model_key, chunk) for chunk in chunks] for chunks in doc_chunks]
+
+    chunk_by_key = {}
+    for chunks, keys in zip(doc_chunks, doc_keys):
+        for chunk, key in zip(chunks, keys):
+            chunk_by_key.setdefault(key, chunk)
+
+    vectors = cache.get_many(chunk_by_key) if cache is not None else {}
+    missing = [key for key in chunk_by_key if key not in vectors]
+    if cache is not None:
+        cache.hits += len(chunk_by_key) - len(missing)
+        cache.misses += len(missing)
+    if missing:
+        encoded = np.asarray(encode([chunk_by_key[key] for key in missing]), dtype=np.float32)
+        vectors.update(zip(missing, encoded))
+        if cache is not None:
+            cache.put_many(zip(missing, encoded))
+
+    dim = len(next(iter(vectors.values()))) if vectors else 0
+    result = np.zeros((len(texts), dim), dtype=np.float32)
+    for i, (chunks, keys) in enumerate(zip(doc_chunks, doc_keys)):
+        if not keys:
+            continue
+        weights = np.array([len(chunk.split()) for chunk in chunks], dtype=np.float32)
+        pooled = np.average(np.vstack([vectors[key] for key in keys]), axis=0, weights=weights)
+        result[i] = pooled / max(np.linalg.norm(pooled), 1e-12)
+    return result
@@ -0,0 +1,144 @@
+import os
+from functools import lru_cache
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+try:
+    from sentence_transformers import SentenceTransformer
+except Exception:
+    SentenceTransformer = None
+
+try:
+    import torch
+except Exception:
+    torch = None
+
+from src.utils.embedding_cache import embed_documents
+
+MODEL_NAME = 'all-MiniLM-L6-v2'
+
+
+def model_key(quantize=False):
+    """Name of the model variant, part of every chunk cache key"""
+    return f'{MODEL_NAME}:int8' if quantize else MODEL_NAME
+
+
+def quantize_model(model):
+    """Apply int8 dynamic quantisation to the Linear layers (CPU only)"""
+    if torch is None:
+        return model
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+@lru_cache(maxsize=2)
+def get_sentence_model(quantize=False):
+    """Load the MiniLM model once per process; None when sentence-transformers is missing"""
+    if SentenceTransformer is None:
+        return None
+    try:
+        model = SentenceTransformer(MODEL_NAME, device='cpu' if quantize else None)
+    except Exception:
+        return None
+    if quantize:
+        model = quantize_model(model)
+    return model
+
+
+def encode_document(text, quantize=False, cache=None):
+    """Chunked, pooled embedding of one document; None when no model is available"""
+    model = get_sentence_model(quantize)
+    if model is None or not text:
+        return None
+    vecs = embed_documents(
+        lambda chunks: model.encode(chunks, normalize_embeddings=True),
+        [text], cache, model_key(quantize)
+    )
+    return vecs[0].tolist()
+
+
+def length_order(texts):
+    """Indices of ``texts`` from longest to shortest, so batches pad to similar lengths"""
+    return sorted(range(len(texts)), key=lambda i: -len(texts[i]))
+
+
+class BulkEncoder:
+    """CPU-throughput encoder for bulk jobs.
+
+    Inputs are sorted by length before encoding and the vectors are put back
+    in input order. With ``processes`` > 1 a sentence-transformers
+    multi-process pool encodes across cores; use it as a context manager so
+    the pool is shut down.
+    """
+
+    def __init__(self, processes=1, quantize=False, batch_size=64, normalize=True):
+        self.processes = max(1, int(processes or 1))
+        self.quantize = quantize
+        self.batch_size = batch_size
+        self.normalize = normalize
+        self.model = get_sentence_model(quantize)
+        self.pool = None
+
+    @property
+    def available(self):
+        return self.model is not None
+
+    def start(self):
+        if self.model is None or self.processes == 1 or self.pool is not None:
+            return self
+        # Split the cores between the workers instead of letting each one
+        # start a full set of torch threads
+        threads = str(max(1, (os.cpu_count() or 1) // self.processes))
+        previous = os.environ.get('OMP_NUM_THREADS')
+        os.environ['OMP_NUM_THREADS'] = threads
+        try:
+            self.pool = self.model.start_multi_process_pool(target_devices=['cpu'] * self.processes)
+        finally:
+            if previous is None:
+                os.environ.pop('OMP_NUM_THREADS', None)
+            else:
+                os.environ['OMP_NUM_THREADS'] = previous
+        return self
+
+    def stop(self):
+        if self.pool is not None:
+            SentenceTransformer.stop_multi_process_pool(self.pool)
+            self.pool = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def encode(self, texts):
+        """Encode ``texts``; returns an (n, dim) float32 array in input order"""
+        texts = list(texts)
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        order = length_order(texts)
+        ordered = [texts[i] for i in order]
+        if self.pool is not None:
+            # Chunks handed to the workers hold texts of similar length
+            chunk_size = max(self.batch_size, -(-len(ordered) // (self.processes * 4)))
+            vecs = self.model.encode_multi_process(
+                ordered, self.pool, batch_size=self.batch_size, chunk_size=chunk_size
+            )
+            if self.normalize:
+                norms = np.linalg.norm(vecs, axis=1, keepdims=True)
+                vecs = vecs / np.maximum(norms, 1e-12)
+        else:
+            vecs = self.model.encode(
+                ordered, batch_size=self.batch_size, normalize_embeddings=self.normalize,
+                convert_to_numpy=True
+            )
+        vecs = np.asarray(vecs, dtype=np.float32)
+        result = np.empty_like(vecs)
+        result[order] = vecs
+        return result
+
+    def encode_documents(self, texts, cache=None):
+        """Encode long texts as pooled chunk vectors, reusing ``cache`` across calls"""
+        return embed_documents(self.encode, list(texts), cache, model_key(self.quantize))
@@ -0,0 +1,171 @@
+import os
+import signal
+import threading
+import time
+
+# inotify (through watchdog) is optional; without it directories are polled
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except Exception:
+    FileSystemEventHandler = object
+    Observer = None
+
+
+def _raise_keyboard_interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def stop_on_sigterm():
+    """Turn SIGTERM into KeyboardInterrupt so service managers stop watch mode cleanly"""
+    signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+
+
+def _file_key(stat):
+    return stat.st_size, stat.st_mtime_ns
+
+
+class _PDFEventHandler(FileSystemEventHandler):
+    """Forward watchdog events for PDFs and new directories to the watcher"""
+
+    def __init__(self, watcher):
+        self.watcher = watcher
+
+    def on_any_event(self, event):
+        for path in (getattr(event, 'src_path', None), getattr(event, 'dest_path', None)):
+            if not path:
+                continue
+            if event.is_directory:
+                if event.event_type in ('created', 'moved'):
+                    # Files moved in together with a directory raise no events
+                    self.watcher._scan_directory(path, recursive=True)
+            elif path.lower().endswith('.pdf'):
+                self.watcher._mark_dirty(path)
+
+
+class PDFDirectoryWatcher:
+    """Report new or changed PDFs under ``root`` without rescanning the tree.
+
+    ``known_files`` maps path to ``(size, mtime_ns)`` for files that are
+    already handled (the processing manifest). With watchdog installed the
+    tree is watched through inotify; otherwise every poll stats the known
+    directories and only lists those whose mtime changed, which catches new,
+    renamed and replaced files but not in-place rewrites. A file is reported
+    once its mtime is ``settle_seconds`` old, so half-copied PDFs are not
+    picked up.
+    """
+
+    def __init__(self, root, known_files=None, poll_interval=2.0, settle_seconds=2.0,
+                 use_inotify=True):
+        self.root = str(root)
+        self.index = dict(known_files or {})
+        self.poll_interval = poll_interval
+        self.settle_seconds = settle_seconds
+        self.use_inotify = use_inotify and Observer is not None
+
+        self._lock = threading.Lock()
+        self._dirty = set()
+        self._dir_mtimes = {}
+        self._subdirs = {}
+        self._observer = None
+
+    @property
+    def mode(self):
+        return 'inotify' if self.use_inotify else 'polling'
+
+    def start(self):
+        """Queue every unhandled PDF in the tree and begin watching"""
+        self._scan_directory(self.root, recursive=True)
+        if self.use_inotify:
+            self._observer = Observer()
+            self._observer.schedule(_PDFEventHandler(self), self.root, recursive=True)
+            self._observer.start()
+
+    def stop(self):
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
+    def _mark_dirty(self, path):
+        with self._lock:
+            self._dirty.add(path)
+
+    def _scan_directory(self, directory, recursive=False):
+        """List ``directory`` and mark its PDFs dirty, remembering subdirectories"""
+        pending = [directory]
+        while pending:
+            current = pending.pop()
+            try:
+                self._dir_mtimes[current] = os.stat(current).st_mtime_ns
+                subdirs = []
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.name.lower().endswith('.pdf'):
+                            self._mark_dirty(entry.path)
+            except OSError:
+                self._dir_mtimes.pop(current, None)
+                self._subdirs.pop(current, None)
+                continue
+            self._subdirs[current] = subdirs
+            if recursive:
+                pending.extend(subdirs)
+            else:
+                # Subdirectories seen for the first time are listed in full
+                pending.extend(d for d in subdirs if d not in self._dir_mtimes)
+
+    def _poll_directories(self):
+        """Relist only the directories whose mtime moved since the last poll"""
+        pending = [self.root]
+        while pending:
+            directory = pending.pop()
+            try:
+                mtime_ns = os.stat(directory).st_mtime_ns
+            except OSError:
+                self._dir_mtimes.pop(directory, None)
+                self._subdirs.pop(directory, None)
+                continue
+            if self._dir_mtimes.get(directory) != mtime_ns:
+                self._scan_directory(directory)
+            pending.extend(self._subdirs.get(directory, ()))
+
+    def poll(self):
+        """Return the dirty PDFs that are new or changed and have settled"""
+        if not self.use_inotify:
+            self._poll_directories()
+
+        with self._lock:
+            dirty = self._dirty
+            self._dirty = set()
+
+        now_ns = time.time_ns()
+        settle_ns = int(self.settle_seconds * 1e9)
+        ready = []
+        for path in sorted(dirty):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            key = _file_key(stat)
+            if self.index.get(path) == key:
+                continue
+            if now_ns - stat.st_mtime_ns < settle_ns:
+                # Still being written; look again on the next poll
+                self._mark_dirty(path)
+                continue
+            self.index[path] = key
+            ready.append(path)
+        return ready
+
+    def wait_for_changes(self, timeout=None):
+        """Block until some PDFs are ready (or ``timeout`` seconds pass)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            ready = self.poll()
+            if ready:
+                return ready
+            if deadline is not None and time.monotonic() >= deadline:
+                return []
+            time.sleep(self.poll_interval)
@@ -0,0 +1,185 @@
+import base64
+import hashlib
+import json
+import math
+from datetime import date
+from functools import cached_property
+
+from django.core.cache import caches
+from django.db.models import Q
+
+
+def _json_value(value):
+    # Full isoformat: DjangoJSONEncoder drops microseconds, which would break equality seeks
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Cannot encode {type(value).__name__} in a cursor")
+
+
+def encode_cursor(values):
+    """Opaque, URL-safe token for the ordering values of one row"""
+    raw = json.dumps(values, default=_json_value, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor, fields):
+    """Ordering values from ``encode_cursor``; None when the token is not valid"""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(fields):
+            return None
+        return [None if value is None else field.to_python(value) for field, value in zip(fields, values)]
+    except Exception:
+        return None
+
+
+class KeysetPaginator:
+    """Seek pagination over descending ``ordering`` columns plus the primary key.
+
+    A page is read with ``WHERE (ordering, pk) < cursor ORDER BY ... LIMIT``
+    instead of an OFFSET, so every page costs about the same as the first
+    when a composite index covers the ordering. Only the leading column may
+    be NULL; NULL rows come after all dated rows, as with ``nulls_last``.
+    """
+
+    def __init__(self, queryset, ordering, per_page=50, count_timeout=300, count_version=None):
+        self.queryset = queryset
+        self.per_page = per_page
+        # Totals are cached for ``count_timeout`` seconds (0: always exact);
+        # a new ``count_version`` (e.g. after an ingest) makes them stale at once
+        self.count_timeout = count_timeout
+        self.count_version = count_version
+        meta = queryset.model._meta
+        # Every column is walked in descending order, so a leading '-' is optional
+        names = [name.lstrip('-') for name in ordering]
+        self.names = [name for name in names if name not in ('pk', meta.pk.name)] + [meta.pk.name]
+        self.fields = [meta.get_field(name) for name in self.names]
+        self.leading = self.names[0]
+        self.nullable = self.fields[0].null
+
+    @cached_property
+    def count(self):
+        if not self.count_timeout:
+            return self.queryset.count()
+        query = f'{self.count_version}:{self.queryset.query}'
+        key = 'keyset_count:' + hashlib.sha1(query.encode('utf-8')).hexdigest()
+        cache = caches['default']
+        count = cache.get(key)
+        if count is None:
+            count = self.queryset.count()
+            cache.set(key, count, timeout=self.count_timeout)
+        return count
+
+    @property
+    def num_pages(self):
+        return max(1, math.ceil(self.count / self.per_page))
+
+    def _ordered(self, queryset, descending=True):
+        prefix = '-' if descending else ''
+        return queryset.order_by(*[prefix + name for name in self.names])
+
+    def _beyond(self, values, descending=True):
+        """Rows after ``values`` in the walk direction, among rows sharing the leading value"""
+        lookup = 'lt' if descending else 'gt'
+        condition = None
+        equal = Q()
+        for name, value in zip(self.names[1:], values[1:]):
+            step = equal & Q(**{f'{name}__{lookup}': value})
+            condition = step if condition is None else condition | step
+            equal &= Q(**{name: value})
+        return condition
+
+    def _seek(self, values, limit, descending=True):
+        """Up to ``limit`` rows strictly after (or before) the row with ``values``"""
+        leading = values[0]
+        rows = []
+        if leading is None:
+            nulls = self.queryset.filter(**{f'{self.leading}__isnull': True})
+            rows = list(self._ordered(nulls.filter(self._beyond(values, descending)), descending)[:limit])
+            if not descending and len(rows) < limit:
+                # Walking back out of the NULL block into the dated rows
+                dated = self.queryset.filter(**{f'{self.leading}__isnull': False})
+                rows += list(self._ordered(dated, descending)[:limit - len(rows)])
+            return rows
+
+        bound, strict = ('lte', 'lt') if descending else ('gte', 'gt')
+        # The redundant range on the leading column lets the index seek to it
+        dated = self.queryset.filter(**{f'{self.leading}__{bound}': leading}).filter(
+            Q(**{f'{self.leading}__{strict}': leading})
+            | (Q(**{self.leading: leading}) & self._beyond(values, descending))
+        )
+        rows = list(self._ordered(dated, descending)[:limit])
+        if descending and self.nullable and len(rows) < limit:
+            nulls = self.queryset.filter(**{f'{self.leading}__isnull': True})
+            rows += list(self._ordered(nulls, descending)[:limit - len(rows)])
+        return rows
+
+    def _first(self, limit):
+        if not self.nullable:
+            return list(self._ordered(self.queryset)[:limit])
+        dated = self.queryset.filter(**{f'{self.leading}__isnull': False})
+        rows = list(self._ordered(dated)[:limit])
+        if len(rows) < limit:
+            nulls = self.queryset.filter(**{f'{self.leading}__isnull': True})
+            rows += list(self._ordered(nulls)[:limit - len(rows)])
+        return rows
+
+    def values_of(self, obj):
+        return [getattr(obj, name) for name in self.names]
+
+    def page(self, after=None, before=None, number=1):
+        """Page following cursor ``after`` or preceding cursor ``before`` (first page without either)"""
+        limit = self.per_page + 1
+        after_values = decode_cursor(after, self.fields)
+        before_values = decode_cursor(before, self.fields) if after_values is None else None
+
+        if after_values is not None:
+            rows = self._seek(after_values, limit)
+            has_previous, has_next = True, len(rows) > self.per_page
+            rows = rows[:self.per_page]
+        elif before_values is not None:
+            rows = self._seek(before_values, limit, descending=False)
+            has_previous, has_next = len(rows) > self.per_page, True
+            rows = rows[:self.per_page][::-1]
+        else:
+            rows = self._first(limit)
+            has_previous, has_next = False, len(rows) > self.per_page
+            rows = rows[:self.per_page]
+            number = 1
+        if not has_previous:
+            number = 1
+        return KeysetPage(self, rows, max(1, number), has_previous, has_next)
+
+
+class KeysetPage:
+    """One keyset page, with the attributes the table templates read from Django's Page"""
+
+    def __init__(self, paginator, object_list, number, has_previous, has_next):
+        self.paginator = paginator
+        self.object_list = object_list
+        self.number = number
+        self.next_cursor = encode_cursor(paginator.values_of(object_list[-1])) if has_next and object_list else ''
+        self.previous_cursor = (
+            encode_cursor(paginator.values_of(object_list[0])) if has_previous and object_list else ''
+        )
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return bool(self.next_cursor)
+
+    def has_previous(self):
+        return bool(self.previous_cursor)
+
+    def next_page_number(self):
+        return self.number + 1
+
+    def previous_page_number(self):
+        return max(1, self.number - 1)
@@ -0,0 +1,80 @@
+import re
+
+# Marks the end of a keyword inside the trie
+_END = ''
+
+
+def _trie_pattern(node):
+    """Regex for a trie node, sharing common prefixes between keywords"""
+    branches = [re.escape(char) + _trie_pattern(child)
+                for char, child in sorted(node.items()) if char != _END]
+    if not branches:
+        return ''
+    pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if _END in node:
+        pattern = '(?:' + pattern + ')?'
+    return pattern
+
+
+class KeywordMatcher:
+    """Find every keyword contained in a text in one pass.
+
+    Matching is case-insensitive substring matching, the same as the
+    ``icontains`` lookups it replaces. The keywords are compiled into a
+    trie; one lookahead regex over the trie finds every position where a
+    keyword can start, and the trie is walked from there so overlapping
+    keywords ("army" inside "india army") are all reported.
+    """
+
+    def __init__(self, keywords):
+        self.keywords = sorted({kw.strip().lower() for kw in keywords if kw and kw.strip()})
+        self.trie = {}
+        for keyword in self.keywords:
+            node = self.trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[_END] = keyword
+        self.regex = re.compile('(?=' + _trie_pattern(self.trie) + ')') if self.keywords else None
+
+    def contains_any(self, text):
+        """True when at least one keyword occurs in ``text``"""
+        return bool(text) and self.regex is not None and self.regex.search(text.lower()) is not None
+
+    def find(self, text):
+        """Return the set of keywords that occur in ``text``"""
+        found = set()
+        if not text or self.regex is None:
+            return found
+        text = text.lower()
+        for hit in self.regex.finditer(text):
+            node = self.trie
+            for char in text[hit.start():]:
+                node = node.get(char)
+                if node is None:
+                    break
+                if _END in node:
+                    found.add(node[_END])
+            if len(found) == len(self.keywords):
+                break
+        return found
+
+
+class RuleSetMatcher:
+    """Evaluate named keyword rule sets (tag -> keywords) with one matcher"""
+
+    def __init__(self, rules):
+        self.rules = {
+            tag: sorted({kw.strip().lower() for kw in keywords if kw and kw.strip()})
+            for tag, keywords in rules.items()
+        }
+        self.matcher = KeywordMatcher(kw for keywords in self.rules.values() for kw in keywords)
+
+    def match(self, text):
+        """Map each rule set that fires to the sorted keywords that matched"""
+        found = self.matcher.find(text)
+        matches = {}
+        for tag, keywords in self.rules.items():
+            hits = [kw for kw in keywords if kw in found]
+            if hits:
+                matches[tag] = hits
+        return matches
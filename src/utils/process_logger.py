@@ -0,0 +1,420 @@
+import atexit
+import contextlib
+import csv
+import functools
+import json
+import logging
+import queue
+import re
+import sys
+import threading
+import time
+from array import array
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+# Pipeline stages timed for every processed PDF, in pipeline order
+PIPELINE_STAGES = (
+    'open', 'text_extraction', 'cleaning', 'field_extraction',
+    'db_save', 'excel_export', 'json_export', 'batch_output'
+)
+
+STAGE_PERCENTILES = (50, 95, 99)
+
+# Sentinel that tells the CSV writer thread to flush and exit
+_STOP_WRITER = object()
+
+
+class StageTimer:
+    """Accumulate wall-clock time per pipeline stage for a single PDF.
+
+    Stages may nest; time is attributed to the innermost running stage only,
+    so the stage totals add up to the time spent inside any stage.
+    """
+
+    def __init__(self):
+        self.durations = {}
+        self._running = []
+
+    def _add(self, stage, seconds):
+        self.durations[stage] = self.durations.get(stage, 0.0) + seconds
+
+    def stage(self, name):
+        return _StageContext(self, name)
+
+    def as_dict(self):
+        return dict(self.durations)
+
+
+class _StageContext:
+    def __init__(self, timer, name):
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self):
+        now = time.perf_counter()
+        running = self.timer._running
+        if running:
+            # Pause the enclosing stage
+            parent = running[-1]
+            self.timer._add(parent[0], now - parent[1])
+        running.append([self.name, now])
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        now = time.perf_counter()
+        running = self.timer._running
+        name, started = running.pop()
+        self.timer._add(name, now - started)
+        if running:
+            # Resume the enclosing stage
+            running[-1][1] = now
+        return False
+
+
+class _ThreadQuietStream:
+    """Stand-in for sys.stdout that drops writes from threads inside ``quiet_stdout``"""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, text):
+        if getattr(_quiet_threads, 'depth', 0):
+            return len(text)
+        return self.stream.write(text)
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+_quiet_threads = threading.local()
+_quiet_install_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def quiet_stdout(enabled):
+    """Silence ``print`` output of the calling thread while ``enabled`` (quiet batch mode).
+
+    Other threads keep printing, and nested uses are counted, so nothing
+    has to be restored on exit. Worker threads silence themselves with
+    ``quietly``.
+    """
+    if not enabled:
+        yield
+        return
+    with _quiet_install_lock:
+        if not isinstance(sys.stdout, _ThreadQuietStream):
+            sys.stdout = _ThreadQuietStream(sys.stdout)
+    _quiet_threads.depth = getattr(_quiet_threads, 'depth', 0) + 1
+    try:
+        yield
+    finally:
+        _quiet_threads.depth -= 1
+
+
+def quietly(func, enabled):
+    """``func`` run under ``quiet_stdout(enabled)`` in whichever thread calls it"""
+    if not enabled:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with quiet_stdout(True):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def timed_stage(name):
+    """Method decorator that times the call under ``self.timings``"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.timings.stage(name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class ProcessLogger:
+    """Comprehensive logging for PDF processing operations.
+
+    Per-file results are queued and written by a background thread, which
+    keeps the CSV open and flushes it every ``flush_rows`` rows or
+    ``flush_interval`` seconds. With ``quiet`` the per-file messages only go
+    to the log file, not the console. When a ``manifest`` is given, every
+    result logged with a ``pdf_path`` is also recorded there. Long-running
+    ingest workers pass their ``worker`` id, which is added to the session
+    id: several workers can start in the same second and must not share
+    session files.
+    """
+
+    def __init__(self, log_dir="logs", record_field="contract_no", quiet=False,
+                 flush_rows=200, flush_interval=2.0, manifest=None, worker=None):
+        self.log_dir = Path(log_dir)
+        self.log_dir.mkdir(exist_ok=True)
+        self.record_field = record_field
+        self.quiet = quiet
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self.manifest = manifest
+
+        # Create timestamp for this session
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.session_id = f"extraction_session_{timestamp}"
+        if worker is not None:
+            self.session_id += "_" + re.sub(r'[^\w.-]+', '-', str(worker))
+
+        # Setup file logging
+        self.setup_file_logging()
+
+        # Setup detailed CSV logging
+        self.setup_csv_logging()
+
+        # Processing statistics
+        self.stats = {
+            'total_files': 0,
+            'successful': 0,
+            'failed': 0,
+            'skipped': 0,
+            'ignored': 0,
+            'start_time': datetime.now(),
+            'end_time': None
+        }
+
+        # Per-stage durations of every file, for the session percentiles
+        self.stage_durations = {stage: array('d') for stage in PIPELINE_STAGES}
+
+        # Background CSV writer; it alone touches the CSV, stats and durations
+        self.log_queue = queue.Queue()
+        self.writer_thread = threading.Thread(
+            target=self._csv_writer_loop, name="CSV_Log_Writer", daemon=True
+        )
+        self.writer_thread.start()
+        atexit.register(self.close)
+
+    def setup_file_logging(self):
+        """Setup file-based logging"""
+        log_file = self.log_dir / f"{self.session_id}.log"
+
+        # Configure logging
+        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(levelname)s - %(message)s',
+            handlers=[
+                file_handler,
+                logging.StreamHandler()  # Also print to console
+            ]
+        )
+
+        self.logger = logging.getLogger(__name__)
+        self.log_file = log_file
+
+        # Per-file messages skip the console handler in quiet mode
+        if self.quiet:
+            self.file_logger = logging.getLogger(f"{__name__}.{self.session_id}")
+            self.file_logger.setLevel(logging.INFO)
+            self.file_logger.propagate = False
+            self.file_logger.addHandler(file_handler)
+        else:
+            self.file_logger = self.logger
+
+    def setup_csv_logging(self):
+        """Setup CSV logging for detailed tracking"""
+        csv_file = self.log_dir / f"{self.session_id}_detailed.csv"
+
+        # CSV headers
+        self.csv_headers = [
+            'timestamp', 'filename', 'status', 'reason', 'file_size',
+            'processing_time', 'error_details', self.record_field, 'pages_extracted'
+        ] + [f"{stage}_time" for stage in PIPELINE_STAGES]
+
+        # Create CSV file with headers
+        with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(self.csv_headers)
+
+        self.csv_file = csv_file
+
+    def log_file_processing(self, filename, status, reason="", file_size=0,
+                          processing_time=0, error_details="", record_id="", pages_extracted=0,
+                          stage_timings=None, pdf_path=None):
+        """Queue a file processing result for the CSV writer thread"""
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.log_queue.put((
+            timestamp, filename, status, reason, file_size, processing_time,
+            error_details, record_id, pages_extracted, stage_timings or {}, pdf_path
+        ))
+
+    def _record_file_result(self, entry):
+        """Log one queued result and return its CSV row (writer thread only)"""
+        (timestamp, filename, status, reason, file_size, processing_time,
+         error_details, record_id, pages_extracted, stage_timings, pdf_path) = entry
+
+        # Log to file
+        if status == 'SUCCESS':
+            self.file_logger.info(f"✅ {filename}: {reason}")
+        elif status == 'SKIPPED':
+            self.file_logger.info(f"⏭️  {filename}: {reason}")
+        elif status == 'FAILED':
+            self.file_logger.error(f"❌ {filename}: {reason}")
+        elif status == 'IGNORED':
+            self.file_logger.warning(f"⚠️  {filename}: {reason}")
+
+        # Only stages the file actually went through count towards percentiles
+        for stage, seconds in stage_timings.items():
+            if stage in self.stage_durations:
+                self.stage_durations[stage].append(seconds)
+
+        # Update statistics
+        if status == 'SUCCESS':
+            self.stats['successful'] += 1
+        elif status == 'SKIPPED':
+            self.stats['skipped'] += 1
+        elif status == 'FAILED':
+            self.stats['failed'] += 1
+        elif status == 'IGNORED':
+            self.stats['ignored'] += 1
+
+        if self.manifest is not None and pdf_path:
+            self.manifest.record(
+                pdf_path, status, record_id=record_id,
+                error=error_details or (reason if status in ('FAILED', 'IGNORED') else ""),
+                session_id=self.session_id
+            )
+
+        return [
+            timestamp, filename, status, reason, file_size,
+            processing_time, error_details, record_id, pages_extracted
+        ] + [
+            f"{stage_timings[stage]:.6f}" if stage in stage_timings else ""
+            for stage in PIPELINE_STAGES
+        ]
+
+    def _csv_writer_loop(self):
+        """Drain the log queue, writing rows in batches by size or age"""
+        pending = []
+        last_flush = time.monotonic()
+        with open(self.csv_file, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            while True:
+                timeout = max(0.0, self.flush_interval - (time.monotonic() - last_flush))
+                try:
+                    entry = self.log_queue.get(timeout=timeout)
+                except queue.Empty:
+                    entry = None
+
+                stopping = entry is _STOP_WRITER
+                if entry is not None and not stopping:
+                    try:
+                        pending.append(self._record_file_result(entry))
+                    except Exception as e:
+                        print(f"⚠️  Could not record log entry: {e}")
+
+                due = time.monotonic() - last_flush >= self.flush_interval
+                if stopping or due or len(pending) >= self.flush_rows:
+                    if pending:
+                        writer.writerows(pending)
+                        f.flush()
+                        pending.clear()
+                    last_flush = time.monotonic()
+
+                if stopping:
+                    break
+
+    def close(self):
+        """Flush queued results and stop the CSV writer thread"""
+        if self.writer_thread.is_alive():
+            self.log_queue.put(_STOP_WRITER)
+            self.writer_thread.join()
+
+    def stage_timing_summary(self):
+        """Aggregate per-stage durations into count, total, mean and percentiles"""
+        summary = {}
+        for stage, durations in self.stage_durations.items():
+            if not durations:
+                continue
+            values = np.frombuffer(durations, dtype=np.float64)
+            stage_summary = {
+                'count': int(values.size),
+                'total_seconds': float(values.sum()),
+                'mean_seconds': float(values.mean()),
+            }
+            for pct, value in zip(STAGE_PERCENTILES, np.percentile(values, STAGE_PERCENTILES)):
+                stage_summary[f'p{pct}_seconds'] = float(value)
+            summary[stage] = stage_summary
+        return summary
+
+    def log_session_start(self, total_files=None):
+        """Log the start of a processing session (``None``: files are discovered while processing)"""
+        self.stats['total_files'] = total_files or 0
+        self.logger.info(f"🚀 Starting PDF extraction session: {self.session_id}")
+        if total_files is None:
+            self.logger.info("📁 Files are discovered while processing")
+        else:
+            self.logger.info(f"📁 Total files to process: {total_files}")
+        self.logger.info(f"📂 Log directory: {self.log_dir}")
+        self.logger.info(f"📄 Detailed CSV log: {self.csv_file}")
+
+    def log_session_end(self):
+        """Log the end of a processing session"""
+        # All queued results must be counted before the summary is built
+        self.close()
+        self.stats['end_time'] = datetime.now()
+        duration = self.stats['end_time'] - self.stats['start_time']
+        stage_timings = self.stage_timing_summary()
+
+        self.logger.info("="*80)
+        self.logger.info("📊 PROCESSING SESSION COMPLETE")
+        self.logger.info("="*80)
+        self.logger.info(f"📁 Total files found: {self.stats['total_files']}")
+        self.logger.info(f"✅ Successful extractions: {self.stats['successful']}")
+        self.logger.info(f"⏭️  Skipped (duplicates): {self.stats['skipped']}")
+        self.logger.info(f"❌ Failed extractions: {self.stats['failed']}")
+        self.logger.info(f"⚠️  Ignored files: {self.stats['ignored']}")
+        self.logger.info(f"⏱️  Total duration: {duration}")
+        for stage, timing in stage_timings.items():
+            self.logger.info(
+                f"⏱️  {stage}: p50={timing['p50_seconds']:.3f}s "
+                f"p95={timing['p95_seconds']:.3f}s p99={timing['p99_seconds']:.3f}s "
+                f"total={timing['total_seconds']:.1f}s"
+            )
+        self.logger.info(f"📄 Detailed logs saved to: {self.log_file}")
+        self.logger.info(f"📊 CSV summary saved to: {self.csv_file}")
+        self.logger.info("="*80)
+
+        # Save session summary to JSON
+        summary_file = self.log_dir / f"{self.session_id}_summary.json"
+        summary_data = {
+            'session_id': self.session_id,
+            'start_time': self.stats['start_time'].isoformat(),
+            'end_time': self.stats['end_time'].isoformat(),
+            'duration_seconds': duration.total_seconds(),
+            'statistics': self.stats.copy(),
+            'stage_timings': stage_timings,
+            'log_files': {
+                'log_file': str(self.log_file),
+                'csv_file': str(self.csv_file),
+                'summary_file': str(summary_file)
+            }
+        }
+
+        # Convert datetime objects to strings for JSON serialization
+        summary_data['statistics']['start_time'] = self.stats['start_time'].isoformat()
+        summary_data['statistics']['end_time'] = self.stats['end_time'].isoformat()
+
+        with open(summary_file, 'w', encoding='utf-8') as f:
+            json.dump(summary_data, f, indent=2, ensure_ascii=False)
+
+        self.logger.info(f"📋 Session summary saved to: {summary_file}")
+
+    def get_log_files(self):
+        """Get list of log files for this session"""
+        return {
+            'log_file': self.log_file,
+            'csv_file': self.csv_file,
+            'summary_file': self.log_dir / f"{self.session_id}_summary.json"
+        }
@@ -0,0 +1,157 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+# Statuses that mean the file needs no more work
+COMPLETED_STATUSES = ('SUCCESS', 'SKIPPED')
+
+# Statuses that are only reprocessed with retry_failed
+FAILED_STATUSES = ('FAILED', 'IGNORED')
+
+# Discovered paths looked up in the manifest per query when resuming
+LOOKUP_BATCH_SIZE = 500
+
+
+class ProcessingManifest:
+    """Persistent record of every PDF a batch run has finished.
+
+    One row per file path with the size and mtime seen when it was
+    processed, so an interrupted run can resume without reopening files
+    that are already done. Every result is committed straight away.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS processed_files (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                record_id TEXT,
+                error TEXT,
+                session_id TEXT,
+                updated_at TEXT NOT NULL
+            )
+        """)
+        self.connection.commit()
+
+    @staticmethod
+    def _stat(path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def record(self, path, status, record_id="", error="", session_id=""):
+        """Store the outcome for ``path`` against its current size and mtime"""
+        stat = self._stat(path) or (0, 0)
+        with self._lock:
+            self.connection.execute(
+                """
+                INSERT OR REPLACE INTO processed_files
+                    (path, size, mtime_ns, status, record_id, error, session_id, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (str(path), stat[0], stat[1], status, record_id or "", error or "",
+                 session_id or "", datetime.now().isoformat())
+            )
+            self.connection.commit()
+
+    def pending_files(self, pdf_files, retry_failed=False):
+        """Split ``pdf_files`` into those still to process and a done count.
+
+        A file is done when the manifest holds it with the same size and
+        mtime and a completed status (or a failed one, unless retrying).
+        Changed files are always processed again.
+        """
+        pending = []
+        done = 0
+        for pdf_path, is_done in self._check_done(pdf_files, retry_failed):
+            if is_done:
+                done += 1
+            else:
+                pending.append(pdf_path)
+        return pending, done
+
+    def iter_pending(self, pdf_files, retry_failed=False):
+        """Yield the paths of ``pdf_files`` that ``pending_files`` would return, as they arrive"""
+        for pdf_path, is_done in self._check_done(pdf_files, retry_failed):
+            if not is_done:
+                yield pdf_path
+
+    def _check_done(self, pdf_files, retry_failed, batch_size=LOOKUP_BATCH_SIZE):
+        """Yield ``(path, done)`` for ``pdf_files``, looking them up by primary key a batch at a time"""
+        done_statuses = set(COMPLETED_STATUSES)
+        if not retry_failed:
+            done_statuses.update(FAILED_STATUSES)
+
+        batch = []
+        for pdf_path in pdf_files:
+            batch.append(pdf_path)
+            if len(batch) >= batch_size:
+                yield from self._check_batch(batch, done_statuses)
+                batch = []
+        if batch:
+            yield from self._check_batch(batch, done_statuses)
+
+    def _check_batch(self, batch, done_statuses):
+        paths = [str(pdf_path) for pdf_path in batch]
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT path, size, mtime_ns, status FROM processed_files "
+                f"WHERE path IN ({','.join('?' * len(paths))})",
+                paths
+            ).fetchall()
+        finished = {
+            path: (size, mtime_ns)
+            for path, size, mtime_ns, status in rows
+            if status in done_statuses
+        }
+        for pdf_path, path in zip(batch, paths):
+            seen = finished.get(path)
+            yield pdf_path, seen is not None and seen == self._stat(pdf_path)
+
+    def file_index(self):
+        """Map every recorded path to the ``(size, mtime_ns)`` it was processed at"""
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT path, size, mtime_ns FROM processed_files"
+            ).fetchall()
+        return {path: (size, mtime_ns) for path, size, mtime_ns in rows}
+
+    def status_counts(self):
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT status, COUNT(*) FROM processed_files GROUP BY status"
+            ).fetchall()
+        return dict(rows)
+
+    def close(self):
+        with self._lock:
+            self.connection.close()
+
+
+def open_run_manifest(db_path, pdf_files, resume=False, retry_failed=False):
+    """Open the manifest for a batch run and return it with the files to process.
+
+    Without ``resume`` or ``retry_failed`` every file is processed and the
+    manifest is only written to.
+    """
+    manifest = ProcessingManifest(db_path)
+    if resume or retry_failed:
+        total = len(pdf_files)
+        pdf_files, already_done = manifest.pending_files(pdf_files, retry_failed=retry_failed)
+        print(f"⏩ Resuming from manifest: {already_done}/{total} PDFs already processed, "
+              f"{len(pdf_files)} remaining")
+        if not pdf_files:
+            print("✅ Nothing left to process")
+    return manifest, pdf_files
@@ -0,0 +1,128 @@
+import os
+import queue
+import threading
+
+# Paths waiting in the queue per worker thread; discovery blocks when it is full
+QUEUE_DEPTH_PER_WORKER = 4
+# Messages kept as examples of each error category
+ERROR_SAMPLES = 3
+
+_DONE = object()
+
+
+def iter_pdf_files(root):
+    """Yield the PDFs under ``root`` while the tree is being listed.
+
+    Directories are read with ``os.scandir`` one at a time, so nothing but
+    the stack of unvisited directories is held in memory. Subdirectories
+    are visited in name order; files come in directory listing order.
+    """
+    pending = [str(root)]
+    while pending:
+        directory = pending.pop()
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.name.lower().endswith('.pdf') and entry.is_file():
+                            yield entry.path
+                    except OSError:
+                        continue
+        except OSError as e:
+            print(f"⚠️  Error listing {directory}: {e}")
+        pending.extend(sorted(subdirs, reverse=True))
+
+
+def run_bounded(items, worker, max_workers=4, queue_depth=None, on_result=None,
+                thread_name_prefix="PDF_Worker"):
+    """Feed ``items`` through a bounded queue to ``max_workers`` threads calling ``worker(item)``.
+
+    The caller's thread produces: it blocks while the queue holds
+    ``queue_depth`` items, so a lazy ``items`` iterator is consumed only as
+    fast as the workers drain it. ``on_result(item, result)`` is called in
+    the worker thread; ``result`` is the exception if ``worker`` raised.
+    Returns the number of items fed.
+    """
+    work = queue.Queue(maxsize=queue_depth or max_workers * QUEUE_DEPTH_PER_WORKER)
+
+    def consume():
+        while True:
+            item = work.get()
+            if item is _DONE:
+                return
+            try:
+                result = worker(item)
+            except Exception as e:
+                result = e
+            if on_result is not None:
+                on_result(item, result)
+
+    threads = [
+        threading.Thread(target=consume, name=f"{thread_name_prefix}_{i}", daemon=True)
+        for i in range(max_workers)
+    ]
+    for thread in threads:
+        thread.start()
+
+    fed = 0
+    try:
+        for item in items:
+            work.put(item)
+            fed += 1
+    except BaseException:
+        # Interrupted: drop what is still queued so the workers stop after their current item
+        while True:
+            try:
+                work.get_nowait()
+            except queue.Empty:
+                break
+        raise
+    finally:
+        for _ in threads:
+            work.put(_DONE)
+        for thread in threads:
+            thread.join()
+    return fed
+
+
+class ErrorSummary:
+    """Thread-safe error counts by category, keeping the first few messages of each"""
+
+    def __init__(self, samples=ERROR_SAMPLES):
+        self.samples = samples
+        self._lock = threading.Lock()
+        self._counts = {}
+        self._examples = {}
+
+    def add(self, category, message=""):
+        with self._lock:
+            self._counts[category] = self._counts.get(category, 0) + 1
+            examples = self._examples.setdefault(category, [])
+            if message and len(examples) < self.samples and message not in examples:
+                examples.append(message)
+
+    @property
+    def total(self):
+        with self._lock:
+            return sum(self._counts.values())
+
+    def __bool__(self):
+        return self.total > 0
+
+    def categories(self):
+        """``(category, count, example messages)``, most frequent first"""
+        with self._lock:
+            return [
+                (category, count, list(self._examples[category]))
+                for category, count in sorted(self._counts.items(), key=lambda item: -item[1])
+            ]
+
+    def print_report(self, heading="ERROR DETAILS"):
+        print(f"\n❌ {heading} ({self.total} errors in {len(self._counts)} categories):")
+        for category, count, examples in self.categories():
+            print(f"  {count:>6} × {category}")
+            for message in examples:
+                print(f"           e.g. {message}")